@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3: 스토리지 백엔드 처리량 벤치마크
+
+storage.py의 백엔드(로컬 / 인메모리 / S3)에 같은 작업을 실행해 MB/s를 비교합니다.
+
+- blob: 큰 객체 하나 쓰기/읽기 (S3는 멀티파트 청크 크기 × 동시성 조합별로 측정)
+- small: 작은 객체 여러 개를 스레드로 동시에 쓰기 (커넥션 풀 재사용 효과)
+- dataset: 고객 데이터 Parquet 데이터셋 쓰기/읽기 (ETL 스크립트와 같은 경로)
+
+AWS 없이 로컬 디렉터리와 memory:// 만으로 실행되며, --s3-uri를 주면
+S3 또는 --endpoint-url의 로컬 S3(MinIO, moto_server 등)도 함께 측정합니다.
+
+사용법:
+    python scripts/1_etl_pipeline/benchmark_storage.py
+    python scripts/1_etl_pipeline/benchmark_storage.py --size-mb 256 \\
+        --s3-uri s3://mlops-training-user01/bench --endpoint-url http://localhost:9000 \\
+        --chunk-sizes 8 16 64 --concurrency 1 4 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from storage import MB, Storage, get_storage, join, read_dataset, write_dataset  # noqa: E402
+from transforms import add_derived_columns, generate_customers  # noqa: E402
+
+
+def timed(func, *args):
+    """함수 실행 시간 측정 (결과, 초)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def report(label: str, num_bytes: int, seconds: float, extra: str = ""):
+    """벤치마크 한 줄 출력"""
+    print(f"  {label:<32} {seconds:>9.3f}s {num_bytes / MB / seconds:>10,.1f} MB/s  {extra}")
+
+
+def bench_blob(storage: Storage, root: str, data: bytes, label: str = "blob"):
+    """큰 객체 하나 쓰기/읽기"""
+    path = join(root, "blob.bin")
+    _, seconds = timed(storage.write_bytes, path, data)
+    report(f"{label} write", len(data), seconds)
+    result, seconds = timed(storage.read_bytes, path)
+    report(f"{label} read", len(data), seconds)
+    if len(result) != len(data):
+        raise RuntimeError(f"Read {len(result)} bytes, expected {len(data)}")
+    storage.delete(path)
+
+
+def bench_small_objects(storage: Storage, root: str, num_objects: int, size: int, workers: int):
+    """작은 객체 num_objects개를 workers개 스레드로 동시에 쓰기/읽기"""
+    payload = os.urandom(size)
+    paths = [join(root, "small", f"obj-{i:05d}.bin") for i in range(num_objects)]
+    total = num_objects * size
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        _, seconds = timed(lambda: list(pool.map(lambda p: storage.write_bytes(p, payload), paths)))
+        report(f"small x{num_objects} write", total, seconds,
+               f"{num_objects / seconds:,.0f} obj/s, {workers} threads")
+        _, seconds = timed(lambda: list(pool.map(storage.read_bytes, paths)))
+        report(f"small x{num_objects} read", total, seconds,
+               f"{num_objects / seconds:,.0f} obj/s, {workers} threads")
+    storage.delete_prefix(join(root, "small"))
+
+
+def bench_dataset(storage: Storage, root: str, rows: int):
+    """고객 데이터 Parquet 데이터셋 쓰기/읽기"""
+    df = add_derived_columns(generate_customers(rows))
+    prefix = join(root, "dataset")
+    _, seconds = timed(write_dataset, storage, df, prefix)
+    num_bytes = sum(info.size for info in storage.list(prefix))
+    report("dataset write", num_bytes, seconds, f"{rows / seconds:,.0f} rows/s")
+    result, seconds = timed(read_dataset, storage, prefix)
+    report("dataset read", num_bytes, seconds, f"{rows / seconds:,.0f} rows/s")
+    if len(result) != rows:
+        raise RuntimeError(f"Read {len(result)} rows, expected {rows}")
+    storage.delete_prefix(prefix)
+
+
+def bench_backend(uri: str, args, data: bytes):
+    """백엔드 하나 전체 측정"""
+    storage, root = get_storage(uri, endpoint_url=args.endpoint_url)
+    print(f"\n📦 {uri} ({type(storage).__name__})")
+    bench_blob(storage, root, data)
+    bench_small_objects(storage, root, args.objects, args.object_kb * 1024, args.workers)
+    bench_dataset(storage, root, args.rows)
+
+
+def bench_s3_transfer(uri: str, data: bytes, chunk_sizes: List[int], concurrency: List[int],
+                      endpoint_url: Optional[str]):
+    """S3 멀티파트 청크 크기 × 동시성 조합별 blob 처리량"""
+    print(f"\n🚀 S3 멀티파트 설정 비교 ({len(data) / MB:.0f} MB)")
+    for chunk_mb in chunk_sizes:
+        for workers in concurrency:
+            storage, root = get_storage(
+                uri,
+                endpoint_url=endpoint_url,
+                multipart_threshold=chunk_mb * MB,
+                multipart_chunksize=chunk_mb * MB,
+                max_concurrency=workers,
+                max_pool_connections=max(workers, 10)
+            )
+            bench_blob(storage, root, data, label=f"chunk {chunk_mb}MB x{workers}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스토리지 백엔드 처리량 벤치마크")
+    parser.add_argument("--size-mb", type=int, default=64, help="blob 크기 (MB)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="dataset 행 수")
+    parser.add_argument("--objects", type=int, default=200, help="small 객체 수")
+    parser.add_argument("--object-kb", type=int, default=64, help="small 객체 크기 (KB)")
+    parser.add_argument("--workers", type=int, default=8, help="small 객체 동시 스레드 수")
+    parser.add_argument("--s3-uri", default=None, help="S3 측정 경로 (예: s3://bucket/bench)")
+    parser.add_argument("--endpoint-url", default=None,
+                        help="S3 호환 엔드포인트 (기본: AWS_ENDPOINT_URL)")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[8, 16, 64],
+                        help="S3 멀티파트 청크 크기 (MB)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 10],
+                        help="S3 멀티파트 동시성")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("스토리지 백엔드 벤치마크")
+    print("=" * 72)
+
+    data = np.random.default_rng(42).bytes(args.size_mb * MB)
+    with tempfile.TemporaryDirectory() as tmp:
+        uris = [tmp, "memory://bench"]
+        if args.s3_uri:
+            uris.append(args.s3_uri)
+        for uri in uris:
+            bench_backend(uri, args, data)
+
+    if args.s3_uri:
+        bench_s3_transfer(args.s3_uri, data, args.chunk_sizes, args.concurrency,
+                          args.endpoint_url)
+
+    print("\n" + "=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3: ETL 변환 벤치마크
+
+기존 행 단위 구현(리스트 컴프리헨션, apply, str.split)과
+transforms.py의 벡터화 구현을 같은 데이터로 실행해 처리량(rows/sec)을 비교합니다.
+S3 없이 로컬에서 실행됩니다.
+
+사용법:
+    python scripts/1_etl_pipeline/benchmark_transforms.py
+    python scripts/1_etl_pipeline/benchmark_transforms.py --rows 1000000 10000000 --skip-baseline
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from transforms import (  # noqa: E402
+    CITIES, add_derived_columns, clean_customers, generate_customers
+)
+
+
+def baseline_generate(num_customers: int) -> pd.DataFrame:
+    """기존 etl_pipeline.py 방식 데이터 생성 (행 단위 루프)"""
+    np.random.seed(42)
+    customer_ids = list(range(1, num_customers + 1))
+    names = [f"Customer_{i}" for i in customer_ids]
+    ages = np.random.randint(18, 70, num_customers)
+    emails = [f"user{i}@example.com" for i in customer_ids]
+    cities = np.random.choice(CITIES, num_customers)
+    join_dates = [
+        datetime.now() - timedelta(days=np.random.randint(1, 365))
+        for _ in range(num_customers)
+    ]
+
+    num_issues = num_customers // 10
+    issue_indices = np.random.choice(num_customers, size=num_issues, replace=False)
+    null_idx, dup_idx, invalid_idx = np.split(
+        issue_indices, [num_issues // 3, 2 * num_issues // 3]
+    )
+    for idx in null_idx:
+        emails[idx] = None
+    for idx in dup_idx:
+        customer_ids[idx] = customer_ids[0]
+    for idx in invalid_idx:
+        emails[idx] = f"invalid_{idx}"
+
+    return pd.DataFrame({
+        'customer_id': customer_ids,
+        'name': names,
+        'age': ages,
+        'email': emails,
+        'city': cities,
+        'join_date': join_dates
+    })
+
+
+def baseline_transform(df: pd.DataFrame) -> pd.DataFrame:
+    """기존 etl_pipeline.py 방식 정제 + 파생 컬럼 (순차 필터, apply)"""
+    def age_to_group(age):
+        if age < 30:
+            return '20-29'
+        elif age < 40:
+            return '30-39'
+        elif age < 50:
+            return '40-49'
+        elif age < 60:
+            return '50-59'
+        else:
+            return '60+'
+
+    df = df[df['email'].notna()]
+    df = df.drop_duplicates(subset=['customer_id'])
+    df = df[df['email'].str.contains('@', na=False)].copy()
+    df['email_domain'] = df['email'].str.split('@').str[1]
+    df['age_group'] = df['age'].apply(age_to_group)
+    return df
+
+
+def vectorized_transform(df: pd.DataFrame) -> pd.DataFrame:
+    """transforms.py 정제 + 파생 컬럼"""
+    df_clean, _ = clean_customers(df)
+    return add_derived_columns(df_clean)
+
+
+def timed(func, *args):
+    """함수 실행 시간 측정 (결과, 초)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def report(label: str, rows: int, seconds: float, memory_mb: float):
+    """벤치마크 한 줄 출력"""
+    print(f"  {label:<24} {seconds:>9.3f}s {rows / seconds:>14,.0f} rows/s {memory_mb:>10.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ETL 변환 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--skip-baseline", action="store_true",
+                        help="행 단위 기존 구현 생략 (대용량에서 수 분 소요)")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("ETL 변환 벤치마크")
+    print("=" * 72)
+
+    for rows in args.rows:
+        print(f"\n📊 {rows:,} rows")
+
+        df_raw, seconds = timed(generate_customers, rows)
+        report("generate (vectorized)", rows, seconds,
+               df_raw.memory_usage(deep=True).sum() / 1e6)
+
+        df_out, seconds = timed(vectorized_transform, df_raw)
+        report("transform (vectorized)", rows, seconds,
+               df_out.memory_usage(deep=True).sum() / 1e6)
+
+        if args.skip_baseline:
+            continue
+
+        df_base_raw, seconds = timed(baseline_generate, rows)
+        report("generate (row loop)", rows, seconds,
+               df_base_raw.memory_usage(deep=True).sum() / 1e6)
+
+        df_base, seconds = timed(baseline_transform, df_raw)
+        report("transform (apply)", rows, seconds,
+               df_base.memory_usage(deep=True).sum() / 1e6)
+
+        # 두 구현의 결과가 같은지 확인
+        pd.testing.assert_frame_equal(
+            df_out.astype({'email_domain': object, 'age_group': object}),
+            df_base,
+            check_dtype=False
+        )
+        print("  ✅ 결과 일치")
+
+    print("\n" + "=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
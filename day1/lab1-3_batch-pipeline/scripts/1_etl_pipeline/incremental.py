@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3: 증분 ETL (파티션 단위 Bronze → Silver)
+
+Bronze / Silver 데이터셋을 join_day(가입일)와 city로 Hive 스타일 파티셔닝하고
+처리한 파티션을 매니페스트(_manifest.json)에 기록합니다.
+다음 실행에서는 Bronze 파일 목록(경로/크기/수정 시각)이 바뀐 파티션만 다시 처리하므로
+매번 전체 이력을 덮어쓰지 않습니다.
+
+    bronze/join_day=2025-01-01/city=Seoul/batch-001.parquet
+    silver/join_day=2025-01-01/city=Seoul/part-00000.parquet
+    silver/_manifest.json      처리한 파티션별 Bronze 지문, 행 수, 품질 리포트
+    silver/_key_index.parquet  customer_id → 소유 파티션 (파티션 간 중복 판정)
+    silver/_common_metadata    파티션 컬럼 타입 (read_dataset이 join_day → date, city → category 복원)
+
+customer_id 중복은 전체 파티션에 걸쳐 판정합니다. 변경되지 않은 파티션이 가진 키는
+KeySet에 먼저 넣고, 변경된 파티션은 이름순으로 처리하며 먼저 적재된 키를 우선합니다.
+
+사용법:
+    # 첫 실행: 샘플 Bronze 배치 추가 후 전체 파티션 처리
+    python scripts/1_etl_pipeline/incremental.py --bronze data/bronze --silver data/silver \\
+        --generate 100000 --batch-id 001
+
+    # 새 배치 추가: 새 Bronze 파일이 들어간 파티션만 다시 처리
+    python scripts/1_etl_pipeline/incremental.py --bronze data/bronze --silver data/silver \\
+        --generate 1000 --batch-id 002 --start-id 100001
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from quality import CUSTOMER_RULES, DataQualityReport, DataQualityValidator, KeySet, Unique  # noqa: E402
+from storage import ObjectInfo, Storage, get_storage, join, write_partition_schema  # noqa: E402
+from transforms import add_derived_columns, generate_customers  # noqa: E402
+
+PARTITION_COLS = ['join_day', 'city']
+PARTITION_SCHEMA = pa.schema([
+    pa.field('join_day', pa.date32()),
+    pa.field('city', pa.dictionary(pa.int32(), pa.string())),
+])
+MANIFEST_FILE = "_manifest.json"
+KEY_INDEX_FILE = "_key_index.parquet"
+
+
+def partition_key(values: Dict[str, Any]) -> str:
+    """파티션 값 → 'join_day=2025-01-01/city=Seoul'"""
+    return "/".join(f"{col}={values[col]}" for col in PARTITION_COLS)
+
+
+def parse_partition_key(key: str) -> Dict[str, str]:
+    """'join_day=2025-01-01/city=Seoul' → {'join_day': ..., 'city': ...}"""
+    return dict(part.split("=", 1) for part in key.split("/"))
+
+
+def add_partition_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """join_date에서 join_day 파티션 컬럼 생성"""
+    df = df.copy()
+    df['join_day'] = pd.to_datetime(df['join_date']).dt.strftime('%Y-%m-%d')
+    return df
+
+
+def read_json(storage: Storage, path: str, default: Dict) -> Dict:
+    """JSON 파일 읽기 (없으면 default)"""
+    if not storage.exists(path):
+        return default
+    return json.loads(storage.read_bytes(path).decode("utf-8"))
+
+
+def write_json(storage: Storage, path: str, data: Dict):
+    """JSON 파일 쓰기"""
+    storage.write_bytes(path, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+
+
+def list_partition_files(storage: Storage, root: str) -> Dict[str, List[ObjectInfo]]:
+    """
+    데이터셋 루트 아래 Parquet 파일을 파티션별로 모으기
+
+    Returns:
+        {파티션 키: [ObjectInfo, ...]}
+    """
+    partitions: Dict[str, List[ObjectInfo]] = {}
+    for info in storage.list(root):
+        if not info.path.endswith(".parquet"):
+            continue
+        parts = info.path[len(root):].strip("/").split("/")[:-1]
+        if parts and all("=" in part for part in parts):
+            partitions.setdefault("/".join(parts), []).append(info)
+    return partitions
+
+
+def fingerprint(files: List[ObjectInfo]) -> str:
+    """파티션 파일 목록 지문 (경로/크기/수정 시각)"""
+    digest = hashlib.sha256()
+    for info in files:
+        digest.update(f"{os.path.basename(info.path)}:{info.size}:{info.mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def write_partition(storage: Storage, root: str, key: str, df: pd.DataFrame) -> str:
+    """
+    파티션 하나 덮어쓰기 (파티션 컬럼은 경로에만 저장)
+
+    Returns:
+        기록한 파일 경로
+    """
+    directory = join(root, key)
+    storage.delete_prefix(directory)
+    path = join(directory, "part-00000.parquet")
+    storage.write_parquet(df.drop(columns=PARTITION_COLS), path)
+    return path
+
+
+def append_bronze_batch(
+    bronze_uri: str,
+    df: pd.DataFrame,
+    batch_id: str,
+    endpoint_url: Optional[str] = None
+) -> int:
+    """
+    Bronze에 새 배치를 파티션별 파일로 추가
+
+    Args:
+        bronze_uri: Bronze 데이터셋 루트
+        df: 원본 고객 데이터
+        batch_id: 배치 식별자 (파일 이름)
+        endpoint_url: S3 호환 엔드포인트
+
+    Returns:
+        기록한 파일 수
+    """
+    storage, root = get_storage(bronze_uri, endpoint_url=endpoint_url)
+    df = add_partition_columns(df)
+    num_files = 0
+    for values, group in df.groupby(PARTITION_COLS, observed=True, sort=False):
+        directory = join(root, partition_key(dict(zip(PARTITION_COLS, values))))
+        storage.write_parquet(
+            group.drop(columns=PARTITION_COLS), join(directory, f"batch-{batch_id}.parquet")
+        )
+        num_files += 1
+    return num_files
+
+
+@dataclass
+class IncrementalETLResult:
+    """증분 ETL 실행 결과"""
+    processed: List[str] = field(default_factory=list)
+    skipped: int = 0
+    deleted: List[str] = field(default_factory=list)
+    report: DataQualityReport = field(
+        default_factory=lambda: DataQualityReport(total_rows=0, valid_rows=0)
+    )
+    elapsed_sec: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "processed": list(self.processed),
+            "skipped": self.skipped,
+            "deleted": list(self.deleted),
+            "report": self.report.to_dict(),
+            "elapsed_sec": self.elapsed_sec
+        }
+
+
+def run_incremental_etl(
+    bronze_uri: str,
+    silver_uri: str,
+    full_refresh: bool = False,
+    endpoint_url: Optional[str] = None
+) -> IncrementalETLResult:
+    """
+    변경된 Bronze 파티션만 Silver로 처리
+
+    Args:
+        bronze_uri: Bronze 데이터셋 루트 (join_day/city 파티션)
+        silver_uri: Silver 데이터셋 루트
+        full_refresh: True면 매니페스트를 무시하고 전체 파티션 재처리
+        endpoint_url: S3 호환 엔드포인트
+
+    Returns:
+        IncrementalETLResult
+    """
+    start = time.perf_counter()
+    bronze, bronze_root = get_storage(bronze_uri, endpoint_url=endpoint_url)
+    silver, silver_root = get_storage(silver_uri, endpoint_url=endpoint_url)
+    if full_refresh:
+        silver.delete_prefix(silver_root)
+
+    manifest_path = join(silver_root, MANIFEST_FILE)
+    key_index_path = join(silver_root, KEY_INDEX_FILE)
+    manifest = {} if full_refresh else read_json(silver, manifest_path, {})
+    done = manifest.get("partitions", {})
+
+    bronze_partitions = list_partition_files(bronze, bronze_root)
+    fingerprints = {key: fingerprint(files) for key, files in bronze_partitions.items()}
+    changed = sorted(key for key, fp in fingerprints.items() if done.get(key, {}).get("fingerprint") != fp)
+    deleted = sorted(set(done) - set(fingerprints))
+    result = IncrementalETLResult(skipped=len(fingerprints) - len(changed), deleted=deleted)
+
+    # 변경되지 않은 파티션이 가진 customer_id를 먼저 등록
+    key_set = KeySet()
+    touched = set(changed) | set(deleted)
+    key_index = pd.DataFrame({"customer_id": pd.Series(dtype="int64"), "partition": pd.Series(dtype="str")})
+    if not full_refresh and silver.exists(key_index_path):
+        key_index = silver.read_parquet(key_index_path)
+        key_index = key_index[~key_index["partition"].isin(touched)]
+        key_set.add(key_index["customer_id"].to_numpy())
+
+    rules = [
+        Unique(rule.column, name=rule.name, key_set=key_set) if isinstance(rule, Unique) else rule
+        for rule in CUSTOMER_RULES
+    ]
+    validator = DataQualityValidator(rules)
+
+    for key in deleted:
+        silver.delete_prefix(join(silver_root, key))
+        done.pop(key, None)
+
+    new_keys = [key_index]
+    for key in changed:
+        df_raw = pd.concat(
+            [bronze.read_parquet(info.path) for info in bronze_partitions[key]], ignore_index=True
+        )
+        for col, value in parse_partition_key(key).items():
+            df_raw[col] = value
+
+        valid, report = validator.validate(df_raw)
+        df_clean = add_derived_columns(df_raw[valid])
+        write_partition(silver, silver_root, key, df_clean)
+
+        new_keys.append(pd.DataFrame({"customer_id": df_clean["customer_id"].to_numpy(), "partition": key}))
+        done[key] = {
+            "fingerprint": fingerprints[key],
+            "rows": report.total_rows,
+            "valid_rows": report.valid_rows,
+            "violations": report.violations,
+            "processed_at": datetime.now().isoformat()
+        }
+        result.processed.append(key)
+        result.report = result.report.merge(report)
+
+    # 키 인덱스 → 매니페스트 순서로 저장 (매니페스트가 커밋 지점)
+    key_index = pd.concat(new_keys, ignore_index=True)
+    silver.write_parquet(key_index, key_index_path)
+    write_partition_schema(silver, silver_root, PARTITION_SCHEMA)
+
+    watermark = max(
+        (info.mtime_ns for files in bronze_partitions.values() for info in files), default=0
+    )
+    write_json(silver, manifest_path, {
+        "partition_cols": PARTITION_COLS,
+        "updated_at": datetime.now().isoformat(),
+        "bronze_watermark": pd.Timestamp(watermark, unit="ns").isoformat() if watermark else None,
+        "partitions": done
+    })
+
+    result.elapsed_sec = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="증분 ETL (파티션 단위 Bronze → Silver)")
+    parser.add_argument("--bronze", required=True, help="Bronze 루트 (로컬 또는 s3://)")
+    parser.add_argument("--silver", required=True, help="Silver 루트 (로컬 또는 s3://)")
+    parser.add_argument("--generate", type=int, default=0, help="새 Bronze 배치 N행 추가")
+    parser.add_argument("--batch-id", default=datetime.now().strftime("%Y%m%d%H%M%S"))
+    parser.add_argument("--start-id", type=int, default=1, help="새 배치의 첫 customer_id")
+    parser.add_argument("--full-refresh", action="store_true", help="전체 파티션 재처리")
+    parser.add_argument("--endpoint-url", default=None)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("증분 ETL (Bronze → Silver)")
+    print("=" * 60)
+
+    if args.generate:
+        df_new = generate_customers(args.generate, seed=args.start_id, start_id=args.start_id)
+        num_files = append_bronze_batch(args.bronze, df_new, args.batch_id, args.endpoint_url)
+        print(f"📝 Bronze 배치 {args.batch_id}: {len(df_new):,}행, {num_files}개 파티션 파일")
+
+    result = run_incremental_etl(
+        args.bronze, args.silver, full_refresh=args.full_refresh, endpoint_url=args.endpoint_url
+    )
+    report = result.report
+
+    print(f"\n🔄 처리 파티션: {len(result.processed)}개 (변경 없음: {result.skipped}개, "
+          f"삭제: {len(result.deleted)}개)")
+    print(f"📥 처리 행: {report.total_rows:,}행 → Silver {report.valid_rows:,}행")
+    for name, count in report.removed.items():
+        print(f"  ✅ {name} 제거: {count:,}행")
+    if report.total_rows:
+        print(f"\n데이터 품질 점수 (처리분): {report.quality_score:.1f}%")
+    print(f"처리 시간: {result.elapsed_sec:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
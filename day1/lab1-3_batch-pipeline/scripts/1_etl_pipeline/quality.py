@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3: 데이터 품질 규칙 엔진
+
+규칙을 선언적으로 정의하고, 모든 규칙을 벡터화된 불리언 마스크로 한 번씩만 평가한 뒤
+하나의 마스크로 합쳐 한 번만 필터링합니다. (단계별 DataFrame 복사 없음)
+
+- 규칙별 위반 건수 (violations): 해당 규칙을 통과하지 못한 행 수
+- 규칙별 제거 건수 (removed): 규칙 순서대로 적용했을 때 그 규칙에서 처음 걸린 행 수
+- 품질 점수: 통과 행 비율 (%)
+
+Null 값은 NotNull 규칙에서만 위반으로 집계하고, 다른 규칙은 Null을 통과로 봅니다.
+Unique 규칙은 앞선 규칙을 통과한 행 중에서 중복을 판정합니다.
+(Null 이메일 제거 → 중복 제거 → 형식 검사 순차 필터와 같은 결과)
+
+사용 예:
+    from quality import DataQualityValidator, CUSTOMER_RULES
+
+    validator = DataQualityValidator(CUSTOMER_RULES)
+    df_clean, report = validator.apply(df_raw)
+    print(report.quality_score, report.violations)
+
+    # 설정(dict)으로 정의
+    validator = DataQualityValidator.from_config([
+        {"rule": "not_null", "column": "email"},
+        {"rule": "in_range", "column": "age", "min_value": 0, "max_value": 120},
+    ])
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class Rule(ABC):
+    """데이터 품질 규칙 (True = 통과)"""
+    column: str
+    name: Optional[str] = None
+
+    rule_type = "rule"
+
+    def __post_init__(self):
+        if self.name is None:
+            self.name = f"{self.rule_type}:{self.column}"
+
+    @abstractmethod
+    def evaluate(self, df: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+        """
+        통과 여부 마스크 계산
+
+        Args:
+            df: 검사할 DataFrame
+            valid: 앞선 규칙을 모두 통과한 행 마스크
+
+        Returns:
+            통과 여부 불리언 배열
+        """
+
+
+@dataclass
+class NotNull(Rule):
+    """Null이 아니어야 함"""
+    rule_type = "not_null"
+
+    def evaluate(self, df: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+        return df[self.column].notna().to_numpy()
+
+
+class KeySet:
+    """
+    청크 간 중복 판정을 위한 압축 키 집합
+
+    - 0 이상 정수 키: 비트맵 (키 1개당 1비트)
+    - 그 외 키 (문자열, 음수, 큰 정수): 64비트 해시의 정렬 배열 (키 1개당 8바이트)
+    """
+
+    MAX_BITMAP_KEY = 2 ** 28  # 비트맵 최대 32MB
+
+    def __init__(self):
+        self._bitmap = np.zeros(0, dtype=np.uint8)
+        self._hashes: Optional[np.ndarray] = None  # None이면 비트맵 모드
+
+    def __len__(self) -> int:
+        if self._hashes is not None:
+            return len(self._hashes)
+        return int(np.unpackbits(self._bitmap).sum())
+
+    @property
+    def nbytes(self) -> int:
+        """키 집합 메모리 사용량 (bytes)"""
+        return self._bitmap.nbytes if self._hashes is None else self._hashes.nbytes
+
+    def add(self, keys: np.ndarray) -> np.ndarray:
+        """
+        키를 추가하고 중복 여부 반환
+
+        Args:
+            keys: 이번 청크의 키 배열
+
+        Returns:
+            이미 본 키(이전 청크 또는 같은 청크의 앞선 행)이면 True인 배열
+        """
+        keys = np.asarray(keys)
+        if len(keys) == 0:
+            return np.zeros(0, dtype=bool)
+
+        duplicated_in_chunk = pd.Series(keys).duplicated().to_numpy()
+
+        if self._hashes is None and self._fits_bitmap(keys):
+            keys = keys.astype(np.int64)
+            required = int(keys.max()) // 8 + 1
+            if required > len(self._bitmap):
+                grown = np.zeros(max(required, 2 * len(self._bitmap)), dtype=np.uint8)
+                grown[:len(self._bitmap)] = self._bitmap
+                self._bitmap = grown
+
+            byte_index = keys >> 3
+            bit = np.left_shift(1, keys & 7).astype(np.uint8)
+            seen_before = (self._bitmap[byte_index] & bit) != 0
+            np.bitwise_or.at(self._bitmap, byte_index, bit)
+            return seen_before | duplicated_in_chunk
+
+        if self._hashes is None:
+            self._switch_to_hashes()
+
+        hashes = pd.util.hash_array(keys)
+        position = np.searchsorted(self._hashes, hashes)
+        position[position == len(self._hashes)] = 0
+        seen_before = (
+            self._hashes[position] == hashes if len(self._hashes) else np.zeros(len(keys), bool)
+        )
+        self._hashes = np.union1d(self._hashes, hashes)
+        return seen_before | duplicated_in_chunk
+
+    def _fits_bitmap(self, keys: np.ndarray) -> bool:
+        return (
+            np.issubdtype(keys.dtype, np.integer)
+            and keys.min() >= 0
+            and keys.max() < self.MAX_BITMAP_KEY
+        )
+
+    def _switch_to_hashes(self):
+        """비트맵에 있던 키를 해시 배열로 옮김"""
+        existing = np.flatnonzero(np.unpackbits(self._bitmap, bitorder="little"))
+        self._hashes = np.unique(pd.util.hash_array(existing.astype(np.int64)))
+        self._bitmap = np.zeros(0, dtype=np.uint8)
+
+
+@dataclass
+class Unique(Rule):
+    """
+    앞선 규칙을 통과한 행 중에서 값이 유일해야 함 (첫 번째 행 유지)
+
+    key_set을 지정하면 이전 청크에서 본 키도 중복으로 판정합니다. (스트리밍 ETL)
+    """
+    key_set: Optional[KeySet] = field(default=None, repr=False, compare=False)
+
+    rule_type = "unique"
+
+    def evaluate(self, df: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+        passed = np.ones(len(df), dtype=bool)
+        if self.key_set is not None:
+            passed[valid] = ~self.key_set.add(df[self.column][valid].to_numpy())
+        else:
+            passed[valid] = ~df[self.column][valid].duplicated().to_numpy()
+        return passed
+
+
+@dataclass
+class Matches(Rule):
+    """문자열이 패턴을 포함해야 함 (regex=False면 단순 부분 문자열)"""
+    pattern: str = ""
+    regex: bool = True
+
+    rule_type = "matches"
+
+    def evaluate(self, df: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+        return df[self.column].str.contains(
+            self.pattern, regex=self.regex, na=True
+        ).to_numpy(dtype=bool)
+
+
+@dataclass
+class InRange(Rule):
+    """값이 [min_value, max_value] 범위 안에 있어야 함"""
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+    rule_type = "in_range"
+
+    def evaluate(self, df: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+        values = df[self.column]
+        passed = values.isna().to_numpy()
+        in_range = np.ones(len(df), dtype=bool)
+        if self.min_value is not None:
+            in_range &= (values >= self.min_value).to_numpy()
+        if self.max_value is not None:
+            in_range &= (values <= self.max_value).to_numpy()
+        return passed | in_range
+
+
+@dataclass
+class IsIn(Rule):
+    """값이 허용 목록에 있어야 함"""
+    values: Sequence[Any] = ()
+
+    rule_type = "is_in"
+
+    def evaluate(self, df: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+        column = df[self.column]
+        return (column.isna() | column.isin(self.values)).to_numpy()
+
+
+RULE_TYPES = {
+    rule.rule_type: rule for rule in [NotNull, Unique, Matches, InRange, IsIn]
+}
+
+# etl_pipeline.py 고객 데이터 규칙 (적용 순서 = 목록 순서)
+CUSTOMER_RULES = [
+    NotNull("email", name="null_emails"),
+    Unique("customer_id", name="duplicate_ids"),
+    Matches("email", pattern="@", regex=False, name="invalid_emails"),
+]
+
+
+@dataclass
+class DataQualityReport:
+    """데이터 품질 검증 결과"""
+    total_rows: int
+    valid_rows: int
+    violations: Dict[str, int] = field(default_factory=dict)
+    removed: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def removed_rows(self) -> int:
+        return self.total_rows - self.valid_rows
+
+    @property
+    def quality_score(self) -> float:
+        """통과 행 비율 (%)"""
+        if self.total_rows == 0:
+            return 100.0
+        return self.valid_rows / self.total_rows * 100
+
+    def merge(self, other: "DataQualityReport") -> "DataQualityReport":
+        """
+        다른 청크의 리포트와 합치기
+
+        Args:
+            other: 다른 청크의 품질 리포트
+
+        Returns:
+            합쳐진 품질 리포트
+        """
+        def add(a: Dict[str, int], b: Dict[str, int]) -> Dict[str, int]:
+            return {name: a.get(name, 0) + b.get(name, 0) for name in {**a, **b}}
+
+        return DataQualityReport(
+            total_rows=self.total_rows + other.total_rows,
+            valid_rows=self.valid_rows + other.valid_rows,
+            violations=add(self.violations, other.violations),
+            removed=add(self.removed, other.removed)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "total_rows": self.total_rows,
+            "valid_rows": self.valid_rows,
+            "removed_rows": self.removed_rows,
+            "quality_score": self.quality_score,
+            "violations": dict(self.violations),
+            "removed": dict(self.removed)
+        }
+
+
+class DataQualityValidator:
+    """
+    데이터 품질 규칙 엔진
+
+    규칙 순서대로 마스크를 계산해 누적 AND로 합치고, 마지막에 한 번만 필터링합니다.
+    """
+
+    def __init__(self, rules: List[Rule]):
+        """
+        Args:
+            rules: 적용 순서대로 나열한 규칙 목록
+        """
+        names = [rule.name for rule in rules]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rule names: {duplicates}")
+        self.rules = list(rules)
+
+    @classmethod
+    def from_config(cls, config: List[Dict[str, Any]]) -> "DataQualityValidator":
+        """
+        설정(dict 목록)으로 생성
+
+        Args:
+            config: [{"rule": "not_null", "column": "email", ...}, ...]
+
+        Returns:
+            DataQualityValidator
+        """
+        rules = []
+        for spec in config:
+            spec = dict(spec)
+            rule_type = spec.pop("rule")
+            if rule_type not in RULE_TYPES:
+                raise ValueError(
+                    f"Unknown rule type: {rule_type}. Available: {sorted(RULE_TYPES)}"
+                )
+            rules.append(RULE_TYPES[rule_type](**spec))
+        return cls(rules)
+
+    def validate(self, df: pd.DataFrame) -> Tuple[np.ndarray, DataQualityReport]:
+        """
+        모든 규칙 평가
+
+        Args:
+            df: 검사할 DataFrame
+
+        Returns:
+            (통과 행 마스크, 품질 리포트)
+        """
+        missing = sorted({rule.column for rule in self.rules} - set(df.columns))
+        if missing:
+            raise ValueError(f"Missing columns for quality rules: {missing}")
+
+        valid = np.ones(len(df), dtype=bool)
+        violations, removed = {}, {}
+        for rule in self.rules:
+            passed = rule.evaluate(df, valid)
+            violations[rule.name] = int(len(passed) - np.count_nonzero(passed))
+
+            newly_removed = valid & ~passed
+            removed[rule.name] = int(np.count_nonzero(newly_removed))
+            valid &= passed
+
+        report = DataQualityReport(
+            total_rows=len(df),
+            valid_rows=int(np.count_nonzero(valid)),
+            violations=violations,
+            removed=removed
+        )
+        return valid, report
+
+    def apply(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, DataQualityReport]:
+        """
+        규칙을 통과한 행만 남기기 (한 번만 필터링)
+
+        Args:
+            df: 정제할 DataFrame
+
+        Returns:
+            (정제된 DataFrame, 품질 리포트)
+        """
+        valid, report = self.validate(df)
+        return df[valid], report
+
+
+def validate_customers(df: pd.DataFrame) -> Tuple[pd.DataFrame, DataQualityReport]:
+    """
+    고객 데이터 품질 검증 및 정제 (편의 함수)
+
+    Args:
+        df: 원본 고객 DataFrame
+
+    Returns:
+        (정제된 DataFrame, 품질 리포트)
+    """
+    return DataQualityValidator(CUSTOMER_RULES).apply(df)
@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3: 스토리지 추상화 (로컬 / 인메모리 / S3)
+
+ETL·Batch 스크립트가 boto3/awswrangler에 직접 묶이지 않도록
+같은 인터페이스의 스토리지 백엔드를 제공합니다.
+
+- LocalStorage:  로컬 파일 시스템 (file:// 또는 일반 경로)
+- MemoryStorage: 프로세스 내 인메모리 객체 저장소 (memory://, AWS 없이 테스트/벤치마크)
+- S3Storage:     boto3 클라이언트 1개를 공유(커넥션 풀)하고, 큰 객체는
+                 TransferConfig로 멀티파트 업로드/다운로드를 병렬 실행
+                 AWS_ENDPOINT_URL로 MinIO / moto_server 같은 로컬 S3도 사용 가능
+
+경로는 모두 스토리지 루트 기준 키('/' 구분)입니다.
+
+사용 예:
+    storage, root = get_storage("s3://mlops-training-user01")   # 또는 "data", "memory://lab"
+    write_dataset(storage, df, f"{root}/processed/customers_cleaned")
+    df = read_dataset(storage, f"{root}/processed/customers_cleaned")
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+MB = 1024 * 1024
+
+# Hive 파티션 컬럼 타입 (Parquet 스키마 전용 파일, Spark / pyarrow 데이터셋과 같은 이름)
+PARTITION_SCHEMA_FILE = "_common_metadata"
+
+
+@dataclass
+class ObjectInfo:
+    """스토리지 객체 정보"""
+    path: str
+    size: int
+    mtime_ns: int
+
+
+class Storage(ABC):
+    """스토리지 백엔드 공통 인터페이스"""
+
+    @abstractmethod
+    def list(self, prefix: str) -> List[ObjectInfo]:
+        """prefix 아래 모든 객체 (이름순)"""
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        """객체 존재 여부"""
+
+    @abstractmethod
+    def delete(self, path: str):
+        """객체 삭제 (없으면 무시)"""
+
+    @abstractmethod
+    def open_input(self, path: str):
+        """읽기용 seek 가능한 바이너리 파일 객체"""
+
+    @abstractmethod
+    def open_output(self, path: str):
+        """쓰기용 바이너리 파일 객체 (close 시점에 저장 완료)"""
+
+    def delete_prefix(self, prefix: str):
+        """prefix 아래 객체 모두 삭제"""
+        for info in self.list(prefix):
+            self.delete(info.path)
+
+    def read_bytes(self, path: str) -> bytes:
+        with self.open_input(path) as f:
+            return f.read()
+
+    def write_bytes(self, path: str, data: bytes):
+        with self.open_output(path) as f:
+            f.write(data)
+
+    def read_parquet(self, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Parquet 파일 하나 읽기"""
+        with self.open_input(path) as f:
+            return pq.read_table(f, columns=columns).to_pandas()
+
+    def write_parquet(self, df: pd.DataFrame, path: str, **kwargs):
+        """Parquet 파일 하나 쓰기"""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with self.open_output(path) as f:
+            pq.write_table(table, f, **kwargs)
+
+    def iter_parquet_batches(
+        self,
+        paths: List[str],
+        batch_size: int,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Parquet 파일들을 batch_size 행씩 읽기 (row group 단위, 한 청크만 메모리에 유지)"""
+        for path in paths:
+            with self.open_input(path) as f:
+                parquet_file = pq.ParquetFile(f)
+                for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+                    yield batch.to_pandas()
+
+
+class LocalStorage(Storage):
+    """로컬 파일 시스템 스토리지"""
+
+    def __init__(self, root: str = "."):
+        self.root = os.path.abspath(root)
+
+    def _full(self, path: str) -> str:
+        return os.path.join(self.root, path.lstrip("/"))
+
+    def list(self, prefix: str) -> List[ObjectInfo]:
+        base = self._full(prefix)
+        if os.path.isfile(base):
+            stat = os.stat(base)
+            return [ObjectInfo(prefix, stat.st_size, stat.st_mtime_ns)]
+
+        infos = []
+        for directory, _, files in os.walk(base):
+            for name in files:
+                full = os.path.join(directory, name)
+                stat = os.stat(full)
+                relative = os.path.relpath(full, self.root).replace(os.sep, "/")
+                infos.append(ObjectInfo(relative, stat.st_size, stat.st_mtime_ns))
+        return sorted(infos, key=lambda info: info.path)
+
+    def exists(self, path: str) -> bool:
+        return os.path.isfile(self._full(path))
+
+    def delete(self, path: str):
+        if os.path.isfile(self._full(path)):
+            os.remove(self._full(path))
+
+    def delete_prefix(self, prefix: str):
+        base = self._full(prefix)
+        if os.path.isdir(base):
+            shutil.rmtree(base)
+        elif os.path.isfile(base):
+            os.remove(base)
+
+    def open_input(self, path: str):
+        return open(self._full(path), "rb")
+
+    def open_output(self, path: str):
+        full = self._full(path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        return open(full, "wb")
+
+
+class _MemoryOutput(io.BytesIO):
+    """close 시점에 MemoryStorage에 저장되는 버퍼"""
+
+    def __init__(self, storage: "MemoryStorage", path: str):
+        super().__init__()
+        self._storage = storage
+        self._path = path
+
+    def close(self):
+        if not self.closed:
+            self._storage._put(self._path, self.getvalue())
+        super().close()
+
+
+class MemoryStorage(Storage):
+    """
+    프로세스 내 인메모리 객체 저장소 (로컬 S3 대체)
+
+    memory://<이름> 으로 얻은 인스턴스는 같은 프로세스 안에서 공유됩니다.
+    """
+
+    _instances: Dict[str, "MemoryStorage"] = {}
+
+    def __init__(self):
+        self._objects: Dict[str, Tuple[bytes, int]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def named(cls, name: str) -> "MemoryStorage":
+        """이름별 공유 인스턴스"""
+        if name not in cls._instances:
+            cls._instances[name] = cls()
+        return cls._instances[name]
+
+    def _put(self, path: str, data: bytes):
+        with self._lock:
+            self._objects[path.lstrip("/")] = (data, time.time_ns())
+
+    def list(self, prefix: str) -> List[ObjectInfo]:
+        prefix = prefix.strip("/")
+        with self._lock:
+            items = list(self._objects.items())
+        return sorted(
+            (ObjectInfo(path, len(data), mtime) for path, (data, mtime) in items
+             if path == prefix or path.startswith(prefix + "/") or not prefix),
+            key=lambda info: info.path
+        )
+
+    def exists(self, path: str) -> bool:
+        return path.lstrip("/") in self._objects
+
+    def delete(self, path: str):
+        with self._lock:
+            self._objects.pop(path.lstrip("/"), None)
+
+    def open_input(self, path: str):
+        try:
+            data, _ = self._objects[path.lstrip("/")]
+        except KeyError:
+            raise FileNotFoundError(f"Object not found: {path}") from None
+        return io.BytesIO(data)
+
+    def open_output(self, path: str):
+        return _MemoryOutput(self, path)
+
+
+class _S3RangeReader(io.RawIOBase):
+    """Range GET으로 읽는 seek 가능한 S3 객체 (Parquet footer / row group 단위 읽기용)"""
+
+    def __init__(self, client, bucket: str, key: str):
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._size = client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        else:
+            self._position = self._size + offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self._size:
+            return 0
+        end = min(self._position + len(buffer), self._size) - 1
+        response = self._client.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={self._position}-{end}"
+        )
+        data = response["Body"].read()
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+class _S3Output:
+    """로컬 임시 버퍼에 쓰고 close 시점에 멀티파트 업로드"""
+
+    def __init__(self, storage: "S3Storage", key: str):
+        self._storage = storage
+        self._key = key
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=storage.multipart_threshold)
+        self.closed = False
+
+    def write(self, data) -> int:
+        return self._buffer.write(data)
+
+    def tell(self) -> int:
+        return self._buffer.tell()
+
+    def flush(self):
+        self._buffer.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        self._buffer.seek(0)
+        self._storage.client.upload_fileobj(
+            self._buffer, self._storage.bucket, self._key, Config=self._storage.transfer_config
+        )
+        self._buffer.close()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._buffer.close()
+            self.closed = True
+
+
+class S3Storage(Storage):
+    """
+    S3 스토리지 (boto3)
+
+    클라이언트 하나를 모든 호출이 공유하므로 HTTP 커넥션이 풀에서 재사용되고,
+    multipart_threshold 이상의 객체는 multipart_chunksize 파트로 나눠
+    max_concurrency개 스레드가 동시에 업로드/다운로드합니다.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        max_pool_connections: int = 32,
+        multipart_threshold: int = 8 * MB,
+        multipart_chunksize: int = 8 * MB,
+        max_concurrency: int = 10,
+        read_buffer_size: int = 8 * MB
+    ):
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+
+        self.bucket = bucket
+        self.multipart_threshold = multipart_threshold
+        self.read_buffer_size = read_buffer_size
+        self.client = boto3.session.Session().client(
+            "s3",
+            endpoint_url=endpoint_url or os.getenv("AWS_ENDPOINT_URL"),
+            region_name=region or os.getenv("AWS_DEFAULT_REGION", "ap-northeast-2"),
+            config=Config(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 5, "mode": "adaptive"}
+            )
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=max_concurrency > 1
+        )
+
+    def list(self, prefix: str) -> List[ObjectInfo]:
+        prefix = prefix.strip("/")
+        paginator = self.client.get_paginator("list_objects_v2")
+        infos = []
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get("Contents", []):
+                key = item["Key"]
+                if prefix and key != prefix and not key.startswith(prefix + "/"):
+                    continue
+                mtime_ns = int(item["LastModified"].timestamp() * 1e9)
+                infos.append(ObjectInfo(key, item["Size"], mtime_ns))
+        return sorted(infos, key=lambda info: info.path)
+
+    def exists(self, path: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=path.lstrip("/"))
+            return True
+        except ClientError:
+            return False
+
+    def delete(self, path: str):
+        self.client.delete_object(Bucket=self.bucket, Key=path.lstrip("/"))
+
+    def delete_prefix(self, prefix: str):
+        keys = [{"Key": info.path} for info in self.list(prefix)]
+        for start in range(0, len(keys), 1000):  # delete_objects 최대 1000개
+            self.client.delete_objects(
+                Bucket=self.bucket, Delete={"Objects": keys[start:start + 1000], "Quiet": True}
+            )
+
+    def read_bytes(self, path: str) -> bytes:
+        buffer = io.BytesIO()
+        self.client.download_fileobj(
+            self.bucket, path.lstrip("/"), buffer, Config=self.transfer_config
+        )
+        return buffer.getvalue()
+
+    def open_input(self, path: str):
+        raw = _S3RangeReader(self.client, self.bucket, path.lstrip("/"))
+        return io.BufferedReader(raw, buffer_size=self.read_buffer_size)
+
+    def open_output(self, path: str):
+        return _S3Output(self, path.lstrip("/"))
+
+
+def get_storage(uri: str, **kwargs) -> Tuple[Storage, str]:
+    """
+    URI에 맞는 스토리지와 루트 경로 반환
+
+    Args:
+        uri: s3://bucket/prefix, memory://name/prefix, file:///path 또는 로컬 경로
+        **kwargs: S3Storage 옵션 (endpoint_url, max_concurrency 등)
+
+    Returns:
+        (스토리지, 스토리지 내부 경로)
+    """
+    if uri.startswith("s3://"):
+        bucket, _, prefix = uri[len("s3://"):].partition("/")
+        return S3Storage(bucket, **kwargs), prefix.strip("/")
+    if uri.startswith("memory://"):
+        name, _, prefix = uri[len("memory://"):].partition("/")
+        return MemoryStorage.named(name), prefix.strip("/")
+    if uri.startswith("file://"):
+        uri = uri[len("file://"):]
+    return LocalStorage("/"), os.path.abspath(uri).lstrip("/")
+
+
+def join(*parts: str) -> str:
+    """키 경로 결합"""
+    return "/".join(part.strip("/") for part in parts if part and part.strip("/"))
+
+
+def parquet_files(storage: Storage, prefix: str) -> List[ObjectInfo]:
+    """데이터셋 prefix 아래 Parquet 파일 ('_'나 '.'로 시작하는 메타데이터 파일 제외)"""
+    return [
+        info for info in storage.list(prefix)
+        if info.path.endswith(".parquet")
+        and not any(part.startswith(("_", ".")) for part in info.path[len(prefix):].split("/"))
+    ]
+
+
+def write_dataset(
+    storage: Storage,
+    df: pd.DataFrame,
+    prefix: str,
+    partition_cols: Optional[List[str]] = None,
+    mode: str = "overwrite"
+) -> List[str]:
+    """
+    DataFrame을 Parquet 데이터셋으로 쓰기 (awswrangler dataset=True와 같은 레이아웃)
+
+    파티션 컬럼은 경로에만 저장되므로 컬럼 타입을 _common_metadata에 함께 기록합니다.
+
+    Args:
+        storage: 스토리지
+        df: 저장할 데이터
+        prefix: 데이터셋 경로
+        partition_cols: Hive 스타일 파티션 컬럼 (예: ['join_day'] → join_day=.../)
+        mode: 'overwrite'(기존 데이터셋 삭제) 또는 'append'
+
+    Returns:
+        기록한 파일 경로 목록
+    """
+    if mode not in ("overwrite", "append"):
+        raise ValueError(f"Unsupported mode: {mode}")
+    if mode == "overwrite":
+        storage.delete_prefix(prefix)
+
+    name = f"part-{time.time_ns():x}.parquet"
+    if not partition_cols:
+        path = join(prefix, name)
+        storage.write_parquet(df, path)
+        return [path]
+
+    write_partition_schema(
+        storage, prefix, pa.Schema.from_pandas(df[partition_cols], preserve_index=False)
+    )
+
+    written = []
+    for values, group in df.groupby(partition_cols, observed=True, sort=False):
+        values = values if isinstance(values, tuple) else (values,)
+        directory = join(prefix, *(f"{col}={value}" for col, value in zip(partition_cols, values)))
+        path = join(directory, name)
+        storage.write_parquet(group.drop(columns=partition_cols), path)
+        written.append(path)
+    return written
+
+
+def write_partition_schema(storage: Storage, prefix: str, schema: pa.Schema):
+    """파티션 컬럼 스키마를 데이터셋 루트의 _common_metadata에 기록"""
+    with storage.open_output(join(prefix, PARTITION_SCHEMA_FILE)) as f:
+        pq.write_metadata(schema, f)
+
+
+def read_partition_schema(storage: Storage, prefix: str) -> Optional[pa.Schema]:
+    """write_dataset이 기록한 파티션 컬럼 스키마 (없으면 None)"""
+    path = join(prefix, PARTITION_SCHEMA_FILE)
+    if not storage.exists(path):
+        return None
+    with storage.open_input(path) as f:
+        return pq.read_schema(f)
+
+
+def read_dataset(
+    storage: Storage,
+    prefix: str,
+    columns: Optional[List[str]] = None,
+    partition_schema: Optional[pa.Schema] = None
+) -> pd.DataFrame:
+    """
+    Parquet 데이터셋 읽기 (Hive 파티션 경로의 값은 컬럼으로 복원)
+
+    파티션 컬럼은 partition_schema(기본: _common_metadata)의 타입으로 변환하고,
+    스키마에 없는 컬럼은 문자열로 둡니다.
+
+    Args:
+        storage: 스토리지
+        prefix: 데이터셋 경로
+        columns: 읽을 컬럼 (파티션 컬럼 제외)
+        partition_schema: 파티션 컬럼 타입 (예: pa.schema([("join_day", pa.date32())]))
+
+    Returns:
+        DataFrame
+    """
+    files = parquet_files(storage, prefix)
+    if not files:
+        raise FileNotFoundError(f"No parquet files under {prefix}")
+
+    frames = []
+    for info in files:
+        df = storage.read_parquet(info.path, columns=columns)
+        relative = info.path[len(prefix):].strip("/").split("/")[:-1]
+        for part in relative:
+            if "=" in part:
+                col, value = part.split("=", 1)
+                df[col] = value
+        frames.append(df)
+    df = pd.concat(frames, ignore_index=True)
+
+    if partition_schema is None:
+        partition_schema = read_partition_schema(storage, prefix)
+    if partition_schema is not None:
+        typed = [
+            field for field in partition_schema
+            if field.name in df.columns
+            and not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type))
+        ]
+        if typed:
+            table = pa.table({
+                field.name: pa.array(df[field.name].to_numpy(dtype=object), pa.string()).cast(field.type)
+                for field in typed
+            })
+            for name, column in table.to_pandas().items():
+                df[name] = column
+    return df
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3: 스트리밍 ETL (Bronze → Silver, 청크 단위)
+
+Bronze 데이터셋 전체를 하나의 DataFrame으로 읽지 않고
+Parquet 파일의 row group을 batch_size 행씩 읽어 정제/변환한 뒤
+Silver 데이터셋에 청크마다 바로 씁니다. 메모리 사용량은 청크 크기에 비례합니다.
+
+- 청크 간 customer_id 중복은 quality.KeySet(비트맵/해시 배열)으로 판정
+- Silver 출력은 ParquetWriter로 row group 단위 기록, max_rows_per_file마다 새 파일
+- storage.py 백엔드 사용: 로컬 경로, memory://, s3:// (AWS_ENDPOINT_URL로 MinIO 등 로컬 S3)
+
+사용법:
+    # 로컬 파일 시스템 (AWS 불필요, --generate로 Bronze 샘플 생성)
+    python scripts/1_etl_pipeline/streaming_etl.py \\
+        --bronze data/raw/customers_raw --silver data/processed/customers_cleaned \\
+        --generate 10000000 --batch-size 500000
+
+    # S3 (또는 AWS_ENDPOINT_URL=http://localhost:9000 로컬 S3)
+    python scripts/1_etl_pipeline/streaming_etl.py \\
+        --bronze s3://mlops-training-user01/raw/customers_raw/ \\
+        --silver s3://mlops-training-user01/processed/customers_cleaned/
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from quality import (  # noqa: E402
+    CUSTOMER_RULES, DataQualityReport, DataQualityValidator, KeySet, Rule, Unique
+)
+from storage import Storage, get_storage, parquet_files  # noqa: E402
+from transforms import add_derived_columns, generate_customers  # noqa: E402
+
+
+class ParquetDatasetWriter:
+    """
+    청크 단위 Parquet 데이터셋 기록기
+
+    청크마다 row group을 추가하고 max_rows_per_file을 넘으면 다음 part 파일로 넘어갑니다.
+    스키마는 첫 청크에서 정하며, categorical 컬럼은 청크마다 카테고리 수가 달라도
+    같은 스키마가 되도록 dictionary<int32> 인덱스로 통일합니다.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        path: str,
+        max_rows_per_file: int = 1_000_000,
+        compression: str = "snappy"
+    ):
+        self.storage = storage
+        self.path = path
+        self.max_rows_per_file = max_rows_per_file
+        self.compression = compression
+        self.files: List[str] = []
+        self.rows_written = 0
+        self._schema: Optional[pa.Schema] = None
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._stream = None
+        self._rows_in_file = 0
+
+    def write(self, df: pd.DataFrame):
+        """청크 기록"""
+        if df.empty:
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._schema is None:
+            self._schema = self._normalize_schema(table.schema)
+        table = table.cast(self._schema)
+
+        if self._writer is None or self._rows_in_file >= self.max_rows_per_file:
+            self._open_next_file()
+        self._writer.write_table(table)
+        self._rows_in_file += table.num_rows
+        self.rows_written += table.num_rows
+
+    def close(self) -> List[str]:
+        """
+        현재 파일 닫기
+
+        Returns:
+            기록한 파일 목록
+        """
+        self._close_file()
+        return self.files
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _normalize_schema(schema: pa.Schema) -> pa.Schema:
+        fields = [
+            pa.field(f.name, pa.dictionary(pa.int32(), f.type.value_type), f.nullable)
+            if pa.types.is_dictionary(f.type) else f
+            for f in schema
+        ]
+        return pa.schema(fields, metadata=schema.metadata)
+
+    def _open_next_file(self):
+        self._close_file()
+        file_path = f"{self.path}/part-{len(self.files):05d}.parquet"
+        self._stream = self.storage.open_output(file_path)
+        self._writer = pq.ParquetWriter(self._stream, self._schema, compression=self.compression)
+        self._rows_in_file = 0
+        self.files.append(file_path)
+
+    def _close_file(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._stream.close()
+            self._writer, self._stream = None, None
+
+
+@dataclass
+class StreamingETLResult:
+    """스트리밍 ETL 실행 결과"""
+    report: DataQualityReport
+    files: List[str] = field(default_factory=list)
+    num_chunks: int = 0
+    elapsed_sec: float = 0.0
+    key_set_bytes: int = 0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.report.total_rows / self.elapsed_sec if self.elapsed_sec else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            **self.report.to_dict(),
+            "files": list(self.files),
+            "num_chunks": self.num_chunks,
+            "elapsed_sec": self.elapsed_sec,
+            "rows_per_sec": self.rows_per_sec,
+            "key_set_bytes": self.key_set_bytes
+        }
+
+
+def run_streaming_etl(
+    bronze_uri: str,
+    silver_uri: str,
+    batch_size: int = 100_000,
+    max_rows_per_file: int = 1_000_000,
+    rules: Optional[List[Rule]] = None,
+    transform: Callable[[pd.DataFrame], pd.DataFrame] = add_derived_columns,
+    endpoint_url: Optional[str] = None
+) -> StreamingETLResult:
+    """
+    Bronze → Silver 스트리밍 ETL
+
+    Args:
+        bronze_uri: Bronze 데이터셋 경로 (로컬 또는 s3://)
+        silver_uri: Silver 데이터셋 경로 (기존 Parquet 파일은 삭제 후 기록)
+        batch_size: 청크당 행 수
+        max_rows_per_file: Silver part 파일당 최대 행 수
+        rules: 품질 규칙 (기본: CUSTOMER_RULES). Unique 규칙은 청크 간 KeySet을 사용
+        transform: 정제된 청크에 적용할 변환 (기본: add_derived_columns)
+        endpoint_url: S3 호환 엔드포인트
+
+    Returns:
+        StreamingETLResult
+    """
+    start = time.perf_counter()
+    key_sets = []
+
+    def with_key_set(rule: Rule) -> Rule:
+        if isinstance(rule, Unique):
+            key_sets.append(KeySet())
+            return dataclasses.replace(rule, key_set=key_sets[-1])
+        return rule
+
+    validator = DataQualityValidator([with_key_set(r) for r in (rules or CUSTOMER_RULES)])
+
+    bronze, bronze_path = get_storage(bronze_uri, endpoint_url=endpoint_url)
+    silver, silver_path = get_storage(silver_uri, endpoint_url=endpoint_url)
+    files = [info.path for info in parquet_files(bronze, bronze_path)]
+    if not files:
+        raise FileNotFoundError(f"Dataset not found: {bronze_uri}")
+    silver.delete_prefix(silver_path)
+
+    report = DataQualityReport(total_rows=0, valid_rows=0)
+    num_chunks = 0
+    with ParquetDatasetWriter(silver, silver_path, max_rows_per_file) as writer:
+        for chunk in bronze.iter_parquet_batches(files, batch_size):
+            valid, chunk_report = validator.validate(chunk)
+            writer.write(transform(chunk[valid]))
+            report = report.merge(chunk_report)
+            num_chunks += 1
+
+    return StreamingETLResult(
+        report=report,
+        files=writer.files,
+        num_chunks=num_chunks,
+        elapsed_sec=time.perf_counter() - start,
+        key_set_bytes=sum(key_set.nbytes for key_set in key_sets)
+    )
+
+
+def write_sample_bronze(
+    bronze_uri: str,
+    num_customers: int,
+    batch_size: int = 1_000_000,
+    endpoint_url: Optional[str] = None
+) -> List[str]:
+    """
+    Bronze 샘플 데이터를 청크 단위로 생성/기록 (품질 이슈 10% 포함)
+
+    Args:
+        bronze_uri: Bronze 데이터셋 경로
+        num_customers: 전체 고객 수
+        batch_size: 생성 청크 크기
+        endpoint_url: S3 호환 엔드포인트
+
+    Returns:
+        기록한 파일 목록
+    """
+    storage, path = get_storage(bronze_uri, endpoint_url=endpoint_url)
+    storage.delete_prefix(path)
+    with ParquetDatasetWriter(storage, path, max_rows_per_file=batch_size) as writer:
+        for offset in range(0, num_customers, batch_size):
+            size = min(batch_size, num_customers - offset)
+            writer.write(generate_customers(size, seed=42 + offset, start_id=offset + 1))
+    return writer.files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 ETL (Bronze → Silver)")
+    parser.add_argument("--bronze", required=True, help="Bronze 경로 (로컬 또는 s3://)")
+    parser.add_argument("--silver", required=True, help="Silver 경로 (로컬 또는 s3://)")
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--max-rows-per-file", type=int, default=1_000_000)
+    parser.add_argument("--generate", type=int, default=0,
+                        help="Bronze 샘플 데이터를 N행 생성한 뒤 실행")
+    parser.add_argument("--endpoint-url", default=None,
+                        help="S3 호환 엔드포인트 (기본: AWS_ENDPOINT_URL)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("스트리밍 ETL (Bronze → Silver)")
+    print("=" * 60)
+
+    if args.generate:
+        files = write_sample_bronze(args.bronze, args.generate, endpoint_url=args.endpoint_url)
+        print(f"📝 Bronze 샘플 생성: {args.generate:,}행, {len(files)}개 파일")
+
+    result = run_streaming_etl(
+        args.bronze, args.silver,
+        batch_size=args.batch_size,
+        max_rows_per_file=args.max_rows_per_file,
+        endpoint_url=args.endpoint_url
+    )
+    report = result.report
+
+    print(f"\n📥 처리: {report.total_rows:,}행 ({result.num_chunks}개 청크)")
+    for name, count in report.removed.items():
+        print(f"  ✅ {name} 제거: {count:,}행")
+    print(f"💾 Silver 기록: {report.valid_rows:,}행, {len(result.files)}개 파일")
+    print(f"\n데이터 품질 점수: {report.quality_score:.1f}%")
+    print(f"처리 시간: {result.elapsed_sec:.2f}s ({result.rows_per_sec:,.0f} rows/s)")
+    print(f"중복 판정 키 집합: {result.key_set_bytes / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
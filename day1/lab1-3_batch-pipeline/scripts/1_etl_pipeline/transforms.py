@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3: ETL 변환 모듈 (벡터화)
+
+etl_pipeline.py의 샘플 데이터 생성 / 정제 / 파생 컬럼 계산을
+행 단위 Python 루프(apply, 리스트 컴프리헨션) 없이 NumPy/pandas 벡터 연산으로 수행합니다.
+
+- generate_customers: NumPy 난수 배열로 고객 데이터 생성 (품질 이슈 포함)
+- count_quality_issues: Null / 중복 / 잘못된 이메일 개수
+- clean_customers: 단계별 제거 건수를 유지하면서 하나의 마스크로 정제
+- add_derived_columns: pd.cut 나이대, 정규식 이메일 도메인 (categorical dtype)
+
+사용 예:
+    from transforms import generate_customers, clean_customers, add_derived_columns
+
+    df_raw = generate_customers(1_000_000)
+    df_clean, removed = clean_customers(df_raw)
+    df_clean = add_derived_columns(df_clean)
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from quality import CUSTOMER_RULES, DataQualityValidator, validate_customers
+
+CITIES = ['Seoul', 'Busan', 'Incheon', 'Daegu']
+
+# 나이대 구간: [-inf, 30) → '20-29', [30, 40) → '30-39', ..., [60, inf) → '60+'
+AGE_BINS = [-np.inf, 30, 40, 50, 60, np.inf]
+AGE_GROUP_LABELS = ['20-29', '30-39', '40-49', '50-59', '60+']
+
+# 첫 번째 '@' 뒤부터 다음 '@' 전까지 (str.split('@').str[1]과 동일)
+EMAIL_DOMAIN_PATTERN = r'@([^@]*)'
+
+
+def generate_customers(
+    num_customers: int = 1000,
+    issue_rate: float = 0.1,
+    seed: int = 42,
+    now: Optional[datetime] = None,
+    start_id: int = 1
+) -> pd.DataFrame:
+    """
+    샘플 고객 데이터 생성
+
+    전체의 issue_rate 만큼 행을 골라 1/3씩 Null 이메일, 중복 customer_id,
+    '@' 없는 이메일로 바꿉니다. (1000명 → 33 / 33 / 34개)
+
+    Args:
+        num_customers: 고객 수
+        issue_rate: 품질 이슈 비율
+        seed: 난수 시드
+        now: 가입일 기준 시각 (기본: 현재 시각)
+        start_id: 첫 customer_id (청크 단위 생성 시 사용)
+
+    Returns:
+        customer_id, name, age, email, city, join_date 컬럼 DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    now = pd.Timestamp(now or datetime.now())
+
+    customer_ids = np.arange(start_id, start_id + num_customers, dtype=np.int64)
+    id_strings = customer_ids.astype(str).astype(object)
+
+    names = 'Customer_' + id_strings
+    emails = 'user' + id_strings + '@example.com'
+    ages = rng.integers(18, 70, num_customers)
+    cities = pd.Categorical.from_codes(
+        rng.integers(0, len(CITIES), num_customers), categories=CITIES
+    )
+    # 가입일 (최근 1년 내)
+    join_dates = now - pd.to_timedelta(rng.integers(1, 365, num_customers), unit='D')
+
+    # ⚠️ 의도적으로 데이터 품질 이슈 추가
+    num_issues = int(num_customers * issue_rate)
+    issue_indices = rng.choice(num_customers, size=num_issues, replace=False)
+    null_idx, dup_idx, invalid_idx = np.split(
+        issue_indices, [num_issues // 3, 2 * num_issues // 3]
+    )
+
+    emails[null_idx] = None                                     # 1. Null 값
+    customer_ids[dup_idx] = customer_ids[0]                     # 2. 중복 (첫 번째 ID)
+    emails[invalid_idx] = 'invalid_' + invalid_idx.astype(str).astype(object)  # 3. 잘못된 형식
+
+    return pd.DataFrame({
+        'customer_id': customer_ids,
+        'name': names,
+        'age': ages,
+        'email': emails,
+        'city': cities,
+        'join_date': join_dates
+    })
+
+
+def count_quality_issues(df: pd.DataFrame) -> Dict[str, int]:
+    """
+    품질 이슈 개수 계산 (quality.CUSTOMER_RULES 규칙별 위반 건수)
+
+    Args:
+        df: 원본 고객 DataFrame
+
+    Returns:
+        {'null_emails', 'duplicate_ids', 'invalid_emails'}
+    """
+    _, report = DataQualityValidator(CUSTOMER_RULES).validate(df)
+    return report.violations
+
+
+def clean_customers(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    고객 데이터 정제
+
+    Null 이메일 제거 → customer_id 중복 제거 → '@' 없는 이메일 제거를
+    quality.DataQualityValidator로 하나의 마스크로 계산해 한 번만 필터링합니다.
+
+    Args:
+        df: 원본 고객 DataFrame
+
+    Returns:
+        (정제된 DataFrame, 단계별 제거 행 수)
+    """
+    df_clean, report = validate_customers(df)
+    return df_clean, report.removed
+
+
+def add_age_group(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    나이대 컬럼 추가 (pd.cut, categorical)
+
+    Args:
+        df: age 컬럼을 가진 DataFrame
+
+    Returns:
+        age_group 컬럼이 추가된 DataFrame
+    """
+    df['age_group'] = pd.cut(
+        df['age'], bins=AGE_BINS, labels=AGE_GROUP_LABELS, right=False
+    )
+    return df
+
+
+def extract_email_domain(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    이메일 도메인 컬럼 추가 (정규식 추출, categorical)
+
+    Args:
+        df: email 컬럼을 가진 DataFrame
+
+    Returns:
+        email_domain 컬럼이 추가된 DataFrame
+    """
+    df['email_domain'] = (
+        df['email'].str.extract(EMAIL_DOMAIN_PATTERN, expand=False).astype('category')
+    )
+    return df
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    파생 컬럼(email_domain, age_group) 추가
+
+    Args:
+        df: 정제된 고객 DataFrame
+
+    Returns:
+        파생 컬럼이 추가된 DataFrame (복사본)
+    """
+    df = df.copy()
+    extract_email_domain(df)
+    add_age_group(df)
+    return df
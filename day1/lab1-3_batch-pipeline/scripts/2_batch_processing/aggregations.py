@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3 Part 2: 단일 스캔 다중 집계 엔진
+
+여러 group-by(도시, 나이대, 이메일 도메인)와 전체 통계를 데이터를 한 번 훑으면서 계산합니다.
+각 그룹 컬럼은 categorical 코드(정수)로 바꾼 뒤 np.bincount로 count / sum / sum_sq를,
+ufunc.at으로 min / max를 구하므로 groupby를 컬럼마다 따로 실행하지 않습니다.
+
+결과는 병합 가능한 부분 집계(PartialAggregate)이므로 청크 단위 입력이나
+파티션별 증분 처리에서도 그대로 합칠 수 있습니다.
+
+사용 예:
+    aggregator = MultiAggregator(['city', 'age_group', 'email_domain'], value_column='age')
+
+    partial = aggregator.aggregate(chunks)          # 청크 iterator 또는 DataFrame
+    tables = build_gold_tables(partial)              # city_analysis, age_analysis, ...
+    tables = add_metadata(tables, source=silver_path)
+    write_gold_tables(tables, write)                 # 테이블별 경로에 동시 기록
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+ALL = '__all__'
+PARTIAL_COLUMNS = ['dimension', 'value', 'count', 'sum', 'sum_sq', 'min', 'max']
+
+# Gold 테이블 이름 → 그룹 컬럼
+GOLD_TABLES = {
+    'city_analysis': 'city',
+    'age_analysis': 'age_group',
+    'domain_analysis': 'email_domain',
+}
+
+
+class PartialAggregate:
+    """
+    병합 가능한 부분 집계
+
+    (dimension, value)별 count / sum / sum_sq / min / max를 가진 long-format 테이블입니다.
+    dimension이 '__all__'인 행은 전체 통계입니다.
+    """
+
+    def __init__(self, frame: Optional[pd.DataFrame] = None):
+        self.frame = frame if frame is not None else pd.DataFrame(columns=PARTIAL_COLUMNS)
+
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        """
+        다른 부분 집계와 합치기
+
+        Args:
+            other: 다른 청크/파티션의 부분 집계
+
+        Returns:
+            합쳐진 부분 집계
+        """
+        return merge_partials([self, other])
+
+    def group(self, dimension: str) -> pd.DataFrame:
+        """그룹 컬럼 하나의 집계 (value 인덱스)"""
+        rows = self.frame[self.frame['dimension'] == dimension]
+        return rows.set_index('value')[PARTIAL_COLUMNS[2:]]
+
+    @property
+    def total_count(self) -> int:
+        rows = self.frame[self.frame['dimension'] == ALL]
+        return int(rows['count'].sum())
+
+    def to_frame(self) -> pd.DataFrame:
+        """저장용 DataFrame"""
+        return self.frame.reset_index(drop=True)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "PartialAggregate":
+        """저장된 DataFrame에서 복원"""
+        missing = set(PARTIAL_COLUMNS) - set(frame.columns)
+        if missing:
+            raise ValueError(f"Missing partial aggregate columns: {sorted(missing)}")
+        return cls(frame[PARTIAL_COLUMNS])
+
+
+def merge_partials(partials: Iterable[PartialAggregate]) -> PartialAggregate:
+    """
+    부분 집계 여러 개 병합 (count/sum/sum_sq 합계, min/max)
+
+    Args:
+        partials: 부분 집계 목록
+
+    Returns:
+        병합된 부분 집계
+    """
+    frames = [p.frame for p in partials if len(p.frame)]
+    if not frames:
+        return PartialAggregate()
+    merged = (
+        pd.concat(frames, ignore_index=True)
+        .groupby(['dimension', 'value'], sort=False)
+        .agg(count=('count', 'sum'), sum=('sum', 'sum'), sum_sq=('sum_sq', 'sum'),
+             min=('min', 'min'), max=('max', 'max'))
+        .reset_index()
+    )
+    return PartialAggregate(merged)
+
+
+class MultiAggregator:
+    """
+    단일 스캔 다중 group-by 집계기
+    """
+
+    def __init__(self, group_by: List[str], value_column: str = 'age'):
+        """
+        Args:
+            group_by: 그룹 컬럼 목록
+            value_column: 통계를 계산할 숫자 컬럼
+        """
+        self.group_by = list(group_by)
+        self.value_column = value_column
+
+    def partial(self, df: pd.DataFrame) -> PartialAggregate:
+        """
+        DataFrame 하나(청크)의 부분 집계
+
+        Args:
+            df: 입력 데이터
+
+        Returns:
+            PartialAggregate
+        """
+        missing = sorted(set(self.group_by + [self.value_column]) - set(df.columns))
+        if missing:
+            raise ValueError(f"Missing columns for aggregation: {missing}")
+
+        values = df[self.value_column].to_numpy(dtype=np.float64)
+        present = ~np.isnan(values)
+        if not present.all():
+            values = values[present]
+        squares = values * values
+
+        count = len(values)
+        frames = [pd.DataFrame({
+            'dimension': [ALL],
+            'value': [''],
+            'count': [count],
+            'sum': [values.sum()],
+            'sum_sq': [squares.sum()],
+            'min': [values.min() if count else np.inf],
+            'max': [values.max() if count else -np.inf]
+        })]
+        for column in self.group_by:
+            codes, labels = self._codes(df[column])
+            if not present.all():
+                codes = codes[present]
+            frames.append(self._summarize(column, codes, labels, values, squares))
+        return PartialAggregate(pd.concat(frames, ignore_index=True))
+
+    def aggregate(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> PartialAggregate:
+        """
+        DataFrame 또는 청크 iterator 전체 집계
+
+        Args:
+            data: DataFrame 또는 DataFrame iterator (예: read_parquet(chunked=...))
+
+        Returns:
+            병합된 PartialAggregate
+        """
+        if isinstance(data, pd.DataFrame):
+            return self.partial(data)
+
+        result = PartialAggregate()
+        for chunk in data:
+            result = result.merge(self.partial(chunk))
+        return result
+
+    @staticmethod
+    def _codes(column: pd.Series):
+        """그룹 컬럼 → (정수 코드, 레이블). categorical이면 기존 코드 사용, Null은 -1"""
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return column.cat.codes.to_numpy(dtype=np.int64), column.cat.categories.astype(str)
+        codes, labels = pd.factorize(column, sort=False)
+        return codes.astype(np.int64), pd.Index(labels).astype(str)
+
+    @staticmethod
+    def _summarize(dimension, codes, labels, values, squares) -> pd.DataFrame:
+        if len(codes) and codes.min() < 0:  # Null 그룹 제외
+            valid = codes >= 0
+            codes, values, squares = codes[valid], values[valid], squares[valid]
+        size = len(labels)
+
+        count = np.bincount(codes, minlength=size)
+        sums = np.bincount(codes, weights=values, minlength=size)
+        sum_sq = np.bincount(codes, weights=squares, minlength=size)
+        mins = np.full(size, np.inf)
+        maxs = np.full(size, -np.inf)
+        np.minimum.at(mins, codes, values)
+        np.maximum.at(maxs, codes, values)
+
+        observed = count > 0
+        return pd.DataFrame({
+            'dimension': dimension,
+            'value': np.asarray(labels, dtype=object)[observed],
+            'count': count[observed].astype(np.int64),
+            'sum': sums[observed],
+            'sum_sq': sum_sq[observed],
+            'min': mins[observed],
+            'max': maxs[observed]
+        })
+
+
+def build_gold_tables(
+    partial: PartialAggregate,
+    top_k: Optional[Dict[str, int]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    부분 집계 → Gold 테이블 (pandas_batch_job.py 출력과 같은 형태)
+
+    Args:
+        partial: 전체 데이터의 부분 집계
+        top_k: 테이블별 상위 N개 제한 (기본: domain_analysis Top 5)
+
+    Returns:
+        {'city_analysis', 'age_analysis', 'domain_analysis', 'statistics'}
+    """
+    top_k = {'domain_analysis': 5} if top_k is None else top_k
+
+    tables = {}
+    for name, column in GOLD_TABLES.items():
+        group = partial.group(column)
+        table = pd.DataFrame({column: group.index.astype(str), 'count': group['count'].to_numpy()})
+        if column == 'age_group':
+            table = table.sort_values(column)
+        else:
+            table = table.sort_values(['count', column], ascending=[False, True])
+        if name in top_k:
+            table = table.head(top_k[name])
+        tables[name] = table.reset_index(drop=True)
+
+    total = partial.group(ALL)
+    count = int(total['count'].sum())
+    tables['statistics'] = pd.DataFrame({
+        'avg_age': [float(total['sum'].sum()) / count if count else 0.0],
+        # age는 정수 컬럼이므로 원본 df['age'].max()와 같은 int64로 기록
+        'max_age': np.array([total['max'].max() if count else 0], dtype=np.int64),
+        'total_customers': [count]
+    })
+    return tables
+
+
+def add_metadata(
+    tables: Dict[str, pd.DataFrame],
+    source: str,
+    processed_at: Optional[datetime] = None,
+    **extra
+) -> Dict[str, pd.DataFrame]:
+    """
+    Gold 테이블에 metadata 테이블 추가 (processed_at, total_rows, source)
+
+    Args:
+        tables: build_gold_tables 결과
+        source: 입력 데이터 경로
+        processed_at: 처리 시각 (기본: 현재)
+        **extra: 추가 메타데이터 컬럼 (예: partitions_updated)
+
+    Returns:
+        metadata가 추가된 테이블 딕셔너리
+    """
+    metadata = {
+        'processed_at': [processed_at or datetime.now()],
+        'total_rows': [int(tables['statistics']['total_customers'].iloc[0])],
+        'source': [source]
+    }
+    metadata.update({key: [value] for key, value in extra.items()})
+    return {**tables, 'metadata': pd.DataFrame(metadata)}
+
+
+def write_gold_tables(
+    tables: Dict[str, pd.DataFrame],
+    write: Callable[[str, pd.DataFrame], object],
+    max_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Gold 테이블을 테이블별 경로에 동시에 기록
+
+    테이블마다 스키마와 경로(city_analysis/, age_analysis/, ...)는 그대로 두고
+    스토리지 왕복만 스레드 풀로 겹쳐서 실행합니다.
+
+    Args:
+        tables: 테이블 이름 → DataFrame
+        write: write(테이블 이름, DataFrame) 기록 함수
+        max_workers: 동시 기록 수 (기본: 테이블 수)
+
+    Returns:
+        기록한 테이블 이름 목록 (입력 순서)
+    """
+    names = list(tables)
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(names), 1)) as pool:
+        futures = [pool.submit(write, name, tables[name]) for name in names]
+        for future in futures:
+            future.result()
+    return names
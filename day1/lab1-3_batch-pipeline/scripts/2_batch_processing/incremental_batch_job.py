@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Lab 1-3 Part 2: 증분 Batch 집계 (파티션별 부분 집계 병합)
+
+incremental.py가 만든 파티션 Silver 데이터셋에서 바뀐 파티션만 다시 읽어
+파티션별 부분 집계(partial)를 갱신하고, Gold 결과는 부분 집계를 합쳐서 만듭니다.
+전체 Silver 이력을 매번 다시 집계하지 않습니다.
+
+    gold/_partials/join_day=.../city=.../part-00000.parquet  파티션별 부분 집계
+    gold/_manifest.json                                   부분 집계에 반영된 Silver 파티션 버전
+    gold/city_analysis/, age_analysis/, domain_analysis/, statistics/, metadata/
+
+부분 집계는 aggregations.MultiAggregator가 만드는 (dimension, value)별
+count / sum / sum_sq / min / max이며 합계와 최솟값/최댓값으로 병합됩니다.
+
+사용법:
+    python scripts/2_batch_processing/incremental_batch_job.py --silver data/silver --gold data/gold
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "1_etl_pipeline"))
+
+from incremental import (  # noqa: E402
+    MANIFEST_FILE, parse_partition_key, read_json, write_json
+)
+from storage import Storage, get_storage, join  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from aggregations import (  # noqa: E402
+    MultiAggregator, PartialAggregate, add_metadata, build_gold_tables, merge_partials,
+    write_gold_tables
+)
+
+PARTIALS_DIR = "_partials"
+
+
+def write_table(storage: Storage, directory: str, df: pd.DataFrame):
+    """작은 Gold 테이블을 단일 파일로 덮어쓰기"""
+    storage.delete_prefix(directory)
+    storage.write_parquet(df, join(directory, "part-00000.parquet"))
+
+
+def run_incremental_batch_job(
+    silver_uri: str,
+    gold_uri: str,
+    full_refresh: bool = False,
+    endpoint_url: Optional[str] = None
+) -> Dict:
+    """
+    바뀐 Silver 파티션만 다시 집계하고 Gold 결과 갱신
+
+    Args:
+        silver_uri: 파티션 Silver 루트 (incremental.py 출력)
+        gold_uri: Gold 루트
+        full_refresh: True면 모든 파티션 부분 집계 재계산
+        endpoint_url: S3 호환 엔드포인트
+
+    Returns:
+        실행 요약 딕셔너리
+    """
+    start = time.perf_counter()
+    silver, silver_root = get_storage(silver_uri, endpoint_url=endpoint_url)
+    gold, gold_root = get_storage(gold_uri, endpoint_url=endpoint_url)
+
+    silver_manifest = read_json(silver, join(silver_root, MANIFEST_FILE), {})
+    silver_partitions = silver_manifest.get("partitions", {})
+    if not silver_partitions:
+        raise FileNotFoundError(f"No partition manifest under {silver_uri}. Run incremental.py first")
+
+    gold_manifest_path = join(gold_root, MANIFEST_FILE)
+    gold_manifest = {} if full_refresh else read_json(gold, gold_manifest_path, {})
+    done = gold_manifest.get("partitions", {})
+
+    # Silver 파티션 버전 = 처리 시각 + Bronze 지문
+    versions = {
+        key: f"{entry['fingerprint']}@{entry['processed_at']}"
+        for key, entry in silver_partitions.items()
+    }
+    changed = sorted(key for key, version in versions.items() if done.get(key) != version)
+    deleted = sorted(set(done) - set(versions))
+
+    aggregator = MultiAggregator(['city', 'age_group', 'email_domain'], value_column='age')
+    partials_root = join(gold_root, PARTIALS_DIR)
+    for key in deleted:
+        gold.delete_prefix(join(partials_root, key))
+        done.pop(key)
+
+    for key in changed:
+        df = silver.read_parquet(join(silver_root, key, "part-00000.parquet"))
+        for col, value in parse_partition_key(key).items():
+            df[col] = value
+        write_table(gold, join(partials_root, key), aggregator.partial(df).to_frame())
+        done[key] = versions[key]
+
+    # 부분 집계 병합 (파티션당 수십 행이므로 전체 Silver 재집계보다 훨씬 작음)
+    merged = merge_partials(
+        PartialAggregate.from_frame(gold.read_parquet(join(partials_root, key, "part-00000.parquet")))
+        for key in sorted(done)
+    )
+    tables = add_metadata(
+        build_gold_tables(merged), source=silver_uri, partitions_updated=len(changed)
+    )
+    write_gold_tables(tables, lambda name, table: write_table(gold, join(gold_root, name), table))
+
+    write_json(gold, gold_manifest_path, {
+        "updated_at": datetime.now().isoformat(),
+        "partitions": done
+    })
+
+    return {
+        "updated": changed,
+        "deleted": deleted,
+        "skipped": len(versions) - len(changed),
+        "tables": tables,
+        "elapsed_sec": time.perf_counter() - start
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="증분 Batch 집계 (Silver → Gold)")
+    parser.add_argument("--silver", required=True, help="파티션 Silver 루트 (로컬 또는 s3://)")
+    parser.add_argument("--gold", required=True, help="Gold 루트 (로컬 또는 s3://)")
+    parser.add_argument("--full-refresh", action="store_true", help="모든 부분 집계 재계산")
+    parser.add_argument("--endpoint-url", default=None)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("증분 BATCH 집계 (Silver → Gold)")
+    print("=" * 60)
+
+    result = run_incremental_batch_job(
+        args.silver, args.gold, full_refresh=args.full_refresh, endpoint_url=args.endpoint_url
+    )
+    tables = result["tables"]
+
+    print(f"\n🔄 부분 집계 갱신: {len(result['updated'])}개 파티션 "
+          f"(변경 없음: {result['skipped']}개, 삭제: {len(result['deleted'])}개)")
+    print("\n1️⃣  도시별 고객 수:")
+    print(tables['city_analysis'].to_string(index=False))
+    print("\n2️⃣  나이대별 분포:")
+    print(tables['age_analysis'].to_string(index=False))
+    print("\n3️⃣  이메일 도메인 Top 5:")
+    print(tables['domain_analysis'].to_string(index=False))
+    print("\n4️⃣  통계 요약:")
+    print(tables['statistics'].to_string(index=False))
+    print(f"\n처리 시간: {result['elapsed_sec']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,13 +8,23 @@ Silver Layer 데이터를 Pandas로 집계하여 Gold Layer에 저장
 2. 여러 기준으로 데이터 집계 (도시, 나이대, 이메일 도메인)
 3. 통계 계산 (평균, 최대값 등)
 4. 결과를 Gold Layer에 Parquet로 저장
+
+집계는 aggregations.MultiAggregator로 데이터를 한 번만 훑어 계산하고,
+CHUNK_ROWS를 지정하면 Silver 데이터를 청크 단위로 읽어 부분 집계를 병합합니다.
+Gold 테이블은 테이블별 경로(city_analysis/, age_analysis/, ...)에 동시에 기록합니다.
+저장소는 etl_pipeline.py와 같은 STORAGE_URI(기본: s3://mlops-training-user{USER_NUM})를 사용합니다.
 """
 
 import os
-import pandas as pd
-import awswrangler as wr
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "1_etl_pipeline"))
+
+from aggregations import MultiAggregator, add_metadata, build_gold_tables, write_gold_tables
+from storage import get_storage, join, parquet_files, read_dataset, write_dataset
+
 print("=" * 60)
 print("BATCH 데이터 처리 (Pandas)")
 print("=" * 60)
@@ -27,33 +37,48 @@ print("=" * 60)
 USER_NUM = os.getenv('USER_NUM', '01')
 BUCKET_NAME = f"mlops-training-user{USER_NUM}"
 AWS_REGION = os.getenv('AWS_DEFAULT_REGION', 'ap-northeast-2')
+STORAGE_URI = os.getenv('STORAGE_URI', f"s3://{BUCKET_NAME}")
+CHUNK_ROWS = int(os.getenv('CHUNK_ROWS', '0'))  # 0이면 한 번에 읽기
+
+storage, root = get_storage(STORAGE_URI, region=AWS_REGION)
 
 print(f"\n사용자: {USER_NUM}")
-print(f"버킷: {BUCKET_NAME}")
+print(f"저장소: {STORAGE_URI}")
 print(f"리전: {AWS_REGION}")
 
 # ============================================================
 # Silver Layer 데이터 읽기
 # ============================================================
 
-silver_path = f"s3://{BUCKET_NAME}/processed/customers_cleaned/"
+silver_path = f"{STORAGE_URI.rstrip('/')}/processed/customers_cleaned/"
+silver_key = join(root, "processed/customers_cleaned")
 print(f"\n{'=' * 60}")
 print(f"Silver Layer 데이터 읽기")
 print(f"{'=' * 60}")
 print(f"경로: {silver_path}")
 
 try:
-    # AWS Wrangler로 Parquet 읽기
-    df = wr.s3.read_parquet(silver_path)
-    print(f"✅ {len(df)}행 로드 완료")
-    print(f"\n스키마:")
-    print(df.dtypes)
+    # Parquet 읽기 (CHUNK_ROWS > 0이면 row group 단위 청크 iterator)
+    aggregator = MultiAggregator(['city', 'age_group', 'email_domain'], value_column='age')
+    if CHUNK_ROWS > 0:
+        files = [info.path for info in parquet_files(storage, silver_key)]
+        if not files:
+            raise FileNotFoundError(f"No parquet files under {silver_path}")
+        chunks = storage.iter_parquet_batches(files, CHUNK_ROWS)
+        partial = aggregator.aggregate(chunks)
+        print(f"✅ {partial.total_count}행 청크 단위 집계 완료 (청크당 {CHUNK_ROWS}행)")
+    else:
+        df = read_dataset(storage, silver_key)
+        print(f"✅ {len(df)}행 로드 완료")
+        print(f"\n스키마:")
+        print(df.dtypes)
+        partial = aggregator.partial(df)
     
 except Exception as e:
     print(f"❌ 데이터 읽기 실패: {e}")
     print(f"\n가능한 원인:")
     print(f"  1. Silver Layer 데이터가 없음 (Part 1을 먼저 실행하세요)")
-    print(f"  2. S3 권한 문제")
+    print(f"  2. S3 권한 문제 (또는 STORAGE_URI 설정 확인)")
     print(f"  3. 경로 오류")
     exit(1)
 
@@ -65,98 +90,51 @@ print("\n" + "=" * 60)
 print("데이터 분석")
 print("=" * 60)
 
+# 도시 / 나이대 / 이메일 도메인 / 전체 통계를 한 번의 스캔으로 집계
+tables = build_gold_tables(partial, top_k={'domain_analysis': 5})
+city_counts = tables['city_analysis']
+age_group_counts = tables['age_analysis']
+domain_counts = tables['domain_analysis']
+stats = tables['statistics']
+
 # 1. 도시별 고객 수 집계
 print("\n1️⃣  도시별 고객 수:")
-city_counts = df.groupby('city').size().reset_index(name='count')
-city_counts = city_counts.sort_values('count', ascending=False)
 print(city_counts.to_string(index=False))
 
 # 2. 나이대별 분포
 print("\n2️⃣  나이대별 분포:")
-age_group_counts = df.groupby('age_group').size().reset_index(name='count')
-age_group_counts = age_group_counts.sort_values('age_group')
 print(age_group_counts.to_string(index=False))
 
 # 3. 이메일 도메인별 분포 (Top 5)
 print("\n3️⃣  이메일 도메인 Top 5:")
-domain_counts = df.groupby('email_domain').size().reset_index(name='count')
-domain_counts = domain_counts.sort_values('count', ascending=False).head(5)
 print(domain_counts.to_string(index=False))
 
 # 4. 통계 요약
 print("\n4️⃣  통계 요약:")
-stats = pd.DataFrame({
-    'avg_age': [df['age'].mean()],
-    'max_age': [df['age'].max()],
-    'total_customers': [len(df)]
-})
 print(stats.to_string(index=False))
 
 # ============================================================
 # Gold Layer에 결과 저장
 # ============================================================
 
-gold_path = f"s3://{BUCKET_NAME}/curated/analysis/"
+gold_path = f"{STORAGE_URI.rstrip('/')}/curated/analysis/"
 print("\n" + "=" * 60)
 print(f"Gold Layer에 결과 저장")
 print(f"{'=' * 60}")
 print(f"경로: {gold_path}")
 
 try:
-    # 1) 도시별 분석 저장
-    city_output = gold_path + "city_analysis/"
-    wr.s3.to_parquet(
-        df=city_counts,
-        path=city_output,
-        dataset=True,
-        mode='overwrite'
-    )
-    print(f"✅ 도시별 분석 저장: {city_output}")
-    
-    # 2) 나이대별 분석 저장
-    age_output = gold_path + "age_analysis/"
-    wr.s3.to_parquet(
-        df=age_group_counts,
-        path=age_output,
-        dataset=True,
-        mode='overwrite'
+    # 테이블별 경로/스키마는 그대로 두고 기록만 동시에 실행
+    # city_analysis/, age_analysis/, domain_analysis/, statistics/, metadata/
+    gold_tables = add_metadata(tables, source=silver_path, processed_at=datetime.now())
+    written = write_gold_tables(
+        gold_tables,
+        lambda name, table: write_dataset(
+            storage, table, join(root, "curated/analysis", name), mode='overwrite'
+        )
     )
-    print(f"✅ 나이대별 분석 저장: {age_output}")
-    
-    # 3) 도메인별 분석 저장
-    domain_output = gold_path + "domain_analysis/"
-    wr.s3.to_parquet(
-        df=domain_counts,
-        path=domain_output,
-        dataset=True,
-        mode='overwrite'
-    )
-    print(f"✅ 도메인별 분석 저장: {domain_output}")
-    
-    # 4) 통계 요약 저장
-    stats_output = gold_path + "statistics/"
-    wr.s3.to_parquet(
-        df=stats,
-        path=stats_output,
-        dataset=True,
-        mode='overwrite'
-    )
-    print(f"✅ 통계 요약 저장: {stats_output}")
-    
-    # 5) 메타데이터 저장
-    metadata = pd.DataFrame({
-        'processed_at': [datetime.now()],
-        'total_rows': [len(df)],
-        'source': [silver_path]
-    })
-    metadata_output = gold_path + "metadata/"
-    wr.s3.to_parquet(
-        df=metadata,
-        path=metadata_output,
-        dataset=True,
-        mode='overwrite'
-    )
-    print(f"✅ 메타데이터 저장: {metadata_output}")
+    for table_name in written:
+        print(f"✅ {table_name} 저장: {gold_path}{table_name}/")
     
 except Exception as e:
     print(f"❌ 저장 실패: {e}")
@@ -171,8 +149,9 @@ print("✅ BATCH 데이터 처리 완료!")
 print("=" * 60)
 
 print(f"\n결과 위치: {gold_path}")
-print(f"\nS3에서 확인:")
-print(f"  aws s3 ls s3://{BUCKET_NAME}/curated/analysis/ --recursive")
+if STORAGE_URI.startswith('s3://'):
+    print(f"\nS3에서 확인:")
+    print(f"  aws s3 ls {gold_path} --recursive")
 
 print(f"\n처리된 데이터:")
 print(f"  - 도시별 분석: {len(city_counts)}개 도시")
@@ -180,6 +159,10 @@ print(f"  - 나이대별 분석: {len(age_group_counts)}개 그룹")
 print(f"  - 도메인별 분석: Top {len(domain_counts)}")
 print(f"  - 통계: 평균 나이 {stats['avg_age'].values[0]:.1f}세")
 
+print(f"\nGold 테이블 읽기 예:")
+print(f"  storage, root = get_storage('{STORAGE_URI}')")
+print(f"  read_dataset(storage, join(root, 'curated/analysis/city_analysis'))")
+
 print(f"\n다음 단계:")
 print(f"  - Jupyter Notebook에서 시각화:")
 print(f"    notebooks/batch_pipeline.ipynb 수행")
@@ -0,0 +1,31 @@
+"""
+Pytest configuration and shared fixtures
+"""
+
+import os
+import sys
+import uuid
+from datetime import datetime
+
+import pytest
+
+# Add script directories to path for imports
+LAB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(LAB_DIR, "scripts", "1_etl_pipeline"))
+sys.path.insert(0, os.path.join(LAB_DIR, "scripts", "2_batch_processing"))
+
+from transforms import generate_customers  # noqa: E402
+
+FIXED_NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def raw_customers():
+    """품질 이슈(10%)가 포함된 고객 데이터 (가입일 기준 시각 고정)"""
+    return generate_customers(1000, issue_rate=0.1, seed=42, now=FIXED_NOW)
+
+
+@pytest.fixture
+def memory_uri():
+    """테스트별 인메모리 스토리지 URI (memory://<고유 이름>)"""
+    return f"memory://test-{uuid.uuid4().hex}"
@@ -0,0 +1,211 @@
+"""
+Test cases for incremental ETL
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from tests.conftest import FIXED_NOW
+from incremental import (
+    KEY_INDEX_FILE,
+    MANIFEST_FILE,
+    PARTITION_COLS,
+    add_partition_columns,
+    append_bronze_batch,
+    parse_partition_key,
+    partition_key,
+    run_incremental_etl
+)
+from storage import get_storage, join, read_dataset
+from transforms import generate_customers
+
+
+def customers(num, start_id=1, seed=0, issue_rate=0.0):
+    """가입일 기준 시각을 고정한 고객 데이터"""
+    return generate_customers(num, issue_rate=issue_rate, seed=seed, now=FIXED_NOW, start_id=start_id)
+
+
+def partitions_of(df):
+    """DataFrame이 들어갈 파티션 키 목록"""
+    values = add_partition_columns(df)[PARTITION_COLS].drop_duplicates()
+    return sorted(partition_key(row) for row in values.to_dict("records"))
+
+
+@pytest.fixture
+def lake(memory_uri):
+    """(bronze URI, silver URI, 스토리지, 루트)"""
+    storage, root = get_storage(memory_uri)
+    return f"{memory_uri}/bronze", f"{memory_uri}/silver", storage, root
+
+
+def read_manifest(storage, root):
+    return json.loads(storage.read_bytes(join(root, "silver", MANIFEST_FILE)))
+
+
+class TestPartitionKey:
+    """파티션 키 변환 테스트"""
+
+    def test_round_trip(self):
+        """파티션 값 ↔ 키"""
+        key = partition_key({"join_day": "2024-01-02", "city": "Seoul"})
+
+        assert key == "join_day=2024-01-02/city=Seoul"
+        assert parse_partition_key(key) == {"join_day": "2024-01-02", "city": "Seoul"}
+
+
+class TestRunIncrementalETL:
+    """매니페스트 기반 증분 처리 테스트"""
+
+    def test_first_run_processes_all(self, lake):
+        """첫 실행은 모든 파티션 처리, 품질 규칙 적용"""
+        bronze, silver, storage, root = lake
+        df = customers(120, issue_rate=0.1)
+        append_bronze_batch(bronze, df, "001")
+
+        result = run_incremental_etl(bronze, silver)
+        manifest = read_manifest(storage, root)
+
+        assert result.processed == partitions_of(df)
+        assert result.skipped == 0
+        assert sorted(manifest["partitions"]) == result.processed
+        assert manifest["partition_cols"] == PARTITION_COLS
+        assert result.report.total_rows == 120
+        assert len(read_dataset(storage, join(root, "silver"))) == result.report.valid_rows
+
+    def test_unchanged_skipped(self, lake):
+        """Bronze가 바뀌지 않으면 다시 처리하지 않음"""
+        bronze, silver, storage, root = lake
+        append_bronze_batch(bronze, customers(80), "001")
+        first = run_incremental_etl(bronze, silver)
+        written = {info.path: info.mtime_ns for info in storage.list(join(root, "silver"))
+                   if "part-" in info.path}
+
+        second = run_incremental_etl(bronze, silver)
+
+        assert second.processed == []
+        assert second.skipped == len(first.processed)
+        assert second.report.total_rows == 0
+        assert {info.path: info.mtime_ns for info in storage.list(join(root, "silver"))
+                if "part-" in info.path} == written
+
+    def test_new_batch_processes_changed_only(self, lake):
+        """새 배치가 들어간 파티션만 다시 처리"""
+        bronze, silver, storage, root = lake
+        append_bronze_batch(bronze, customers(80), "001")
+        first = run_incremental_etl(bronze, silver)
+
+        df_new = customers(20, start_id=1001, seed=5)
+        append_bronze_batch(bronze, df_new, "002")
+        second = run_incremental_etl(bronze, silver)
+
+        assert second.processed == partitions_of(df_new)
+        assert second.skipped == len(set(first.processed) | set(partitions_of(df_new))) - len(second.processed)
+        silver_ids = set(read_dataset(storage, join(root, "silver"))["customer_id"])
+        assert silver_ids == set(range(1, 81)) | set(range(1001, 1021))
+
+    def test_watermark(self, lake):
+        """매니페스트에 Bronze 최신 수정 시각 기록"""
+        bronze, silver, storage, root = lake
+        append_bronze_batch(bronze, customers(50), "001")
+        run_incremental_etl(bronze, silver)
+
+        bronze_storage, bronze_root = get_storage(bronze)
+        latest = max(info.mtime_ns for info in bronze_storage.list(bronze_root))
+        manifest = read_manifest(storage, root)
+        assert pd.Timestamp(manifest["bronze_watermark"]) == pd.Timestamp(latest, unit="ns")
+
+    def test_deleted_partition(self, lake):
+        """Bronze에서 사라진 파티션은 Silver / 매니페스트에서 삭제"""
+        bronze, silver, storage, root = lake
+        append_bronze_batch(bronze, customers(100), "001")
+        first = run_incremental_etl(bronze, silver)
+
+        removed = first.processed[0]
+        bronze_storage, bronze_root = get_storage(bronze)
+        bronze_storage.delete_prefix(join(bronze_root, removed))
+        second = run_incremental_etl(bronze, silver)
+
+        assert second.deleted == [removed]
+        assert second.processed == []
+        assert removed not in read_manifest(storage, root)["partitions"]
+        assert storage.list(join(root, "silver", removed)) == []
+
+    def test_partition_dtypes(self, lake):
+        """Silver를 read_dataset으로 읽으면 join_day는 날짜, city는 category"""
+        bronze, silver, storage, root = lake
+        df = customers(40)
+        append_bronze_batch(bronze, df, "001")
+        run_incremental_etl(bronze, silver)
+
+        actual = read_dataset(storage, join(root, "silver")).sort_values("customer_id", ignore_index=True)
+        assert isinstance(actual["city"].dtype, pd.CategoricalDtype)
+        assert actual["join_day"].tolist() == df["join_date"].dt.date.tolist()
+        assert actual["city"].astype(str).tolist() == df["city"].astype(str).tolist()
+
+    def test_full_refresh(self, lake):
+        """full_refresh는 매니페스트를 무시하고 전체 재처리"""
+        bronze, silver, storage, root = lake
+        append_bronze_batch(bronze, customers(100), "001")
+        first = run_incremental_etl(bronze, silver)
+        result = run_incremental_etl(bronze, silver, full_refresh=True)
+
+        assert result.processed == first.processed
+        assert result.skipped == 0
+
+
+class TestCrossPartitionKeyIndex:
+    """파티션 간 customer_id 중복 판정 (_key_index) 테스트"""
+
+    def test_duplicate_in_other_partition(self, lake):
+        """변경되지 않은 파티션이 가진 키는 새 파티션에서 중복으로 제거"""
+        bronze, silver, storage, root = lake
+        append_bronze_batch(bronze, customers(80), "001")
+        run_incremental_etl(bronze, silver)
+
+        # 같은 customer_id, 다른 가입일/도시 → 다른 파티션
+        df_dup = customers(30, start_id=1, seed=99)
+        append_bronze_batch(bronze, df_dup, "002")
+        result = run_incremental_etl(bronze, silver)
+
+        silver_df = read_dataset(storage, join(root, "silver"))
+        assert silver_df["customer_id"].is_unique
+        assert set(silver_df["customer_id"]) == set(range(1, 81))
+        assert result.report.removed["duplicate_ids"] == 30
+
+    def test_key_index_tracks_owner(self, lake):
+        """키 인덱스가 Silver에 남은 키와 소유 파티션을 기록"""
+        bronze, silver, storage, root = lake
+        append_bronze_batch(bronze, customers(60, issue_rate=0.1), "001")
+        run_incremental_etl(bronze, silver)
+        append_bronze_batch(bronze, customers(40, start_id=1, seed=3), "002")
+        run_incremental_etl(bronze, silver)
+
+        key_index = storage.read_parquet(join(root, "silver", KEY_INDEX_FILE))
+        silver_df = read_dataset(storage, join(root, "silver"))
+        owners = silver_df.assign(
+            partition=[partition_key(row) for row in silver_df[PARTITION_COLS].to_dict("records")]
+        )
+        assert key_index["customer_id"].is_unique
+        assert (dict(zip(key_index["customer_id"], key_index["partition"]))
+                == dict(zip(owners["customer_id"], owners["partition"])))
+
+    def test_reprocessed_partition_releases_keys(self, lake):
+        """삭제된 파티션의 키는 인덱스에서 빠져 다른 파티션에서 다시 적재 가능"""
+        bronze, silver, storage, root = lake
+        df = customers(1)
+        append_bronze_batch(bronze, df, "001")
+        run_incremental_etl(bronze, silver)
+
+        bronze_storage, bronze_root = get_storage(bronze)
+        bronze_storage.delete_prefix(bronze_root)
+        moved = df.assign(city=pd.Categorical(["Busan" if df["city"][0] != "Busan" else "Seoul"]))
+        append_bronze_batch(bronze, moved, "002")
+        result = run_incremental_etl(bronze, silver)
+
+        assert result.deleted == partitions_of(df)
+        assert result.processed == partitions_of(moved)
+        assert result.report.valid_rows == 1
+        key_index = storage.read_parquet(join(root, "silver", KEY_INDEX_FILE))
+        assert key_index["partition"].tolist() == partitions_of(moved)
@@ -0,0 +1,204 @@
+"""
+Test cases for data quality rules engine
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from quality import (
+    CUSTOMER_RULES,
+    DataQualityReport,
+    DataQualityValidator,
+    InRange,
+    IsIn,
+    KeySet,
+    Matches,
+    NotNull,
+    Rule,
+    Unique,
+    validate_customers
+)
+
+
+def sequential_clean(df):
+    """Null 이메일 제거 → 중복 제거 → 형식 검사 순차 필터 (기준 구현)"""
+    df = df[df["email"].notna()]
+    df = df[~df["customer_id"].duplicated()]
+    return df[df["email"].str.contains("@", regex=False)]
+
+
+class TestRules:
+    """개별 규칙 테스트"""
+
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({
+            "id": [1, 2, 2, 3, None],
+            "email": ["a@x.com", None, "b@x.com", "bad", "c@x.com"],
+            "age": [20, -1, 150, None, 45],
+            "city": ["Seoul", "Busan", "Tokyo", None, "Seoul"],
+        })
+
+    def test_abstract(self):
+        """Rule은 evaluate 없이 생성할 수 없음"""
+        with pytest.raises(TypeError):
+            Rule("id")
+
+    def test_default_name(self):
+        """이름을 지정하지 않으면 rule_type:column"""
+        assert NotNull("email").name == "not_null:email"
+        assert InRange("age", name="age_range").name == "age_range"
+
+    def test_not_null(self, df):
+        """Null만 위반"""
+        mask = NotNull("email").evaluate(df, np.ones(len(df), bool))
+        np.testing.assert_array_equal(mask, [True, False, True, True, True])
+
+    def test_matches(self, df):
+        """패턴 미포함 위반, Null은 통과"""
+        mask = Matches("email", pattern="@", regex=False).evaluate(df, np.ones(len(df), bool))
+        np.testing.assert_array_equal(mask, [True, True, True, False, True])
+
+    def test_in_range(self, df):
+        """범위 밖 위반, Null은 통과"""
+        mask = InRange("age", min_value=0, max_value=120).evaluate(df, np.ones(len(df), bool))
+        np.testing.assert_array_equal(mask, [True, False, False, True, True])
+
+    def test_is_in(self, df):
+        """허용 목록 밖 위반, Null은 통과"""
+        mask = IsIn("city", values=["Seoul", "Busan"]).evaluate(df, np.ones(len(df), bool))
+        np.testing.assert_array_equal(mask, [True, True, False, True, True])
+
+    def test_unique_respects_valid(self, df):
+        """앞선 규칙에서 제거된 행은 중복 판정에서 제외"""
+        valid = np.array([True, True, False, True, True])
+        mask = Unique("email").evaluate(df.assign(email=["a", "a", "a", "b", "b"]), valid)
+        np.testing.assert_array_equal(mask, [True, False, True, True, False])
+
+
+class TestKeySet:
+    """청크 간 중복 판정 키 집합 테스트"""
+
+    def test_bitmap_keys(self):
+        """0 이상 정수 키는 비트맵으로 중복 판정"""
+        keys = KeySet()
+        np.testing.assert_array_equal(keys.add(np.array([1, 5, 5, 9])), [False, False, True, False])
+        np.testing.assert_array_equal(keys.add(np.array([9, 2, 1])), [True, False, True])
+
+        assert len(keys) == 4
+        assert keys.nbytes <= 8
+
+    def test_string_keys(self):
+        """문자열 키는 해시 배열로 중복 판정"""
+        keys = KeySet()
+        np.testing.assert_array_equal(keys.add(np.array(["a", "b", "a"], dtype=object)), [False, False, True])
+        np.testing.assert_array_equal(keys.add(np.array(["b", "c"], dtype=object)), [True, False])
+
+        assert len(keys) == 3
+        assert keys.nbytes == 3 * 8
+
+    def test_switch_to_hashes(self):
+        """비트맵 키 이후 음수/큰 키가 오면 기존 키를 유지한 채 해시 모드로 전환"""
+        keys = KeySet()
+        keys.add(np.array([3, 7, 100]))
+        seen = keys.add(np.array([-1, 7, KeySet.MAX_BITMAP_KEY, 100, 4]))
+
+        np.testing.assert_array_equal(seen, [False, True, False, True, False])
+        assert len(keys) == 6
+
+    def test_empty(self):
+        """빈 청크"""
+        keys = KeySet()
+        assert len(keys.add(np.array([], dtype=np.int64))) == 0
+        assert len(keys) == 0
+
+    def test_matches_global_duplicated(self):
+        """청크로 나눠 넣어도 전체 duplicated()와 같은 결과"""
+        rng = np.random.default_rng(0)
+        values = rng.integers(0, 5000, 20000)
+        keys = KeySet()
+        seen = np.concatenate([keys.add(chunk) for chunk in np.array_split(values, 7)])
+
+        np.testing.assert_array_equal(seen, pd.Series(values).duplicated().to_numpy())
+
+
+class TestDataQualityValidator:
+    """규칙 엔진 테스트"""
+
+    def test_matches_sequential_filters(self, raw_customers):
+        """하나의 마스크 결과가 순차 필터와 같은지 테스트"""
+        df_clean, report = DataQualityValidator(CUSTOMER_RULES).apply(raw_customers)
+
+        pd.testing.assert_frame_equal(df_clean, sequential_clean(raw_customers))
+        assert report.valid_rows == len(df_clean)
+        assert sum(report.removed.values()) == report.removed_rows
+
+    def test_customer_report(self, raw_customers):
+        """의도적으로 넣은 품질 이슈 집계"""
+        _, report = validate_customers(raw_customers)
+
+        assert report.violations == {"null_emails": 33, "duplicate_ids": 33, "invalid_emails": 34}
+        assert report.total_rows == 1000
+        assert report.quality_score == pytest.approx(report.valid_rows / 10)
+
+    def test_removed_counts_first_failure(self):
+        """여러 규칙에 걸린 행은 처음 걸린 규칙에서만 제거로 집계"""
+        df = pd.DataFrame({"email": [None, "bad", "ok@x"], "age": [200, 200, 30]})
+        validator = DataQualityValidator([
+            NotNull("email", name="email"),
+            InRange("age", max_value=120, name="age"),
+        ])
+        _, report = validator.validate(df)
+
+        assert report.violations == {"email": 1, "age": 2}
+        assert report.removed == {"email": 1, "age": 1}
+        assert report.valid_rows == 1
+
+    def test_from_config(self, raw_customers):
+        """설정(dict)으로 만든 규칙 엔진"""
+        validator = DataQualityValidator.from_config([
+            {"rule": "not_null", "column": "email", "name": "null_emails"},
+            {"rule": "unique", "column": "customer_id", "name": "duplicate_ids"},
+            {"rule": "matches", "column": "email", "pattern": "@", "regex": False,
+             "name": "invalid_emails"},
+        ])
+        expected, _ = validate_customers(raw_customers)
+        df_clean, _ = validator.apply(raw_customers)
+
+        pd.testing.assert_frame_equal(df_clean, expected)
+
+    def test_unknown_rule(self):
+        """지원하지 않는 규칙 오류"""
+        with pytest.raises(ValueError, match="Unknown rule type: regex"):
+            DataQualityValidator.from_config([{"rule": "regex", "column": "email"}])
+
+    def test_duplicate_names(self):
+        """규칙 이름 중복 오류"""
+        with pytest.raises(ValueError, match="Duplicate rule names"):
+            DataQualityValidator([NotNull("email"), NotNull("email")])
+
+    def test_missing_column(self):
+        """없는 컬럼 오류"""
+        with pytest.raises(ValueError, match=r"Missing columns for quality rules: \['email'\]"):
+            DataQualityValidator([NotNull("email")]).validate(pd.DataFrame({"id": [1]}))
+
+    def test_empty_frame(self):
+        """빈 DataFrame은 품질 점수 100"""
+        _, report = DataQualityValidator([NotNull("email")]).validate(pd.DataFrame({"email": []}))
+        assert report.quality_score == 100.0
+
+
+class TestDataQualityReport:
+    """품질 리포트 테스트"""
+
+    def test_merge(self):
+        """청크 리포트 합치기"""
+        a = DataQualityReport(10, 8, {"x": 2}, {"x": 2})
+        b = DataQualityReport(5, 4, {"x": 1, "y": 1}, {"y": 1})
+        merged = a.merge(b)
+
+        assert (merged.total_rows, merged.valid_rows) == (15, 12)
+        assert merged.violations == {"x": 3, "y": 1}
+        assert merged.removed == {"x": 2, "y": 1}
+        assert merged.to_dict()["removed_rows"] == 3
@@ -0,0 +1,184 @@
+"""
+Test cases for storage backends
+"""
+
+import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from storage import (
+    PARTITION_SCHEMA_FILE,
+    LocalStorage,
+    MemoryStorage,
+    Storage,
+    get_storage,
+    join,
+    parquet_files,
+    read_dataset,
+    write_dataset
+)
+
+
+@pytest.fixture(params=["memory", "local"])
+def backend(request, memory_uri, tmp_path):
+    """(스토리지, 루트) - 인메모리 / 로컬 파일 시스템"""
+    if request.param == "memory":
+        return get_storage(memory_uri)
+    return get_storage(str(tmp_path / "lake"))
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "customer_id": [1, 2, 3, 4],
+        "age": [21, 35, 47, 62],
+        "city": pd.Categorical(["Seoul", "Busan", "Seoul", "Daegu"]),
+        "join_day": ["2024-01-01", "2024-01-01", "2024-01-02", "2024-01-02"],
+    })
+
+
+class TestStorage:
+    """공통 인터페이스 테스트"""
+
+    def test_abstract(self):
+        """추상 메서드를 구현하지 않은 백엔드는 생성할 수 없음"""
+        with pytest.raises(TypeError):
+            Storage()
+
+        class ListOnly(Storage):
+            def list(self, prefix):
+                return []
+
+        with pytest.raises(TypeError, match="open_output"):
+            ListOnly()
+
+    def test_bytes_round_trip(self, backend):
+        """바이트 쓰기 / 읽기 / 목록 / 삭제"""
+        storage, root = backend
+        storage.write_bytes(join(root, "a/1.bin"), b"one")
+        storage.write_bytes(join(root, "a/b/2.bin"), b"two")
+        storage.write_bytes(join(root, "c.bin"), b"three")
+
+        assert storage.read_bytes(join(root, "a/b/2.bin")) == b"two"
+        assert [info.path for info in storage.list(join(root, "a"))] == [
+            join(root, "a/1.bin"), join(root, "a/b/2.bin")
+        ]
+        assert storage.list(join(root, "c.bin"))[0].size == 5
+        assert storage.exists(join(root, "a/1.bin"))
+
+        storage.delete(join(root, "a/1.bin"))
+        storage.delete(join(root, "missing.bin"))
+        assert not storage.exists(join(root, "a/1.bin"))
+
+        storage.delete_prefix(join(root, "a"))
+        assert storage.list(join(root, "a")) == []
+        assert storage.exists(join(root, "c.bin"))
+
+    def test_missing_object(self, backend):
+        """없는 객체 읽기 오류"""
+        storage, root = backend
+        with pytest.raises(FileNotFoundError):
+            storage.read_bytes(join(root, "missing.bin"))
+
+    def test_parquet_round_trip(self, backend, frame):
+        """Parquet 파일 하나 쓰기 / 읽기 / 배치 읽기"""
+        storage, root = backend
+        path = join(root, "one.parquet")
+        storage.write_parquet(frame, path)
+
+        pd.testing.assert_frame_equal(storage.read_parquet(path), frame)
+        assert storage.read_parquet(path, columns=["age"]).columns.tolist() == ["age"]
+        batches = list(storage.iter_parquet_batches([path, path], batch_size=3))
+        assert [len(batch) for batch in batches] == [3, 1, 3, 1]
+
+    def test_memory_named_shared(self):
+        """memory://<이름>은 같은 인스턴스"""
+        assert MemoryStorage.named("shared-test") is MemoryStorage.named("shared-test")
+        assert get_storage("memory://shared-test/x/")[1] == "x"
+
+    def test_local_paths(self, tmp_path):
+        """로컬 경로 / file:// URI"""
+        storage, root = get_storage(f"file://{tmp_path}/lake")
+
+        assert isinstance(storage, LocalStorage)
+        assert "/" + root == f"{tmp_path}/lake"
+
+
+class TestDataset:
+    """Parquet 데이터셋 쓰기 / 읽기 테스트"""
+
+    def test_round_trip(self, backend, frame):
+        """파티션 없는 데이터셋"""
+        storage, root = backend
+        written = write_dataset(storage, frame, join(root, "ds"))
+
+        assert len(written) == 1
+        pd.testing.assert_frame_equal(read_dataset(storage, join(root, "ds")), frame)
+
+    def test_overwrite_and_append(self, backend, frame):
+        """overwrite는 기존 파일 삭제, append는 추가"""
+        storage, root = backend
+        prefix = join(root, "ds")
+        write_dataset(storage, frame, prefix)
+        write_dataset(storage, frame, prefix, mode="append")
+        assert len(read_dataset(storage, prefix)) == 8
+
+        write_dataset(storage, frame, prefix, mode="overwrite")
+        assert len(read_dataset(storage, prefix)) == 4
+
+        with pytest.raises(ValueError, match="Unsupported mode"):
+            write_dataset(storage, frame, prefix, mode="upsert")
+
+    def test_partitioned_layout(self, backend, frame):
+        """Hive 파티션 경로와 파티션 스키마 파일"""
+        storage, root = backend
+        prefix = join(root, "ds")
+        written = write_dataset(storage, frame, prefix, partition_cols=["join_day"])
+
+        assert sorted(path.split("/")[-2] for path in written) == [
+            "join_day=2024-01-01", "join_day=2024-01-02"
+        ]
+        assert storage.exists(join(prefix, PARTITION_SCHEMA_FILE))
+        assert len(parquet_files(storage, prefix)) == 2
+
+    def test_partition_dtypes_restored(self, backend, frame):
+        """파티션 컬럼을 원래 타입으로 복원"""
+        storage, root = backend
+        df = frame.assign(year=[2023, 2023, 2024, 2024], day=pd.to_datetime(frame["join_day"]))
+        write_dataset(storage, df, join(root, "ds"), partition_cols=["city", "year", "day"])
+        actual = read_dataset(storage, join(root, "ds")).sort_values("customer_id", ignore_index=True)
+
+        assert isinstance(actual["city"].dtype, pd.CategoricalDtype)
+        assert actual["year"].dtype == "int64"
+        assert pd.api.types.is_datetime64_any_dtype(actual["day"])
+        assert actual["city"].astype(str).tolist() == ["Seoul", "Busan", "Seoul", "Daegu"]
+        assert actual["year"].tolist() == [2023, 2023, 2024, 2024]
+        assert (actual["day"] == df["day"]).all()
+
+    def test_explicit_partition_schema(self, backend, frame):
+        """partition_schema로 타입 지정"""
+        storage, root = backend
+        prefix = join(root, "ds")
+        write_dataset(storage, frame, prefix, partition_cols=["join_day"])
+        actual = read_dataset(
+            storage, prefix, partition_schema=pa.schema([("join_day", pa.date32())])
+        )
+
+        assert set(actual["join_day"]) == {datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)}
+
+    def test_partitions_without_schema_file(self, backend, frame):
+        """스키마 파일이 없으면 파티션 값은 문자열"""
+        storage, root = backend
+        prefix = join(root, "ds")
+        write_dataset(storage, frame.assign(year=2024), prefix, partition_cols=["year"])
+        storage.delete(join(prefix, PARTITION_SCHEMA_FILE))
+
+        assert read_dataset(storage, prefix)["year"].tolist() == ["2024"] * 4
+
+    def test_empty_dataset(self, backend):
+        """데이터셋이 없으면 오류"""
+        storage, root = backend
+        with pytest.raises(FileNotFoundError, match="No parquet files"):
+            read_dataset(storage, join(root, "missing"))
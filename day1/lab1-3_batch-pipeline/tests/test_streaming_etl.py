@@ -0,0 +1,131 @@
+"""
+Test cases for streaming ETL
+"""
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from quality import InRange, NotNull, Unique, validate_customers
+from storage import get_storage, join, read_dataset, write_dataset
+from streaming_etl import ParquetDatasetWriter, run_streaming_etl, write_sample_bronze
+from transforms import add_derived_columns, generate_customers
+
+
+def in_memory_etl(df):
+    """전체를 한 번에 읽어 정제/변환하는 기준 구현"""
+    df_clean, report = validate_customers(df)
+    return add_derived_columns(df_clean).reset_index(drop=True), report
+
+
+def assert_same_rows(actual, expected):
+    """categorical 카테고리 구성과 무관하게 값 비교"""
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected.reset_index(drop=True),
+        check_categorical=False, check_dtype=False
+    )
+
+
+class TestRunStreamingETL:
+    """row group 단위 스트리밍 ETL 테스트"""
+
+    @pytest.mark.parametrize("batch_size", [97, 1000, 5000])
+    def test_matches_in_memory(self, memory_uri, batch_size):
+        """청크 크기와 무관하게 인메모리 ETL과 같은 결과"""
+        bronze, silver = f"{memory_uri}/raw", f"{memory_uri}/silver"
+        write_sample_bronze(bronze, 3000, batch_size=1000)
+        storage, root = get_storage(memory_uri)
+        expected, expected_report = in_memory_etl(read_dataset(storage, join(root, "raw")))
+
+        result = run_streaming_etl(bronze, silver, batch_size=batch_size)
+        actual = read_dataset(storage, join(root, "silver"))
+
+        assert_same_rows(actual, expected)
+        assert result.report.to_dict() == expected_report.to_dict()
+        assert result.num_chunks == sum(-(-1000 // batch_size) for _ in range(3))
+
+    def test_duplicates_across_chunks(self, memory_uri):
+        """다른 청크에서 처음 본 customer_id도 중복으로 제거"""
+        df = generate_customers(20, issue_rate=0.0, seed=1)
+        df.loc[15, "customer_id"] = df.loc[2, "customer_id"]
+        storage, root = get_storage(memory_uri)
+        write_dataset(storage, df, join(root, "raw"))
+
+        result = run_streaming_etl(f"{memory_uri}/raw", f"{memory_uri}/silver", batch_size=5)
+        actual = read_dataset(storage, join(root, "silver"))
+
+        assert result.report.removed["duplicate_ids"] == 1
+        assert len(actual) == 19
+        assert actual["customer_id"].is_unique
+        assert result.key_set_bytes > 0
+
+    def test_custom_rules_and_transform(self, memory_uri):
+        """규칙 / 변환 지정"""
+        df = pd.DataFrame({"id": [1, 2, 2, 3, 4], "age": [10, 20, 30, 200, None]})
+        storage, root = get_storage(memory_uri)
+        write_dataset(storage, df, join(root, "raw"))
+
+        result = run_streaming_etl(
+            f"{memory_uri}/raw", f"{memory_uri}/silver", batch_size=2,
+            rules=[NotNull("age"), Unique("id"), InRange("age", max_value=120)],
+            transform=lambda chunk: chunk.assign(age=chunk["age"] * 2)
+        )
+        actual = read_dataset(storage, join(root, "silver"))
+
+        assert actual["id"].tolist() == [1, 2]
+        assert actual["age"].tolist() == [20, 40]
+        assert result.report.removed == {"not_null:age": 1, "unique:id": 1, "in_range:age": 1}
+
+    def test_overwrites_silver(self, memory_uri):
+        """기존 Silver 파일은 삭제 후 기록"""
+        bronze, silver = f"{memory_uri}/raw", f"{memory_uri}/silver"
+        write_sample_bronze(bronze, 500)
+        run_streaming_etl(bronze, silver, max_rows_per_file=100, batch_size=100)
+        result = run_streaming_etl(bronze, silver)
+
+        storage, root = get_storage(memory_uri)
+        assert len(result.files) == 1
+        assert len(storage.list(join(root, "silver"))) == 1
+
+    def test_missing_bronze(self, memory_uri):
+        """Bronze 데이터셋이 없으면 오류"""
+        with pytest.raises(FileNotFoundError, match="Dataset not found"):
+            run_streaming_etl(f"{memory_uri}/missing", f"{memory_uri}/silver")
+
+    def test_local_storage(self, tmp_path):
+        """로컬 파일 시스템 경로"""
+        write_sample_bronze(str(tmp_path / "raw"), 1000)
+        result = run_streaming_etl(str(tmp_path / "raw"), str(tmp_path / "silver"), batch_size=300)
+
+        assert result.report.total_rows == 1000
+        assert all(path.endswith(".parquet") for path in result.files)
+        assert result.to_dict()["valid_rows"] == result.report.valid_rows
+
+
+class TestParquetDatasetWriter:
+    """청크 단위 Parquet 기록기 테스트"""
+
+    def test_rolls_files(self, memory_uri):
+        """max_rows_per_file을 넘으면 다음 part 파일"""
+        storage, root = get_storage(memory_uri)
+        with ParquetDatasetWriter(storage, join(root, "out"), max_rows_per_file=250) as writer:
+            for _ in range(5):
+                writer.write(pd.DataFrame({"x": range(100)}))
+
+        assert writer.rows_written == 500
+        assert [path.rsplit("/", 1)[1] for path in writer.files] == [
+            "part-00000.parquet", "part-00001.parquet"
+        ]
+        with storage.open_input(writer.files[0]) as f:
+            assert pq.ParquetFile(f).metadata.num_row_groups == 3
+
+    def test_categorical_schema(self, memory_uri):
+        """청크마다 카테고리가 달라도 같은 스키마로 기록"""
+        storage, root = get_storage(memory_uri)
+        with ParquetDatasetWriter(storage, join(root, "out")) as writer:
+            writer.write(pd.DataFrame({"city": pd.Categorical(["Seoul"] * 3)}))
+            writer.write(pd.DataFrame({"city": pd.Categorical(["Busan", "Daegu"])}))
+            writer.write(pd.DataFrame({"city": pd.Categorical([])}))
+
+        actual = read_dataset(storage, join(root, "out"))
+        assert actual["city"].astype(str).tolist() == ["Seoul"] * 3 + ["Busan", "Daegu"]
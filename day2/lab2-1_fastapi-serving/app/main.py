@@ -9,11 +9,16 @@ Endpoints:
     - GET  /health     : Health check
     - POST /predict    : 단일 예측
     - POST /predict/batch : 배치 예측
+    - POST /predict/columnar : 대용량 배치 예측 (컬럼 JSON / 바이너리 입력, 컬럼 응답)
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Tuple
+import io
+import os
+import json
 import joblib
 import numpy as np
 from pathlib import Path
@@ -38,10 +43,16 @@ app = FastAPI(
 # 모델 로드
 MODEL_PATH = Path(__file__).parent.parent / "model.joblib"
 IRIS_SPECIES = {0: "setosa", 1: "versicolor", 2: "virginica"}
+FEATURE_NAMES = ["sepal_length", "sepal_width", "petal_length", "petal_width"]
+FEATURE_RANGE = (0.0, 10.0)
+BINARY_DTYPES = {"float32": "<f4", "float64": "<f8"}
+MAX_BATCH_ROWS = int(os.getenv("MAX_BATCH_ROWS", "1000000"))
 
 try:
     logger.info(f"모델 로드 시도: {MODEL_PATH}")
     model = joblib.load(MODEL_PATH)
+    # predict_proba 컬럼 순서(model.classes_) → 품종 이름
+    SPECIES_BY_COLUMN = np.array([IRIS_SPECIES[int(c)] for c in model.classes_])
     MODEL_LOADED = True
     logger.info("✅ 모델 로드 성공")
 except Exception as e:
@@ -115,6 +126,13 @@ class BatchPredictionResponse(BaseModel):
     predictions: List[PredictionResponse]
 
 
+class ColumnarPredictionResponse(BaseModel):
+    """컬럼 형식 배치 예측 결과 모델 (행마다 객체를 만들지 않음)"""
+    count: int = Field(..., description="예측한 샘플 수")
+    predictions: List[str] = Field(..., description="샘플별 예측 품종")
+    confidence: List[float] = Field(..., description="샘플별 예측 신뢰도 (0-1)")
+
+
 class HealthResponse(BaseModel):
     """Health check 응답 모델"""
     status: str
@@ -128,6 +146,110 @@ class InfoResponse(BaseModel):
     model_loaded: bool
 
 
+# ============================================================
+# 예측 헬퍼
+# ============================================================
+
+def predict_array(input_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    predict_proba 한 번으로 품종과 신뢰도 계산
+
+    predict / predict_proba를 따로 부르면 forest를 두 번 실행하므로
+    확률에서 argmax로 클래스를 구함 (RandomForest.predict와 같은 결과)
+
+    Args:
+        input_data: (n, 4) 피처 배열
+
+    Returns:
+        (품종 이름 배열, 신뢰도 배열)
+    """
+    probabilities = model.predict_proba(input_data)
+    best = probabilities.argmax(axis=1)
+    confidence = probabilities[np.arange(len(best)), best]
+    return SPECIES_BY_COLUMN[best], confidence
+
+
+def parse_columnar_body(body: bytes, content_type: str, dtype: str = "float32") -> np.ndarray:
+    """
+    컬럼 JSON / 바이너리 요청 본문을 (n, 4) 배열로 변환
+
+    - application/json: {"sepal_length": [...], "sepal_width": [...], ...}
+    - application/x-npy: np.save로 저장한 (n, 4) 배열
+    - application/octet-stream: 헤더 없는 little-endian 행 우선 배열 (dtype 지정)
+
+    Args:
+        body: 요청 본문
+        content_type: Content-Type 헤더
+        dtype: octet-stream 입력의 자료형 (float32, float64)
+
+    Returns:
+        검증된 (n, 4) float64 배열
+
+    Raises:
+        ValueError: 형식 / 크기 / 값 범위가 잘못된 경우
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+
+    if media_type == "application/json":
+        payload = json.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError(f"Columnar JSON must be an object with keys: {FEATURE_NAMES}")
+        missing = [name for name in FEATURE_NAMES if name not in payload]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+        try:
+            columns = [np.asarray(payload[name], dtype=np.float64) for name in FEATURE_NAMES]
+        except (TypeError, ValueError):
+            raise ValueError("Each feature column must be a flat list of numbers")
+        if any(column.ndim != 1 for column in columns):
+            raise ValueError("Each feature column must be a flat list of numbers")
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("Feature columns must have the same length")
+        input_data = np.column_stack(columns)
+    elif media_type == "application/x-npy":
+        try:
+            input_data = np.load(io.BytesIO(body), allow_pickle=False)
+        except EOFError:
+            raise ValueError("Empty or truncated .npy body")
+        # 구조화/복소수/문자열 배열은 float64 변환 시 500 에러 또는 허수부 손실
+        if input_data.dtype.kind not in "fiu":
+            raise ValueError(
+                f"Unsupported .npy dtype: {input_data.dtype}. Supported: ['float', 'int', 'uint']"
+            )
+    elif media_type == "application/octet-stream":
+        if dtype not in BINARY_DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype}. Supported: {list(BINARY_DTYPES)}")
+        item_size = np.dtype(BINARY_DTYPES[dtype]).itemsize
+        if len(body) % (item_size * len(FEATURE_NAMES)) != 0:
+            raise ValueError(
+                f"Binary body size {len(body)} is not a multiple of "
+                f"{len(FEATURE_NAMES)} x {dtype}"
+            )
+        input_data = np.frombuffer(body, dtype=BINARY_DTYPES[dtype]).reshape(-1, len(FEATURE_NAMES))
+    else:
+        raise ValueError(
+            f"Unsupported content type: {media_type}. "
+            f"Supported: ['application/json', 'application/x-npy', 'application/octet-stream']"
+        )
+
+    input_data = np.asarray(input_data, dtype=np.float64)
+    if input_data.ndim != 2 or input_data.shape[1] != len(FEATURE_NAMES):
+        raise ValueError(f"Expected shape (n, {len(FEATURE_NAMES)}), got {input_data.shape}")
+    if not 0 < len(input_data) <= MAX_BATCH_ROWS:
+        raise ValueError(f"Batch size must be between 1 and {MAX_BATCH_ROWS}, got {len(input_data)}")
+
+    # IrisFeatures의 ge / le 검증을 배열 전체에 한 번에 적용
+    low, high = FEATURE_RANGE
+    invalid = ~np.isfinite(input_data) | (input_data < low) | (input_data > high)
+    if invalid.any():
+        row, col = np.argwhere(invalid)[0]
+        raise ValueError(
+            f"{int(invalid.sum())} values out of range [{low}, {high}] "
+            f"(first: row {row}, {FEATURE_NAMES[col]}={input_data[row, col]})"
+        )
+    return input_data
+
+
 # ============================================================
 # API 엔드포인트
 # ============================================================
@@ -198,12 +320,11 @@ async def predict(features: IrisFeatures):
         ]])
         
         # 예측
-        prediction = model.predict(input_data)[0]
-        probabilities = model.predict_proba(input_data)[0]
+        labels, confidence = predict_array(input_data)
         
         result = PredictionResponse(
-            prediction=IRIS_SPECIES[prediction],
-            confidence=float(probabilities[prediction])
+            prediction=str(labels[0]),
+            confidence=float(confidence[0])
         )
         
         logger.info(
@@ -251,17 +372,14 @@ async def predict_batch(features_list: List[IrisFeatures]):
             for f in features_list
         ])
         
-        # 배치 예측
-        predictions = model.predict(input_data)
-        probabilities = model.predict_proba(input_data)
+        # 배치 예측 (predict_proba 한 번)
+        labels, confidence = predict_array(input_data)
         
         # 결과 생성
-        results = []
-        for pred, probs in zip(predictions, probabilities):
-            results.append(PredictionResponse(
-                prediction=IRIS_SPECIES[pred],
-                confidence=float(probs[pred])
-            ))
+        results = [
+            PredictionResponse(prediction=label, confidence=conf)
+            for label, conf in zip(labels.tolist(), confidence.tolist())
+        ]
         
         logger.info(f"배치 예측 성공: {len(results)}개 샘플")
         
@@ -275,6 +393,69 @@ async def predict_batch(features_list: List[IrisFeatures]):
         )
 
 
+@app.post(
+    "/predict/columnar",
+    response_model=None,
+    responses={200: {"model": ColumnarPredictionResponse}}
+)
+async def predict_columnar(request: Request, dtype: str = "float32"):
+    """
+    대용량 배치 예측 (컬럼 입력 / 컬럼 응답)
+
+    행마다 pydantic 객체를 만들지 않고 요청 본문을 바로 numpy 배열로 변환해
+    10만 행 이상의 배치도 행 단위 Python 처리 없이 예측
+
+    - application/json: {"sepal_length": [...], "sepal_width": [...], ...}
+    - application/x-npy: (n, 4) .npy 배열
+    - application/octet-stream: little-endian (n, 4) 배열 (?dtype=float32|float64)
+
+    Args:
+        request: 요청 (Content-Type으로 입력 형식 구분)
+        dtype: octet-stream 입력의 자료형
+
+    Returns:
+        {"count", "predictions": [...], "confidence": [...]}
+
+    Raises:
+        HTTPException: 모델 미로드 (503), 입력 오류 (422)
+    """
+    if not MODEL_LOADED:
+        logger.error("컬럼 배치 예측 요청 실패: 모델이 로드되지 않음")
+        raise HTTPException(
+            status_code=503,
+            detail="Model not loaded. Please check server logs."
+        )
+
+    body = await request.body()
+    try:
+        input_data = parse_columnar_body(
+            body, request.headers.get("content-type", "application/json"), dtype
+        )
+    except ValueError as e:
+        logger.warning(f"컬럼 배치 입력 오류: {e}")
+        raise HTTPException(status_code=422, detail=str(e))
+
+    try:
+        # CPU 작업은 스레드 풀에서 실행해 이벤트 루프를 막지 않음
+        labels, confidence = await run_in_threadpool(predict_array, input_data)
+    except Exception as e:
+        logger.error(f"컬럼 배치 예측 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch prediction error: {str(e)}"
+        )
+
+    logger.info(f"컬럼 배치 예측 성공: {len(labels)}개 샘플")
+
+    # response_model 검증 / 행 단위 직렬화를 거치지 않고 리스트를 그대로 직렬화
+    content = json.dumps({
+        "count": len(labels),
+        "predictions": labels.tolist(),
+        "confidence": confidence.tolist()
+    })
+    return Response(content=content, media_type="application/json")
+
+
 # ============================================================
 # 앱 시작/종료 이벤트
 # ============================================================
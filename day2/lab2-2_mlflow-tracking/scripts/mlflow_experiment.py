@@ -118,9 +118,8 @@ print()
 # 실험 1: LinearRegression
 print("[1/2] LinearRegression 학습 중...")
 with mlflow.start_run(run_name="linear-baseline"):
-    # 1. 파라미터 기록
-    mlflow.log_param("model_type", "LinearRegression")
-    mlflow.log_param("fit_intercept", True)
+    # 1. 파라미터 기록 (dict로 한 번에 보내면 log_batch 요청 1회)
+    mlflow.log_params({"model_type": "LinearRegression", "fit_intercept": True})
     
     # 2. 모델 학습
     model = LinearRegression()
@@ -133,16 +132,13 @@ with mlflow.start_run(run_name="linear-baseline"):
     mae = mean_absolute_error(y_test, y_pred)
     
     # 4. 메트릭 기록
-    mlflow.log_metric("rmse", rmse)
-    mlflow.log_metric("r2_score", r2)
-    mlflow.log_metric("mae", mae)
+    mlflow.log_metrics({"rmse": rmse, "r2_score": r2, "mae": mae})
     
     # 5. 모델 저장
     mlflow.sklearn.log_model(model, "model")
     
     # 6. 태그 추가
-    mlflow.set_tag("stage", "baseline")
-    mlflow.set_tag("author", "mlops-training")
+    mlflow.set_tags({"stage": "baseline", "author": "mlops-training"})
     
     # 결과 출력
     print(f"\n📊 Results:")
@@ -9,16 +9,15 @@ California Housing 데이터셋을 사용한 End-to-End MLOps 파이프라인
 
 파이프라인 단계:
 1. Data Load - California Housing 데이터 로드
-2. Preprocess - 데이터 전처리
-3. Feature Engineering - 피처 엔지니어링
-4. Train Model - MLflow로 모델 학습 및 추적
-5. Evaluate - 모델 평가
-6. Deploy - KServe로 모델 배포 (조건부)
+2. Prepare Features - 데이터 분할 + 스케일링, 학습된 변환 저장
+3. Train Model - MLflow로 모델 학습 및 추적 (변환 함께 기록)
+4. Evaluate - 모델 평가
+5. Deploy - KServe로 모델 배포 (조건부)
 """
 
 import os
 from kfp import dsl
-from kfp.dsl import component, Input, Output, Dataset, Model, Metrics
+from kfp.dsl import component, Input, Output, Dataset, Model, Metrics, Artifact
 from kfp import compiler
 
 # ============================================================
@@ -32,52 +31,100 @@ DEFAULT_MODEL_NAME = f"california-model-user{USER_NUM}"
 print(f"[설정] USER_NUM: {USER_NUM}")
 print(f"[설정] DEFAULT_NAMESPACE: {DEFAULT_NAMESPACE}")
 
+# 사전 빌드 공용 컴포넌트 이미지 (day3/component-image/build_image.py로 생성)
+# 설정하면 모든 컴포넌트가 이 이미지를 사용하고 Pod 시작 시 pip install을 건너뜀
+# (이미지의 sitecustomize가 각 단계 Pod의 시작 오버헤드를 로그에 출력)
+COMPONENT_IMAGE = os.getenv("COMPONENT_IMAGE", "")
+
+
+def component_env(packages=None):
+    """컴포넌트 이미지/패키지 설정 (COMPONENT_IMAGE가 있으면 사전 빌드 이미지 사용)"""
+    if COMPONENT_IMAGE:
+        return {"base_image": COMPONENT_IMAGE, "install_kfp_package": False}
+    return {"base_image": "python:3.9-slim", "packages_to_install": packages}
+
 # ============================================================
 # Components
 # ============================================================
 
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["scikit-learn", "pandas", "numpy"]
-)
+@component(**component_env(["scikit-learn", "pandas", "numpy", "pyarrow"]))
 def load_data(
     data_source: str,
     output_data: Output[Dataset]
 ):
     """Step 1: 데이터 로드"""
+    
+    import os
     import pandas as pd
     from sklearn.datasets import fetch_california_housing
-    import json
+    import time
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def write_artifact(df, path, name):
+        """Parquet(zstd) 저장: 스키마 메타데이터 기록 + 쓰기 시간/크기 출력"""
+        start = time.perf_counter()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({b"mlops.step": b"load_data", b"mlops.artifact": name.encode()})
+        pq.write_table(table.replace_schema_metadata(metadata), path, compression="zstd")
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  💾 {name}: {df.shape}, {size_kb:.1f} KB, write {elapsed:.1f} ms")
     
     print(f"📥 데이터 소스: {data_source}")
     
     if data_source == "sklearn":
         data = fetch_california_housing()
-        df = pd.DataFrame(data.data, columns=data.feature_names)
+        # 8개 입력 피처는 float32로 저장 (타겟은 float64 유지)
+        df = pd.DataFrame(data.data, columns=data.feature_names).astype("float32")
         df['target'] = data.target
     else:
         raise ValueError(f"Unknown data source: {data_source}")
     
     print(f"✅ 데이터 로드 완료: {df.shape}")
-    df.to_parquet(output_data.path)
+    write_artifact(df, output_data.path, "dataset")
 
 
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["scikit-learn", "pandas", "numpy"]
-)
-def preprocess(
+@component(**component_env(["scikit-learn", "pandas", "numpy", "pyarrow"]))
+def prepare_features(
     input_data: Input[Dataset],
     X_train_out: Output[Dataset],
     X_test_out: Output[Dataset],
     y_train_out: Output[Dataset],
-    y_test_out: Output[Dataset]
+    y_test_out: Output[Dataset],
+    feature_transform: Output[Artifact]
 ):
-    """Step 2: 데이터 전처리"""
-    import pandas as pd
-    from sklearn.model_selection import train_test_split
+    """Step 2: 전처리 + 피처 엔지니어링 (분할 → Train 통계로 표준화, 학습된 변환 저장)"""
     
-    df = pd.read_parquet(input_data.path)
+    import os
+    import json
+    from sklearn.model_selection import train_test_split
+    import time
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def read_artifact(path, name):
+        """Parquet 로드 + 읽기 시간/크기 출력"""
+        start = time.perf_counter()
+        df = pq.read_table(path).to_pandas()
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  📂 {name}: {df.shape}, {size_kb:.1f} KB, read {elapsed:.1f} ms")
+        return df
+
+    def write_artifact(df, path, name):
+        """Parquet(zstd) 저장: 스키마 메타데이터 기록 + 쓰기 시간/크기 출력"""
+        start = time.perf_counter()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({b"mlops.step": b"prepare_features", b"mlops.artifact": name.encode()})
+        pq.write_table(table.replace_schema_metadata(metadata), path, compression="zstd")
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  💾 {name}: {df.shape}, {size_kb:.1f} KB, write {elapsed:.1f} ms")
+    
+    df = read_artifact(input_data.path, "dataset")
     
     X = df.drop('target', axis=1)
     y = df['target']
@@ -88,68 +135,71 @@ def preprocess(
     
     print(f"✅ Train: {X_train.shape}, Test: {X_test.shape}")
     
-    X_train.to_parquet(X_train_out.path)
-    X_test.to_parquet(X_test_out.path)
-    pd.DataFrame(y_train).to_parquet(y_train_out.path)
-    pd.DataFrame(y_test).to_parquet(y_test_out.path)
-
-
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["scikit-learn", "pandas", "numpy"]
-)
-def feature_engineering(
-    X_train_in: Input[Dataset],
-    X_test_in: Input[Dataset],
-    X_train_out: Output[Dataset],
-    X_test_out: Output[Dataset]
-):
-    """Step 3: 피처 엔지니어링"""
-    import pandas as pd
-    from sklearn.preprocessing import StandardScaler
-    import pickle
-    
-    X_train = pd.read_parquet(X_train_in.path)
-    X_test = pd.read_parquet(X_test_in.path)
-    
-    scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
-    
-    pd.DataFrame(X_train_scaled, columns=X_train.columns).to_parquet(X_train_out.path)
-    pd.DataFrame(X_test_scaled, columns=X_test.columns).to_parquet(X_test_out.path)
+    # 표준화: Train 통계 (StandardScaler와 동일, 분산 0인 열은 스케일 1)
+    mean = X_train.mean(axis=0)
+    scale = X_train.std(axis=0, ddof=0).replace(0.0, 1.0)
+    
+    write_artifact(((X_train - mean) / scale).astype("float32"), X_train_out.path, "X_train")
+    write_artifact(((X_test - mean) / scale).astype("float32"), X_test_out.path, "X_test")
+    write_artifact(y_train.to_frame(), y_train_out.path, "y_train")
+    write_artifact(y_test.to_frame(), y_test_out.path, "y_test")
+    
+    # 학습된 변환 저장 (lab3-2 FeaturePipeline.to_dict()와 같은 형식)
+    with open(feature_transform.path, "w", encoding="utf-8") as f:
+        json.dump({
+            "feature_names": list(X_train.columns),
+            "derived_features": [],
+            "standardize": True,
+            "eps": 1e-6,
+            "mean": mean.astype(float).tolist(),
+            "scale": scale.astype(float).tolist()
+        }, f, indent=2)
     
     print(f"✅ 피처 스케일링 완료")
 
 
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["scikit-learn", "pandas", "numpy", "mlflow", "boto3"]
-)
+@component(**component_env([
+    "scikit-learn", "pandas", "numpy", "pyarrow", "mlflow", "boto3"
+]))
 def train_model(
     X_train: Input[Dataset],
     X_test: Input[Dataset],
     y_train: Input[Dataset],
     y_test: Input[Dataset],
+    feature_transform: Input[Artifact],
     mlflow_tracking_uri: str,
     experiment_name: str,
     n_estimators: int,
     max_depth: int
 ) -> str:
-    """Step 4: 모델 학습 (MLflow 추적)"""
-    import pandas as pd
+    """Step 3: 모델 학습 (MLflow 추적)"""
+    
+    import os
+    import json
     import mlflow
     from sklearn.ensemble import RandomForestRegressor
-    from sklearn.metrics import mean_squared_error, r2_score
     import numpy as np
+    import time
+    import pyarrow.parquet as pq
+
+    def read_artifact(path, name):
+        """Parquet 로드 + 읽기 시간/크기 출력"""
+        start = time.perf_counter()
+        df = pq.read_table(path).to_pandas()
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  📂 {name}: {df.shape}, {size_kb:.1f} KB, read {elapsed:.1f} ms")
+        return df
     
     mlflow.set_tracking_uri(mlflow_tracking_uri)
     mlflow.set_experiment(experiment_name)
     
-    X_tr = pd.read_parquet(X_train.path)
-    X_te = pd.read_parquet(X_test.path)
-    y_tr = pd.read_parquet(y_train.path).values.ravel()
-    y_te = pd.read_parquet(y_test.path).values.ravel()
+    X_tr = read_artifact(X_train.path, "X_train")
+    X_te = read_artifact(X_test.path, "X_test")
+    y_tr = read_artifact(y_train.path, "y_train").values.ravel()
+    y_te = read_artifact(y_test.path, "y_test").values.ravel()
+    with open(feature_transform.path, encoding="utf-8") as f:
+        transform = json.load(f)
     
     with mlflow.start_run() as run:
         model = RandomForestRegressor(
@@ -161,8 +211,12 @@ def train_model(
         model.fit(X_tr, y_tr)
         
         y_pred = model.predict(X_te)
-        rmse = np.sqrt(mean_squared_error(y_te, y_pred))
-        r2 = r2_score(y_te, y_pred)
+        
+        # 단일 패스 메트릭: 잔차를 한 번만 계산해 RMSE/R² 도출
+        residual = y_te - y_pred
+        mse = float(np.dot(residual, residual) / residual.size)
+        rmse = float(np.sqrt(mse))
+        r2 = float(1.0 - mse / y_te.var())
         
         mlflow.log_params({
             "n_estimators": n_estimators,
@@ -170,6 +224,8 @@ def train_model(
         })
         mlflow.log_metrics({"rmse": rmse, "r2": r2})
         mlflow.sklearn.log_model(model, "model")
+        # 서빙에서 같은 전처리를 재현하도록 변환을 모델과 함께 기록
+        mlflow.log_dict(transform, "feature_transform.json")
         
         print(f"✅ 모델 학습 완료")
         print(f"   RMSE: {rmse:.4f}")
@@ -179,16 +235,14 @@ def train_model(
         return run.info.run_id
 
 
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["mlflow", "boto3"]
-)
+@component(**component_env(["mlflow", "boto3"]))
 def evaluate_model(
     run_id: str,
     mlflow_tracking_uri: str,
     r2_threshold: float
 ) -> str:
-    """Step 5: 모델 평가 및 배포 결정"""
+    """Step 4: 모델 평가 및 배포 결정"""
+    
     import mlflow
     
     mlflow.set_tracking_uri(mlflow_tracking_uri)
@@ -207,17 +261,15 @@ def evaluate_model(
         return "skip"
 
 
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["kubernetes", "mlflow", "boto3"]
-)
+@component(**component_env(["kubernetes", "mlflow", "boto3"]))
 def deploy_model(
     run_id: str,
     model_name: str,
     namespace: str,
     mlflow_tracking_uri: str
 ):
-    """Step 6: KServe로 모델 배포"""
+    """Step 5: KServe로 모델 배포"""
+    
     import mlflow
     from kubernetes import client, config
     
@@ -234,9 +286,10 @@ def deploy_model(
     print(f"✅ 배포 완료 (시뮬레이션)")
 
 
-@component(base_image="python:3.9-slim")
+@component(**component_env())
 def send_alert(run_id: str, message: str):
     """알림 전송"""
+    
     print(f"⚠️ Alert: {message}")
     print(f"   Run ID: {run_id}")
 
@@ -276,44 +329,47 @@ def e2e_pipeline(
     # Step 1: 데이터 로드
     load_task = load_data(data_source=data_source)
     
-    # Step 2: 전처리
-    preprocess_task = preprocess(
+    # Step 2: 전처리 + 피처 엔지니어링
+    feature_task = prepare_features(
         input_data=load_task.outputs["output_data"]
     )
     
-    # Step 3: 피처 엔지니어링
-    feature_task = feature_engineering(
-        X_train_in=preprocess_task.outputs["X_train_out"],
-        X_test_in=preprocess_task.outputs["X_test_out"]
-    )
+    # 데이터 단계는 KFP 캐시 재사용: 입력 아티팩트·컴포넌트·파라미터가 같으면 건너뜀
+    # (n_estimators 등 학습 파라미터만 바꾸면 train_model부터 다시 실행)
+    for task in (load_task, feature_task):
+        task.set_caching_options(True)
     
-    # Step 4: 모델 학습
+    # Step 3: 모델 학습
     train_task = train_model(
         X_train=feature_task.outputs["X_train_out"],
         X_test=feature_task.outputs["X_test_out"],
-        y_train=preprocess_task.outputs["y_train_out"],
-        y_test=preprocess_task.outputs["y_test_out"],
+        y_train=feature_task.outputs["y_train_out"],
+        y_test=feature_task.outputs["y_test_out"],
+        feature_transform=feature_task.outputs["feature_transform"],
         mlflow_tracking_uri=mlflow_tracking_uri,
         experiment_name=experiment_name,
         n_estimators=n_estimators,
         max_depth=max_depth
     )
     
-    # Step 5: 평가
+    # Step 4: 평가
     evaluate_task = evaluate_model(
         run_id=train_task.output,
         mlflow_tracking_uri=mlflow_tracking_uri,
         r2_threshold=r2_threshold
     )
+    # MLflow 조회/태그 기록 및 배포는 부수 효과가 있으므로 캐시하지 않음
+    evaluate_task.set_caching_options(False)
     
-    # Step 6: 조건부 배포
+    # Step 5: 조건부 배포
     with dsl.If(evaluate_task.output == "deploy"):
-        deploy_model(
+        deploy_task = deploy_model(
             run_id=train_task.output,
             model_name=model_name,
             namespace=namespace,
             mlflow_tracking_uri=mlflow_tracking_uri
         )
+        deploy_task.set_caching_options(False)
     
     with dsl.If(evaluate_task.output == "skip"):
         send_alert(
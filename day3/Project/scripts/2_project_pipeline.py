@@ -25,7 +25,7 @@
 
 import os
 from kfp import dsl
-from kfp.dsl import component, Input, Output, Dataset
+from kfp.dsl import component, Input, Output, Dataset, Artifact
 from kfp import compiler
 
 
@@ -38,21 +38,45 @@ USER_NAMESPACE = "kubeflow-user-example-com" # 현재 Kubeflow 프로필 네임
 # MLflow 설정 (변경 불필요)
 MLFLOW_TRACKING_URI = "http://mlflow-server-service.mlflow-system.svc.cluster.local:5000"
 
+# 사전 빌드 공용 컴포넌트 이미지 (day3/component-image/build_image.py로 생성)
+# 설정하면 모든 컴포넌트가 이 이미지를 사용하고 Pod 시작 시 pip install을 건너뜀
+# (이미지의 sitecustomize가 각 단계 Pod의 시작 오버헤드를 로그에 출력)
+COMPONENT_IMAGE = os.getenv("COMPONENT_IMAGE", "")
+
+
+def component_env(packages=None):
+    """컴포넌트 이미지/패키지 설정 (COMPONENT_IMAGE가 있으면 사전 빌드 이미지 사용)"""
+    if COMPONENT_IMAGE:
+        return {"base_image": COMPONENT_IMAGE, "install_kfp_package": False}
+    return {"base_image": "python:3.9-slim", "packages_to_install": packages}
+
 
 # ============================================================
 # Component 1: 데이터 로드
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["pandas==2.0.3", "scikit-learn==1.3.2"]
-)
+@component(**component_env(["pandas==2.0.3", "scikit-learn==1.3.2", "pyarrow==14.0.2"]))
 def load_data(
     data_source: str,
     output_data: Output[Dataset]
 ):
     """California Housing 데이터셋 로드"""
-    import pandas as pd
+    
+    import os
     from sklearn.datasets import fetch_california_housing
+    import time
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def write_artifact(df, path, name):
+        """Parquet(zstd) 저장: 스키마 메타데이터 기록 + 쓰기 시간/크기 출력"""
+        start = time.perf_counter()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({b"mlops.step": b"load_data", b"mlops.artifact": name.encode()})
+        pq.write_table(table.replace_schema_metadata(metadata), path, compression="zstd")
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  💾 {name}: {df.shape}, {size_kb:.1f} KB, write {elapsed:.1f} ms")
     
     print("=" * 60)
     print("  Step 1: Load Data")
@@ -61,167 +85,196 @@ def load_data(
     housing = fetch_california_housing(as_frame=True)
     df = housing.frame
     
+    # 8개 입력 피처 float64 -> float32 (타겟은 float64 유지)
+    feature_cols = list(housing.feature_names)
+    df[feature_cols] = df[feature_cols].astype("float32")
+    
     print(f"  Source: {data_source}")
     print(f"  Shape: {df.shape}")
     print(f"  Columns: {list(df.columns)}")
     
-    df.to_csv(output_data.path, index=False)
+    write_artifact(df, output_data.path, "dataset")
     print(f"  ✅ Data saved")
 
 
 # ============================================================
-# Component 2: 전처리
+# Component 2: 전처리 + 피처 엔지니어링 ⭐ (평가 항목)
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["pandas==2.0.3", "scikit-learn==1.3.2", "numpy==1.24.3"]
-)
-def preprocess(
+@component(**component_env([
+    "pandas==2.0.3", "scikit-learn==1.3.2", "numpy==1.24.3", "pyarrow==14.0.2"
+]))
+def prepare_features(
     input_data: Input[Dataset],
     X_train_out: Output[Dataset],
     X_test_out: Output[Dataset],
     y_train_out: Output[Dataset],
     y_test_out: Output[Dataset],
+    feature_transform: Output[Artifact],
     test_size: float = 0.2
-):
-    """데이터 전처리: Train/Test 분할 및 정규화"""
-    import pandas as pd
-    from sklearn.model_selection import train_test_split
-    from sklearn.preprocessing import StandardScaler
-    
-    print("=" * 60)
-    print("  Step 2: Preprocess")
-    print("=" * 60)
-    
-    df = pd.read_csv(input_data.path)
-    
-    X = df.drop(columns=['MedHouseVal'])
-    y = df['MedHouseVal']
-    
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=42
-    )
-    
-    scaler = StandardScaler()
-    X_train_scaled = pd.DataFrame(
-        scaler.fit_transform(X_train),
-        columns=X_train.columns
-    )
-    X_test_scaled = pd.DataFrame(
-        scaler.transform(X_test),
-        columns=X_test.columns
-    )
-    
-    X_train_scaled.to_csv(X_train_out.path, index=False)
-    X_test_scaled.to_csv(X_test_out.path, index=False)
-    y_train.to_csv(y_train_out.path, index=False)
-    y_test.to_csv(y_test_out.path, index=False)
-    
-    print(f"  Train: {len(X_train)}, Test: {len(X_test)}")
-    print(f"  ✅ Preprocessing completed")
-
-
-# ============================================================
-# Component 3: 피처 엔지니어링 ⭐ (평가 항목)
-# ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["pandas==2.0.3", "numpy==1.24.3"]
-)
-def feature_engineering(
-    X_train_in: Input[Dataset],
-    X_test_in: Input[Dataset],
-    X_train_out: Output[Dataset],
-    X_test_out: Output[Dataset]
 ) -> int:
     """
-    피처 엔지니어링 - 파생 변수 생성
+    전처리 + 피처 엔지니어링 - Train/Test 분할, 파생 변수 생성, 표준화
+    
+    1. Train/Test 분할 (원본 값)
+    2. 파생 피처를 원본(스케일 전) 값으로 계산 → 비율/거리가 실제 단위로 계산됨
+    3. 원본 + 파생 피처를 Train 통계로 표준화
+    4. 학습된 변환(파생 피처 정의 + 평균/표준편차)을 feature_transform JSON으로 저장
+       → train_model이 모델과 함께 기록하여 서빙에서 같은 변환을 재현
+       (lab3-2 FeaturePipeline.to_dict()와 같은 형식)
     
-    ⭐ TODO: 팀에서 창의적인 피처를 추가하세요! (평가 항목)
+    ⭐ TODO: DERIVED_FEATURES에 팀의 파생 피처를 추가하세요! (평가 항목)
     최소 1개 이상의 파생 피처가 필요합니다.
     
-    피처 아이디어:
-    - bedroom_ratio: 방 대비 침실 비율
-    - people_per_household: 가구당 인구
-    - dist_to_bay: Bay Area까지 거리
-    - income_category: 소득 구간 (binning)
-    - density: 밀집도 지표
-    - income_rooms: 소득 × 방 수 상호작용
+    지원 연산:
+    - ratio: inputs[0] / (inputs[1] + 1e-6)  예) bedroom_ratio, people_per_household
+    - product: inputs[0] * inputs[1]          예) income_rooms, density
+    - linear: weights[0] * inputs[0] + weights[1] * inputs[1]  예) location_score
+    - distance: (위도, 경도)에서 origin까지 거리  예) dist_to_bay, dist_to_la
     
     Returns:
         생성된 새 피처 개수
     """
+    
+    import os
+    import json
     import pandas as pd
     import numpy as np
-    
-    print("=" * 60)
-    print("  Step 3: Feature Engineering")
-    print("=" * 60)
-    
-    X_train = pd.read_csv(X_train_in.path)
-    X_test = pd.read_csv(X_test_in.path)
-    
-    original_cols = list(X_train.columns)
-    
-    def add_features(df):
-        """
-        ⭐ TODO: 여기에 새로운 피처를 추가하세요!
-        """
-        df = df.copy()
-        
+    from sklearn.model_selection import train_test_split
+    import time
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def read_artifact(path, name):
+        """Parquet 로드 + 읽기 시간/크기 출력"""
+        start = time.perf_counter()
+        df = pq.read_table(path).to_pandas()
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  📂 {name}: {df.shape}, {size_kb:.1f} KB, read {elapsed:.1f} ms")
+        return df
+
+    def write_artifact(df, path, name):
+        """Parquet(zstd) 저장: 스키마 메타데이터 기록 + 쓰기 시간/크기 출력"""
+        start = time.perf_counter()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({b"mlops.step": b"prepare_features", b"mlops.artifact": name.encode()})
+        pq.write_table(table.replace_schema_metadata(metadata), path, compression="zstd")
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  💾 {name}: {df.shape}, {size_kb:.1f} KB, write {elapsed:.1f} ms")
+    
+    # ⭐ TODO: 여기에 새로운 피처를 추가하세요!
+    DERIVED_FEATURES = [
         # 예시 1: 방당 침실 비율
-        df['bedroom_ratio'] = df['AveBedrms'] / (df['AveRooms'] + 1e-6)
+        {"name": "bedroom_ratio", "op": "ratio", "inputs": ["AveBedrms", "AveRooms"]},
         
         # 예시 2: 가구당 인구
-        df['people_per_household'] = df['Population'] / (df['AveOccup'] + 1e-6)
+        {"name": "people_per_household", "op": "ratio", "inputs": ["Population", "AveOccup"]},
         
         # TODO: 더 많은 피처 추가!
         # 예시 3: Bay Area까지 거리
-        # bay_lat, bay_long = 37.77, -122.42
-        # df['dist_to_bay'] = np.sqrt(
-        #     (df['Latitude'] - bay_lat)**2 + 
-        #     (df['Longitude'] - bay_long)**2
-        # )
+        # {"name": "dist_to_bay", "op": "distance", "inputs": ["Latitude", "Longitude"],
+        #  "origin": [37.77, -122.42]},
         
         # 예시 4: 소득과 방 수의 상호작용
-        # df['income_rooms'] = df['MedInc'] * df['AveRooms']
+        # {"name": "income_rooms", "op": "product", "inputs": ["MedInc", "AveRooms"]},
         
+        # 예시 5: 위치 점수 (가중 합)
+        # {"name": "location_score", "op": "linear", "inputs": ["Latitude", "Longitude"],
+        #  "weights": [0.5, 0.5]},
+    ]
+    EPS = 1e-6
+    
+    def add_features(df):
+        """원본(스케일 전) 값으로 파생 피처 계산"""
+        df = df.copy()
+        for spec in DERIVED_FEATURES:
+            a, b = (df[col].to_numpy(dtype="float64") for col in spec["inputs"])
+            if spec["op"] == "ratio":
+                df[spec["name"]] = a / (b + EPS)
+            elif spec["op"] == "product":
+                df[spec["name"]] = a * b
+            elif spec["op"] == "linear":
+                df[spec["name"]] = spec["weights"][0] * a + spec["weights"][1] * b
+            elif spec["op"] == "distance":
+                df[spec["name"]] = np.hypot(a - spec["origin"][0], b - spec["origin"][1])
+            else:
+                raise ValueError(
+                    f"Unsupported feature op: {spec['op']}. Supported: ['ratio', 'product', 'linear', 'distance']"
+                )
         return df
     
-    X_train_fe = add_features(X_train)
-    X_test_fe = add_features(X_test)
+    print("=" * 60)
+    print("  Step 2: Prepare Features")
+    print("=" * 60)
     
-    new_cols = [c for c in X_train_fe.columns if c not in original_cols]
+    df = read_artifact(input_data.path, "dataset")
     
-    print(f"  Original features: {len(original_cols)}")
-    print(f"  New features: {new_cols}")
-    print(f"  Total features: {len(X_train_fe.columns)}")
+    X = df.drop(columns=['MedHouseVal'])
+    y = df['MedHouseVal']
+    feature_cols = list(X.columns)
     
-    X_train_fe.to_csv(X_train_out.path, index=False)
-    X_test_fe.to_csv(X_test_out.path, index=False)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=42
+    )
     
-    print(f"  ✅ Feature engineering completed")
+    # 1) 파생 피처: 원본 값으로 계산
+    X_train_fe = add_features(X_train)
+    X_test_fe = add_features(X_test)
+    output_cols = list(X_train_fe.columns)
+    new_cols = output_cols[len(feature_cols):]
+    
+    # 2) 표준화: Train 통계 (StandardScaler와 동일, 분산 0인 열은 스케일 1)
+    train_values = X_train_fe.to_numpy(dtype="float64")
+    mean = train_values.mean(axis=0)
+    scale = train_values.std(axis=0)
+    scale[scale == 0] = 1.0
+    
+    def standardize(values):
+        return pd.DataFrame((values - mean) / scale, columns=output_cols).astype("float32")
+    
+    write_artifact(standardize(train_values), X_train_out.path, "X_train")
+    write_artifact(standardize(X_test_fe.to_numpy(dtype="float64")), X_test_out.path, "X_test")
+    write_artifact(y_train.to_frame(), y_train_out.path, "y_train")
+    write_artifact(y_test.to_frame(), y_test_out.path, "y_test")
+    
+    # 3) 학습된 변환 저장 (서빙 시 원본 입력 → 같은 피처 재현)
+    with open(feature_transform.path, "w", encoding="utf-8") as f:
+        json.dump({
+            "feature_names": feature_cols,
+            "derived_features": DERIVED_FEATURES,
+            "standardize": True,
+            "eps": EPS,
+            "mean": mean.tolist(),
+            "scale": scale.tolist()
+        }, f, indent=2)
+    
+    print(f"  Train: {len(X_train)}, Test: {len(X_test)}")
+    print(f"  Original features: {len(feature_cols)}")
+    print(f"  New features: {new_cols}")
+    print(f"  Total features: {len(output_cols)}")
+    print(f"  ✅ Feature preparation completed")
     
     return len(new_cols)
 
 
 # ============================================================
-# Component 4: 모델 학습 (MLflow 연동)
+# Component 3: 모델 학습 (MLflow 연동)
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=[
-        "pandas==2.0.3",
-        "scikit-learn==1.3.2",
-        "mlflow==2.9.2",
-        "numpy==1.24.3"
-    ]
-)
+@component(**component_env([
+    "pandas==2.0.3",
+    "scikit-learn==1.3.2",
+    "mlflow==2.9.2",
+    "numpy==1.24.3",
+    "pyarrow==14.0.2"
+]))
 def train_model(
     X_train: Input[Dataset],
     X_test: Input[Dataset],
     y_train: Input[Dataset],
     y_test: Input[Dataset],
+    feature_transform: Input[Artifact],
     mlflow_tracking_uri: str,
     experiment_name: str,
     team_name: str,
@@ -233,27 +286,43 @@ def train_model(
     
     Note:
         S3 권한 문제를 피하기 위해 artifact 저장은 비활성화되어 있습니다.
-        메트릭과 파라미터만 기록합니다.
+        메트릭과 파라미터, 피처 변환(feature_transform 태그)만 기록합니다.
     
     Returns:
         MLflow Run ID
     """
-    import pandas as pd
+    
+    import os
+    import json
     import numpy as np
     import mlflow
+    from mlflow.entities import Metric, Param, RunTag
     from sklearn.ensemble import RandomForestRegressor
-    from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
-    import os
+    import time
+    import pyarrow.parquet as pq
+
+    def read_artifact(path, name):
+        """Parquet 로드 + 읽기 시간/크기 출력"""
+        start = time.perf_counter()
+        df = pq.read_table(path).to_pandas()
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  📂 {name}: {df.shape}, {size_kb:.1f} KB, read {elapsed:.1f} ms")
+        return df
     
     print("=" * 60)
-    print(f"  Step 4: Train Model - {team_name}")
+    print(f"  Step 3: Train Model - {team_name}")
     print("=" * 60)
     
     # 데이터 로드
-    X_train_df = pd.read_csv(X_train.path)
-    X_test_df = pd.read_csv(X_test.path)
-    y_train_df = pd.read_csv(y_train.path)
-    y_test_df = pd.read_csv(y_test.path)
+    X_train_df = read_artifact(X_train.path, "X_train")
+    X_test_df = read_artifact(X_test.path, "X_test")
+    y_train_df = read_artifact(y_train.path, "y_train")
+    y_test_df = read_artifact(y_test.path, "y_test")
+    
+    # prepare_features가 학습한 변환 (원본 입력 → 모델 입력)
+    with open(feature_transform.path, encoding="utf-8") as f:
+        transform = json.load(f)
     
     print(f"  Training data: {X_train_df.shape}")
     print(f"  Test data: {X_test_df.shape}")
@@ -270,14 +339,15 @@ def train_model(
         run_id = run.info.run_id
         print(f"  Run ID: {run_id}")
         
-        # 파라미터 로깅
-        mlflow.log_params({
+        # 파라미터/태그/메트릭은 모아 두었다가 log_batch 한 번으로 전송 (호출마다 HTTP 왕복 방지)
+        params = {
             "n_estimators": n_estimators,
             "max_depth": max_depth,
             "random_state": 42,
             "team": team_name
-        })
-        mlflow.set_tag("team", team_name)
+        }
+        # 피처 변환은 모델과 함께 기록 → 서빙에서 같은 전처리를 재현
+        tags = {"team": team_name, "feature_transform": json.dumps(transform, separators=(",", ":"))}
         
         # 모델 학습
         print(f"  Training RandomForest...")
@@ -292,12 +362,15 @@ def train_model(
         # 예측 및 평가
         y_pred = model.predict(X_test_df)
         
-        r2 = r2_score(y_test_df, y_pred)
-        rmse = np.sqrt(mean_squared_error(y_test_df, y_pred))
-        mae = mean_absolute_error(y_test_df, y_pred)
+        # 단일 패스 메트릭: 잔차를 한 번만 계산해 MAE/MSE/RMSE/R² 도출
+        y_true = y_test_df.values.ravel()
+        residual = y_true - y_pred
+        mse = float(np.dot(residual, residual) / residual.size)
+        mae = float(np.abs(residual).mean())
+        rmse = float(np.sqrt(mse))
+        r2 = float(1.0 - mse / y_true.var())
         
-        # 메트릭 로깅
-        mlflow.log_metrics({"r2": r2, "rmse": rmse, "mae": mae})
+        metrics = {"r2": r2, "rmse": rmse, "mae": mae}
         
         print(f"  Performance:")
         print(f"    - R2 Score: {r2:.4f}")
@@ -319,12 +392,22 @@ def train_model(
         print(f"  Top 5 Feature Importance:")
         for feat, imp in sorted_importance:
             safe_name = feat.replace(" ", "_")[:15]
-            mlflow.log_metric(f"fi_{safe_name}", imp)
+            metrics[f"fi_{safe_name}"] = float(imp)
             print(f"    - {feat}: {imp:.4f}")
         
+        # 메트릭/파라미터/태그 로깅 (요청 1회)
+        timestamp = int(time.time() * 1000)
+        mlflow.tracking.MlflowClient().log_batch(
+            run_id,
+            metrics=[Metric(k, v, timestamp, 0) for k, v in metrics.items()],
+            params=[Param(k, str(v)) for k, v in params.items()],
+            tags=[RunTag(k, str(v)) for k, v in tags.items()]
+        )
+        
         # ⚠️ S3 artifact 저장 비활성화 (권한 문제 방지)
         # mlflow.log_dict(feature_importance, "feature_importance.json")
         # mlflow.sklearn.log_model(model, "model")
+        # mlflow.log_dict(transform, "feature_transform.json")
         
         print(f"  ✅ Training completed")
     
@@ -332,23 +415,21 @@ def train_model(
 
 
 # ============================================================
-# Component 5: 모델 평가
+# Component 4: 모델 평가
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["mlflow==2.9.2"]
-)
+@component(**component_env(["mlflow==2.9.2"]))
 def evaluate_model(
     run_id: str,
     mlflow_tracking_uri: str,
     r2_threshold: float = 0.75
 ) -> str:
     """모델 평가 및 배포 결정"""
-    import mlflow
+    
     import os
+    import mlflow
     
     print("=" * 60)
-    print("  Step 5: Evaluate Model")
+    print("  Step 4: Evaluate Model")
     print("=" * 60)
     
     os.environ['MLFLOW_TRACKING_URI'] = mlflow_tracking_uri
@@ -379,12 +460,9 @@ def evaluate_model(
 
 
 # ============================================================
-# Component 6: 모델 배포 (KServe)
+# Component 5: 모델 배포 (KServe)
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["kubernetes==28.1.0"]
-)
+@component(**component_env(["kubernetes==28.1.0"]))
 def deploy_model(
     run_id: str,
     model_name: str,
@@ -396,12 +474,13 @@ def deploy_model(
     ⚠️ 중요: namespace는 현재 Kubeflow 프로필의 네임스페이스와 
     동일해야 RBAC 권한 오류가 발생하지 않습니다.
     """
+    
     from kubernetes import client, config
     from kubernetes.client.rest import ApiException
     import time
     
     print("=" * 60)
-    print("  Step 6: Deploy Model (KServe)")
+    print("  Step 5: Deploy Model (KServe)")
     print("=" * 60)
     
     print(f"  Model Name: {model_name}")
@@ -492,11 +571,12 @@ def deploy_model(
 
 
 # ============================================================
-# Component 7: 알림
+# Component 6: 알림
 # ============================================================
-@component(base_image="python:3.9-slim")
+@component(**component_env())
 def send_alert(run_id: str, team_name: str):
     """성능 미달 알림"""
+    
     print("=" * 60)
     print(f"  Alert - {team_name}")
     print("=" * 60)
@@ -537,23 +617,23 @@ def project_pipeline(
     # Step 1: 데이터 로드
     load_task = load_data(data_source=data_source)
     
-    # Step 2: 전처리
-    preprocess_task = preprocess(
+    # Step 2: 전처리 + 피처 엔지니어링
+    feature_task = prepare_features(
         input_data=load_task.outputs["output_data"]
     )
     
-    # Step 3: 피처 엔지니어링
-    feature_task = feature_engineering(
-        X_train_in=preprocess_task.outputs["X_train_out"],
-        X_test_in=preprocess_task.outputs["X_test_out"]
-    )
+    # 데이터 단계는 KFP 캐시 재사용: 입력 아티팩트·컴포넌트·파라미터가 같으면 건너뜀
+    # (n_estimators 등 학습 파라미터만 바꾸면 train_model부터 다시 실행)
+    for task in (load_task, feature_task):
+        task.set_caching_options(True)
     
-    # Step 4: 모델 학습
+    # Step 3: 모델 학습
     train_task = train_model(
         X_train=feature_task.outputs["X_train_out"],
         X_test=feature_task.outputs["X_test_out"],
-        y_train=preprocess_task.outputs["y_train_out"],
-        y_test=preprocess_task.outputs["y_test_out"],
+        y_train=feature_task.outputs["y_train_out"],
+        y_test=feature_task.outputs["y_test_out"],
+        feature_transform=feature_task.outputs["feature_transform"],
         mlflow_tracking_uri=mlflow_tracking_uri,
         experiment_name=experiment_name,
         team_name=team_name,
@@ -561,20 +641,23 @@ def project_pipeline(
         max_depth=max_depth
     )
     
-    # Step 5: 평가
+    # Step 4: 평가
     evaluate_task = evaluate_model(
         run_id=train_task.output,
         mlflow_tracking_uri=mlflow_tracking_uri,
         r2_threshold=r2_threshold
     )
+    # MLflow 조회/태그 기록 및 배포는 부수 효과가 있으므로 캐시하지 않음
+    evaluate_task.set_caching_options(False)
     
-    # Step 6: 조건부 배포
+    # Step 5: 조건부 배포
     with dsl.If(evaluate_task.output == "deploy"):
-        deploy_model(
+        deploy_task = deploy_model(
             run_id=train_task.output,
             model_name=model_name,
             namespace=namespace
         )
+        deploy_task.set_caching_options(False)
     
     with dsl.If(evaluate_task.output == "skip"):
         send_alert(run_id=train_task.output, team_name=team_name)
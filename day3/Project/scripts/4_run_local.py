@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Day 3 Project: 로컬 파이프라인 실행 (캐시 재사용 / 병렬 실행)
+============================================================
+
+Kubeflow 클러스터 없이 파이프라인 컴포넌트를 로컬에서 DAG로 실행합니다.
+업스트림 입력/코드/파라미터가 같은 단계는 캐시된 출력을 재사용하므로
+하이퍼파라미터 스윕에서는 train_model / evaluate_model만 다시 실행됩니다.
+스윕의 n_estimators별 학습/평가 브랜치는 서로 독립적이므로 병렬 실행됩니다.
+
+배포 단계(deploy_model / send_alert)는 로컬에서 실행하지 않습니다.
+
+사용법:
+    python scripts/4_run_local.py
+    python scripts/4_run_local.py --pipeline solution --n-estimators 50 100 200
+    python scripts/4_run_local.py --pipeline e2e --no-cache
+    python scripts/4_run_local.py --n-estimators 50 100 200 --workers 3 --executor process
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+from local_runner import LocalPipelineRunner, Step, StepOutput  # noqa: E402
+
+PIPELINE_FILES = {
+    "project": os.path.join(SCRIPT_DIR, "2_project_pipeline.py"),
+    "solution": os.path.join(SCRIPT_DIR, "..", "solution", "project_solution.py"),
+    "e2e": os.path.join(SCRIPT_DIR, "1_e2e_pipeline.py"),
+}
+
+
+def load_pipeline_module(name: str):
+    """숫자로 시작하는 스크립트 파일을 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location(f"{name}_pipeline", PIPELINE_FILES[name])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_steps(module, pipeline: str, args):
+    """파이프라인 함수와 동일한 단계 연결 (배포 단계 제외, n_estimators별 학습 브랜치)"""
+    steps = [
+        Step("load_data", module.load_data, {"data_source": "sklearn"}),
+        Step("prepare_features", module.prepare_features, {
+            "input_data": StepOutput("load_data", "output_data"),
+        }),
+    ]
+    for n_estimators in args.n_estimators:
+        steps.extend(build_train_branch(module, pipeline, args, n_estimators))
+    return steps
+
+
+def build_train_branch(module, pipeline: str, args, n_estimators: int):
+    """학습 → 평가 브랜치"""
+    train_args = {
+        "X_train": StepOutput("prepare_features", "X_train_out"),
+        "X_test": StepOutput("prepare_features", "X_test_out"),
+        "y_train": StepOutput("prepare_features", "y_train_out"),
+        "y_test": StepOutput("prepare_features", "y_test_out"),
+        "feature_transform": StepOutput("prepare_features", "feature_transform"),
+        "mlflow_tracking_uri": args.mlflow_uri,
+        "experiment_name": args.experiment_name,
+        "n_estimators": n_estimators,
+        "max_depth": args.max_depth,
+    }
+    if pipeline != "e2e":
+        train_args["team_name"] = args.team_name
+
+    suffix = f"n{n_estimators}"
+    return [
+        Step(f"train_model_{suffix}", module.train_model, train_args),
+        # MLflow 태그를 기록하는 단계이므로 항상 실행
+        Step(f"evaluate_model_{suffix}", module.evaluate_model, {
+            "run_id": StepOutput(f"train_model_{suffix}"),
+            "mlflow_tracking_uri": args.mlflow_uri,
+            "r2_threshold": args.r2_threshold,
+        }, cache=False),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 파이프라인 실행")
+    parser.add_argument("--pipeline", default="project", choices=list(PIPELINE_FILES))
+    parser.add_argument("--n-estimators", type=int, nargs="+", default=[100],
+                        help="여러 값을 주면 하이퍼파라미터 스윕")
+    parser.add_argument("--max-depth", type=int, default=10)
+    parser.add_argument("--r2-threshold", type=float, default=0.75)
+    parser.add_argument("--team-name", default="local")
+    parser.add_argument("--experiment-name", default="local-pipeline")
+    parser.add_argument("--mlflow-uri", default=f"file:{os.path.abspath('mlruns')}")
+    parser.add_argument("--cache-dir", default=".pipeline_cache")
+    parser.add_argument("--no-cache", action="store_true", help="캐시 무시하고 전체 재실행")
+    parser.add_argument("--workers", type=int, default=1, help="동시에 실행할 최대 단계 수")
+    parser.add_argument("--executor", default="thread", choices=["thread", "process"])
+    args = parser.parse_args()
+
+    module = load_pipeline_module(args.pipeline)
+    runner = LocalPipelineRunner(cache_dir=args.cache_dir, use_cache=not args.no_cache)
+
+    print("=" * 60)
+    print(f"  Local Pipeline Runner: {args.pipeline}")
+    print(f"  Cache: {os.path.abspath(args.cache_dir)}")
+    print("=" * 60)
+
+    results = runner.run(
+        build_steps(module, args.pipeline, args),
+        max_workers=args.workers,
+        executor=args.executor
+    )
+
+    print("\n" + "=" * 60)
+    print(f"  {'step':<26} {'status':<9} {'start':>8} {'elapsed':>9}")
+    for result in sorted(results.values(), key=lambda r: r.started_sec):
+        status = "cached" if result.cached else "executed"
+        print(f"  {result.name:<26} {status:<9} {result.started_sec:>7.2f}s "
+              f"{result.elapsed_sec:>8.2f}s")
+    print(f"\n  {'n_estimators':>12}  decision")
+    for n_estimators in args.n_estimators:
+        decision = results[f"evaluate_model_n{n_estimators}"].return_value
+        print(f"  {n_estimators:>12}  {decision}")
+    print(f"\n  Wall time: {runner.wall_time:.2f}s")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+"""
+Local Pipeline Runner
+=====================
+
+Kubeflow 클러스터 없이 @component 함수를 로컬에서 DAG로 실행하는 러너
+
+- StepOutput 참조로부터 의존성을 계산해 준비된 단계부터 실행
+- 독립적인 브랜치는 스레드 풀 / 프로세스 풀에서 병렬 실행
+- 아티팩트는 로컬 파일로 전달 (cache_dir를 /dev/shm에 두면 메모리 기반)
+- 단계별 결과를 content-addressed 캐시에 저장
+  캐시 키 = 컴포넌트 소스 해시 + 파라미터 + 입력 아티팩트 내용 해시
+- 업스트림이 바뀌지 않은 단계는 캐시된 출력을 재사용 (재실행 없음)
+  → n_estimators만 바꾼 하이퍼파라미터 스윕은 train_model부터만 실행
+- 단계별 시작 시점 / 소요 시간과 전체 wall time 보고
+
+사용 예:
+    from local_runner import LocalPipelineRunner, Step, StepOutput
+
+    steps = [
+        Step("load_data", load_data, {"data_source": "sklearn"}),
+        Step("prepare_features", prepare_features,
+             {"input_data": StepOutput("load_data", "output_data")}),
+    ]
+    runner = LocalPipelineRunner(cache_dir=".pipeline_cache")
+    results = runner.run(steps, max_workers=4, executor="process")
+
+현대오토에버 MLOps Training
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait
+)
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# ============================================================
+# 아티팩트 / 단계 정의
+# ============================================================
+class LocalArtifact:
+    """KFP Input/Output 아티팩트의 로컬 대체 객체 (path, metadata 지원)"""
+
+    def __init__(self, path: str, metadata: Optional[Dict] = None):
+        self.path = path
+        self.uri = path
+        self.metadata = metadata or {}
+
+    def log_metric(self, metric: str, value: float) -> None:
+        """Metrics 아티팩트 호환"""
+        self.metadata[metric] = value
+
+
+@dataclass(frozen=True)
+class StepOutput:
+    """업스트림 단계 출력 참조 (name="Output"이면 반환값)"""
+    step: str
+    name: str = "Output"
+
+
+@dataclass
+class Step:
+    """파이프라인 단계 정의"""
+    name: str
+    component: Any
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    cache: bool = True
+
+
+@dataclass
+class StepResult:
+    """단계 실행 결과"""
+    name: str
+    cache_key: str
+    outputs: Dict[str, str]
+    output_hashes: Dict[str, str]
+    return_value: Any = None
+    cached: bool = False
+    elapsed_sec: float = 0.0
+    started_sec: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "cache_key": self.cache_key[:12],
+            "cached": self.cached,
+            "started_sec": round(self.started_sec, 3),
+            "elapsed_sec": round(self.elapsed_sec, 3),
+            "return_value": self.return_value
+        }
+
+
+# ============================================================
+# 해시 유틸리티
+# ============================================================
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def component_fingerprint(component) -> str:
+    """컴포넌트 소스(데코레이터 포함) 해시 - 코드/패키지 변경 시 캐시 무효화"""
+    source = inspect.getsource(component.python_func)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _artifact_names(component) -> Dict[str, List[str]]:
+    """컴포넌트 스펙에서 입력/출력 아티팩트 이름 추출"""
+    spec = component.component_spec
+    inputs = [k for k, v in (spec.inputs or {}).items() if v.type.startswith("system.")]
+    outputs = [k for k, v in (spec.outputs or {}).items() if v.type.startswith("system.")]
+    return {"inputs": inputs, "outputs": outputs}
+
+
+def step_dependencies(step: Step) -> Set[str]:
+    """StepOutput 참조로부터 업스트림 단계 이름 추출"""
+    return {
+        value.step for value in step.arguments.values()
+        if isinstance(value, StepOutput)
+    }
+
+
+# ============================================================
+# 컴포넌트 실행 (스레드 / 프로세스 워커)
+# ============================================================
+_MODULE_CACHE: Dict[str, Any] = {}
+
+
+def _component_ref(component) -> Tuple[str, str]:
+    """프로세스 워커에서 다시 로드할 수 있는 (소스 파일, 함수 이름)"""
+    func = component.python_func
+    return inspect.getsourcefile(func), func.__name__
+
+
+def _call_component(component, kwargs: Dict[str, Any]) -> Any:
+    """컴포넌트 함수 호출 (component가 튜플이면 소스 파일에서 로드)"""
+    if isinstance(component, tuple):
+        source_file, func_name = component
+        module = _MODULE_CACHE.get(source_file)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(
+                f"_local_component_{len(_MODULE_CACHE)}", source_file
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _MODULE_CACHE[source_file] = module
+        component = getattr(module, func_name)
+    return component.python_func(**kwargs)
+
+
+# ============================================================
+# 러너
+# ============================================================
+class LocalPipelineRunner:
+    """content-addressed 캐시를 사용하는 로컬 파이프라인 러너"""
+
+    def __init__(self, cache_dir: str = ".pipeline_cache", use_cache: bool = True):
+        """
+        Args:
+            cache_dir: 단계 출력 저장 디렉토리 (키별 하위 디렉토리)
+            use_cache: False면 항상 재실행 (결과는 캐시에 갱신)
+        """
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.wall_time = 0.0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def cache_key(self, step: Step, results: Dict[str, StepResult]) -> str:
+        """컴포넌트 소스 + 파라미터 + 입력 아티팩트 해시로 캐시 키 계산"""
+        resolved = {}
+        for arg, value in sorted(step.arguments.items()):
+            if isinstance(value, StepOutput):
+                upstream = results[value.step]
+                if value.name == "Output":
+                    resolved[arg] = {"value": upstream.return_value}
+                else:
+                    resolved[arg] = {"artifact": upstream.output_hashes[value.name]}
+            else:
+                resolved[arg] = {"value": value}
+
+        payload = json.dumps({
+            "component": step.component.python_func.__name__,
+            "source": component_fingerprint(step.component),
+            "arguments": resolved
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_cached(self, step: Step, key: str) -> Optional[StepResult]:
+        """
+        캐시 디렉토리에서 단계 결과 복원
+
+        출력 파일이 없거나 기록된 해시와 다르면(삭제/수정된 캐시) None을 반환해
+        단계를 다시 실행합니다.
+        """
+        meta_path = os.path.join(self.cache_dir, key, "_meta.json")
+        if not os.path.exists(meta_path):
+            return None
+
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        outputs = {
+            name: os.path.join(self.cache_dir, key, name)
+            for name in meta["output_hashes"]
+        }
+        for name, path in outputs.items():
+            if not os.path.isfile(path) or hash_file(path) != meta["output_hashes"][name]:
+                return None
+
+        return StepResult(
+            name=step.name,
+            cache_key=key,
+            outputs=outputs,
+            output_hashes=meta["output_hashes"],
+            return_value=meta["return_value"],
+            cached=True
+        )
+
+    def _prepare(self, step: Step, results: Dict[str, StepResult]) -> Tuple[str, Dict]:
+        """임시 작업 디렉토리 생성 및 컴포넌트 인자(아티팩트 경로) 구성"""
+        work_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=f".{step.name}-")
+        kwargs = {}
+        for arg, value in step.arguments.items():
+            if isinstance(value, StepOutput):
+                upstream = results[value.step]
+                kwargs[arg] = (
+                    upstream.return_value if value.name == "Output"
+                    else LocalArtifact(upstream.outputs[value.name])
+                )
+            else:
+                kwargs[arg] = value
+        for name in _artifact_names(step.component)["outputs"]:
+            kwargs[name] = LocalArtifact(os.path.join(work_dir, name))
+        return work_dir, kwargs
+
+    def _finalize(
+        self,
+        step: Step,
+        key: str,
+        work_dir: str,
+        return_value: Any
+    ) -> StepResult:
+        """출력 해시 계산 후 작업 디렉토리를 캐시 키 위치로 이동"""
+        output_hashes = {
+            name: hash_file(os.path.join(work_dir, name))
+            for name in _artifact_names(step.component)["outputs"]
+        }
+        with open(os.path.join(work_dir, "_meta.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "step": step.name,
+                "output_hashes": output_hashes,
+                "return_value": return_value
+            }, f, indent=2, default=str)
+
+        target = os.path.join(self.cache_dir, key)
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        os.replace(work_dir, target)
+
+        return StepResult(
+            name=step.name,
+            cache_key=key,
+            outputs={name: os.path.join(target, name) for name in output_hashes},
+            output_hashes=output_hashes,
+            return_value=return_value
+        )
+
+    def run(
+        self,
+        steps: List[Step],
+        max_workers: int = 1,
+        executor: str = "thread"
+    ) -> Dict[str, StepResult]:
+        """
+        DAG 실행: 의존성이 충족된 단계부터 병렬로 실행
+
+        Args:
+            steps: 단계 정의 리스트 (순서 무관)
+            max_workers: 동시에 실행할 최대 단계 수
+            executor: "thread" (같은 프로세스) 또는 "process" (프로세스 풀)
+
+        Returns:
+            {단계 이름: 결과}
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor}. Use 'thread' or 'process'")
+
+        by_name = {step.name: step for step in steps}
+        pending = {step.name: step_dependencies(step) for step in steps}
+        for name, deps in pending.items():
+            unknown = deps - by_name.keys()
+            if unknown:
+                raise ValueError(f"Step '{name}' depends on unknown steps: {sorted(unknown)}")
+
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        results: Dict[str, StepResult] = {}
+        running = {}
+        run_start = time.perf_counter()
+
+        with pool_class(max_workers=max_workers) as pool:
+            while pending or running:
+                ready = [name for name, deps in pending.items() if deps <= results.keys()]
+                progressed = False
+                for name in ready:
+                    del pending[name]
+                    step = by_name[name]
+                    start = time.perf_counter()
+                    key = self.cache_key(step, results)
+
+                    cached = (
+                        self._load_cached(step, key)
+                        if self.use_cache and step.cache else None
+                    )
+                    if cached is not None:
+                        cached.started_sec = start - run_start
+                        cached.elapsed_sec = time.perf_counter() - start
+                        results[name] = cached
+                        self._report(cached)
+                        progressed = True
+                        continue
+
+                    work_dir, kwargs = self._prepare(step, results)
+                    component = (
+                        _component_ref(step.component) if executor == "process"
+                        else step.component
+                    )
+                    future = pool.submit(_call_component, component, kwargs)
+                    running[future] = (step, key, work_dir, start)
+
+                if progressed:
+                    # 캐시 적중으로 새로 준비된 단계를 먼저 제출
+                    continue
+                if not running:
+                    raise ValueError(f"Cyclic dependencies between steps: {sorted(pending)}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step, key, work_dir, start = running.pop(future)
+                    try:
+                        return_value = future.result()
+                        result = self._finalize(step, key, work_dir, return_value)
+                    except BaseException:
+                        shutil.rmtree(work_dir, ignore_errors=True)
+                        for other in running:
+                            other.cancel()
+                        raise
+                    result.started_sec = start - run_start
+                    result.elapsed_sec = time.perf_counter() - start
+                    results[step.name] = result
+                    self._report(result)
+
+        self.wall_time = time.perf_counter() - run_start
+        busy = sum(r.elapsed_sec for r in results.values())
+        print(f"  ⏱️  Wall time: {self.wall_time:.2f}s "
+              f"(sum of step times {busy:.2f}s, {executor} x{max_workers})")
+        return results
+
+    @staticmethod
+    def _report(result: StepResult) -> None:
+        """단계 완료 로그"""
+        status = "♻️  cached" if result.cached else "✅ executed"
+        print(f"  [{result.name}] {status} (+{result.started_sec:.2f}s start, "
+              f"{result.elapsed_sec:.2f}s, key={result.cache_key[:12]})")
@@ -10,7 +10,7 @@
 
 import os
 from kfp import dsl
-from kfp.dsl import component, Input, Output, Dataset
+from kfp.dsl import component, Input, Output, Dataset, Artifact
 from kfp import compiler
 
 
@@ -21,18 +21,42 @@ TEAM_NAME = os.environ.get("TEAM_NAME", "solution-team")
 USER_NAMESPACE = os.environ.get("NAMESPACE", "kubeflow-user-example-com")
 MLFLOW_TRACKING_URI = "http://mlflow-server-service.mlflow-system.svc.cluster.local:5000"
 
+# 사전 빌드 공용 컴포넌트 이미지 (day3/component-image/build_image.py로 생성)
+# 설정하면 모든 컴포넌트가 이 이미지를 사용하고 Pod 시작 시 pip install을 건너뜀
+# (이미지의 sitecustomize가 각 단계 Pod의 시작 오버헤드를 로그에 출력)
+COMPONENT_IMAGE = os.getenv("COMPONENT_IMAGE", "")
+
+
+def component_env(packages=None):
+    """컴포넌트 이미지/패키지 설정 (COMPONENT_IMAGE가 있으면 사전 빌드 이미지 사용)"""
+    if COMPONENT_IMAGE:
+        return {"base_image": COMPONENT_IMAGE, "install_kfp_package": False}
+    return {"base_image": "python:3.9-slim", "packages_to_install": packages}
+
 
 # ============================================================
 # Component 1: 데이터 로드
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["pandas==2.0.3", "scikit-learn==1.3.2"]
-)
+@component(**component_env(["pandas==2.0.3", "scikit-learn==1.3.2", "pyarrow==14.0.2"]))
 def load_data(data_source: str, output_data: Output[Dataset]):
     """California Housing 데이터셋 로드"""
-    import pandas as pd
+    
+    import os
     from sklearn.datasets import fetch_california_housing
+    import time
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def write_artifact(df, path, name):
+        """Parquet(zstd) 저장: 스키마 메타데이터 기록 + 쓰기 시간/크기 출력"""
+        start = time.perf_counter()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({b"mlops.step": b"load_data", b"mlops.artifact": name.encode()})
+        pq.write_table(table.replace_schema_metadata(metadata), path, compression="zstd")
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  💾 {name}: {df.shape}, {size_kb:.1f} KB, write {elapsed:.1f} ms")
     
     print("=" * 60)
     print("  Step 1: Load Data")
@@ -41,173 +65,196 @@ def load_data(data_source: str, output_data: Output[Dataset]):
     housing = fetch_california_housing(as_frame=True)
     df = housing.frame
     
+    # 8개 입력 피처 float64 -> float32 (타겟은 float64 유지)
+    feature_cols = list(housing.feature_names)
+    df[feature_cols] = df[feature_cols].astype("float32")
+    
     print(f"  Source: {data_source}")
     print(f"  Shape: {df.shape}")
     print(f"  Target statistics:")
     print(f"    Mean: {df['MedHouseVal'].mean():.4f}")
     print(f"    Std: {df['MedHouseVal'].std():.4f}")
     
-    df.to_csv(output_data.path, index=False)
+    write_artifact(df, output_data.path, "dataset")
     print(f"  ✅ Data saved")
 
 
 # ============================================================
-# Component 2: 전처리
+# Component 2: 전처리 + 피처 엔지니어링 (완성 버전)
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["pandas==2.0.3", "scikit-learn==1.3.2", "numpy==1.24.3"]
-)
-def preprocess(
+@component(**component_env([
+    "pandas==2.0.3", "scikit-learn==1.3.2", "numpy==1.24.3", "pyarrow==14.0.2"
+]))
+def prepare_features(
     input_data: Input[Dataset],
     X_train_out: Output[Dataset],
     X_test_out: Output[Dataset],
     y_train_out: Output[Dataset],
     y_test_out: Output[Dataset],
+    feature_transform: Output[Artifact],
     test_size: float = 0.2
-):
-    """데이터 전처리"""
-    import pandas as pd
-    from sklearn.model_selection import train_test_split
-    from sklearn.preprocessing import StandardScaler
-    
-    print("=" * 60)
-    print("  Step 2: Preprocess")
-    print("=" * 60)
-    
-    df = pd.read_csv(input_data.path)
-    
-    X = df.drop(columns=['MedHouseVal'])
-    y = df['MedHouseVal']
-    
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=42
-    )
-    
-    scaler = StandardScaler()
-    X_train_scaled = pd.DataFrame(
-        scaler.fit_transform(X_train),
-        columns=X_train.columns
-    )
-    X_test_scaled = pd.DataFrame(
-        scaler.transform(X_test),
-        columns=X_test.columns
-    )
-    
-    X_train_scaled.to_csv(X_train_out.path, index=False)
-    X_test_scaled.to_csv(X_test_out.path, index=False)
-    y_train.to_csv(y_train_out.path, index=False)
-    y_test.to_csv(y_test_out.path, index=False)
-    
-    print(f"  Train: {len(X_train)}, Test: {len(X_test)}")
-    print(f"  ✅ Preprocessing completed")
-
-
-# ============================================================
-# Component 3: 피처 엔지니어링 (완성 버전)
-# ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["pandas==2.0.3", "numpy==1.24.3"]
-)
-def feature_engineering(
-    X_train_in: Input[Dataset],
-    X_test_in: Input[Dataset],
-    X_train_out: Output[Dataset],
-    X_test_out: Output[Dataset]
 ) -> int:
     """
-    피처 엔지니어링 - 완성 버전
+    전처리 + 피처 엔지니어링 - 완성 버전
+    
+    파생 피처는 원본(스케일 전) 값으로 계산한 뒤 원본 + 파생 피처를 Train 통계로 표준화하고,
+    학습된 변환(파생 피처 정의 + 평균/표준편차)을 feature_transform JSON으로 저장합니다.
+    (lab3-2 FeaturePipeline.to_dict()와 같은 형식 → train_model이 모델과 함께 기록)
     
     생성되는 피처:
     1. rooms_per_household: 가구당 방 수
     2. bedrooms_ratio: 방 대비 침실 비율
     3. population_per_household: 가구당 인구
-    4. dist_to_bay: Bay Area까지 거리
+    4. dist_to_bay: Bay Area(샌프란시스코)까지 거리 (실제 위도/경도 기준)
     5. density: 밀집도 지표
     6. income_rooms: 소득 × 방 수 상호작용
     7. location_score: 위치 점수
+    
+    Returns:
+        생성된 새 피처 개수
     """
+    
+    import os
+    import json
     import pandas as pd
     import numpy as np
-    
-    print("=" * 60)
-    print("  Step 3: Feature Engineering (Solution)")
-    print("=" * 60)
-    
-    X_train = pd.read_csv(X_train_in.path)
-    X_test = pd.read_csv(X_test_in.path)
-    
-    original_cols = list(X_train.columns)
-    
-    def add_features(df):
-        """파생 변수 추가 - 완성 버전"""
-        df = df.copy()
-        
+    from sklearn.model_selection import train_test_split
+    import time
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def read_artifact(path, name):
+        """Parquet 로드 + 읽기 시간/크기 출력"""
+        start = time.perf_counter()
+        df = pq.read_table(path).to_pandas()
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  📂 {name}: {df.shape}, {size_kb:.1f} KB, read {elapsed:.1f} ms")
+        return df
+
+    def write_artifact(df, path, name):
+        """Parquet(zstd) 저장: 스키마 메타데이터 기록 + 쓰기 시간/크기 출력"""
+        start = time.perf_counter()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({b"mlops.step": b"prepare_features", b"mlops.artifact": name.encode()})
+        pq.write_table(table.replace_schema_metadata(metadata), path, compression="zstd")
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  💾 {name}: {df.shape}, {size_kb:.1f} KB, write {elapsed:.1f} ms")
+    
+    DERIVED_FEATURES = [
         # 1. 가구당 방 수
-        df['rooms_per_household'] = df['AveRooms'] / (df['AveOccup'] + 1e-6)
-        
+        {"name": "rooms_per_household", "op": "ratio", "inputs": ["AveRooms", "AveOccup"]},
         # 2. 방 대비 침실 비율
-        df['bedrooms_ratio'] = df['AveBedrms'] / (df['AveRooms'] + 1e-6)
-        
+        {"name": "bedrooms_ratio", "op": "ratio", "inputs": ["AveBedrms", "AveRooms"]},
         # 3. 가구당 인구
-        df['population_per_household'] = df['Population'] / (df['AveOccup'] + 1e-6)
-        
-        # 4. Bay Area까지 거리 (정규화된 좌표 기반)
-        # 참고: 정규화된 데이터이므로 원래 좌표가 아닌 상대적 거리
-        df['dist_to_bay'] = np.sqrt(
-            df['Latitude']**2 + df['Longitude']**2
-        )
-        
+        {"name": "population_per_household", "op": "ratio", "inputs": ["Population", "AveOccup"]},
+        # 4. Bay Area까지 거리 (스케일 전 좌표이므로 실제 거리)
+        {"name": "dist_to_bay", "op": "distance", "inputs": ["Latitude", "Longitude"],
+         "origin": [37.77, -122.42]},
         # 5. 밀집도 지표
-        df['density'] = df['Population'] * df['AveOccup']
-        
+        {"name": "density", "op": "product", "inputs": ["Population", "AveOccup"]},
         # 6. 소득과 방 수의 상호작용
-        df['income_rooms'] = df['MedInc'] * df['AveRooms']
-        
-        # 7. 위치 점수 (위도와 경도의 조합)
-        df['location_score'] = df['Latitude'] * 0.5 + df['Longitude'] * 0.5
-        
+        {"name": "income_rooms", "op": "product", "inputs": ["MedInc", "AveRooms"]},
+        # 7. 위치 점수 (위도/경도 선형 결합)
+        {"name": "location_score", "op": "linear", "inputs": ["Latitude", "Longitude"],
+         "weights": [0.5, 0.5]},
+    ]
+    EPS = 1e-6
+    
+    def add_features(df):
+        """원본(스케일 전) 값으로 파생 피처 계산"""
+        df = df.copy()
+        for spec in DERIVED_FEATURES:
+            a, b = (df[col].to_numpy(dtype="float64") for col in spec["inputs"])
+            if spec["op"] == "ratio":
+                df[spec["name"]] = a / (b + EPS)
+            elif spec["op"] == "product":
+                df[spec["name"]] = a * b
+            elif spec["op"] == "linear":
+                df[spec["name"]] = spec["weights"][0] * a + spec["weights"][1] * b
+            elif spec["op"] == "distance":
+                df[spec["name"]] = np.hypot(a - spec["origin"][0], b - spec["origin"][1])
+            else:
+                raise ValueError(
+                    f"Unsupported feature op: {spec['op']}. Supported: ['ratio', 'product', 'linear', 'distance']"
+                )
         return df
     
+    print("=" * 60)
+    print("  Step 2: Prepare Features (Solution)")
+    print("=" * 60)
+    
+    df = read_artifact(input_data.path, "dataset")
+    
+    X = df.drop(columns=['MedHouseVal'])
+    y = df['MedHouseVal']
+    feature_cols = list(X.columns)
+    
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=42
+    )
+    
+    # 1) 파생 피처: 원본 값으로 계산
     X_train_fe = add_features(X_train)
     X_test_fe = add_features(X_test)
+    output_cols = list(X_train_fe.columns)
+    new_cols = output_cols[len(feature_cols):]
+    
+    # 2) 표준화: Train 통계 (StandardScaler와 동일, 분산 0인 열은 스케일 1)
+    train_values = X_train_fe.to_numpy(dtype="float64")
+    mean = train_values.mean(axis=0)
+    scale = train_values.std(axis=0)
+    scale[scale == 0] = 1.0
+    
+    def standardize(values):
+        return pd.DataFrame((values - mean) / scale, columns=output_cols).astype("float32")
+    
+    write_artifact(standardize(train_values), X_train_out.path, "X_train")
+    write_artifact(standardize(X_test_fe.to_numpy(dtype="float64")), X_test_out.path, "X_test")
+    write_artifact(y_train.to_frame(), y_train_out.path, "y_train")
+    write_artifact(y_test.to_frame(), y_test_out.path, "y_test")
+    
+    # 3) 학습된 변환 저장 (서빙 시 원본 입력 → 같은 피처 재현)
+    with open(feature_transform.path, "w", encoding="utf-8") as f:
+        json.dump({
+            "feature_names": feature_cols,
+            "derived_features": DERIVED_FEATURES,
+            "standardize": True,
+            "eps": EPS,
+            "mean": mean.tolist(),
+            "scale": scale.tolist()
+        }, f, indent=2)
     
-    new_cols = [c for c in X_train_fe.columns if c not in original_cols]
-    
-    print(f"  Original features: {len(original_cols)}")
+    print(f"  Train: {len(X_train)}, Test: {len(X_test)}")
+    print(f"  Original features: {len(feature_cols)}")
     print(f"  New features ({len(new_cols)}):")
     for feat in new_cols:
         stats = X_train_fe[feat].describe()
         print(f"    - {feat}: mean={stats['mean']:.4f}, std={stats['std']:.4f}")
-    
-    print(f"  Total features: {len(X_train_fe.columns)}")
-    
-    X_train_fe.to_csv(X_train_out.path, index=False)
-    X_test_fe.to_csv(X_test_out.path, index=False)
-    
-    print(f"  ✅ Feature engineering completed")
+    print(f"  Total features: {len(output_cols)}")
+    print(f"  ✅ Feature preparation completed")
     
     return len(new_cols)
 
 
 # ============================================================
-# Component 4: 모델 학습 (완성 버전)
+# Component 3: 모델 학습 (완성 버전)
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=[
-        "pandas==2.0.3",
-        "scikit-learn==1.3.2",
-        "mlflow==2.9.2",
-        "numpy==1.24.3"
-    ]
-)
+@component(**component_env([
+    "pandas==2.0.3",
+    "scikit-learn==1.3.2",
+    "mlflow==2.9.2",
+    "numpy==1.24.3",
+    "pyarrow==14.0.2"
+]))
 def train_model(
     X_train: Input[Dataset],
     X_test: Input[Dataset],
     y_train: Input[Dataset],
     y_test: Input[Dataset],
+    feature_transform: Input[Artifact],
     mlflow_tracking_uri: str,
     experiment_name: str,
     team_name: str,
@@ -215,21 +262,37 @@ def train_model(
     max_depth: int = 10
 ) -> str:
     """모델 학습 및 MLflow 기록"""
-    import pandas as pd
+    
+    import os
+    import json
     import numpy as np
     import mlflow
+    from mlflow.entities import Metric, Param, RunTag
     from sklearn.ensemble import RandomForestRegressor
-    from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
-    import os
+    import time
+    import pyarrow.parquet as pq
+
+    def read_artifact(path, name):
+        """Parquet 로드 + 읽기 시간/크기 출력"""
+        start = time.perf_counter()
+        df = pq.read_table(path).to_pandas()
+        elapsed = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(path) / 1024
+        print(f"  📂 {name}: {df.shape}, {size_kb:.1f} KB, read {elapsed:.1f} ms")
+        return df
     
     print("=" * 60)
-    print(f"  Step 4: Train Model - {team_name}")
+    print(f"  Step 3: Train Model - {team_name}")
     print("=" * 60)
     
-    X_train_df = pd.read_csv(X_train.path)
-    X_test_df = pd.read_csv(X_test.path)
-    y_train_df = pd.read_csv(y_train.path)
-    y_test_df = pd.read_csv(y_test.path)
+    X_train_df = read_artifact(X_train.path, "X_train")
+    X_test_df = read_artifact(X_test.path, "X_test")
+    y_train_df = read_artifact(y_train.path, "y_train")
+    y_test_df = read_artifact(y_test.path, "y_test")
+    
+    # prepare_features가 학습한 변환 (원본 입력 → 모델 입력)
+    with open(feature_transform.path, encoding="utf-8") as f:
+        transform = json.load(f)
     
     print(f"  Training data: {X_train_df.shape}")
     print(f"  Test data: {X_test_df.shape}")
@@ -242,14 +305,19 @@ def train_model(
         run_id = run.info.run_id
         print(f"  Run ID: {run_id}")
         
-        mlflow.log_params({
+        # 파라미터/태그/메트릭은 모아 두었다가 log_batch 한 번으로 전송 (호출마다 HTTP 왕복 방지)
+        params = {
             "n_estimators": n_estimators,
             "max_depth": max_depth,
             "random_state": 42,
             "n_features": X_train_df.shape[1]
-        })
-        mlflow.set_tag("team", team_name)
-        mlflow.set_tag("pipeline", "solution")
+        }
+        # 피처 변환은 모델과 함께 기록 → 서빙에서 같은 전처리를 재현
+        tags = {
+            "team": team_name,
+            "pipeline": "solution",
+            "feature_transform": json.dumps(transform, separators=(",", ":"))
+        }
         
         print(f"  Training RandomForest...")
         model = RandomForestRegressor(
@@ -262,11 +330,15 @@ def train_model(
         
         y_pred = model.predict(X_test_df)
         
-        r2 = r2_score(y_test_df, y_pred)
-        rmse = np.sqrt(mean_squared_error(y_test_df, y_pred))
-        mae = mean_absolute_error(y_test_df, y_pred)
+        # 단일 패스 메트릭: 잔차를 한 번만 계산해 MAE/MSE/RMSE/R² 도출
+        y_true = y_test_df.values.ravel()
+        residual = y_true - y_pred
+        mse = float(np.dot(residual, residual) / residual.size)
+        mae = float(np.abs(residual).mean())
+        rmse = float(np.sqrt(mse))
+        r2 = float(1.0 - mse / y_true.var())
         
-        mlflow.log_metrics({"r2": r2, "rmse": rmse, "mae": mae})
+        metrics = {"r2": r2, "rmse": rmse, "mae": mae}
         
         print(f"  Performance:")
         print(f"    - R2 Score: {r2:.4f}")
@@ -288,32 +360,38 @@ def train_model(
         print(f"  Top 5 Feature Importance:")
         for feat, imp in sorted_importance:
             safe_name = feat.replace(" ", "_")[:15]
-            mlflow.log_metric(f"fi_{safe_name}", imp)
+            metrics[f"fi_{safe_name}"] = float(imp)
             print(f"    - {feat}: {imp:.4f}")
         
+        timestamp = int(time.time() * 1000)
+        mlflow.tracking.MlflowClient().log_batch(
+            run_id,
+            metrics=[Metric(k, v, timestamp, 0) for k, v in metrics.items()],
+            params=[Param(k, str(v)) for k, v in params.items()],
+            tags=[RunTag(k, str(v)) for k, v in tags.items()]
+        )
+        
         print(f"  ✅ Training completed")
     
     return run_id
 
 
 # ============================================================
-# Component 5: 모델 평가
+# Component 4: 모델 평가
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["mlflow==2.9.2"]
-)
+@component(**component_env(["mlflow==2.9.2"]))
 def evaluate_model(
     run_id: str,
     mlflow_tracking_uri: str,
     r2_threshold: float = 0.75
 ) -> str:
     """모델 평가 및 배포 결정"""
-    import mlflow
+    
     import os
+    import mlflow
     
     print("=" * 60)
-    print("  Step 5: Evaluate Model")
+    print("  Step 4: Evaluate Model")
     print("=" * 60)
     
     os.environ['MLFLOW_TRACKING_URI'] = mlflow_tracking_uri
@@ -344,20 +422,18 @@ def evaluate_model(
 
 
 # ============================================================
-# Component 6: 모델 배포
+# Component 5: 모델 배포
 # ============================================================
-@component(
-    base_image="python:3.9-slim",
-    packages_to_install=["kubernetes==28.1.0"]
-)
+@component(**component_env(["kubernetes==28.1.0"]))
 def deploy_model(run_id: str, model_name: str, namespace: str):
     """KServe InferenceService로 모델 배포"""
+    
     from kubernetes import client, config
     from kubernetes.client.rest import ApiException
     import time
     
     print("=" * 60)
-    print("  Step 6: Deploy Model (KServe)")
+    print("  Step 5: Deploy Model (KServe)")
     print("=" * 60)
     
     print(f"  Model Name: {model_name}")
@@ -426,11 +502,12 @@ def deploy_model(run_id: str, model_name: str, namespace: str):
 
 
 # ============================================================
-# Component 7: 알림
+# Component 6: 알림
 # ============================================================
-@component(base_image="python:3.9-slim")
+@component(**component_env())
 def send_alert(run_id: str, team_name: str):
     """성능 미달 알림"""
+    
     print("=" * 60)
     print(f"  Alert - {team_name}")
     print("=" * 60)
@@ -463,18 +540,19 @@ def project_pipeline(
     
     load_task = load_data(data_source=data_source)
     
-    preprocess_task = preprocess(input_data=load_task.outputs["output_data"])
+    feature_task = prepare_features(input_data=load_task.outputs["output_data"])
     
-    feature_task = feature_engineering(
-        X_train_in=preprocess_task.outputs["X_train_out"],
-        X_test_in=preprocess_task.outputs["X_test_out"]
-    )
+    # 데이터 단계는 KFP 캐시 재사용: 입력 아티팩트·컴포넌트·파라미터가 같으면 건너뜀
+    # (n_estimators 등 학습 파라미터만 바꾸면 train_model부터 다시 실행)
+    for task in (load_task, feature_task):
+        task.set_caching_options(True)
     
     train_task = train_model(
         X_train=feature_task.outputs["X_train_out"],
         X_test=feature_task.outputs["X_test_out"],
-        y_train=preprocess_task.outputs["y_train_out"],
-        y_test=preprocess_task.outputs["y_test_out"],
+        y_train=feature_task.outputs["y_train_out"],
+        y_test=feature_task.outputs["y_test_out"],
+        feature_transform=feature_task.outputs["feature_transform"],
         mlflow_tracking_uri=mlflow_tracking_uri,
         experiment_name=experiment_name,
         team_name=team_name,
@@ -487,13 +565,16 @@ def project_pipeline(
         mlflow_tracking_uri=mlflow_tracking_uri,
         r2_threshold=r2_threshold
     )
+    # MLflow 조회/태그 기록 및 배포는 부수 효과가 있으므로 캐시하지 않음
+    evaluate_task.set_caching_options(False)
     
     with dsl.If(evaluate_task.output == "deploy"):
-        deploy_model(
+        deploy_task = deploy_model(
             run_id=train_task.output,
             model_name=model_name,
             namespace=namespace
         )
+        deploy_task.set_caching_options(False)
     
     with dsl.If(evaluate_task.output == "skip"):
         send_alert(run_id=train_task.output, team_name=team_name)
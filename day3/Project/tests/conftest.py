@@ -0,0 +1,19 @@
+"""
+Pytest configuration and shared fixtures
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add scripts to path for imports
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """단계 출력 캐시 디렉토리"""
+    return str(tmp_path / "cache")
@@ -0,0 +1,47 @@
+"""
+러너 테스트용 경량 컴포넌트
+
+프로세스 풀 워커가 소스 파일에서 다시 로드할 수 있도록 별도 모듈에 정의합니다.
+"""
+
+from kfp.dsl import component, Input, Output, Dataset
+
+
+@component(base_image="python:3.9-slim")
+def make_data(rows: int, output_data: Output[Dataset]):
+    """0..rows-1 정수를 한 줄씩 기록"""
+    with open(output_data.path, "w") as f:
+        f.write("\n".join(str(i) for i in range(rows)))
+
+
+@component(base_image="python:3.9-slim")
+def scale(input_data: Input[Dataset], output_data: Output[Dataset], factor: int = 2):
+    """입력 값에 factor를 곱해 기록"""
+    with open(input_data.path) as f:
+        values = [int(line) * factor for line in f.read().split()]
+    with open(output_data.path, "w") as f:
+        f.write("\n".join(str(v) for v in values))
+
+
+@component(base_image="python:3.9-slim")
+def train(input_data: Input[Dataset], n_estimators: int) -> float:
+    """합계 × n_estimators (학습 단계 대용)"""
+    with open(input_data.path) as f:
+        return float(sum(int(line) for line in f.read().split()) * n_estimators)
+
+
+@component(base_image="python:3.9-slim")
+def sleep_step(seconds: float) -> float:
+    """seconds 동안 대기 (병렬 실행 확인용)"""
+    import time
+    time.sleep(seconds)
+    return seconds
+
+
+@component(base_image="python:3.9-slim")
+def timed_sleep(seconds: float) -> str:
+    """seconds 동안 대기하고 실제 실행 구간("시작,종료" epoch 초)을 반환"""
+    import time
+    start = time.time()
+    time.sleep(seconds)
+    return f"{start},{time.time()}"
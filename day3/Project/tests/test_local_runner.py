@@ -0,0 +1,304 @@
+"""
+Test cases for local pipeline runner
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+from local_runner import (
+    LocalArtifact,
+    LocalPipelineRunner,
+    Step,
+    StepOutput,
+    _call_component,
+    _component_ref
+)
+from tests import pipeline_components
+from tests.pipeline_components import make_data, scale, sleep_step, timed_sleep, train
+
+SCALE_TEMPLATE = '''
+from kfp.dsl import component, Input, Output, Dataset
+
+
+@component(base_image="python:3.9-slim")
+def scale(input_data: Input[Dataset], output_data: Output[Dataset], factor: int = 2):
+    """{doc}"""
+    with open(input_data.path) as f:
+        values = [int(line) * factor + {offset} for line in f.read().split()]
+    with open(output_data.path, "w") as f:
+        f.write("\\n".join(str(v) for v in values))
+'''
+
+
+def load_scale(tmp_path, name, doc="입력 값에 factor를 곱해 기록", offset=0):
+    """소스를 바꿀 수 있도록 임시 파일에서 scale 컴포넌트 로드"""
+    path = tmp_path / f"{name}.py"
+    path.write_text(SCALE_TEMPLATE.format(doc=doc, offset=offset), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.scale
+
+
+def build_steps(rows=100, n_estimators=10, scale_component=scale):
+    """make_data → scale → train 체인"""
+    return [
+        Step("make_data", make_data, {"rows": rows}),
+        Step("scale", scale_component, {"input_data": StepOutput("make_data", "output_data")}),
+        Step("train", train, {
+            "input_data": StepOutput("scale", "output_data"),
+            "n_estimators": n_estimators,
+        }),
+    ]
+
+
+def executed(results):
+    """캐시를 쓰지 않고 실행된 단계 이름"""
+    return {name for name, result in results.items() if not result.cached}
+
+
+def run_intervals(results):
+    """timed_sleep 단계의 실제 실행 구간 (시작 순)"""
+    return sorted(
+        tuple(float(t) for t in result.return_value.split(","))
+        for result in results.values()
+    )
+
+
+class TestCaching:
+    """content-addressed 캐시 테스트"""
+
+    def test_second_run_all_cached(self, cache_dir):
+        """같은 입력으로 다시 실행하면 모든 단계가 캐시 적중"""
+        first = LocalPipelineRunner(cache_dir).run(build_steps())
+        second = LocalPipelineRunner(cache_dir).run(build_steps())
+
+        assert executed(first) == {"make_data", "scale", "train"}
+        assert executed(second) == set()
+        assert second["train"].return_value == first["train"].return_value == 99000.0
+        assert second["train"].cache_key == first["train"].cache_key
+
+    def test_param_change_reruns_downstream_only(self, cache_dir):
+        """n_estimators만 바꾸면 train만 다시 실행"""
+        LocalPipelineRunner(cache_dir).run(build_steps(n_estimators=10))
+        results = LocalPipelineRunner(cache_dir).run(build_steps(n_estimators=20))
+
+        assert executed(results) == {"train"}
+        assert results["train"].return_value == 198000.0
+
+    def test_source_change_reruns_step(self, cache_dir, tmp_path):
+        """소스가 바뀐 단계는 다시 실행, 출력이 같으면 하위 단계는 캐시 적중"""
+        original = load_scale(tmp_path, "scale_v1")
+        LocalPipelineRunner(cache_dir).run(build_steps(scale_component=original))
+
+        edited = load_scale(tmp_path, "scale_v2", doc="설명만 변경")
+        results = LocalPipelineRunner(cache_dir).run(build_steps(scale_component=edited))
+
+        assert executed(results) == {"scale"}
+
+    def test_input_hash_invalidates_downstream(self, cache_dir, tmp_path):
+        """업스트림 출력 해시가 바뀌면 하위 단계 캐시 무효화"""
+        original = load_scale(tmp_path, "scale_v1")
+        first = LocalPipelineRunner(cache_dir).run(build_steps(scale_component=original))
+
+        changed = load_scale(tmp_path, "scale_v2", offset=1)
+        results = LocalPipelineRunner(cache_dir).run(build_steps(scale_component=changed))
+
+        assert executed(results) == {"scale", "train"}
+        assert (results["scale"].output_hashes["output_data"]
+                != first["scale"].output_hashes["output_data"])
+        assert results["train"].return_value == first["train"].return_value + 100 * 10
+
+    def test_upstream_change_reruns_chain(self, cache_dir):
+        """첫 단계 파라미터가 바뀌면 전체 체인 재실행"""
+        LocalPipelineRunner(cache_dir).run(build_steps(rows=100))
+        results = LocalPipelineRunner(cache_dir).run(build_steps(rows=50))
+
+        assert executed(results) == {"make_data", "scale", "train"}
+
+    def test_no_cache(self, cache_dir):
+        """use_cache=False면 항상 재실행"""
+        LocalPipelineRunner(cache_dir).run(build_steps())
+        results = LocalPipelineRunner(cache_dir, use_cache=False).run(build_steps())
+
+        assert executed(results) == {"make_data", "scale", "train"}
+
+    def test_step_cache_disabled(self, cache_dir):
+        """cache=False 단계만 다시 실행"""
+        LocalPipelineRunner(cache_dir).run(build_steps())
+        steps = build_steps()
+        steps[2].cache = False
+        results = LocalPipelineRunner(cache_dir).run(steps)
+
+        assert executed(results) == {"train"}
+
+    def test_cached_outputs_readable(self, cache_dir):
+        """캐시에서 복원한 출력 경로가 실제 파일인지 테스트"""
+        LocalPipelineRunner(cache_dir).run(build_steps(rows=3))
+        results = LocalPipelineRunner(cache_dir).run(build_steps(rows=3))
+
+        with open(results["scale"].outputs["output_data"]) as f:
+            assert f.read().split() == ["0", "2", "4"]
+
+    @pytest.mark.parametrize("corrupt", ["delete", "modify"])
+    def test_missing_or_modified_output_reruns(self, cache_dir, corrupt):
+        """캐시 출력 파일이 삭제/수정되면 해당 단계를 다시 실행"""
+        first = LocalPipelineRunner(cache_dir).run(build_steps(rows=3))
+        path = first["scale"].outputs["output_data"]
+        if corrupt == "delete":
+            os.remove(path)
+        else:
+            with open(path, "w") as f:
+                f.write("999")
+
+        results = LocalPipelineRunner(cache_dir).run(build_steps(rows=3))
+
+        assert executed(results) == {"scale"}
+        with open(results["scale"].outputs["output_data"]) as f:
+            assert f.read().split() == ["0", "2", "4"]
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_failed_step_not_cached(self, cache_dir, executor):
+        """실패한 단계는 캐시에 남지 않음"""
+        steps = [Step("scale", scale, {"input_data": StepOutput("make_data", "output_data")}),
+                 Step("make_data", make_data, {"rows": "not-a-number"})]
+        with pytest.raises(TypeError):
+            LocalPipelineRunner(cache_dir).run(steps, executor=executor)
+
+        results = LocalPipelineRunner(cache_dir).run(build_steps())
+        assert executed(results) == {"make_data", "scale", "train"}
+
+
+class TestScheduling:
+    """DAG 실행 순서 / 병렬 실행 테스트"""
+
+    def test_dependency_order(self, cache_dir):
+        """입력 순서와 무관하게 업스트림 완료 후 하위 단계 시작"""
+        results = LocalPipelineRunner(cache_dir).run(list(reversed(build_steps())))
+
+        for upstream, downstream in (("make_data", "scale"), ("scale", "train")):
+            finished = results[upstream].started_sec + results[upstream].elapsed_sec
+            assert results[downstream].started_sec >= finished
+        assert results["train"].return_value == 99000.0
+
+    def test_independent_branches_parallel(self, cache_dir):
+        """독립 브랜치의 실제 실행 구간이 서로 겹침 (동시 실행)"""
+        steps = [Step(f"sleep_{i}", timed_sleep, {"seconds": 0.5 + i * 0.01}) for i in range(3)]
+        results = LocalPipelineRunner(cache_dir).run(steps, max_workers=3)
+
+        intervals = run_intervals(results)
+        # 모든 단계가 실행 중인 공통 구간이 존재 (시작 지연이 0.5초 가까이 되어도 통과)
+        assert max(start for start, _ in intervals) < min(end for _, end in intervals)
+
+    def test_single_worker_serial(self, cache_dir):
+        """max_workers=1이면 독립 브랜치도 순차 실행 (실행 구간이 겹치지 않음)"""
+        steps = [Step(f"sleep_{i}", timed_sleep, {"seconds": 0.2 + i * 0.01}) for i in range(3)]
+        results = LocalPipelineRunner(cache_dir).run(steps, max_workers=1)
+
+        intervals = run_intervals(results)
+        for (_, previous_end), (next_start, _) in zip(intervals, intervals[1:]):
+            assert next_start >= previous_end
+
+    def test_sweep_branches_share_upstream(self, cache_dir):
+        """스윕 브랜치가 같은 업스트림 결과를 공유"""
+        steps = build_steps()[:2] + [
+            Step(f"train_n{n}", train, {
+                "input_data": StepOutput("scale", "output_data"),
+                "n_estimators": n,
+            })
+            for n in (1, 2, 3)
+        ]
+        results = LocalPipelineRunner(cache_dir).run(steps, max_workers=3)
+
+        assert [results[f"train_n{n}"].return_value for n in (1, 2, 3)] == [9900.0, 19800.0, 29700.0]
+
+    def test_wall_time_report(self, cache_dir, capsys):
+        """단계별 시작/소요 시간과 전체 wall time 보고"""
+        runner = LocalPipelineRunner(cache_dir)
+        results = runner.run([Step("sleep", sleep_step, {"seconds": 0.1})])
+
+        result = results["sleep"]
+        assert result.elapsed_sec >= 0.1
+        assert runner.wall_time >= result.elapsed_sec
+        assert set(result.to_dict()) == {
+            "name", "cache_key", "cached", "started_sec", "elapsed_sec", "return_value"
+        }
+        output = capsys.readouterr().out
+        assert "[sleep] ✅ executed" in output
+        assert "Wall time" in output
+
+
+class TestProcessExecutor:
+    """프로세스 풀 실행 테스트"""
+
+    def test_component_ref(self):
+        """소스 파일 / 함수 이름 참조"""
+        source_file, func_name = _component_ref(train)
+
+        assert os.path.samefile(source_file, pipeline_components.__file__)
+        assert func_name == "train"
+
+    def test_call_component_reload(self, tmp_path):
+        """참조 튜플로 소스 파일에서 컴포넌트를 다시 로드해 호출"""
+        data = tmp_path / "data"
+        data.write_text("1\n2\n3")
+
+        value = _call_component(_component_ref(train), {
+            "input_data": LocalArtifact(str(data)), "n_estimators": 2
+        })
+
+        assert value == 12.0
+
+    def test_process_matches_thread(self, tmp_path):
+        """프로세스 풀 실행 결과가 스레드 실행과 같은지 테스트"""
+        thread = LocalPipelineRunner(str(tmp_path / "thread")).run(build_steps(), max_workers=2)
+        process = LocalPipelineRunner(str(tmp_path / "process")).run(
+            build_steps(), max_workers=2, executor="process"
+        )
+
+        for name in thread:
+            assert process[name].return_value == thread[name].return_value
+            assert process[name].output_hashes == thread[name].output_hashes
+            assert process[name].cache_key == thread[name].cache_key
+
+    def test_process_cache_shared(self, cache_dir):
+        """프로세스 풀로 만든 캐시를 스레드 실행에서 재사용"""
+        LocalPipelineRunner(cache_dir).run(build_steps(), executor="process")
+        results = LocalPipelineRunner(cache_dir).run(build_steps())
+
+        assert executed(results) == set()
+
+
+class TestValidation:
+    """DAG 검증 오류 테스트"""
+
+    def test_unknown_dependency(self, cache_dir):
+        """존재하지 않는 업스트림 참조 오류"""
+        steps = build_steps()[1:]
+        with pytest.raises(ValueError, match="depends on unknown steps: \\['make_data'\\]"):
+            LocalPipelineRunner(cache_dir).run(steps)
+
+    def test_cycle(self, cache_dir):
+        """순환 의존성 오류"""
+        steps = [
+            Step("a", scale, {"input_data": StepOutput("b", "output_data")}),
+            Step("b", scale, {"input_data": StepOutput("a", "output_data")}),
+        ]
+        with pytest.raises(ValueError, match="Cyclic dependencies between steps: \\['a', 'b'\\]"):
+            LocalPipelineRunner(cache_dir).run(steps)
+
+    def test_cycle_after_valid_steps(self, cache_dir):
+        """선행 단계 실행 후 남은 순환도 감지"""
+        steps = build_steps()[:1] + [
+            Step("a", scale, {"input_data": StepOutput("b", "output_data")}),
+            Step("b", train, {"input_data": StepOutput("a", "output_data"), "n_estimators": 1}),
+        ]
+        with pytest.raises(ValueError, match="Cyclic dependencies"):
+            LocalPipelineRunner(cache_dir).run(steps)
+
+    def test_unknown_executor(self, cache_dir):
+        """지원하지 않는 executor 오류"""
+        with pytest.raises(ValueError, match="Unknown executor"):
+            LocalPipelineRunner(cache_dir).run(build_steps(), executor="dask")
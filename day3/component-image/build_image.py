@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+공용 컴포넌트 이미지 생성기
+==========================
+
+Day 3 파이프라인 컴포넌트들이 선언한 packages_to_install을 모아
+하나의 고정(pinned) requirements.txt와 Dockerfile을 생성합니다.
+
+이미지를 빌드/푸시한 뒤 COMPONENT_IMAGE 환경 변수로 지정하면
+모든 컴포넌트가 이 이미지를 사용하고 Pod 시작 시 pip install을 건너뜁니다.
+
+- 파이프라인 파일을 import하지 않고 AST로 패키지 목록을 수집
+  (KFP v1 create_component_from_func / KFP v2 @component 모두 지원)
+- 같은 패키지의 버전이 서로 다르면 오류
+- 버전이 없는 패키지는 다른 컴포넌트의 고정 버전 또는 DEFAULT_PINS 사용
+- 이미지 태그는 requirements.txt + Dockerfile + sitecustomize.py 내용 해시 (요구사항이 같으면 같은 태그)
+- sitecustomize.py가 모든 단계 Pod의 시작 오버헤드를 출력 (컴포넌트 코드 수정 불필요)
+
+사용법:
+    python day3/component-image/build_image.py --registry docker.io/myteam
+    docker build -t <출력된 이미지> day3/component-image
+    docker push <출력된 이미지>
+    export COMPONENT_IMAGE=<출력된 이미지>
+    python day3/Project/scripts/2_project_pipeline.py
+
+현대오토에버 MLOps Training
+"""
+
+import argparse
+import ast
+import hashlib
+import os
+import re
+import sys
+
+IMAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+DAY3_DIR = os.path.dirname(IMAGE_DIR)
+
+PIPELINE_FILES = [
+    "Project/scripts/1_e2e_pipeline.py",
+    "Project/scripts/2_project_pipeline.py",
+    "Project/solution/project_solution.py",
+    "lab3-1_drift-monitoring/scripts/2_monitor_pipeline.py",
+    "lab3-1_drift-monitoring/scripts/3_retrain_pipeline.py",
+]
+
+# 어떤 컴포넌트에서도 버전을 지정하지 않은 패키지의 기본 고정 버전 (Python 3.9 호환)
+DEFAULT_PINS = {
+    "boto3": "1.34.14",
+    "scipy": "1.11.4",
+}
+
+BASE_IMAGE = "python:3.9-slim"
+KFP_VERSION = "2.7.0"
+
+STARTUP_HOOK = "sitecustomize.py"
+
+_REQUIREMENT = re.compile(r"^\s*([A-Za-z0-9_.\-\[\]]+)\s*(?:==\s*([^\s;]+))?\s*$")
+
+
+def collect_packages(path: str) -> list:
+    """
+    파이프라인 파일에서 컴포넌트 패키지 목록 수집
+
+    packages_to_install=[...] 키워드 인자와 component_env([...]) 호출의
+    리스트 리터럴을 찾습니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    packages = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+
+        candidates = [kw.value for kw in node.keywords if kw.arg == "packages_to_install"]
+        if getattr(node.func, "id", None) == "component_env" and node.args:
+            candidates.append(node.args[0])
+
+        for value in candidates:
+            if isinstance(value, (ast.List, ast.Tuple)):
+                packages.extend(
+                    elt.value for elt in value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                )
+    return packages
+
+
+def resolve_pins(requirements: dict) -> dict:
+    """
+    패키지별 버전 결정
+
+    Args:
+        requirements: {패키지: {버전 집합 (None = 미지정)}}
+
+    Returns:
+        {패키지: 버전}
+    """
+    resolved, conflicts, unpinned = {}, [], []
+    for name, versions in sorted(requirements.items()):
+        pinned = sorted(v for v in versions if v)
+        if len(pinned) > 1:
+            conflicts.append(f"{name}: {', '.join(pinned)}")
+        elif pinned:
+            resolved[name] = pinned[0]
+        elif name in DEFAULT_PINS:
+            resolved[name] = DEFAULT_PINS[name]
+        else:
+            unpinned.append(name)
+
+    if conflicts:
+        raise ValueError("Conflicting versions across components:\n  " + "\n  ".join(conflicts))
+    if unpinned:
+        raise ValueError(f"No pinned version for: {unpinned}. Add them to DEFAULT_PINS")
+    return resolved
+
+
+def render_dockerfile(base_image: str, kfp_version: str) -> str:
+    """공용 컴포넌트 이미지 Dockerfile"""
+    return f"""# 자동 생성 파일 - build_image.py로 다시 생성하세요
+# Day 3 파이프라인 컴포넌트 공용 이미지 (런타임 pip install 제거)
+
+FROM {base_image}
+
+ENV PYTHONUNBUFFERED=1 \\
+    PIP_DISABLE_PIP_VERSION_CHECK=1
+
+COPY requirements.txt /tmp/requirements.txt
+RUN pip install --no-cache-dir -r /tmp/requirements.txt && rm /tmp/requirements.txt
+
+# KFP 런타임과 동일하게 --no-deps로 설치 (kfp의 kubernetes 버전 제약과 충돌 방지)
+RUN pip install --no-cache-dir --no-deps kfp=={kfp_version}
+
+# 시작 오버헤드 보고: Python 시작 시 sitecustomize가 Pod당 한 번 출력
+COPY {STARTUP_HOOK} /opt/component-startup/{STARTUP_HOOK}
+ENV PYTHONPATH=/opt/component-startup
+
+# import 검증 (빌드 시점에 실패하도록)
+RUN python -c "import mlflow, numpy, pandas, pyarrow, sklearn, scipy, kubernetes, sitecustomize"
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공용 컴포넌트 이미지 생성")
+    parser.add_argument("--registry", default="docker.io/mlops-training",
+                        help="이미지 레지스트리/네임스페이스")
+    parser.add_argument("--name", default="day3-components")
+    parser.add_argument("--base-image", default=BASE_IMAGE)
+    parser.add_argument("--kfp-version", default=KFP_VERSION,
+                        help="파이프라인을 컴파일하는 KFP SDK와 같은 버전")
+    args = parser.parse_args()
+
+    requirements = {}
+    for relative in PIPELINE_FILES:
+        packages = collect_packages(os.path.join(DAY3_DIR, relative))
+        print(f"  {relative}: {len(packages)} package declarations")
+        for spec in packages:
+            match = _REQUIREMENT.match(spec)
+            if not match:
+                raise ValueError(f"Unsupported requirement spec in {relative}: {spec}")
+            name, version = match.group(1).lower(), match.group(2)
+            requirements.setdefault(name, set()).add(version)
+
+    try:
+        pins = resolve_pins(requirements)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    lines = [f"{name}=={version}" for name, version in sorted(pins.items())]
+    content = "# 자동 생성 파일 - build_image.py로 다시 생성하세요\n" + "\n".join(lines) + "\n"
+    # v2 컴포넌트가 Pod에서 kfp를 설치하지 않도록 kfp도 이미지에 포함 (Dockerfile)
+    dockerfile = render_dockerfile(args.base_image, args.kfp_version)
+    with open(os.path.join(IMAGE_DIR, STARTUP_HOOK), encoding="utf-8") as f:
+        startup_hook = f.read()
+    digest = hashlib.sha256((dockerfile + content + startup_hook).encode("utf-8")).hexdigest()[:12]
+    image = f"{args.registry}/{args.name}:{digest}"
+
+    with open(os.path.join(IMAGE_DIR, "requirements.txt"), "w", encoding="utf-8") as f:
+        f.write(content)
+    with open(os.path.join(IMAGE_DIR, "Dockerfile"), "w", encoding="utf-8") as f:
+        f.write(dockerfile)
+
+    print(f"\n📦 Pinned packages ({len(lines)} + kfp=={args.kfp_version}):")
+    for line in lines:
+        print(f"   {line}")
+    print(f"\n🐳 Image: {image}")
+    print(f"\n   docker build -t {image} {os.path.relpath(IMAGE_DIR)}")
+    print(f"   docker push {image}")
+    print(f"   export COMPONENT_IMAGE={image}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""
+컴포넌트 Pod 시작 오버헤드 보고
+===============================
+
+공용 컴포넌트 이미지의 PYTHONPATH에 포함되어 Python 시작 시 자동으로 import됩니다.
+파이프라인 Pod(KFP_POD_NAME 설정)에서 컨테이너 시작(PID 1) → Python 시작까지의
+시간을 한 번 출력합니다. 하위 Python 프로세스는 환경 변수로 중복 출력을 건너뜁니다.
+
+컴포넌트 코드에는 측정 코드가 필요 없으며 KFP v1/v2 컴포넌트 모두 적용됩니다.
+
+현대오토에버 MLOps Training
+"""
+
+import os
+
+_REPORTED_ENV = "KFP_STARTUP_OVERHEAD_REPORTED"
+
+
+def report_startup_overhead() -> None:
+    """컨테이너 시작 → 현재 프로세스 시작 시간 출력 (Pod당 한 번)"""
+    if not os.getenv("KFP_POD_NAME") or os.getenv(_REPORTED_ENV):
+        return
+    os.environ[_REPORTED_ENV] = "1"
+    try:
+        with open("/proc/uptime") as uptime, open("/proc/1/stat") as stat:
+            pid1_start = int(stat.read().rsplit(")", 1)[1].split()[19]) / os.sysconf("SC_CLK_TCK")
+            overhead = float(uptime.read().split()[0]) - pid1_start
+    except (OSError, ValueError, IndexError):
+        return
+    print(f"  ⏱️ Startup overhead: {overhead:.1f}s", flush=True)
+
+
+report_startup_overhead()
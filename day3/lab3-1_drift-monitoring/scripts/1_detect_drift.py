@@ -185,22 +185,22 @@ print()
 # Step 4: MLflow에 기록
 print("[Step 4] Log to MLflow")
 with mlflow.start_run(run_name="drift_detection"):
-    # 메트릭 기록
-    mlflow.log_metric("drift_score", drift_score)
-    mlflow.log_metric("n_drifted_features", n_drifted)
-    mlflow.log_metric("dataset_drift", 1 if dataset_drift else 0)
-    
-    # Feature별 메트릭
+    # 메트릭 기록 (Feature별 메트릭 포함, log_batch 요청 하나로 전송)
+    metrics = {
+        "drift_score": drift_score,
+        "n_drifted_features": n_drifted,
+        "dataset_drift": 1 if dataset_drift else 0
+    }
     for result in drift_results:
-        mlflow.log_metric(f"ks_{result['feature']}", result['ks_statistic'])
-        mlflow.log_metric(f"pval_{result['feature']}", result['p_value'])
+        metrics[f"ks_{result['feature']}"] = result['ks_statistic']
+        metrics[f"pval_{result['feature']}"] = result['p_value']
+    mlflow.log_metrics(metrics)
     
     # 아티팩트 기록
     mlflow.log_artifact(report_path)
     
     # 태그
-    mlflow.set_tag("drift_detected", str(dataset_drift))
-    mlflow.set_tag("method", "ks_test")
+    mlflow.set_tags({"drift_detected": str(dataset_drift), "method": "ks_test"})
     
     print("  ✅ Metrics logged to MLflow")
     print(f"     - drift_score: {drift_score:.2f}")
@@ -13,6 +13,19 @@ print("=" * 60)
 print("  Lab 3-1: Monitoring Pipeline")
 print("=" * 60)
 
+# Pre-built shared component image (generated by day3/component-image/build_image.py)
+# When set, every component uses it and skips pip install at pod startup
+# (the image's sitecustomize prints each step pod's startup overhead)
+COMPONENT_IMAGE = os.getenv("COMPONENT_IMAGE", "")
+
+
+def component_env(packages=None):
+    """Component image/package options (uses the pre-built image if COMPONENT_IMAGE is set)"""
+    if COMPONENT_IMAGE:
+        return {"base_image": COMPONENT_IMAGE, "packages_to_install": []}
+    return {"base_image": "python:3.9", "packages_to_install": packages or []}
+
+
 # Component 1: Collect Production Data
 def collect_production_data(sample_size: int = 1000) -> int:
     """Collect production data (simulation) - return sample size only"""
@@ -21,7 +34,7 @@ def collect_production_data(sample_size: int = 1000) -> int:
 
 collect_production_data_op = create_component_from_func(
     func=collect_production_data,
-    base_image='python:3.9'
+    **component_env()
 )
 
 
@@ -74,8 +87,7 @@ def detect_drift(sample_size: int, drift_threshold: float = 0.3) -> str:
 
 detect_drift_op = create_component_from_func(
     func=detect_drift,
-    base_image='python:3.9',
-    packages_to_install=['scikit-learn==1.3.2', 'pandas==2.0.3', 'numpy', 'scipy']
+    **component_env(['scikit-learn==1.3.2', 'pandas==2.0.3', 'numpy', 'scipy'])
 )
 
 
@@ -92,19 +104,20 @@ def log_metrics(drift_result: str) -> str:
     mlflow.set_tracking_uri(mlflow_uri)
     mlflow.set_experiment("drift-monitoring-pipeline")
     
-    with mlflow.start_run(run_name="pipeline_drift_check"):
-        mlflow.log_metric("drift_score", result['drift_score'])
-        mlflow.log_metric("drift_detected", 1 if result['drift_detected'] else 0)
-        mlflow.log_metric("n_drifted", result['n_drifted'])
-        mlflow.set_tag("pipeline", "monitoring")
+    # 태그는 run 생성 요청에, 메트릭은 log_batch 요청 하나에 담아 전송
+    with mlflow.start_run(run_name="pipeline_drift_check", tags={"pipeline": "monitoring"}):
+        mlflow.log_metrics({
+            "drift_score": result['drift_score'],
+            "drift_detected": 1 if result['drift_detected'] else 0,
+            "n_drifted": result['n_drifted']
+        })
     
     print("Metrics logged to MLflow")
     return "Success"
 
 log_metrics_op = create_component_from_func(
     func=log_metrics,
-    base_image='python:3.9',
-    packages_to_install=['mlflow==2.9.2']
+    **component_env(['mlflow==2.9.2'])
 )
 
 
@@ -126,7 +139,7 @@ def send_alert(drift_result: str) -> str:
 
 send_alert_op = create_component_from_func(
     func=send_alert,
-    base_image='python:3.9'
+    **component_env()
 )
 
 
@@ -13,6 +13,19 @@ print("=" * 60)
 print("  Lab 3-1: Auto-Retraining Pipeline")
 print("=" * 60)
 
+# Pre-built shared component image (generated by day3/component-image/build_image.py)
+# When set, every component uses it and skips pip install at pod startup
+# (the image's sitecustomize prints each step pod's startup overhead)
+COMPONENT_IMAGE = os.getenv("COMPONENT_IMAGE", "")
+
+
+def component_env(packages=None):
+    """Component image/package options (uses the pre-built image if COMPONENT_IMAGE is set)"""
+    if COMPONENT_IMAGE:
+        return {"base_image": COMPONENT_IMAGE, "packages_to_install": []}
+    return {"base_image": "python:3.9", "packages_to_install": packages or []}
+
+
 # Component 1: Check Drift and Decide
 def check_drift_and_decide(drift_threshold: float = 0.3) -> str:
     """Check recent Drift Score and decide whether to retrain"""
@@ -53,8 +66,7 @@ def check_drift_and_decide(drift_threshold: float = 0.3) -> str:
 
 check_drift_op = create_component_from_func(
     func=check_drift_and_decide,
-    base_image='python:3.9',
-    packages_to_install=['mlflow==2.9.2', 'pandas==2.0.3']
+    **component_env(['mlflow==2.9.2', 'pandas==2.0.3'])
 )
 
 
@@ -103,9 +115,8 @@ def retrain_model(train_size: int = 5000) -> str:
         mae = mean_absolute_error(y_test, predictions)
         
         # Log metrics only (no model artifact)
-        mlflow.log_metric("mae", mae)
-        mlflow.log_param("n_estimators", 100)
-        mlflow.log_param("train_size", train_size)
+        mlflow.log_metrics({"mae": mae})
+        mlflow.log_params({"n_estimators": 100, "train_size": train_size})
         
         # Model version from run_id
         run_id = mlflow.active_run().info.run_id
@@ -125,8 +136,7 @@ def retrain_model(train_size: int = 5000) -> str:
 
 retrain_model_op = create_component_from_func(
     func=retrain_model,
-    base_image='python:3.9',
-    packages_to_install=['pandas==2.0.3', 'numpy', 'scikit-learn==1.3.2', 'mlflow==2.9.2']
+    **component_env(['pandas==2.0.3', 'numpy', 'scikit-learn==1.3.2', 'mlflow==2.9.2'])
 )
 
 
@@ -147,7 +157,7 @@ def deploy_model(model_result: str) -> str:
 
 deploy_model_op = create_component_from_func(
     func=deploy_model,
-    base_image='python:3.9'
+    **component_env()
 )
 
 
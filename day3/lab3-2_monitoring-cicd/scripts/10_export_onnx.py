@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: California Housing 모델 ONNX 변환
+
+SUPPORTED_MODELS의 모든 모델 유형(또는 --model로 지정한 저장 모델)을 ONNX로 변환하고,
+테스트 세트에서 sklearn 예측과 수치 일치를 검사합니다.
+모델마다 {model_type}.onnx, 최적화된 그래프 {model_type}.opt.onnx,
+메타데이터 {model_type}_onnx.json(opset, 입력 dtype, 피처 이름, 일치 검사 결과)이 저장됩니다.
+
+사용법:
+    python scripts/10_export_onnx.py
+    python scripts/10_export_onnx.py --model-types linear_regression --dtype float64
+    python scripts/10_export_onnx.py --model models/model.joblib --output-dir models/onnx
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.onnx_export import (  # noqa: E402
+    DEFAULT_OPSET,
+    ORT_OPTIMIZATION_LEVELS,
+    export_all_models
+)
+from src.model.trainer import CaliforniaHousingModel  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ONNX 변환")
+    parser.add_argument("--model", default=None, help="저장된 모델 경로 (없으면 전체 유형 학습)")
+    parser.add_argument("--model-types", nargs="+", default=None,
+                        choices=list(CaliforniaHousingModel.SUPPORTED_MODELS))
+    parser.add_argument("--output-dir", default="models/onnx")
+    parser.add_argument("--dtype", default="float32", choices=["float32", "float64"])
+    parser.add_argument("--opset", type=int, default=DEFAULT_OPSET)
+    parser.add_argument("--optimization-level", default="extended",
+                        choices=list(ORT_OPTIMIZATION_LEVELS))
+    parser.add_argument("--no-optimized", action="store_true", help="최적화 그래프 저장 생략")
+    parser.add_argument("--atol", type=float, default=1e-4)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    print("=" * 60)
+    print("  ONNX Export")
+    print("=" * 60)
+
+    loader = CaliforniaHousingModel()
+    X_train, X_test, y_train, _ = loader.load_data()
+    export_kwargs = {
+        "dtype": args.dtype,
+        "opset": args.opset,
+        "optimization_level": args.optimization_level,
+        "save_optimized": not args.no_optimized,
+        "atol": args.atol
+    }
+
+    if args.model:
+        model = CaliforniaHousingModel.load(args.model)
+        results = {
+            model.model_type: model.export_onnx(
+                os.path.join(args.output_dir, f"{model.model_type}.onnx"),
+                X_check=X_test,
+                **export_kwargs
+            )
+        }
+    else:
+        results = export_all_models(
+            X_train, y_train, args.output_dir,
+            X_check=X_test,
+            model_types=args.model_types,
+            **export_kwargs
+        )
+
+    print(f"\n{'model':<20} {'size(KB)':>10} {'max diff':>10} {'mismatch':>9}  parity")
+    print("-" * 60)
+    failed = []
+    for model_type, result in results.items():
+        parity = result.parity
+        print(f"{model_type:<20} {result.size_bytes / 1024:>10.1f} "
+              f"{parity.max_abs_diff:>10.2e} {parity.mismatch_rate:>9.2%}  "
+              f"{'✅' if parity.passed else '❌'}")
+        if not parity.passed:
+            failed.append(model_type)
+
+    print(f"\n💾 저장 위치: {args.output_dir}/")
+    if failed:
+        print(f"⚠️ 수치 불일치: {', '.join(failed)} (--atol 조정 또는 선형 모델은 --dtype float64)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
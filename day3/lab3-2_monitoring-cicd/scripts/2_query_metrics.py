@@ -9,9 +9,10 @@ Lab 3-2: Prometheus 메트릭 조회 스크립트
 
 import os
 import sys
-import json
-import requests
-from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.monitoring.prometheus import PrometheusClient  # noqa: E402
 
 # 설정
 PROMETHEUS_URL = os.getenv("PROMETHEUS_URL", "http://localhost:9090")
@@ -22,44 +23,23 @@ USER_ID = f"user{USER_NUM}"
 MAE_THRESHOLD = 0.45
 R2_THRESHOLD = 0.75
 
+# 연결 풀 / 응답 캐시를 공유하는 클라이언트
+client = PrometheusClient(PROMETHEUS_URL)
+
 
 def query_prometheus(query):
     """Prometheus instant query"""
     try:
-        response = requests.get(
-            f"{PROMETHEUS_URL}/api/v1/query",
-            params={"query": query},
-            timeout=10
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if data["status"] == "success":
-                return data["data"]["result"]
+        return client.query(query)
     except Exception as e:
         print(f"Query error: {e}")
     return []
 
 
 def query_prometheus_range(query, duration_minutes=30, step="30s"):
-    """Prometheus range query"""
-    end_time = datetime.utcnow()
-    start_time = end_time - timedelta(minutes=duration_minutes)
-    
+    """Prometheus range query (긴 구간은 자동 분할)"""
     try:
-        response = requests.get(
-            f"{PROMETHEUS_URL}/api/v1/query_range",
-            params={
-                "query": query,
-                "start": start_time.isoformat() + "Z",
-                "end": end_time.isoformat() + "Z",
-                "step": step
-            },
-            timeout=30
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if data["status"] == "success":
-                return data["data"]["result"]
+        return client.query_last(query, duration=duration_minutes * 60, step=step)
     except Exception as e:
         print(f"Range query error: {e}")
     return []
@@ -95,30 +75,33 @@ def main():
     print(f"📡 Prometheus URL: {PROMETHEUS_URL}")
     
     # 연결 테스트
-    try:
-        response = requests.get(f"{PROMETHEUS_URL}/-/healthy", timeout=5)
-        if response.status_code != 200:
-            print("\n❌ Prometheus 연결 실패")
-            print("   포트포워딩 확인: kubectl port-forward -n monitoring svc/prometheus 9090:9090")
-            return 1
-    except:
+    if not client.healthy():
         print("\n❌ Prometheus 연결 실패")
         print("   포트포워딩 확인: kubectl port-forward -n monitoring svc/prometheus 9090:9090")
         return 1
     
     print("\n✅ Prometheus 연결 성공")
     
+    # 전체/본인 메트릭 쿼리를 한 번에 동시 요청
+    results = client.query_many({
+        "mae": 'model_mae_score',
+        "r2": 'model_r2_score',
+        "rate": 'rate(model_prediction_total{status="success"}[5m])',
+        "my_mae": f'model_mae_score{{user_id="{USER_ID}"}}',
+        "my_r2": f'model_r2_score{{user_id="{USER_ID}"}}',
+        "my_rps": f'rate(model_prediction_total{{user_id="{USER_ID}", status="success"}}[5m])',
+        "my_latency": f'histogram_quantile(0.95, rate(model_prediction_latency_bucket{{user_id="{USER_ID}"}}[5m]))'
+    })
+    
     # 1. MAE Score (전체)
-    mae_results = query_prometheus('model_mae_score')
-    print_metric("model_mae_score (MAE - 낮을수록 좋음)", mae_results, MAE_THRESHOLD, higher_is_better=False)
+    print_metric("model_mae_score (MAE - 낮을수록 좋음)", results["mae"], MAE_THRESHOLD, higher_is_better=False)
     
     # 2. R² Score (전체)
-    r2_results = query_prometheus('model_r2_score')
-    print_metric("model_r2_score (R² - 높을수록 좋음)", r2_results, R2_THRESHOLD, higher_is_better=True)
+    print_metric("model_r2_score (R² - 높을수록 좋음)", results["r2"], R2_THRESHOLD, higher_is_better=True)
     
     # 3. Prediction Rate
     print("\n📊 model_prediction_total (예측 처리량):")
-    rate_results = query_prometheus('rate(model_prediction_total{status="success"}[5m])')
+    rate_results = results["rate"]
     if rate_results:
         for r in rate_results[:10]:
             user_id = r["metric"].get("user_id", "unknown")
@@ -133,7 +116,7 @@ def main():
     print("=" * 60)
     
     # MAE
-    my_mae = query_prometheus(f'model_mae_score{{user_id="{USER_ID}"}}')
+    my_mae = results["my_mae"]
     if my_mae:
         mae_value = float(my_mae[0]["value"][1])
         status = "⚠️ Drift!" if mae_value > MAE_THRESHOLD else "✅ Normal"
@@ -142,7 +125,7 @@ def main():
         print(f"\n📉 MAE: 데이터 없음")
     
     # R²
-    my_r2 = query_prometheus(f'model_r2_score{{user_id="{USER_ID}"}}')
+    my_r2 = results["my_r2"]
     if my_r2:
         r2_value = float(my_r2[0]["value"][1])
         status = "⚠️ Drift!" if r2_value < R2_THRESHOLD else "✅ Normal"
@@ -151,13 +134,13 @@ def main():
         print(f"📈 R²:  데이터 없음")
     
     # RPS
-    my_rps = query_prometheus(f'rate(model_prediction_total{{user_id="{USER_ID}", status="success"}}[5m])')
+    my_rps = results["my_rps"]
     if my_rps:
         rps_value = float(my_rps[0]["value"][1])
         print(f"⚡ RPS: {rps_value:.2f} req/sec")
     
     # Latency
-    my_latency = query_prometheus(f'histogram_quantile(0.95, rate(model_prediction_latency_bucket{{user_id="{USER_ID}"}}[5m]))')
+    my_latency = results["my_latency"]
     if my_latency:
         latency_value = float(my_latency[0]["value"][1]) * 1000  # ms
         print(f"⏱️ Latency (p95): {latency_value:.2f} ms")
@@ -5,6 +5,11 @@ Lab 3-2: Drift 시뮬레이션 스크립트
 Metrics Exporter의 메트릭 값을 변경하여 Drift를 시뮬레이션합니다.
 실제로는 ConfigMap을 업데이트하여 Exporter가 다른 값을 생성하게 합니다.
 
+※ 별도 metrics-exporter Deployment(가상 값 생성, 레거시 구성)에만 적용됩니다.
+   서빙 프로세스에 내장된 exporter(src/serving/exporter.py)는 실제 요청 입력 / 정답 피드백으로
+   MAE / R² / 드리프트를 계산하므로, 이 스크립트 대신 분포가 바뀐 입력과 피드백을 서빙 API에 보내
+   Drift를 재현합니다 (ConfigMap / Pod 재시작 불필요).
+
 사용법:
     python scripts/3_simulate_drift.py --user user01 --drift-level high
     python scripts/3_simulate_drift.py --user user01 --reset
@@ -17,11 +22,17 @@ import subprocess
 import json
 import yaml
 import time
-import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.monitoring.prometheus import PrometheusClient, instant_values  # noqa: E402
 
 # 설정
 PROMETHEUS_URL = os.getenv("PROMETHEUS_URL", "http://localhost:9090")
 
+# Drift 전/후 값을 비교하므로 응답 캐시 없이 사용
+client = PrometheusClient(PROMETHEUS_URL, cache_ttl_sec=0)
+
 # Drift 레벨 정의
 DRIFT_LEVELS = {
     "none": {"mae_multiplier": 1.0, "r2_multiplier": 1.0},
@@ -48,28 +59,24 @@ def run_kubectl(args):
 def query_prometheus(query):
     """Prometheus 쿼리"""
     try:
-        response = requests.get(
-            f"{PROMETHEUS_URL}/api/v1/query",
-            params={"query": query},
-            timeout=10
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if data["status"] == "success":
-                return data["data"]["result"]
-    except:
+        return client.query(query)
+    except Exception:
         pass
     return []
 
 
 def get_current_metrics(user_id):
-    """현재 메트릭 조회"""
-    mae = query_prometheus(f'model_mae_score{{user_id="{user_id}"}}')
-    r2 = query_prometheus(f'model_r2_score{{user_id="{user_id}"}}')
+    """현재 메트릭 조회 (MAE / R² 동시 요청)"""
+    results = client.query_many({
+        "mae": f'model_mae_score{{user_id="{user_id}"}}',
+        "r2": f'model_r2_score{{user_id="{user_id}"}}'
+    })
+    mae = instant_values(results["mae"])
+    r2 = instant_values(results["r2"])
     
     return {
-        "mae": float(mae[0]["value"][1]) if mae else None,
-        "r2": float(r2[0]["value"][1]) if r2 else None
+        "mae": mae.get(user_id),
+        "r2": r2.get(user_id)
     }
 
 
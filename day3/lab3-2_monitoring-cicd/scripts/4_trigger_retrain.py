@@ -4,10 +4,19 @@ Lab 3-2: 자동 재학습 트리거 스크립트
 
 Drift가 감지되면 GitHub Actions 워크플로우를 트리거합니다.
 
+--sweep 모드는 전체 사용자(user_id)의 MAE / R²를 벡터 쿼리 2개로 한 번에 조회해
+모든 사용자의 Drift를 판정하고, 쿨다운(중복 방지)과 실행당 최대 건수 / 최소 간격
+제한을 적용해 트리거합니다. CronJob 하나로 전체 사용자를 처리할 때 사용합니다.
+
 사용법:
     export USER_NUM="01"
     python scripts/4_trigger_retrain.py --check-drift
     python scripts/4_trigger_retrain.py --force-trigger
+
+    # 전체 사용자 일괄 점검 (dry-run)
+    python scripts/4_trigger_retrain.py --sweep --check-drift
+    python scripts/4_trigger_retrain.py --sweep --check-drift --no-dry-run \
+        --max-dispatches 5 --cooldown 3600 --state-file /data/retrain_state.json
 """
 
 import os
@@ -17,73 +26,68 @@ import json
 import requests
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.monitoring.prometheus import PrometheusClient, instant_values  # noqa: E402
+from src.monitoring.retrain import DispatchLimiter, evaluate_drift  # noqa: E402
+
 # 설정
 PROMETHEUS_URL = os.getenv("PROMETHEUS_URL", "http://localhost:9090")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 GITHUB_REPO = os.getenv("GITHUB_REPO", "")
 USER_NUM = os.getenv("USER_NUM", "01")
 USER_ID = f"user{USER_NUM}"
+RETRAIN_STATE_FILE = os.getenv("RETRAIN_STATE_FILE", "retrain_dispatch_state.json")
 
 # 임계값
 MAE_THRESHOLD = 0.45
 R2_THRESHOLD = 0.75
 
+# 연결 풀 / 응답 캐시를 공유하는 클라이언트
+client = PrometheusClient(PROMETHEUS_URL)
+github_session = requests.Session()
+
 
 def query_prometheus(query):
     """Prometheus 쿼리"""
     try:
-        response = requests.get(
-            f"{PROMETHEUS_URL}/api/v1/query",
-            params={"query": query},
-            timeout=10
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if data["status"] == "success":
-                return data["data"]["result"]
+        return client.query(query)
     except Exception as e:
         print(f"Query error: {e}")
     return []
 
 
-def check_model_drift(user_id):
-    """모델 Drift 감지"""
-    mae_result = query_prometheus(f'model_mae_score{{user_id="{user_id}"}}')
-    r2_result = query_prometheus(f'model_r2_score{{user_id="{user_id}"}}')
+def check_model_drift(user_id, mae_threshold=MAE_THRESHOLD):
+    """모델 Drift 감지 (MAE / R² 쿼리 동시 요청)"""
+    results = client.query_many({
+        "mae": f'model_mae_score{{user_id="{user_id}"}}',
+        "r2": f'model_r2_score{{user_id="{user_id}"}}'
+    })
+    # 시계열이 없거나 Prometheus에 연결할 수 없으면 NaN → "No metrics available"
+    mae = {user_id: float(results["mae"][0]["value"][1]) if results["mae"] else float("nan")}
+    r2 = {user_id: float(results["r2"][0]["value"][1]) if results["r2"] else float("nan")}
     
-    if not mae_result or not r2_result:
-        return {
-            'drift_detected': False,
-            'mae': None,
-            'r2': None,
-            'drift_score': 0,
-            'reason': 'No metrics available'
-        }
+    status = evaluate_drift(mae, r2, mae_threshold, R2_THRESHOLD)[0]
+    del status['user_id']
+    return status
+
+
+def check_all_users(mae_threshold=MAE_THRESHOLD):
+    """
+    전체 사용자 Drift 감지 (벡터 쿼리 2개)
     
-    current_mae = float(mae_result[0]["value"][1])
-    current_r2 = float(r2_result[0]["value"][1])
-    
-    mae_drift = current_mae > MAE_THRESHOLD
-    r2_drift = current_r2 < R2_THRESHOLD
-    
-    # Drift Score 계산
-    mae_score = max(0, (current_mae - MAE_THRESHOLD) / MAE_THRESHOLD) if mae_drift else 0
-    r2_score = max(0, (R2_THRESHOLD - current_r2) / R2_THRESHOLD) if r2_drift else 0
-    drift_score = (mae_score + r2_score) / 2
-    
-    reasons = []
-    if mae_drift:
-        reasons.append(f"MAE({current_mae:.4f}) > {MAE_THRESHOLD}")
-    if r2_drift:
-        reasons.append(f"R²({current_r2:.4f}) < {R2_THRESHOLD}")
-    
-    return {
-        'drift_detected': mae_drift or r2_drift,
-        'mae': current_mae,
-        'r2': current_r2,
-        'drift_score': drift_score,
-        'reason': '; '.join(reasons) if reasons else 'Model performance normal'
-    }
+    사용자별로 여러 시계열이 있으면 가장 나쁜 값(MAE 최대, R² 최소)을 사용합니다.
+    """
+    results = client.query_many({
+        "mae": 'max by (user_id) (model_mae_score)',
+        "r2": 'min by (user_id) (model_r2_score)'
+    })
+    return evaluate_drift(
+        instant_values(results["mae"]),
+        instant_values(results["r2"]),
+        mae_threshold,
+        R2_THRESHOLD
+    )
 
 
 def trigger_github_workflow(user_id, drift_score, dry_run=True):
@@ -127,7 +131,7 @@ def trigger_github_workflow(user_id, drift_score, dry_run=True):
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = github_session.post(url, headers=headers, json=payload, timeout=30)
         
         if response.status_code == 204:
             print(f"\n✅ 재학습 트리거 성공!")
@@ -143,17 +147,84 @@ def trigger_github_workflow(user_id, drift_score, dry_run=True):
         return False
 
 
+def sweep(args, dry_run):
+    """전체 사용자 Drift 점검 및 트리거"""
+    print("=" * 60)
+    print("  Auto-Retrain Trigger Sweep (all users)")
+    print("=" * 60)
+    print(f"\n📅 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    statuses = check_all_users(args.threshold)
+    if not statuses:
+        print(f"\n❌ 메트릭 없음 (Prometheus 연결 확인: {PROMETHEUS_URL})")
+        return 1
+    
+    print(f"\n{'user_id':<12} {'MAE':>8} {'R²':>8} {'score':>8}  drift")
+    print("-" * 50)
+    for status in statuses:
+        mae = f"{status['mae']:.4f}" if status['mae'] is not None else "-"
+        r2 = f"{status['r2']:.4f}" if status['r2'] is not None else "-"
+        print(f"{status['user_id']:<12} {mae:>8} {r2:>8} {status['drift_score']:>8.4f}  "
+              f"{'🚨' if status['drift_detected'] else '✅'}")
+    
+    if args.force_trigger:
+        candidates = statuses
+    elif args.check_drift:
+        candidates = [s for s in statuses if s['drift_detected']]
+    else:
+        print(f"\n📝 --check-drift 또는 --force-trigger를 함께 지정하세요.")
+        return 0
+    
+    print(f"\n🔍 {len(candidates)}/{len(statuses)}명 트리거 대상")
+    if not candidates:
+        return 0
+    
+    # dry-run에서는 쿨다운 상태를 저장하지 않음
+    limiter = DispatchLimiter(
+        state_path=None if dry_run else args.state_file,
+        cooldown_sec=args.cooldown,
+        max_dispatches=args.max_dispatches,
+        min_interval_sec=0.0 if dry_run else args.dispatch_interval
+    )
+    summary = limiter.dispatch_all(
+        candidates,
+        lambda user_id, score: trigger_github_workflow(user_id, score or 0.5, dry_run=dry_run)
+    )
+    
+    print(f"\n" + "=" * 60)
+    print(f"  Sweep 결과{' (DRY RUN)' if dry_run else ''}")
+    print("=" * 60)
+    print(f"   트리거: {', '.join(summary.dispatched) or '-'}")
+    print(f"   쿨다운: {', '.join(summary.cooldown) or '-'}")
+    print(f"   연기(다음 실행): {', '.join(summary.deferred) or '-'}")
+    print(f"   실패: {', '.join(summary.failed) or '-'}")
+    
+    return 1 if summary.failed else 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="자동 재학습 트리거")
     parser.add_argument("--check-drift", action="store_true", help="Drift 확인 후 필요시 트리거")
     parser.add_argument("--force-trigger", action="store_true", help="강제 트리거 (Drift 상관없이)")
     parser.add_argument("--threshold", type=float, default=MAE_THRESHOLD, help="MAE 임계값")
     parser.add_argument("--no-dry-run", action="store_true", help="실제 GitHub API 호출")
+    parser.add_argument("--sweep", action="store_true", help="전체 사용자 일괄 점검")
+    parser.add_argument("--cooldown", type=float, default=3600.0,
+                        help="같은 사용자 재트리거 최소 간격 (초, --sweep)")
+    parser.add_argument("--max-dispatches", type=int, default=10,
+                        help="실행당 최대 트리거 수 (--sweep)")
+    parser.add_argument("--dispatch-interval", type=float, default=1.0,
+                        help="트리거 사이 최소 간격 (초, --sweep)")
+    parser.add_argument("--state-file", default=RETRAIN_STATE_FILE,
+                        help="사용자별 마지막 트리거 시각 저장 파일 (--sweep)")
     
     args = parser.parse_args()
     
     dry_run = not args.no_dry_run
     
+    if args.sweep:
+        return sweep(args, dry_run)
+    
     print("=" * 60)
     print("  Auto-Retrain Trigger Check")
     print("=" * 60)
@@ -161,7 +232,7 @@ def main():
     print(f"📅 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Drift 상태 확인
-    drift_status = check_model_drift(USER_ID)
+    drift_status = check_model_drift(USER_ID, args.threshold)
     
     print(f"\n📊 현재 메트릭:")
     if drift_status['mae']:
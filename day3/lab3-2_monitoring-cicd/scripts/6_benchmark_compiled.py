@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 컴파일된 트리 예측기 벤치마크
+
+sklearn RandomForest 예측과 배열 기반 CompiledForest 예측의
+결과 일치 여부 및 단일 행 / 배치 추론 지연 시간을 비교합니다.
+
+사용법:
+    python scripts/6_benchmark_compiled.py
+    python scripts/6_benchmark_compiled.py --model-type gradient_boosting --batch-sizes 1 10 1000
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.trainer import CaliforniaHousingModel  # noqa: E402
+
+
+def measure_latency(predict_fn, X, n_iterations):
+    """반복 호출 지연 시간 측정 (ms, 호출별 배열)"""
+    for _ in range(5):
+        predict_fn(X)
+
+    timings = np.empty(n_iterations)
+    for i in range(n_iterations):
+        start = time.perf_counter()
+        predict_fn(X)
+        timings[i] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CompiledForest 벤치마크")
+    parser.add_argument("--model-type", default="random_forest",
+                        choices=["random_forest", "gradient_boosting"])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  Compiled Tree Predictor Benchmark")
+    print("=" * 60)
+
+    model = CaliforniaHousingModel(model_type=args.model_type)
+    X_train, X_test, y_train, y_test = model.load_data()
+    model.train(X_train, y_train)
+    compiled = model.compile()
+
+    info = compiled.to_dict()
+    print(f"\n🌲 모델: {args.model_type}")
+    print(f"   Trees: {info['n_trees']}, Nodes: {info['n_nodes']}, "
+          f"Max depth: {info['max_depth']}")
+    print(f"   Compiled size: {info['size_bytes'] / 1024:.1f} KB")
+
+    # 결과 일치 여부
+    sklearn_pred = model.predict(X_test)
+    compiled_pred = compiled.predict(X_test)
+    max_diff = float(np.max(np.abs(sklearn_pred - compiled_pred)))
+    status = "✅" if max_diff < 1e-9 else "⚠️"
+    print(f"\n{status} Parity: max |diff| = {max_diff:.2e} ({len(X_test)} samples)")
+
+    print(f"\n⚡ 지연 시간 ({args.iterations}회 반복)")
+    print(f"   {'batch':>7} {'sklearn p50':>12} {'compiled p50':>13} "
+          f"{'sklearn p99':>12} {'compiled p99':>13} {'speedup':>8}")
+    print(f"   {'-' * 70}")
+
+    for batch_size in args.batch_sizes:
+        idx = np.arange(batch_size) % len(X_test)
+        X_batch = X_test[idx]
+
+        sk = measure_latency(model.predict, X_batch, args.iterations)
+        cf = measure_latency(compiled.predict, X_batch, args.iterations)
+
+        sk_p50, sk_p99 = np.percentile(sk, [50, 99])
+        cf_p50, cf_p99 = np.percentile(cf, [50, 99])
+        print(f"   {batch_size:>7} {sk_p50:>10.3f}ms {cf_p50:>11.3f}ms "
+              f"{sk_p99:>10.3f}ms {cf_p99:>11.3f}ms {sk_p50 / cf_p50:>7.1f}x")
+
+    print("\n" + "=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 서빙용 모델 경량화 (가지치기 / 깊이 제한 / 증류)
+
+RandomForest 학습 후 압축 후보를 만들고, 원본 대비 MAE 허용 범위 이내에서
+가장 빠른 모델을 원본 옆에 저장합니다.
+
+사용법:
+    python scripts/7_compress_model.py
+    python scripts/7_compress_model.py --output models/model.joblib --mae-tolerance 0.01
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.compression import compressed_path  # noqa: E402
+from src.model.trainer import train_model  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 경량화")
+    parser.add_argument("--model-type", default="random_forest",
+                        choices=["random_forest", "gradient_boosting"])
+    parser.add_argument("--output", default="models/model.joblib", help="원본 모델 저장 경로")
+    parser.add_argument("--mae-tolerance", type=float, default=0.02,
+                        help="허용 MAE 상대 증가율 (0.02 = 2%%)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    print("=" * 60)
+    print("  Model Compression")
+    print("=" * 60)
+
+    model, metrics = train_model(
+        model_type=args.model_type,
+        save_path=args.output,
+        compress=True,
+        mae_tolerance=args.mae_tolerance
+    )
+
+    print(f"\n📦 원본 모델: {args.output} (MAE={metrics['mae']:.4f})")
+    target = compressed_path(args.output)
+    if os.path.exists(target):
+        print(f"✅ 압축 모델: {target}")
+    else:
+        print(f"⚠️ 허용 범위({args.mae_tolerance:.0%}) 내 압축 후보 없음 - 원본 모델 사용")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
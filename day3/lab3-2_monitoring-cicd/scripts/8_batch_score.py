@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 오프라인 배치 예측 (프로세스 풀 병렬)
+
+대용량 피처 파일(Parquet 또는 .npy)을 청크로 나눠 여러 프로세스에서 예측하고
+청크별 Parquet 파일(row_id, prediction)로 기록합니다.
+중간에 실패해도 같은 명령을 다시 실행하면 남은 청크만 예측합니다.
+
+사용법:
+    # 모델 학습/저장 + 100만 행 샘플 피처 생성 후 예측
+    python scripts/8_batch_score.py --train --generate 1000000
+
+    python scripts/8_batch_score.py --model models/model.joblib \\
+        --input data/features.parquet --output data/predictions --workers 4
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.batch import score_batch  # noqa: E402
+from src.model.trainer import CaliforniaHousingModel, train_model  # noqa: E402
+
+# California Housing 피처별 대략적인 값 범위 (샘플 생성용)
+FEATURE_RANGES = {
+    "MedInc": (0.5, 15.0),
+    "HouseAge": (1.0, 52.0),
+    "AveRooms": (1.0, 10.0),
+    "AveBedrms": (0.5, 2.0),
+    "Population": (3.0, 5000.0),
+    "AveOccup": (1.0, 6.0),
+    "Latitude": (32.5, 42.0),
+    "Longitude": (-124.3, -114.3),
+}
+
+
+def generate_features(path: str, num_rows: int, seed: int = 42) -> None:
+    """샘플 피처 파일 생성 (.parquet 또는 .npy)"""
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([
+        rng.uniform(low, high, num_rows)
+        for low, high in (FEATURE_RANGES[name] for name in CaliforniaHousingModel.FEATURE_NAMES)
+    ])
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if path.endswith(".npy"):
+        np.save(path, X)
+    else:
+        pd.DataFrame(X, columns=CaliforniaHousingModel.FEATURE_NAMES).to_parquet(
+            path, row_group_size=100_000
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배치 예측")
+    parser.add_argument("--model", default="models/model.joblib", help="저장된 모델 경로")
+    parser.add_argument("--train", action="store_true", help="모델을 학습해 --model에 저장")
+    parser.add_argument("--input", default="data/features.parquet",
+                        help="피처 파일 (.parquet 또는 .npy)")
+    parser.add_argument("--output", default="data/predictions", help="예측 결과 디렉터리")
+    parser.add_argument("--generate", type=int, default=0, help="샘플 피처 N행 생성")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=None, help="워커 수 (기본: CPU 수)")
+    parser.add_argument("--compile", action="store_true",
+                        help="CompiledForest로 예측 (워커 간 모델 메모리 공유, 처리량은 낮음)")
+    parser.add_argument("--no-resume", action="store_true", help="기존 결과 삭제 후 처음부터")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    print("=" * 60)
+    print("  Batch Scoring")
+    print("=" * 60)
+
+    if args.train:
+        train_model(model_type="random_forest", save_path=args.model)
+    if args.generate:
+        generate_features(args.input, args.generate)
+        print(f"\n📝 샘플 피처 생성: {args.generate:,}행 → {args.input}")
+
+    result = score_batch(
+        args.model,
+        args.input,
+        args.output,
+        chunk_size=args.chunk_size,
+        n_workers=args.workers,
+        compile_model=args.compile,
+        resume=not args.no_resume
+    )
+
+    print(f"\n📊 입력: {result.total_rows:,}행, {result.num_chunks}개 청크")
+    if result.skipped_chunks:
+        print(f"   이어서 실행: {result.skipped_chunks}개 청크 건너뜀")
+    print(f"✅ 예측: {result.scored_rows:,}행, {result.elapsed_sec:.2f}s "
+          f"({result.rows_per_sec:,.0f} rows/s)")
+    print(f"💾 결과: {result.output_dir}/part-*.parquet")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
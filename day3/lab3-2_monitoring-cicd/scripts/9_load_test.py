@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 서빙 API 부하 테스트
+
+California Housing API(create_app) 또는 day2 Iris API(app/main.py)에
+동시 요청을 보내 지연 시간 히스토그램, 처리량, 오류율을 측정합니다.
+
+- --url 없이 실행하면 앱을 프로세스 안에서 직접 호출 (네트워크/서버 불필요)
+- --url을 주면 실행 중인 서버(localhost 등)에 요청
+- --sweep으로 동시성을 늘려가며 처리량이 포화되는 지점을 찾음
+- --mlflow-experiment를 주면 설정/결과를 MLflow run에 기록 (배치 로거로 log_batch 전송,
+  트래킹 서버는 MLFLOW_TRACKING_URI)
+
+사용법:
+    # 프로세스 내 housing API, closed-loop 동시 사용자 16명, 64행 바이너리 요청
+    python scripts/9_load_test.py --concurrency 16 --batch-size 64 --format binary
+
+    # 실행 중인 서버에 초당 200건 open-loop
+    python scripts/9_load_test.py --url http://localhost:8080 --mode open --rate 200
+
+    # day2 Iris API 동시성 스윕
+    python scripts/9_load_test.py --target iris --sweep 1 2 4 8 16 32 --output results/iris.json
+
+    # day2 Iris API 컬럼 엔드포인트(/predict/columnar), 1000행 .npy 요청
+    python scripts/9_load_test.py --target iris --batch-size 1000 --format npy
+
+    # 스윕 결과를 MLflow에 기록 (동시성 = 메트릭 step)
+    python scripts/9_load_test.py --sweep 1 2 4 8 16 --mlflow-experiment serving-load-test
+"""
+
+import os
+import sys
+import json
+import argparse
+import importlib.util
+import logging
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.serving.loadtest import (  # noqa: E402
+    PAYLOAD_FORMATS,
+    LoadTestConfig,
+    find_saturation,
+    run_load_test,
+    sweep_concurrency
+)
+
+IRIS_APP_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "..", "day2", "lab2-1_fastapi-serving", "app", "main.py"
+)
+
+
+def load_housing_app(model_path):
+    """create_app() 앱 생성 (모델 파일이 없으면 합성 데이터로 작은 모델 학습)"""
+    from src.model.trainer import CaliforniaHousingModel
+    from src.serving.api import create_app
+
+    if model_path:
+        model = CaliforniaHousingModel.load(model_path)
+    else:
+        print("⚠️ --model 미지정: 합성 데이터로 학습한 모델 사용")
+        rng = np.random.default_rng(42)
+        X = rng.normal(size=(2000, 8))
+        model = CaliforniaHousingModel(
+            model_params={"n_estimators": 50, "max_depth": 8, "random_state": 42}
+        )
+        model.train(X, 2.0 + X[:, 0])
+    return create_app(model=model)
+
+
+def load_iris_app():
+    """day2 Iris API 모듈 로드 (model.joblib은 train_model.py로 미리 생성)"""
+    spec = importlib.util.spec_from_file_location("iris_serving_app", IRIS_APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not module.MODEL_LOADED:
+        print("⚠️ Iris 모델이 로드되지 않았습니다 (day2/lab2-1_fastapi-serving/train_model.py 실행 필요)")
+    return module.app
+
+
+def print_result(result):
+    summary = result.to_dict()
+    latency = summary["latency_ms"]
+    print(f"\n📊 {summary['requests']:,}건 / {summary['elapsed_sec']:.1f}s "
+          f"(오류 {summary['errors']}건, {summary['error_rate']:.2%}, 누락 {summary['dropped']}건)")
+    print(f"   처리량: {summary['throughput_rps']:,.1f} req/s, {summary['rows_per_sec']:,.0f} rows/s")
+    print(f"   지연 시간: p50 {latency['p50']:.2f} ms, p90 {latency['p90']:.2f} ms, "
+          f"p99 {latency['p99']:.2f} ms, max {latency['max']:.2f} ms")
+    print(f"   상태 코드: {summary['status_counts']}")
+    print(result.render_histogram())
+
+
+def log_to_mlflow(experiment, args, results, saturation=None):
+    """
+    부하 테스트 설정/결과를 MLflow run에 기록
+
+    메트릭은 BatchedMlflowLogger에 모았다가 log_batch로 전송하므로
+    스윕 지점 수와 관계없이 트래킹 서버 요청이 몇 번으로 끝납니다.
+
+    Args:
+        experiment: MLflow 실험 이름
+        args: 명령행 인자
+        results: LoadTestResult 리스트 (스윕이면 동시성 순서)
+        saturation: 포화 동시성 (스윕일 때)
+
+    Returns:
+        기록한 run ID
+    """
+    import mlflow
+    from src.monitoring.tracking import batch_logger
+
+    params = {
+        "target": args.target,
+        "mode": args.mode,
+        "duration_sec": args.duration,
+        "batch_size": args.batch_size,
+        "payload_format": args.format
+    }
+    if args.mode == "open":
+        params["rate"] = args.rate
+    elif not args.sweep:
+        params["concurrency"] = args.concurrency
+
+    mlflow.set_experiment(experiment)
+    with mlflow.start_run(run_name=f"loadtest-{args.target}") as run:
+        with batch_logger() as batch:
+            batch.log_params(params)
+            batch.set_tags({"url": args.url or "in-process"})
+            for result in results:
+                batch.log_metrics({
+                    "throughput_rps": result.throughput_rps,
+                    "rows_per_sec": result.rows_per_sec,
+                    "error_rate": result.error_rate,
+                    "latency_p50_ms": result.percentile(50),
+                    "latency_p90_ms": result.percentile(90),
+                    "latency_p99_ms": result.percentile(99)
+                }, step=result.config.concurrency if args.sweep else 0)
+            if saturation is not None:
+                batch.log_metric("saturation_concurrency", saturation)
+        stats = batch.stats
+    if stats.failed_batches:
+        print(f"⚠️ MLflow 기록 일부 실패: {stats.last_error}")
+    return run.info.run_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서빙 API 부하 테스트")
+    parser.add_argument("--target", default="housing", choices=["housing", "iris"])
+    parser.add_argument("--url", default=None, help="서버 URL (없으면 프로세스 내 실행)")
+    parser.add_argument("--model", default=None, help="housing 모델 파일 (프로세스 내 실행 시)")
+    parser.add_argument("--mode", default="closed", choices=["closed", "open"])
+    parser.add_argument("--concurrency", type=int, default=8, help="closed-loop 동시 사용자 수")
+    parser.add_argument("--rate", type=float, default=100.0, help="open-loop 초당 요청 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--batch-size", type=int, default=1, help="요청당 행 수")
+    parser.add_argument("--format", default="json", choices=list(PAYLOAD_FORMATS),
+                        help="요청 형식 (npy / columnar는 iris만: /predict/columnar)")
+    parser.add_argument("--sweep", type=int, nargs="+", default=None,
+                        help="closed-loop 동시성 스윕 (예: 1 2 4 8 16)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--mlflow-experiment", default=None,
+                        help="결과를 기록할 MLflow 실험 (없으면 기록 안 함)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print("=" * 60)
+    print("  Serving Load Test")
+    print("=" * 60)
+
+    if args.url:
+        target = args.url
+    elif args.target == "housing":
+        target = load_housing_app(args.model)
+    else:
+        target = load_iris_app()
+    print(f"대상: {args.target} ({args.url or '프로세스 내'}), "
+          f"{args.batch_size}행 {args.format} 요청")
+
+    config = LoadTestConfig(
+        mode=args.mode,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        duration_sec=args.duration,
+        batch_size=args.batch_size,
+        payload_format=args.format
+    )
+
+    if args.sweep:
+        results, saturation = sweep_concurrency(target, args.sweep, config, profile=args.target)
+        print(f"\n{'동시성':>6} {'req/s':>10} {'rows/s':>12} {'p50 ms':>9} {'p99 ms':>9} {'오류율':>7}")
+        for result in results:
+            print(f"{result.config.concurrency:>6} {result.throughput_rps:>10,.1f} "
+                  f"{result.rows_per_sec:>12,.0f} {result.percentile(50):>9.2f} "
+                  f"{result.percentile(99):>9.2f} {result.error_rate:>7.2%}")
+        if saturation is None:
+            print("\n📈 스윕 범위 안에서 처리량이 계속 증가했습니다 (더 높은 동시성 필요)")
+        else:
+            print(f"\n📈 포화 지점: 동시성 {saturation} (이후 처리량 증가 5% 미만)")
+        report = {
+            "saturation_concurrency": find_saturation(results),
+            "results": [result.to_dict() for result in results]
+        }
+    else:
+        result = run_load_test(target, config, profile=args.target)
+        print_result(result)
+        results, saturation = [result], None
+        report = result.to_dict()
+
+    if args.mlflow_experiment:
+        run_id = log_to_mlflow(args.mlflow_experiment, args, results, saturation)
+        print(f"\n📝 MLflow run 기록: {run_id} (실험: {args.mlflow_experiment})")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
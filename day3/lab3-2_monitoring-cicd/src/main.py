@@ -23,6 +23,7 @@ def main():
         import uvicorn
         from src.model.trainer import train_model
         from src.serving.api import create_app
+        from src.serving.exporter import create_exporter
         
         # 환경 변수에서 설정 읽기
         port = int(os.environ.get("PORT", 8080))
@@ -38,14 +39,41 @@ def main():
         
         # 모델 학습
         logger.info("Training model...")
-        model, metrics = train_model(model_type="random_forest")
+        engineer_features = os.environ.get("ENGINEER_FEATURES", "false").lower() == "true"
+        model, metrics = train_model(
+            model_type="random_forest",
+            engineer_features=engineer_features
+        )
         logger.info(f"Model trained successfully!")
         logger.info(f"  MAE: {metrics['mae']:.4f}")
         logger.info(f"  R²: {metrics['r2']:.4f}")
         
+        # 임베디드 메트릭 exporter (실제 트래픽 기반 MAE/R² / 드리프트 / 지연 시간, 선택)
+        # 학습 입력을 드리프트 기준으로 사용하고, 기존 metrics-exporter와 같은 포트로 노출
+        # 기준 데이터를 다시 로드하므로 ENABLE_EXPORTER=true일 때만 활성화
+        exporter = None
+        if os.environ.get("ENABLE_EXPORTER", "false").lower() == "true":
+            X_reference, _, _, _ = model.load_data()
+            exporter = create_exporter(
+                model_version=model_version,
+                reference_data=X_reference,
+                feature_names=model.FEATURE_NAMES
+            )
+            exporter.serve(int(os.environ.get("EXPORTER_PORT", 8000)))
+        
+        # 배열 기반 컴파일 예측기로 서빙 (선택)
+        # 컴파일된 예측기는 변환을 포함하지 않으므로 피처 파이프라인을 별도로 전달
+        transform = None
+        if os.environ.get("COMPILE_MODEL", "false").lower() == "true":
+            logger.info("Compiling model to array-based predictor...")
+            transform = model.feature_pipeline
+            model = model.compile()
+        
         # FastAPI 앱 생성
         logger.info("Creating FastAPI application...")
-        app = create_app(model=model, model_version=model_version)
+        app = create_app(
+            model=model, model_version=model_version, transform=transform, exporter=exporter
+        )
         
         if app is None:
             logger.error("Failed to create FastAPI app")
@@ -1,5 +1,32 @@
 """Model training and inference module"""
 
 from .trainer import CaliforniaHousingModel, train_model
+from .batch import BatchScorer, BatchScoringResult, score_batch
+from .compiled import CompiledForest
+from .compression import CompressionReport, ModelCompressor
+from .features import FeaturePipeline
+from .onnx_export import OnnxExportResult, ParityReport, export_all_models, export_onnx
+from .metrics import (
+    RegressionMetricsAccumulator,
+    compute_regression_metrics,
+    compute_segment_metrics
+)
 
-__all__ = ["CaliforniaHousingModel", "train_model"]
+__all__ = [
+    "CaliforniaHousingModel",
+    "train_model",
+    "BatchScorer",
+    "BatchScoringResult",
+    "score_batch",
+    "CompiledForest",
+    "CompressionReport",
+    "ModelCompressor",
+    "FeaturePipeline",
+    "OnnxExportResult",
+    "ParityReport",
+    "export_all_models",
+    "export_onnx",
+    "RegressionMetricsAccumulator",
+    "compute_regression_metrics",
+    "compute_segment_metrics"
+]
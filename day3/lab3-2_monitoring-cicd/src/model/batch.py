@@ -0,0 +1,383 @@
+"""
+Batch Scoring Module
+
+대용량 피처 파일(Parquet 또는 .npy)을 청크로 나눠 프로세스 풀에서 병렬 예측
+- 부모 프로세스가 예측기를 비압축 joblib 파일로 한 번 저장하고,
+  워커는 초기화 시 mmap_mode="r"로 한 번만 로드 (요청마다 역직렬화하지 않음)
+- compile_model=True면 CompiledForest 배열이 메모리 매핑된 채로 쓰여 워커 간 페이지 캐시를 공유
+  (sklearn 트리는 로드 시 노드 배열을 복사하므로 워커마다 사본을 가짐)
+- 청크마다 row_id / prediction Parquet 파일을 원자적으로 기록 (임시 파일 → rename)
+- 재실행 시 이미 기록된 청크는 건너뛰어 실패 지점부터 이어서 처리
+  (입력 / 청크 설정 / 모델 / 컴파일 여부가 이전 실행과 다르면 이어서 실행하지 않음)
+"""
+
+import json
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .trainer import CaliforniaHousingModel
+
+logger = logging.getLogger(__name__)
+
+JOB_FILE = "_job.json"
+ARTIFACT_FILE = "_predictor.joblib"
+
+# 워커 프로세스별 예측기 (초기화 시 한 번 로드)
+_worker_state: Dict = {}
+
+
+@dataclass(frozen=True)
+class ScoringChunk:
+    """예측 청크 (전역 행 범위, Parquet이면 포함된 row group)"""
+    chunk_id: int
+    start: int
+    stop: int
+    row_groups: Tuple[int, ...] = ()
+
+    @property
+    def num_rows(self) -> int:
+        return self.stop - self.start
+
+
+@dataclass
+class BatchScoringResult:
+    """배치 예측 실행 결과"""
+    output_dir: str
+    total_rows: int
+    scored_rows: int
+    num_chunks: int
+    skipped_chunks: int
+    elapsed_sec: float
+    files: List[str] = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self) -> float:
+        """이번 실행에서 예측한 행 기준 처리량"""
+        return self.scored_rows / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "output_dir": self.output_dir,
+            "total_rows": self.total_rows,
+            "scored_rows": self.scored_rows,
+            "num_chunks": self.num_chunks,
+            "skipped_chunks": self.skipped_chunks,
+            "elapsed_sec": round(self.elapsed_sec, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1)
+        }
+
+
+def plan_chunks(
+    input_path: str,
+    chunk_size: int,
+    feature_columns: Sequence[str] = CaliforniaHousingModel.FEATURE_NAMES
+) -> List[ScoringChunk]:
+    """
+    입력 파일을 예측 청크로 분할
+
+    .npy는 chunk_size 행 단위로 나누고, Parquet은 row group 경계에 맞춰
+    chunk_size 이상이 될 때까지 연속된 row group을 묶습니다.
+
+    Args:
+        input_path: 피처 파일 경로 (.parquet 또는 .npy)
+        chunk_size: 청크당 목표 행 수
+        feature_columns: Parquet 피처 컬럼 (순서대로 모델 입력)
+
+    Returns:
+        청크 목록
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    if _input_format(input_path) == "npy":
+        X = np.load(input_path, mmap_mode="r")
+        if X.ndim != 2 or X.shape[1] != len(feature_columns):
+            raise ValueError(
+                f"Expected array of shape (n, {len(feature_columns)}), got {X.shape}"
+            )
+        return [
+            ScoringChunk(i, start, min(start + chunk_size, X.shape[0]))
+            for i, start in enumerate(range(0, X.shape[0], chunk_size))
+        ]
+
+    metadata = pq.ParquetFile(input_path).metadata
+    missing = [c for c in feature_columns if c not in metadata.schema.names]
+    if missing:
+        raise ValueError(f"Missing feature columns in {input_path}: {missing}")
+
+    chunks, groups, start, rows = [], [], 0, 0
+    for rg in range(metadata.num_row_groups):
+        groups.append(rg)
+        rows += metadata.row_group(rg).num_rows
+        if rows >= chunk_size or rg == metadata.num_row_groups - 1:
+            chunks.append(ScoringChunk(len(chunks), start, start + rows, tuple(groups)))
+            start, rows, groups = start + rows, 0, []
+    return chunks
+
+
+def read_chunk(
+    input_path: str,
+    chunk: ScoringChunk,
+    feature_columns: Sequence[str] = CaliforniaHousingModel.FEATURE_NAMES
+) -> np.ndarray:
+    """
+    청크 하나의 피처 행렬 읽기
+
+    Args:
+        input_path: 피처 파일 경로
+        chunk: 읽을 청크
+        feature_columns: Parquet 피처 컬럼
+
+    Returns:
+        (chunk.num_rows, n_features) float64 배열
+    """
+    if _input_format(input_path) == "npy":
+        X = np.load(input_path, mmap_mode="r")
+        return np.asarray(X[chunk.start:chunk.stop], dtype=np.float64)
+
+    table = pq.ParquetFile(input_path).read_row_groups(
+        list(chunk.row_groups), columns=list(feature_columns)
+    )
+    return np.column_stack([
+        table.column(name).to_numpy().astype(np.float64, copy=False)
+        for name in feature_columns
+    ])
+
+
+def chunk_path(output_dir: str, chunk: ScoringChunk) -> str:
+    """청크 출력 파일 경로"""
+    return os.path.join(output_dir, f"part-{chunk.chunk_id:05d}.parquet")
+
+
+def _input_format(path: str) -> str:
+    if path.endswith(".npy"):
+        return "npy"
+    if path.endswith(".parquet"):
+        return "parquet"
+    raise ValueError(f"Unsupported input format: {path}. Supported: .parquet, .npy")
+
+
+def _init_worker(artifact_path: str) -> None:
+    """워커 초기화: 예측기를 메모리 매핑으로 한 번 로드"""
+    artifact = joblib.load(artifact_path, mmap_mode="r")
+    predictor = artifact["predictor"]
+    # 프로세스 풀이 병렬화하므로 워커 내부 스레드 병렬화는 끔 (CPU 과다 할당 방지)
+    estimator = getattr(predictor, "model", None)
+    if estimator is not None and hasattr(estimator, "n_jobs"):
+        estimator.n_jobs = 1
+    _worker_state["predictor"] = predictor
+    _worker_state["transform"] = artifact["transform"]
+
+
+def _score_chunk(
+    input_path: str,
+    chunk: ScoringChunk,
+    output_dir: str,
+    feature_columns: Sequence[str]
+) -> Tuple[int, int]:
+    """청크 예측 후 Parquet 기록 (워커에서 실행). (chunk_id, 행 수) 반환"""
+    X = read_chunk(input_path, chunk, feature_columns)
+    transform = _worker_state["transform"]
+    if transform is not None:
+        X = transform.transform(X)
+    predictions = np.asarray(_worker_state["predictor"].predict(X), dtype=np.float64)
+
+    table = pa.table({
+        "row_id": np.arange(chunk.start, chunk.stop, dtype=np.int64),
+        "prediction": predictions
+    })
+    path = chunk_path(output_dir, chunk)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return chunk.chunk_id, chunk.num_rows
+
+
+class BatchScorer:
+    """프로세스 풀 기반 배치 예측기"""
+
+    def __init__(
+        self,
+        model: CaliforniaHousingModel,
+        n_workers: Optional[int] = None,
+        chunk_size: int = 100_000,
+        compile_model: bool = False,
+        feature_columns: Sequence[str] = CaliforniaHousingModel.FEATURE_NAMES,
+        model_fingerprint: Optional[Dict] = None
+    ):
+        """
+        배치 예측기 초기화
+
+        Args:
+            model: 학습된 모델
+            n_workers: 워커 프로세스 수 (기본: CPU 수)
+            chunk_size: 청크당 목표 행 수
+            compile_model: 트리 모델을 CompiledForest로 변환해 예측.
+                워커 간 모델 메모리를 공유하지만 대용량 배치에서는 sklearn 예측보다 느림
+            feature_columns: Parquet 입력의 피처 컬럼
+            model_fingerprint: 이어서 실행할 때 같은 모델인지 확인할 식별 정보
+                (기본: 모델 객체의 joblib.hash)
+        """
+        if not model.is_fitted:
+            raise RuntimeError("Model is not fitted. Cannot score.")
+
+        self.model = model
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.compile_model = compile_model
+        self.feature_columns = list(feature_columns)
+        self.model_fingerprint = model_fingerprint
+
+    @classmethod
+    def from_file(cls, model_path: str, **kwargs) -> "BatchScorer":
+        """저장된 모델 파일에서 생성 (모델 파일 경로 / 크기 / 수정 시각으로 모델 식별)"""
+        stat = os.stat(model_path)
+        kwargs.setdefault("model_fingerprint", {
+            "model_path": os.path.abspath(model_path),
+            "model_size": stat.st_size,
+            "model_mtime_ns": stat.st_mtime_ns
+        })
+        return cls(CaliforniaHousingModel.load(model_path), **kwargs)
+
+    def _write_artifact(self, output_dir: str) -> str:
+        """워커가 메모리 매핑할 예측기 파일 저장 (비압축)"""
+        if self.compile_model and self.model.model_type != "linear_regression":
+            predictor = self.model.compile()
+            transform = self.model.feature_pipeline
+        else:
+            predictor, transform = self.model, None
+
+        path = os.path.join(output_dir, ARTIFACT_FILE)
+        joblib.dump({"predictor": predictor, "transform": transform}, path)
+        return path
+
+    def _check_job(self, input_path: str, output_dir: str, resume: bool) -> None:
+        """이전 실행과 입력/청크 설정/모델이 같은지 확인하고 작업 정보 기록"""
+        stat = os.stat(input_path)
+        job = {
+            "input_path": os.path.abspath(input_path),
+            "input_size": stat.st_size,
+            "input_mtime_ns": stat.st_mtime_ns,
+            "chunk_size": self.chunk_size,
+            "feature_columns": self.feature_columns,
+            "model": self.model_fingerprint or {"model_hash": joblib.hash(self.model)},
+            "compile_model": self.compile_model
+        }
+        job_path = os.path.join(output_dir, JOB_FILE)
+
+        if os.path.exists(job_path):
+            with open(job_path) as f:
+                previous = json.load(f)
+            if resume and previous != job:
+                raise ValueError(
+                    f"Output directory {output_dir} belongs to a different job. "
+                    f"Use resume=False to overwrite it."
+                )
+
+        if not resume:
+            for name in os.listdir(output_dir):
+                if name.startswith("part-"):
+                    os.remove(os.path.join(output_dir, name))
+
+        with open(job_path, "w") as f:
+            json.dump(job, f, indent=2)
+
+    def score(self, input_path: str, output_dir: str, resume: bool = True) -> BatchScoringResult:
+        """
+        피처 파일 전체 예측
+
+        Args:
+            input_path: 피처 파일 경로 (.parquet 또는 .npy)
+            output_dir: 예측 결과 디렉터리 (part-*.parquet, row_id / prediction 컬럼)
+            resume: True면 이미 기록된 청크는 건너뜀
+
+        Returns:
+            실행 결과
+        """
+        start_time = time.perf_counter()
+        chunks = plan_chunks(input_path, self.chunk_size, self.feature_columns)
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._check_job(input_path, output_dir, resume)
+
+        pending = [c for c in chunks if not os.path.exists(chunk_path(output_dir, c))]
+        skipped = len(chunks) - len(pending)
+        if skipped:
+            logger.info(f"Resuming: {skipped}/{len(chunks)} chunks already scored")
+
+        scored_rows = 0
+        if pending:
+            artifact_path = self._write_artifact(output_dir)
+            n_workers = min(self.n_workers, len(pending))
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(artifact_path,)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _score_chunk, input_path, chunk, output_dir, self.feature_columns
+                    )
+                    for chunk in pending
+                ]
+                for future in as_completed(futures):
+                    chunk_id, rows = future.result()
+                    scored_rows += rows
+                    elapsed = time.perf_counter() - start_time
+                    logger.info(
+                        f"Chunk {chunk_id} scored: {rows} rows "
+                        f"({scored_rows / elapsed:,.0f} rows/s)"
+                    )
+            os.remove(artifact_path)
+
+        return BatchScoringResult(
+            output_dir=output_dir,
+            total_rows=sum(c.num_rows for c in chunks),
+            scored_rows=scored_rows,
+            num_chunks=len(chunks),
+            skipped_chunks=skipped,
+            elapsed_sec=time.perf_counter() - start_time,
+            files=[chunk_path(output_dir, c) for c in chunks]
+        )
+
+
+def score_batch(
+    model_path: str,
+    input_path: str,
+    output_dir: str,
+    chunk_size: int = 100_000,
+    n_workers: Optional[int] = None,
+    compile_model: bool = False,
+    resume: bool = True
+) -> BatchScoringResult:
+    """
+    배치 예측 편의 함수
+
+    Args:
+        model_path: CaliforniaHousingModel.save()로 저장한 모델 경로
+        input_path: 피처 파일 경로 (.parquet 또는 .npy)
+        output_dir: 예측 결과 디렉터리
+        chunk_size: 청크당 목표 행 수
+        n_workers: 워커 프로세스 수
+        compile_model: 트리 모델 컴파일 여부
+        resume: 이미 기록된 청크 건너뛰기
+
+    Returns:
+        실행 결과
+    """
+    scorer = BatchScorer.from_file(
+        model_path,
+        n_workers=n_workers,
+        chunk_size=chunk_size,
+        compile_model=compile_model
+    )
+    return scorer.score(input_path, output_dir, resume=resume)
@@ -0,0 +1,289 @@
+"""
+Compiled Tree Ensemble Module
+
+학습된 트리 앙상블(RandomForest, GradientBoosting)을 연속된 NumPy 배열로
+평탄화(flatten)하여 sklearn 추정기 객체 없이 예측
+
+- 모든 트리의 노드를 feature / threshold / left / right / value 배열로 변환
+- 배치의 모든 샘플 × 모든 트리를 레벨 단위로 동시에 탐색 (벡터화)
+- 1~10행 요청에서 sklearn의 트리별 호출 오버헤드 제거
+"""
+
+import os
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+from sklearn.ensemble import (
+    ExtraTreesRegressor,
+    GradientBoostingRegressor,
+    RandomForestRegressor
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledForest:
+    """평탄화된 배열 기반 트리 앙상블 예측기"""
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        n_features: int,
+        missing_right: Optional[np.ndarray] = None,
+        scale: float = 1.0,
+        bias: float = 0.0,
+        batch_size: int = 8192
+    ):
+        """
+        컴파일된 포레스트 초기화
+
+        Args:
+            feature: 노드별 분할 특성 인덱스 (리프는 0)
+            threshold: 노드별 분할 임계값 (x <= threshold 이면 왼쪽)
+            left: 왼쪽 자식 노드 전역 인덱스 (리프는 자기 자신)
+            right: 오른쪽 자식 노드 전역 인덱스 (리프는 자기 자신)
+            value: 노드별 출력값
+            roots: 트리별 루트 노드 전역 인덱스
+            max_depth: 전체 트리 중 최대 깊이
+            n_features: 입력 특성 수
+            missing_right: 노드별 결측값(NaN) 오른쪽 이동 여부 (기본: 왼쪽)
+            scale: 트리 출력 합계에 곱하는 계수 (RF: 1/n_trees, GBM: learning_rate)
+            bias: 예측값에 더하는 상수 (GBM 초기 예측값)
+            batch_size: 한 번에 탐색할 최대 행 수 (메모리 제한)
+        """
+        self.feature = np.ascontiguousarray(feature, dtype=np.int32)
+        self.threshold = np.ascontiguousarray(threshold, dtype=np.float64)
+        self.left = np.ascontiguousarray(left, dtype=np.int32)
+        self.right = np.ascontiguousarray(right, dtype=np.int32)
+        self.value = np.ascontiguousarray(value, dtype=np.float64)
+        self.roots = np.ascontiguousarray(roots, dtype=np.int32)
+        self.missing_right = (
+            np.zeros(len(self.feature), dtype=bool) if missing_right is None
+            else np.ascontiguousarray(missing_right, dtype=bool)
+        )
+        # 자식 노드를 [left, right] 쌍으로 인터리브: 레벨당 gather 1회로 다음 노드 선택
+        self._children = np.stack([self.left, self.right], axis=1).ravel()
+        self.max_depth = int(max_depth)
+        self.n_features = int(n_features)
+        self.scale = float(scale)
+        self.bias = float(bias)
+        self.batch_size = batch_size
+
+    @property
+    def n_trees(self) -> int:
+        """트리 개수"""
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        """전체 노드 수"""
+        return len(self.feature)
+
+    @classmethod
+    def from_sklearn(cls, model, batch_size: int = 8192) -> "CompiledForest":
+        """
+        sklearn 트리 앙상블을 평탄화
+
+        Args:
+            model: 학습된 RandomForestRegressor / ExtraTreesRegressor /
+                GradientBoostingRegressor
+            batch_size: 한 번에 탐색할 최대 행 수
+
+        Returns:
+            컴파일된 예측기
+        """
+        if isinstance(model, (RandomForestRegressor, ExtraTreesRegressor)):
+            trees = [est.tree_ for est in model.estimators_]
+            scale = 1.0 / len(trees)
+            bias = 0.0
+        elif isinstance(model, GradientBoostingRegressor):
+            trees = [est.tree_ for est in model.estimators_[:, 0]]
+            scale = model.learning_rate
+            bias = cls._gbm_bias(model)
+        else:
+            raise TypeError(
+                f"Unsupported model for compilation: {type(model).__name__}. "
+                f"Supported: RandomForestRegressor, ExtraTreesRegressor, "
+                f"GradientBoostingRegressor"
+            )
+
+        if getattr(trees[0], "n_outputs", 1) != 1:
+            raise ValueError("Only single-output regressors can be compiled")
+
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        missing_rights = []
+        offset = 0
+        max_depth = 0
+
+        for tree in trees:
+            n = tree.node_count
+            node_ids = np.arange(n, dtype=np.int64) + offset
+            is_leaf = tree.children_left == -1
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+            values.append(tree.value[:, 0, 0])
+            # sklearn>=1.3: 분할별 결측값 방향 (없으면 NaN은 왼쪽으로 이동)
+            missing_left = getattr(tree, "missing_go_to_left", None)
+            missing_rights.append(
+                np.zeros(n, dtype=bool) if missing_left is None
+                else ~np.asarray(missing_left, dtype=bool)
+            )
+            roots.append(offset)
+
+            max_depth = max(max_depth, tree.max_depth)
+            offset += n
+
+        compiled = cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.concatenate(values),
+            roots=np.asarray(roots),
+            max_depth=max_depth,
+            n_features=model.n_features_in_,
+            missing_right=np.concatenate(missing_rights),
+            scale=scale,
+            bias=bias,
+            batch_size=batch_size
+        )
+        logger.info(
+            f"Compiled {type(model).__name__}: {compiled.n_trees} trees, "
+            f"{compiled.n_nodes} nodes, max_depth={compiled.max_depth}"
+        )
+        return compiled
+
+    @staticmethod
+    def _gbm_bias(model: GradientBoostingRegressor) -> float:
+        """GradientBoosting 초기 예측값 (상수 init 추정기만 지원)"""
+        if model.init_ == "zero":
+            return 0.0
+        constant = getattr(model.init_, "constant_", None)
+        if constant is None:
+            raise ValueError(
+                "Only constant init estimators can be compiled "
+                f"(got {type(model.init_).__name__})"
+            )
+        return float(np.ravel(constant)[0])
+
+    def _leaf_indices(self, X: np.ndarray) -> np.ndarray:
+        """배치 × 트리 리프 노드 인덱스 계산 (레벨 단위 벡터화 탐색)"""
+        n_samples = X.shape[0]
+        flat_X = X.ravel()
+        row_offset = (np.arange(n_samples, dtype=np.int64) * self.n_features)[:, None]
+
+        has_missing = bool(np.isnan(flat_X).any())
+
+        nodes = np.broadcast_to(self.roots, (n_samples, self.n_trees)).copy()
+        for _ in range(self.max_depth):
+            x = flat_X[row_offset + self.feature[nodes]]
+            go_right = x > self.threshold[nodes]
+            if has_missing:
+                go_right |= np.isnan(x) & self.missing_right[nodes]
+            nodes = self._children[2 * nodes + go_right]
+        return nodes
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        예측 수행
+
+        Args:
+            X: 입력 특성 (n_samples, n_features) 또는 단일 샘플 (n_features,)
+
+        Returns:
+            예측값 배열
+        """
+        # sklearn 트리와 동일하게 float32로 비교 (임계값 경계 일치)
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        if X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected {self.n_features} features, got {X.shape[1]}"
+            )
+
+        X = np.ascontiguousarray(X)
+        predictions = np.empty(X.shape[0], dtype=np.float64)
+        for start in range(0, X.shape[0], self.batch_size):
+            stop = start + self.batch_size
+            leaves = self._leaf_indices(X[start:stop])
+            predictions[start:stop] = self.value[leaves].sum(axis=1)
+
+        return self.bias + self.scale * predictions
+
+    def to_dict(self) -> Dict:
+        """메타데이터 딕셔너리"""
+        return {
+            "n_trees": self.n_trees,
+            "n_nodes": self.n_nodes,
+            "max_depth": self.max_depth,
+            "n_features": self.n_features,
+            "size_bytes": int(sum(
+                a.nbytes for a in (
+                    self.feature, self.threshold, self.left,
+                    self.right, self.value, self.roots
+                )
+            ))
+        }
+
+    def save(self, filepath: str) -> None:
+        """컴파일된 배열 저장 (.npz)"""
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        np.savez(
+            filepath,
+            feature=self.feature,
+            threshold=self.threshold,
+            left=self.left,
+            right=self.right,
+            value=self.value,
+            roots=self.roots,
+            missing_right=self.missing_right,
+            meta=np.array(
+                [self.max_depth, self.n_features, self.scale, self.bias],
+                dtype=np.float64
+            )
+        )
+        logger.info(f"Compiled model saved to {filepath}")
+
+    @classmethod
+    def load(cls, filepath: str, batch_size: int = 8192) -> "CompiledForest":
+        """
+        컴파일된 배열 로드
+
+        Args:
+            filepath: .npz 파일 경로
+            batch_size: 한 번에 탐색할 최대 행 수
+
+        Returns:
+            컴파일된 예측기
+        """
+        with np.load(filepath) as data:
+            max_depth, n_features, scale, bias = data["meta"]
+            compiled = cls(
+                feature=data["feature"],
+                threshold=data["threshold"],
+                left=data["left"],
+                right=data["right"],
+                value=data["value"],
+                roots=data["roots"],
+                max_depth=int(max_depth),
+                n_features=int(n_features),
+                missing_right=data["missing_right"],
+                scale=scale,
+                bias=bias,
+                batch_size=batch_size
+            )
+        logger.info(f"Compiled model loaded from {filepath}")
+        return compiled
+
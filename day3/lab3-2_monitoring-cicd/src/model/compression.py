@@ -0,0 +1,333 @@
+"""
+Model Compression Module
+
+서빙용 트리 앙상블 경량화
+- 트리 가지치기 (OOB 오차가 낮은 트리만 유지 / GBM 앞쪽 스테이지만 유지)
+- 최대 깊이 제한 재학습
+- 지식 증류 (원본 모델 예측값으로 작은 GBM 학습)
+
+원본 대비 MAE 증가가 허용 범위 이내인 후보 중 가장 빠른 모델을 선택합니다.
+"""
+
+import copy
+import json
+import os
+import pickle
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    RandomForestRegressor
+)
+
+from .metrics import compute_regression_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompressionCandidate:
+    """압축 후보 모델"""
+    name: str
+    model: object = field(repr=False)
+    mae: float
+    r2: float
+    size_kb: float
+    latency_ms: float
+    n_trees: int
+    accepted: bool = False
+    test_mae: Optional[float] = None
+    test_r2: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        result = {
+            "name": self.name,
+            "mae": round(self.mae, 4),
+            "r2": round(self.r2, 4),
+            "size_kb": round(self.size_kb, 2),
+            "latency_ms": round(self.latency_ms, 4),
+            "n_trees": self.n_trees,
+            "accepted": self.accepted
+        }
+        if self.test_mae is not None:
+            result["test_mae"] = round(self.test_mae, 4)
+            result["test_r2"] = round(self.test_r2, 4)
+        return result
+
+
+@dataclass
+class CompressionReport:
+    """압축 결과 리포트"""
+    baseline: CompressionCandidate
+    candidates: List[CompressionCandidate]
+    mae_tolerance: float
+    selected: Optional[CompressionCandidate] = None
+
+    @property
+    def mae_budget(self) -> float:
+        """허용되는 최대 MAE"""
+        return self.baseline.mae * (1 + self.mae_tolerance)
+
+    def to_dict(self) -> Dict:
+        return {
+            "mae_tolerance": self.mae_tolerance,
+            "mae_budget": round(self.mae_budget, 4),
+            "baseline": self.baseline.to_dict(),
+            "candidates": [c.to_dict() for c in self.candidates],
+            "selected": self.selected.name if self.selected else None
+        }
+
+    def summary(self) -> str:
+        """크기 / 지연 시간 / 정확도 트레이드오프 표 (MAE/R²는 검증, test MAE는 테스트 세트)"""
+        has_test = self.baseline.test_mae is not None
+        test_header = f" {'test MAE':>9}" if has_test else ""
+        lines = [
+            f"{'candidate':<22} {'trees':>5} {'size(KB)':>10} "
+            f"{'latency(ms)':>12} {'MAE':>8} {'R²':>7}{test_header}  accepted",
+            "-" * (88 if has_test else 78)
+        ]
+        for c in [self.baseline] + self.candidates:
+            mark = "★" if c is self.selected else ("✓" if c.accepted else "")
+            test_value = f" {c.test_mae:>9.4f}" if has_test else ""
+            lines.append(
+                f"{c.name:<22} {c.n_trees:>5} {c.size_kb:>10.1f} "
+                f"{c.latency_ms:>12.3f} {c.mae:>8.4f} {c.r2:>7.4f}{test_value}  {mark}"
+            )
+        lines.append(f"MAE budget: {self.mae_budget:.4f} "
+                     f"(baseline {self.baseline.mae:.4f} + {self.mae_tolerance:.0%})")
+        return "\n".join(lines)
+
+
+class ModelCompressor:
+    """트리 앙상블 압축기"""
+
+    def __init__(
+        self,
+        mae_tolerance: float = 0.02,
+        tree_counts: Sequence[int] = (10, 25, 50),
+        max_depths: Sequence[int] = (6, 8),
+        distill: bool = True,
+        distill_params: Optional[Dict] = None,
+        latency_iterations: int = 50
+    ):
+        """
+        압축기 초기화
+
+        Args:
+            mae_tolerance: 원본 대비 허용 MAE 상대 증가율 (0.02 = 2%)
+            tree_counts: 가지치기 후 유지할 트리 개수 후보
+            max_depths: 깊이 제한 재학습 후보 (RandomForest만 해당)
+            distill: 지식 증류 후보 생성 여부
+            distill_params: 증류 학생 모델(GBM) 하이퍼파라미터 (None이면 기본값)
+            latency_iterations: 단일 행 지연 시간 측정 반복 횟수
+        """
+        self.mae_tolerance = mae_tolerance
+        self.tree_counts = tuple(tree_counts)
+        self.max_depths = tuple(max_depths)
+        self.distill = distill
+        self.distill_params = distill_params or {
+            "n_estimators": 60,
+            "max_depth": 4,
+            "learning_rate": 0.15,
+            "random_state": 42
+        }
+        self.latency_iterations = latency_iterations
+
+    def compress(
+        self,
+        estimator,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray,
+        X_test: Optional[np.ndarray] = None,
+        y_test: Optional[np.ndarray] = None
+    ) -> CompressionReport:
+        """
+        압축 후보 생성 및 선택
+
+        RandomForest 트리 순위는 학습 데이터의 OOB 샘플로 매기고, 검증 데이터는
+        후보 수용 여부 판단에만 사용합니다. 테스트 데이터는 선택이 끝난 뒤
+        최종 정확도(test_mae / test_r2) 보고에만 사용합니다.
+
+        Args:
+            estimator: 학습된 RandomForestRegressor 또는 GradientBoostingRegressor
+            X_train: 학습 데이터 (트리 순위 OOB / 깊이 제한 재학습 / 증류에 사용)
+            y_train: 학습 타겟
+            X_val: 검증 데이터 (수용 여부 판단, 테스트 세트와 분리)
+            y_val: 검증 타겟
+            X_test: 테스트 데이터 (선택, 최종 MAE 보고용)
+            y_test: 테스트 타겟
+
+        Returns:
+            압축 리포트 (selected가 None이면 허용 범위 내 후보 없음)
+        """
+        if not isinstance(estimator, (RandomForestRegressor, GradientBoostingRegressor)):
+            raise TypeError(
+                f"Unsupported model for compression: {type(estimator).__name__}"
+            )
+
+        X_train = np.asarray(X_train)
+        y_train = np.asarray(y_train)
+        X_val = np.asarray(X_val)
+        baseline = self._evaluate("original", estimator, X_val, y_val)
+
+        candidates = []
+        for n_trees in self.tree_counts:
+            if n_trees < baseline.n_trees:
+                pruned = self._prune(estimator, n_trees, X_train, y_train)
+                candidates.append(
+                    self._evaluate(f"pruned_{n_trees}", pruned, X_val, y_val)
+                )
+
+        if isinstance(estimator, RandomForestRegressor):
+            for max_depth in self.max_depths:
+                current = estimator.max_depth
+                if current is None or max_depth < current:
+                    shallow = self._limit_depth(estimator, max_depth, X_train, y_train)
+                    candidates.append(
+                        self._evaluate(f"depth_{max_depth}", shallow, X_val, y_val)
+                    )
+
+        if self.distill:
+            student = self._distill(estimator, X_train)
+            candidates.append(self._evaluate("distilled_gbm", student, X_val, y_val))
+
+        report = CompressionReport(
+            baseline=baseline,
+            candidates=candidates,
+            mae_tolerance=self.mae_tolerance
+        )
+        for c in candidates:
+            c.accepted = c.mae <= report.mae_budget
+
+        if X_test is not None and y_test is not None:
+            X_test = np.asarray(X_test)
+            for c in [baseline] + candidates:
+                test_metrics = compute_regression_metrics(y_test, c.model.predict(X_test))
+                c.test_mae = test_metrics["mae"]
+                c.test_r2 = test_metrics["r2"]
+
+        accepted = [c for c in candidates if c.accepted]
+        if accepted:
+            report.selected = min(accepted, key=lambda c: (c.latency_ms, c.size_kb))
+            logger.info(
+                f"Compression selected {report.selected.name}: "
+                f"MAE {baseline.mae:.4f} -> {report.selected.mae:.4f}, "
+                f"latency {baseline.latency_ms:.3f}ms -> "
+                f"{report.selected.latency_ms:.3f}ms"
+            )
+        else:
+            logger.info("No compressed candidate within MAE tolerance")
+
+        return report
+
+    def _prune(self, estimator, n_trees: int, X_train: np.ndarray, y_train: np.ndarray):
+        """
+        트리 가지치기 (RF: OOB MAE가 낮은 트리 선택, GBM: 앞쪽 스테이지 유지)
+
+        RF 트리 순위를 검증 데이터로 매기면 같은 데이터로 수용 여부를 판단할 때
+        압축 후보의 MAE가 낙관적으로 측정되므로, 각 트리가 학습에 쓰지 않은
+        학습 샘플(OOB)로 순위를 매깁니다. OOB를 복원할 수 없으면 앞쪽 트리를 유지합니다.
+        """
+        pruned = copy.copy(estimator)
+
+        if isinstance(estimator, RandomForestRegressor):
+            tree_mae = self._oob_tree_mae(estimator, X_train, y_train)
+            if tree_mae is None:
+                logger.info("OOB samples unavailable, keeping the first trees")
+                keep = np.arange(n_trees)
+            else:
+                keep = np.sort(np.argsort(tree_mae)[:n_trees])
+            pruned.estimators_ = [estimator.estimators_[i] for i in keep]
+        else:
+            pruned.estimators_ = estimator.estimators_[:n_trees]
+            pruned.n_estimators_ = n_trees
+            pruned.train_score_ = estimator.train_score_[:n_trees]
+
+        pruned.n_estimators = n_trees
+        return pruned
+
+    @staticmethod
+    def _oob_tree_mae(estimator, X_train: np.ndarray, y_train: np.ndarray) -> Optional[np.ndarray]:
+        """
+        RandomForest 트리별 OOB MAE
+
+        각 트리의 부트스트랩 샘플을 트리 random_state로 다시 뽑아 복원하고,
+        트리 루트 노드의 샘플 수와 맞지 않으면(bootstrap=False, X_train이 학습
+        데이터가 아님, sample_weight 사용 등) None을 반환합니다.
+        """
+        if not estimator.bootstrap:
+            return None
+
+        n_samples = len(X_train)
+        n_bootstrap = getattr(estimator, "_n_samples_bootstrap", n_samples)
+        errors = []
+        for tree in estimator.estimators_:
+            sampled = np.random.RandomState(tree.random_state).randint(0, n_samples, n_bootstrap)
+            counts = np.bincount(sampled, minlength=n_samples)
+            root = tree.tree_
+            if (root.n_node_samples[0] != np.count_nonzero(counts)
+                    or root.weighted_n_node_samples[0] != n_bootstrap):
+                return None
+            oob = counts == 0
+            if not oob.any():
+                return None
+            errors.append(np.abs(tree.predict(X_train[oob]) - y_train[oob]).mean())
+        return np.array(errors)
+
+    def _limit_depth(self, estimator, max_depth: int, X_train: np.ndarray, y_train: np.ndarray):
+        """최대 깊이를 제한하여 재학습"""
+        params = estimator.get_params()
+        params["max_depth"] = max_depth
+        shallow = type(estimator)(**params)
+        shallow.fit(X_train, y_train)
+        return shallow
+
+    def _distill(self, estimator, X_train: np.ndarray):
+        """원본 모델 예측값(soft target)으로 작은 GBM 학습"""
+        teacher_targets = estimator.predict(X_train)
+        student = GradientBoostingRegressor(**self.distill_params)
+        student.fit(X_train, teacher_targets)
+        return student
+
+    def _evaluate(self, name: str, estimator, X_val: np.ndarray, y_val: np.ndarray) -> CompressionCandidate:
+        """후보 모델의 정확도 / 크기 / 단일 행 지연 시간 측정"""
+        metrics = compute_regression_metrics(y_val, estimator.predict(X_val))
+
+        row = X_val[:1]
+        estimator.predict(row)
+        timings = np.empty(self.latency_iterations)
+        for i in range(self.latency_iterations):
+            start = time.perf_counter()
+            estimator.predict(row)
+            timings[i] = (time.perf_counter() - start) * 1000
+
+        return CompressionCandidate(
+            name=name,
+            model=estimator,
+            mae=metrics["mae"],
+            r2=metrics["r2"],
+            size_kb=len(pickle.dumps(estimator)) / 1024,
+            latency_ms=float(np.median(timings)),
+            n_trees=len(estimator.estimators_)
+        )
+
+
+def compressed_path(filepath: str) -> str:
+    """원본 모델 경로 옆의 압축 모델 경로 (model.joblib -> model_compressed.joblib)"""
+    root, ext = os.path.splitext(filepath)
+    return f"{root}_compressed{ext or '.joblib'}"
+
+
+def save_compression_report(report: CompressionReport, filepath: str) -> str:
+    """압축 리포트를 원본 모델 옆에 JSON으로 저장"""
+    root, _ = os.path.splitext(filepath)
+    report_path = f"{root}_compression.json"
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+    return report_path
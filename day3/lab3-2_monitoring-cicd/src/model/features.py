@@ -0,0 +1,194 @@
+"""
+Feature Pipeline Module
+
+전처리(표준화)와 파생 피처 생성을 하나의 변환 그래프로 기록하고
+NumPy 배열 연산 한 번으로 실행
+
+- 파생 피처(비율, 곱, 선형 결합, 기준점까지 거리)는 원본(스케일 전) 값으로 계산
+- 학습 시 원본 + 파생 피처 전체의 평균/표준편차를 기록 (StandardScaler와 동일)
+- to_dict() / from_dict()로 모델과 함께 직렬화하여 서빙에서 동일한 변환 재현
+- pandas 없이 동작 (요청 처리 경로에서 DataFrame 생성 없음)
+"""
+
+import copy
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# 기본 파생 피처 그래프 (Day 3 프로젝트 피처 엔지니어링과 동일한 정의)
+DEFAULT_DERIVED_FEATURES = (
+    {"name": "bedroom_ratio", "op": "ratio", "inputs": ["AveBedrms", "AveRooms"]},
+    {"name": "people_per_household", "op": "ratio", "inputs": ["Population", "AveOccup"]},
+    {"name": "dist_to_bay", "op": "distance", "inputs": ["Latitude", "Longitude"],
+     "origin": [37.77, -122.42]},
+    {"name": "dist_to_la", "op": "distance", "inputs": ["Latitude", "Longitude"],
+     "origin": [34.05, -118.24]},
+)
+
+SUPPORTED_OPS = ("ratio", "product", "linear", "distance")
+
+
+class FeaturePipeline:
+    """표준화 + 파생 피처 변환 그래프"""
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        derived_features: Optional[Sequence[Dict]] = None,
+        standardize: bool = True,
+        eps: float = 1e-6
+    ):
+        """
+        피처 파이프라인 초기화
+
+        Args:
+            feature_names: 입력 특성 이름 (입력 배열의 열 순서)
+            derived_features: 파생 피처 정의 리스트
+                ({"name", "op": ratio|product|linear|distance, "inputs",
+                "weights"(linear), "origin"(distance)})
+                None이면 DEFAULT_DERIVED_FEATURES 사용
+            standardize: 평균/표준편차 표준화 적용 여부
+            eps: 비율 피처의 0 나누기 방지 상수
+        """
+        self.feature_names = list(feature_names)
+        self.derived_features = copy.deepcopy(
+            list(DEFAULT_DERIVED_FEATURES if derived_features is None else derived_features)
+        )
+        self.standardize = standardize
+        self.eps = eps
+        self.mean_: Optional[np.ndarray] = None
+        self.scale_: Optional[np.ndarray] = None
+        self._ops = self._resolve(self.derived_features)
+
+    def _resolve(self, derived_features: List[Dict]) -> List[tuple]:
+        """파생 피처 정의를 (연산, 출력 열, 입력 열 인덱스, 기준점 또는 가중치) 튜플로 변환"""
+        index = {name: i for i, name in enumerate(self.feature_names)}
+        ops = []
+        for offset, spec in enumerate(derived_features):
+            op = spec["op"]
+            if op not in SUPPORTED_OPS:
+                raise ValueError(
+                    f"Unsupported feature op: {op}. Supported: {list(SUPPORTED_OPS)}"
+                )
+            missing = [name for name in spec["inputs"] if name not in index]
+            if missing:
+                raise ValueError(f"Unknown input features for {spec['name']}: {missing}")
+
+            a, b = (index[name] for name in spec["inputs"])
+            if op == "linear":
+                params = tuple(spec.get("weights", (1.0, 1.0)))
+            else:
+                params = tuple(spec.get("origin", (0.0, 0.0)))
+            ops.append((op, len(self.feature_names) + offset, a, b, params))
+        return ops
+
+    @property
+    def output_names(self) -> List[str]:
+        """변환 결과 열 이름 (원본 + 파생)"""
+        return self.feature_names + [spec["name"] for spec in self.derived_features]
+
+    @property
+    def is_fitted(self) -> bool:
+        """표준화 통계 기록 여부"""
+        return not self.standardize or self.mean_ is not None
+
+    def _derive(self, X: np.ndarray) -> np.ndarray:
+        """원본 열 복사 + 파생 열을 미리 할당한 출력 배열에 직접 계산"""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        n_inputs = len(self.feature_names)
+        if X.shape[1] != n_inputs:
+            raise ValueError(f"Expected {n_inputs} features, got {X.shape[1]}")
+
+        out = np.empty((X.shape[0], len(self.output_names)), dtype=np.float64)
+        out[:, :n_inputs] = X
+
+        for op, k, a, b, params in self._ops:
+            target = out[:, k]
+            if op == "ratio":
+                np.divide(X[:, a], X[:, b] + self.eps, out=target)
+            elif op == "product":
+                np.multiply(X[:, a], X[:, b], out=target)
+            elif op == "linear":
+                np.multiply(X[:, a], params[0], out=target)
+                target += params[1] * X[:, b]
+            else:
+                np.hypot(X[:, a] - params[0], X[:, b] - params[1], out=target)
+        return out
+
+    def fit(self, X: np.ndarray) -> "FeaturePipeline":
+        """
+        표준화 통계 학습
+
+        Args:
+            X: 원본 입력 특성 (n_samples, n_features)
+
+        Returns:
+            self
+        """
+        if self.standardize:
+            out = self._derive(X)
+            self.mean_ = out.mean(axis=0)
+            scale = out.std(axis=0)
+            # StandardScaler와 동일: 분산이 0인 열은 스케일 1
+            scale[scale == 0] = 1.0
+            self.scale_ = scale
+        logger.info(
+            f"Feature pipeline fitted: {len(self.feature_names)} inputs -> "
+            f"{len(self.output_names)} outputs"
+        )
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        변환 그래프 실행 (파생 피처 + 표준화)
+
+        Args:
+            X: 원본 입력 특성 (n_samples, n_features) 또는 단일 샘플
+
+        Returns:
+            변환된 배열 (n_samples, len(output_names))
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Feature pipeline is not fitted. Call fit() first.")
+
+        out = self._derive(X)
+        if self.standardize:
+            out -= self.mean_
+            out /= self.scale_
+        return out
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """학습 후 변환"""
+        return self.fit(X).transform(X)
+
+    def to_dict(self) -> Dict:
+        """직렬화 가능한 변환 그래프"""
+        return {
+            "feature_names": self.feature_names,
+            "derived_features": self.derived_features,
+            "standardize": self.standardize,
+            "eps": self.eps,
+            "mean": None if self.mean_ is None else self.mean_.tolist(),
+            "scale": None if self.scale_ is None else self.scale_.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FeaturePipeline":
+        """to_dict() 결과로부터 복원"""
+        pipeline = cls(
+            feature_names=data["feature_names"],
+            derived_features=data["derived_features"],
+            standardize=data.get("standardize", True),
+            eps=data.get("eps", 1e-6)
+        )
+        if data.get("mean") is not None:
+            pipeline.mean_ = np.asarray(data["mean"], dtype=np.float64)
+            pipeline.scale_ = np.asarray(data["scale"], dtype=np.float64)
+        return pipeline
@@ -0,0 +1,269 @@
+"""
+Evaluation Metrics Module
+
+단일 패스(single-pass) 회귀 평가 메트릭 계산
+- MAE, MSE, RMSE, R²를 하나의 잔차 배열에서 한 번에 계산
+- 분위수 오차, 세그먼트별 메트릭
+- 가중치 및 청크 단위 누적 (대용량 데이터/스트리밍 평가)
+"""
+
+from typing import Dict, Hashable, Optional, Sequence
+
+import numpy as np
+
+
+def _prepare_arrays(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sample_weight: Optional[np.ndarray] = None
+):
+    """입력 배열을 1차원 float64 배열로 변환 및 검증"""
+    y_true = np.asarray(y_true, dtype=np.float64).ravel()
+    y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+
+    if y_true.shape != y_pred.shape:
+        raise ValueError(
+            f"Shape mismatch: y_true={y_true.shape}, y_pred={y_pred.shape}"
+        )
+
+    if sample_weight is not None:
+        sample_weight = np.asarray(sample_weight, dtype=np.float64).ravel()
+        if sample_weight.shape != y_true.shape:
+            raise ValueError(
+                f"Shape mismatch: sample_weight={sample_weight.shape}, "
+                f"y_true={y_true.shape}"
+            )
+
+    return y_true, y_pred, sample_weight
+
+
+def _r2_from_sums(ss_res: float, ss_tot: float) -> float:
+    """잔차 제곱합과 전체 제곱합으로 R² 계산 (sklearn과 동일한 상수 타겟 처리)"""
+    if ss_tot == 0:
+        return 1.0 if ss_res == 0 else 0.0
+    return 1.0 - ss_res / ss_tot
+
+
+def compute_regression_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sample_weight: Optional[np.ndarray] = None,
+    quantiles: Optional[Sequence[float]] = None
+) -> Dict[str, float]:
+    """
+    회귀 메트릭 단일 패스 계산
+
+    잔차(residual)를 한 번만 계산하고 MAE, MSE, RMSE, R²를 모두 도출합니다.
+    sklearn의 mean_absolute_error / mean_squared_error / r2_score를
+    각각 호출하는 것과 동일한 값을 반환합니다.
+
+    Args:
+        y_true: 실제값
+        y_pred: 예측값
+        sample_weight: 샘플 가중치 (선택)
+        quantiles: 절대 오차 분위수 리스트 (예: [0.5, 0.9, 0.99])
+
+    Returns:
+        메트릭 딕셔너리 (mae, mse, rmse, r2, 선택 시 ae_p50 등)
+    """
+    y_true, y_pred, sample_weight = _prepare_arrays(y_true, y_pred, sample_weight)
+
+    if y_true.size == 0:
+        raise ValueError("Cannot compute metrics on empty arrays")
+
+    residual = y_true - y_pred
+    abs_err = np.abs(residual)
+
+    if sample_weight is None:
+        mae = float(abs_err.mean())
+        ss_res = float(np.dot(residual, residual))
+        mse = ss_res / residual.size
+        centered = y_true - y_true.mean()
+        ss_tot = float(np.dot(centered, centered))
+    else:
+        weight_sum = float(sample_weight.sum())
+        if weight_sum <= 0:
+            raise ValueError("Sum of sample_weight must be positive")
+        mae = float(np.dot(sample_weight, abs_err) / weight_sum)
+        ss_res = float(np.dot(sample_weight, residual * residual))
+        mse = ss_res / weight_sum
+        centered = y_true - np.dot(sample_weight, y_true) / weight_sum
+        ss_tot = float(np.dot(sample_weight, centered * centered))
+
+    metrics = {
+        "mae": mae,
+        "mse": mse,
+        "rmse": float(np.sqrt(mse)),
+        "r2": _r2_from_sums(ss_res, ss_tot)
+    }
+
+    if quantiles:
+        values = np.quantile(abs_err, quantiles)
+        for q, value in zip(quantiles, np.atleast_1d(values)):
+            metrics[f"ae_p{q * 100:g}"] = float(value)
+
+    return metrics
+
+
+def compute_segment_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    segments: Sequence[Hashable],
+    sample_weight: Optional[np.ndarray] = None
+) -> Dict[Hashable, Dict[str, float]]:
+    """
+    세그먼트별 회귀 메트릭 계산
+
+    세그먼트 레이블을 정수 코드로 변환한 뒤 np.bincount로
+    모든 세그먼트의 합계를 한 번에 집계합니다 (세그먼트별 반복 없음).
+
+    Args:
+        y_true: 실제값
+        y_pred: 예측값
+        segments: 샘플별 세그먼트 레이블 (예: 지역, 가격대)
+        sample_weight: 샘플 가중치 (선택)
+
+    Returns:
+        {세그먼트: {count, mae, mse, rmse, r2}} 딕셔너리
+    """
+    y_true, y_pred, sample_weight = _prepare_arrays(y_true, y_pred, sample_weight)
+    segments = np.asarray(segments).ravel()
+
+    if segments.shape != y_true.shape:
+        raise ValueError(
+            f"Shape mismatch: segments={segments.shape}, y_true={y_true.shape}"
+        )
+
+    labels, codes = np.unique(segments, return_inverse=True)
+    n_segments = len(labels)
+    w = np.ones_like(y_true) if sample_weight is None else sample_weight
+
+    residual = y_true - y_pred
+    counts = np.bincount(codes, minlength=n_segments)
+    w_sum = np.bincount(codes, weights=w, minlength=n_segments)
+    abs_sum = np.bincount(codes, weights=w * np.abs(residual), minlength=n_segments)
+    sq_sum = np.bincount(codes, weights=w * residual * residual, minlength=n_segments)
+    y_sum = np.bincount(codes, weights=w * y_true, minlength=n_segments)
+    y_sq_sum = np.bincount(codes, weights=w * y_true * y_true, minlength=n_segments)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mae = abs_sum / w_sum
+        mse = sq_sum / w_sum
+        ss_tot = np.maximum(y_sq_sum - y_sum * y_sum / w_sum, 0.0)
+
+    results = {}
+    for i, label in enumerate(labels.tolist()):
+        results[label] = {
+            "count": int(counts[i]),
+            "mae": float(mae[i]),
+            "mse": float(mse[i]),
+            "rmse": float(np.sqrt(mse[i])),
+            "r2": _r2_from_sums(float(sq_sum[i]), float(ss_tot[i]))
+        }
+    return results
+
+
+class RegressionMetricsAccumulator:
+    """
+    청크 단위 회귀 메트릭 누적기
+
+    전체 예측 배열을 메모리에 올리지 않고 청크별로 update()를 호출해
+    MAE, MSE, RMSE, R²를 계산합니다. 타겟 분산은 Chan의 병렬 알고리즘으로
+    병합하므로 청크 크기와 무관하게 수치적으로 안정적입니다.
+    merge()로 워커별 부분 결과를 합칠 수 있습니다.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.weight_sum = 0.0
+        self.abs_err_sum = 0.0
+        self.sq_err_sum = 0.0
+        self.y_mean = 0.0
+        self.y_m2 = 0.0
+
+    def update(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None
+    ) -> "RegressionMetricsAccumulator":
+        """
+        청크 누적
+
+        Args:
+            y_true: 청크 실제값
+            y_pred: 청크 예측값
+            sample_weight: 청크 샘플 가중치 (선택)
+
+        Returns:
+            self (체이닝 가능)
+        """
+        y_true, y_pred, sample_weight = _prepare_arrays(y_true, y_pred, sample_weight)
+        if y_true.size == 0:
+            return self
+
+        residual = y_true - y_pred
+        if sample_weight is None:
+            w_sum = float(y_true.size)
+            abs_sum = float(np.abs(residual).sum())
+            sq_sum = float(np.dot(residual, residual))
+            mean = float(y_true.mean())
+            centered = y_true - mean
+            m2 = float(np.dot(centered, centered))
+        else:
+            w_sum = float(sample_weight.sum())
+            if w_sum <= 0:
+                return self
+            abs_sum = float(np.dot(sample_weight, np.abs(residual)))
+            sq_sum = float(np.dot(sample_weight, residual * residual))
+            mean = float(np.dot(sample_weight, y_true) / w_sum)
+            centered = y_true - mean
+            m2 = float(np.dot(sample_weight, centered * centered))
+
+        self._combine(y_true.size, w_sum, abs_sum, sq_sum, mean, m2)
+        return self
+
+    def merge(
+        self,
+        other: "RegressionMetricsAccumulator"
+    ) -> "RegressionMetricsAccumulator":
+        """다른 누적기의 부분 결과 병합"""
+        if other.weight_sum > 0:
+            self._combine(
+                other.count, other.weight_sum, other.abs_err_sum,
+                other.sq_err_sum, other.y_mean, other.y_m2
+            )
+        return self
+
+    def _combine(
+        self,
+        count: int,
+        w_sum: float,
+        abs_sum: float,
+        sq_sum: float,
+        mean: float,
+        m2: float
+    ) -> None:
+        """부분 통계 병합 (Chan et al. 병렬 분산 공식)"""
+        total = self.weight_sum + w_sum
+        delta = mean - self.y_mean
+
+        self.y_m2 += m2 + delta * delta * self.weight_sum * w_sum / total
+        self.y_mean += delta * w_sum / total
+        self.weight_sum = total
+        self.count += count
+        self.abs_err_sum += abs_sum
+        self.sq_err_sum += sq_sum
+
+    def result(self) -> Dict[str, float]:
+        """누적 메트릭 반환"""
+        if self.weight_sum <= 0:
+            raise ValueError("No samples accumulated")
+
+        mse = self.sq_err_sum / self.weight_sum
+        return {
+            "mae": self.abs_err_sum / self.weight_sum,
+            "mse": mse,
+            "rmse": float(np.sqrt(mse)),
+            "r2": _r2_from_sums(self.sq_err_sum, self.y_m2)
+        }
@@ -0,0 +1,356 @@
+"""
+ONNX Export Module
+
+sklearn 회귀 모델(SUPPORTED_MODELS) → ONNX 변환 및 검증
+- skl2onnx 변환 (float32 / float64 입력, opset 지정)
+- ONNX Runtime 그래프 최적화 수준 선택 및 최적화된 그래프 오프라인 저장
+  (서빙 시 세션 생성 때마다 최적화를 반복하지 않도록)
+- sklearn 예측과 수치 일치 검사
+- 변환 메타데이터(opset, 입력 dtype, 피처 이름 등)를 모델 옆 JSON과
+  ONNX metadata_props에 함께 기록
+
+onnx / onnxruntime / skl2onnx는 선택 의존성으로, 변환 함수 호출 시에만 import합니다.
+"""
+
+import os
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 이름 → onnxruntime.GraphOptimizationLevel 속성
+ORT_OPTIMIZATION_LEVELS = {
+    "disable": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+
+ONNX_DTYPES = ("float32", "float64")
+
+DEFAULT_OPSET = 15
+
+
+@dataclass
+class ParityReport:
+    """ONNX vs sklearn 예측 비교 결과"""
+    num_samples: int
+    max_abs_diff: float
+    mean_abs_diff: float
+    mismatch_rate: float
+    atol: float
+    rtol: float
+
+    @property
+    def passed(self) -> bool:
+        return self.mismatch_rate == 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "num_samples": self.num_samples,
+            "max_abs_diff": float(self.max_abs_diff),
+            "mean_abs_diff": float(self.mean_abs_diff),
+            "mismatch_rate": round(float(self.mismatch_rate), 6),
+            "atol": self.atol,
+            "rtol": self.rtol,
+            "passed": self.passed
+        }
+
+
+@dataclass
+class OnnxExportResult:
+    """ONNX 변환 결과"""
+    path: str
+    metadata_path: str
+    metadata: Dict
+    optimized_path: Optional[str] = None
+    parity: Optional[ParityReport] = None
+    size_bytes: int = field(default=0)
+
+    def to_dict(self) -> Dict:
+        return {
+            "path": self.path,
+            "optimized_path": self.optimized_path,
+            "metadata_path": self.metadata_path,
+            "size_bytes": self.size_bytes,
+            "metadata": self.metadata,
+            "parity": self.parity.to_dict() if self.parity else None
+        }
+
+
+def onnx_metadata_path(onnx_path: str) -> str:
+    """ONNX 모델 옆의 메타데이터 경로 (model.onnx -> model_onnx.json)"""
+    root, _ = os.path.splitext(onnx_path)
+    return f"{root}_onnx.json"
+
+
+def optimized_onnx_path(onnx_path: str) -> str:
+    """최적화된 그래프 경로 (model.onnx -> model.opt.onnx)"""
+    root, ext = os.path.splitext(onnx_path)
+    return f"{root}.opt{ext or '.onnx'}"
+
+
+def graph_optimization_level(name: str):
+    """이름 → onnxruntime.GraphOptimizationLevel"""
+    if name not in ORT_OPTIMIZATION_LEVELS:
+        raise ValueError(
+            f"Unsupported optimization level: {name}. "
+            f"Supported: {list(ORT_OPTIMIZATION_LEVELS)}"
+        )
+    import onnxruntime as ort
+    return getattr(ort.GraphOptimizationLevel, ORT_OPTIMIZATION_LEVELS[name])
+
+
+def convert_estimator(
+    estimator,
+    n_features: int,
+    dtype: str = "float32",
+    opset: int = DEFAULT_OPSET,
+    input_name: str = "features"
+):
+    """
+    sklearn 회귀 모델 → onnx.ModelProto
+
+    float64 입력은 선형 모델만 지원합니다. skl2onnx의 트리 앙상블 변환기는
+    ai.onnx.ml opset 1 (float 전용) TreeEnsembleRegressor를 만들기 때문입니다.
+
+    Args:
+        estimator: 학습된 sklearn 회귀 모델
+        n_features: 입력 특성 수
+        dtype: 입력 dtype ("float32" 또는 "float64")
+        opset: 기본 도메인 opset
+        input_name: 그래프 입력 이름
+
+    Returns:
+        ONNX 모델
+    """
+    if dtype not in ONNX_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}. Supported: {list(ONNX_DTYPES)}")
+    if dtype == "float64" and hasattr(estimator, "estimators_"):
+        raise ValueError(
+            f"float64 input is not supported for {type(estimator).__name__}; use float32"
+        )
+
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import DoubleTensorType, FloatTensorType
+
+    tensor_type = FloatTensorType if dtype == "float32" else DoubleTensorType
+    return convert_sklearn(
+        estimator,
+        initial_types=[(input_name, tensor_type([None, n_features]))],
+        target_opset={"": opset, "ai.onnx.ml": 3}
+    )
+
+
+def create_session(path: str, optimization_level: str = "extended",
+                   optimized_model_path: Optional[str] = None):
+    """
+    CPU InferenceSession 생성
+
+    Args:
+        path: ONNX 모델 경로
+        optimization_level: disable / basic / extended / all
+        optimized_model_path: 지정하면 최적화된 그래프를 이 경로에 저장
+
+    Returns:
+        onnxruntime.InferenceSession
+    """
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = graph_optimization_level(optimization_level)
+    if optimized_model_path:
+        options.optimized_model_filepath = optimized_model_path
+    return ort.InferenceSession(path, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def check_parity(
+    session,
+    X: np.ndarray,
+    reference: np.ndarray,
+    dtype: str = "float32",
+    atol: float = 1e-4,
+    rtol: float = 1e-4
+) -> ParityReport:
+    """
+    ONNX 세션 예측과 기준 예측 비교
+
+    float32 그래프는 분기 임계값도 float32로 반올림되므로, 임계값에 아주 가까운
+    샘플은 다른 리프로 갈 수 있습니다. 그런 샘플이 mismatch_rate에 드러납니다.
+
+    Args:
+        session: onnxruntime.InferenceSession
+        X: 입력 특성 (모델 입력 기준, feature_pipeline 적용 후)
+        reference: sklearn 예측
+        dtype: 세션 입력 dtype
+        atol: 허용 절대 오차
+        rtol: 허용 상대 오차
+
+    Returns:
+        비교 결과
+    """
+    input_name = session.get_inputs()[0].name
+    predictions = session.run(None, {input_name: np.asarray(X, dtype=dtype)})[0].ravel()
+    reference = np.asarray(reference, dtype=np.float64).ravel()
+
+    diff = np.abs(predictions.astype(np.float64) - reference)
+    mismatched = diff > atol + rtol * np.abs(reference)
+    return ParityReport(
+        num_samples=len(reference),
+        max_abs_diff=float(diff.max()) if len(diff) else 0.0,
+        mean_abs_diff=float(diff.mean()) if len(diff) else 0.0,
+        mismatch_rate=float(mismatched.mean()) if len(diff) else 0.0,
+        atol=atol,
+        rtol=rtol
+    )
+
+
+def _library_versions() -> Dict[str, str]:
+    import onnx
+    import onnxruntime
+    import skl2onnx
+    import sklearn
+    return {
+        "onnx": onnx.__version__,
+        "onnxruntime": onnxruntime.__version__,
+        "skl2onnx": skl2onnx.__version__,
+        "sklearn": sklearn.__version__
+    }
+
+
+def export_onnx(
+    estimator,
+    path: str,
+    feature_names: Sequence[str],
+    dtype: str = "float32",
+    opset: int = DEFAULT_OPSET,
+    optimization_level: str = "extended",
+    save_optimized: bool = True,
+    X_check: Optional[np.ndarray] = None,
+    atol: float = 1e-4,
+    rtol: float = 1e-4,
+    extra_metadata: Optional[Dict] = None
+) -> OnnxExportResult:
+    """
+    sklearn 회귀 모델을 ONNX로 저장하고 검증
+
+    Args:
+        estimator: 학습된 sklearn 회귀 모델
+        path: 저장 경로 (.onnx)
+        feature_names: 그래프 입력 열 이름 (순서대로)
+        dtype: 입력 dtype ("float32" 또는 "float64")
+        opset: 기본 도메인 opset
+        optimization_level: ORT 그래프 최적화 수준 (disable / basic / extended / all)
+        save_optimized: 최적화된 그래프를 model.opt.onnx로 함께 저장할지 여부.
+            "all"로 저장한 그래프는 하드웨어별 최적화가 들어가 만든 호스트에서만 사용
+        X_check: 수치 일치 검사용 입력 (None이면 검사 생략)
+        atol: 허용 절대 오차
+        rtol: 허용 상대 오차
+        extra_metadata: 메타데이터에 추가할 항목
+
+    Returns:
+        변환 결과
+    """
+    import onnx
+
+    feature_names = list(feature_names)
+    onnx_model = convert_estimator(estimator, len(feature_names), dtype=dtype, opset=opset)
+    onnx.checker.check_model(onnx_model)
+
+    graph_input = onnx_model.graph.input[0].name
+    metadata = {
+        "estimator": type(estimator).__name__,
+        "opset": {
+            (entry.domain or "ai.onnx"): entry.version for entry in onnx_model.opset_import
+        },
+        "input_name": graph_input,
+        "output_names": [output.name for output in onnx_model.graph.output],
+        "input_dtype": dtype,
+        "feature_names": feature_names,
+        "optimization_level": optimization_level,
+        "versions": _library_versions(),
+        **(extra_metadata or {})
+    }
+    onnx.helper.set_model_props(onnx_model, {
+        "feature_names": ",".join(feature_names),
+        "input_dtype": dtype,
+        "estimator": metadata["estimator"]
+    })
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    onnx.save_model(onnx_model, path)
+
+    optimized_path = optimized_onnx_path(path) if save_optimized else None
+    session = create_session(path, optimization_level, optimized_model_path=optimized_path)
+
+    parity = None
+    if X_check is not None:
+        parity = check_parity(
+            session, X_check, estimator.predict(X_check), dtype=dtype, atol=atol, rtol=rtol
+        )
+        metadata["parity"] = parity.to_dict()
+        if not parity.passed:
+            logger.warning(
+                f"ONNX parity check failed: {parity.mismatch_rate:.2%} of samples differ "
+                f"(max abs diff {parity.max_abs_diff:.3g})"
+            )
+
+    metadata_path = onnx_metadata_path(path)
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2, ensure_ascii=False)
+
+    logger.info(f"ONNX model saved to {path}")
+    return OnnxExportResult(
+        path=path,
+        metadata_path=metadata_path,
+        metadata=metadata,
+        optimized_path=optimized_path,
+        parity=parity,
+        size_bytes=os.path.getsize(path)
+    )
+
+
+def load_onnx_metadata(onnx_path: str) -> Dict:
+    """ONNX 모델 옆에 저장된 메타데이터 로드"""
+    with open(onnx_metadata_path(onnx_path), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def export_all_models(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    output_dir: str,
+    X_check: Optional[np.ndarray] = None,
+    model_types: Optional[List[str]] = None,
+    **export_kwargs
+) -> Dict[str, OnnxExportResult]:
+    """
+    SUPPORTED_MODELS 전체를 학습 후 ONNX로 변환
+
+    Args:
+        X_train: 학습 데이터 특성
+        y_train: 학습 데이터 타겟
+        output_dir: 저장 디렉터리 ({model_type}.onnx)
+        X_check: 수치 일치 검사용 입력
+        model_types: 변환할 모델 유형 (기본: 전체)
+        **export_kwargs: export_onnx() 추가 인자
+
+    Returns:
+        모델 유형별 변환 결과
+    """
+    from .trainer import CaliforniaHousingModel
+
+    results = {}
+    for model_type in model_types or list(CaliforniaHousingModel.SUPPORTED_MODELS):
+        model = CaliforniaHousingModel(model_type=model_type)
+        model.train(X_train, y_train)
+        results[model_type] = model.export_onnx(
+            os.path.join(output_dir, f"{model_type}.onnx"),
+            X_check=X_check,
+            **export_kwargs
+        )
+    return results
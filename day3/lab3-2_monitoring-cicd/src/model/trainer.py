@@ -14,7 +14,17 @@ from sklearn.datasets import fetch_california_housing
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from .compiled import CompiledForest
+from .compression import (
+    CompressionReport,
+    ModelCompressor,
+    compressed_path,
+    save_compression_report
+)
+from .features import FeaturePipeline
+from .metrics import compute_regression_metrics
+from .onnx_export import DEFAULT_OPSET, OnnxExportResult, export_onnx
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +46,8 @@ class CaliforniaHousingModel:
     def __init__(
         self,
         model_type: str = "random_forest",
-        model_params: Optional[Dict] = None
+        model_params: Optional[Dict] = None,
+        feature_pipeline: Optional[FeaturePipeline] = None
     ):
         """
         모델 초기화
@@ -44,6 +55,8 @@ class CaliforniaHousingModel:
         Args:
             model_type: 모델 유형 (random_forest, gradient_boosting, linear_regression)
             model_params: 모델 하이퍼파라미터
+            feature_pipeline: 전처리/파생 피처 변환 그래프 (선택).
+                train()에서 학습되고 predict()에서 자동 적용되며 모델과 함께 저장됨
         """
         if model_type not in self.SUPPORTED_MODELS:
             raise ValueError(
@@ -53,6 +66,7 @@ class CaliforniaHousingModel:
 
         self.model_type = model_type
         self.model_params = model_params or self._get_default_params(model_type)
+        self.feature_pipeline = feature_pipeline
         self.model = None
         self.is_fitted = False
         self.metrics = {}
@@ -119,6 +133,11 @@ class CaliforniaHousingModel:
         Returns:
             학습 메트릭
         """
+        if self.feature_pipeline is not None:
+            X_train = self.feature_pipeline.fit_transform(X_train)
+            if X_val is not None:
+                X_val = self.feature_pipeline.transform(X_val)
+
         model_class = self.SUPPORTED_MODELS[self.model_type]
         self.model = model_class(**self.model_params)
 
@@ -127,17 +146,21 @@ class CaliforniaHousingModel:
         self.is_fitted = True
 
         # 학습 메트릭 계산
-        train_pred = self.model.predict(X_train)
-        self.metrics["train_mae"] = mean_absolute_error(y_train, train_pred)
-        self.metrics["train_mse"] = mean_squared_error(y_train, train_pred)
-        self.metrics["train_r2"] = r2_score(y_train, train_pred)
+        train_metrics = compute_regression_metrics(
+            y_train, self.model.predict(X_train)
+        )
+        self.metrics["train_mae"] = train_metrics["mae"]
+        self.metrics["train_mse"] = train_metrics["mse"]
+        self.metrics["train_r2"] = train_metrics["r2"]
 
         # 검증 메트릭 계산 (제공된 경우)
         if X_val is not None and y_val is not None:
-            val_pred = self.model.predict(X_val)
-            self.metrics["val_mae"] = mean_absolute_error(y_val, val_pred)
-            self.metrics["val_mse"] = mean_squared_error(y_val, val_pred)
-            self.metrics["val_r2"] = r2_score(y_val, val_pred)
+            val_metrics = compute_regression_metrics(
+                y_val, self.model.predict(X_val)
+            )
+            self.metrics["val_mae"] = val_metrics["mae"]
+            self.metrics["val_mse"] = val_metrics["mse"]
+            self.metrics["val_r2"] = val_metrics["r2"]
 
         logger.info(f"Training completed. MAE={self.metrics['train_mae']:.4f}")
         return self.metrics
@@ -164,6 +187,9 @@ class CaliforniaHousingModel:
                 f"Expected {len(self.FEATURE_NAMES)} features, got {X.shape[1]}"
             )
 
+        if self.feature_pipeline is not None:
+            X = self.feature_pipeline.transform(X)
+
         return self.model.predict(X)
 
     def evaluate(
@@ -182,17 +208,157 @@ class CaliforniaHousingModel:
             평가 메트릭
         """
         predictions = self.predict(X_test)
-
-        metrics = {
-            "mae": mean_absolute_error(y_test, predictions),
-            "mse": mean_squared_error(y_test, predictions),
-            "rmse": np.sqrt(mean_squared_error(y_test, predictions)),
-            "r2": r2_score(y_test, predictions)
-        }
+        metrics = compute_regression_metrics(y_test, predictions)
 
         logger.info(f"Evaluation: MAE={metrics['mae']:.4f}, R²={metrics['r2']:.4f}")
         return metrics
 
+    def compile(self, batch_size: int = 8192) -> CompiledForest:
+        """
+        트리 앙상블을 배열 기반 예측기로 컴파일
+
+        반환된 CompiledForest는 predict() 인터페이스가 같으므로
+        ModelServer(model=...)에 그대로 전달할 수 있습니다.
+        feature_pipeline이 있으면 ModelServer(transform=...)로 함께 전달해야 합니다.
+
+        Args:
+            batch_size: 한 번에 탐색할 최대 행 수
+
+        Returns:
+            컴파일된 예측기
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model is not fitted. Cannot compile.")
+
+        return CompiledForest.from_sklearn(self.model, batch_size=batch_size)
+
+    def compress(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray,
+        mae_tolerance: float = 0.02,
+        X_test: Optional[np.ndarray] = None,
+        y_test: Optional[np.ndarray] = None,
+        **compressor_kwargs
+    ) -> Tuple[Optional["CaliforniaHousingModel"], CompressionReport]:
+        """
+        서빙용 경량 모델 생성 (가지치기 / 깊이 제한 / 증류)
+
+        Args:
+            X_train: 학습 데이터 특성
+            y_train: 학습 데이터 타겟
+            X_val: 검증 데이터 특성 (후보 선택용, 테스트 세트와 분리)
+            y_val: 검증 데이터 타겟
+            mae_tolerance: 원본 대비 허용 MAE 상대 증가율
+            X_test: 테스트 데이터 특성 (선택, 최종 MAE 보고용)
+            y_test: 테스트 데이터 타겟
+            **compressor_kwargs: ModelCompressor 추가 설정
+
+        Returns:
+            (압축 모델 또는 None, 압축 리포트)
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model is not fitted. Cannot compress.")
+
+        if self.feature_pipeline is not None:
+            X_train = self.feature_pipeline.transform(X_train)
+            X_val = self.feature_pipeline.transform(X_val)
+            if X_test is not None:
+                X_test = self.feature_pipeline.transform(X_test)
+
+        compressor = ModelCompressor(mae_tolerance=mae_tolerance, **compressor_kwargs)
+        report = compressor.compress(
+            self.model, X_train, y_train, X_val, y_val, X_test=X_test, y_test=y_test
+        )
+
+        if report.selected is None:
+            return None, report
+
+        estimator = report.selected.model
+        model_type = next(
+            name for name, cls in self.SUPPORTED_MODELS.items()
+            if isinstance(estimator, cls)
+        )
+        compressed = CaliforniaHousingModel(
+            model_type=model_type,
+            model_params=estimator.get_params(),
+            feature_pipeline=self.feature_pipeline
+        )
+        compressed.model = estimator
+        compressed.is_fitted = True
+        compressed.metrics = {
+            "val_mae": report.selected.mae,
+            "val_r2": report.selected.r2,
+            "compressed_from": self.model_type
+        }
+        if report.selected.test_mae is not None:
+            compressed.metrics["test_mae"] = report.selected.test_mae
+            compressed.metrics["test_r2"] = report.selected.test_r2
+        return compressed, report
+
+    def export_onnx(
+        self,
+        path: str,
+        X_check: Optional[np.ndarray] = None,
+        dtype: str = "float32",
+        opset: int = DEFAULT_OPSET,
+        optimization_level: str = "extended",
+        save_optimized: bool = True,
+        atol: float = 1e-4,
+        rtol: float = 1e-4
+    ) -> OnnxExportResult:
+        """
+        ONNX로 변환 저장 (onnx / onnxruntime / skl2onnx 필요)
+
+        ONNX 그래프에는 추정기만 들어갑니다. feature_pipeline이 있으면 그래프 입력은
+        파이프라인 출력 열이며, 파이프라인 설정이 메타데이터에 함께 기록되므로
+        서빙 측에서 FeaturePipeline.from_dict()로 복원해 적용하면 됩니다.
+
+        Args:
+            path: 저장 경로 (.onnx)
+            X_check: 수치 일치 검사용 원본 입력 (n_samples, 8)
+            dtype: 입력 dtype ("float32", 선형 모델은 "float64"도 가능)
+            opset: 기본 도메인 opset
+            optimization_level: ORT 그래프 최적화 수준 (disable / basic / extended / all)
+            save_optimized: 최적화된 그래프를 함께 저장할지 여부
+            atol: 허용 절대 오차
+            rtol: 허용 상대 오차
+
+        Returns:
+            변환 결과
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model is not fitted. Cannot export.")
+
+        feature_names = self.FEATURE_NAMES
+        if self.feature_pipeline is not None:
+            feature_names = self.feature_pipeline.output_names
+            if X_check is not None:
+                X_check = self.feature_pipeline.transform(X_check)
+
+        return export_onnx(
+            self.model,
+            path,
+            feature_names=feature_names,
+            dtype=dtype,
+            opset=opset,
+            optimization_level=optimization_level,
+            save_optimized=save_optimized,
+            X_check=X_check,
+            atol=atol,
+            rtol=rtol,
+            extra_metadata={
+                "model_type": self.model_type,
+                "raw_feature_names": self.FEATURE_NAMES,
+                "feature_pipeline": (
+                    self.feature_pipeline.to_dict() if self.feature_pipeline else None
+                ),
+                "metrics": self.metrics
+            }
+        )
+
     def save(self, filepath: str) -> None:
         """모델 저장"""
         if not self.is_fitted:
@@ -203,6 +369,9 @@ class CaliforniaHousingModel:
             "model": self.model,
             "model_type": self.model_type,
             "model_params": self.model_params,
+            "feature_pipeline": (
+                self.feature_pipeline.to_dict() if self.feature_pipeline else None
+            ),
             "metrics": self.metrics
         }, filepath)
         logger.info(f"Model saved to {filepath}")
@@ -211,10 +380,12 @@ class CaliforniaHousingModel:
     def load(cls, filepath: str) -> "CaliforniaHousingModel":
         """모델 로드"""
         data = joblib.load(filepath)
+        pipeline = data.get("feature_pipeline")
 
         instance = cls(
             model_type=data["model_type"],
-            model_params=data["model_params"]
+            model_params=data["model_params"],
+            feature_pipeline=FeaturePipeline.from_dict(pipeline) if pipeline else None
         )
         instance.model = data["model"]
         instance.metrics = data.get("metrics", {})
@@ -227,7 +398,11 @@ class CaliforniaHousingModel:
 def train_model(
     model_type: str = "random_forest",
     test_size: float = 0.2,
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    compress: bool = False,
+    mae_tolerance: float = 0.02,
+    engineer_features: bool = False,
+    validation_size: float = 0.2
 ) -> Tuple[CaliforniaHousingModel, Dict[str, float]]:
     """
     모델 학습 편의 함수
@@ -236,17 +411,48 @@ def train_model(
         model_type: 모델 유형
         test_size: 테스트 세트 비율
         save_path: 모델 저장 경로 (선택)
+        compress: 학습 후 경량화 단계 실행 여부 (트리 모델만 해당).
+            save_path가 있으면 압축 모델과 리포트를 원본 옆에 저장
+        mae_tolerance: 압축 모델의 허용 MAE 상대 증가율
+        engineer_features: 표준화 + 파생 피처 파이프라인 사용 여부
+        validation_size: compress=True일 때 학습 데이터에서 떼어 낼 검증 세트 비율.
+            가지치기 / 후보 수용은 이 검증 세트로 판단하고 테스트 세트는 최종 평가에만 사용
 
     Returns:
         학습된 모델과 평가 메트릭
     """
-    model = CaliforniaHousingModel(model_type=model_type)
+    pipeline = (
+        FeaturePipeline(CaliforniaHousingModel.FEATURE_NAMES)
+        if engineer_features else None
+    )
+    model = CaliforniaHousingModel(model_type=model_type, feature_pipeline=pipeline)
     X_train, X_test, y_train, y_test = model.load_data(test_size=test_size)
+    compress = compress and model_type in ("random_forest", "gradient_boosting")
 
-    model.train(X_train, y_train, X_test, y_test)
+    if compress:
+        # 압축 후보 선택용 검증 세트를 학습 데이터에서 분리 (테스트 세트 누수 방지)
+        X_train, X_val, y_train, y_val = train_test_split(
+            X_train, y_train, test_size=validation_size, random_state=42
+        )
+        model.train(X_train, y_train, X_val, y_val)
+    else:
+        model.train(X_train, y_train, X_test, y_test)
     metrics = model.evaluate(X_test, y_test)
 
     if save_path:
         model.save(save_path)
 
+    if compress:
+        compressed, report = model.compress(
+            X_train, y_train, X_val, y_val, mae_tolerance=mae_tolerance,
+            X_test=X_test, y_test=y_test
+        )
+        logger.info(f"Compression report:\n{report.summary()}")
+
+        if save_path:
+            report_path = save_compression_report(report, save_path)
+            logger.info(f"Compression report saved to {report_path}")
+            if compressed is not None:
+                compressed.save(compressed_path(save_path))
+
     return model, metrics
@@ -8,6 +8,22 @@ from .drift import (
     ModelMonitor,
     calculate_drift_score
 )
+from .prometheus import (
+    PrometheusClient,
+    PrometheusError,
+    instant_values
+)
+from .retrain import (
+    DispatchLimiter,
+    DispatchSummary,
+    evaluate_drift
+)
+from .tracking import (
+    BatchedMlflowLogger,
+    BatchLoggerStats,
+    batch_logger,
+    is_transient_error
+)
 
 __all__ = [
     "DriftDetector",
@@ -15,5 +31,15 @@ __all__ = [
     "DriftLevel",
     "ModelMetrics",
     "ModelMonitor",
-    "calculate_drift_score"
+    "calculate_drift_score",
+    "PrometheusClient",
+    "PrometheusError",
+    "instant_values",
+    "DispatchLimiter",
+    "DispatchSummary",
+    "evaluate_drift",
+    "BatchedMlflowLogger",
+    "BatchLoggerStats",
+    "batch_logger",
+    "is_transient_error"
 ]
@@ -7,11 +7,14 @@ Monitoring and Drift Detection Module
 import logging
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 
 import numpy as np
 from scipy import stats
 
+from ..model.metrics import compute_regression_metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -220,6 +223,38 @@ class ModelMonitor:
         self.r2_threshold = r2_threshold
         self.metrics_history: List[ModelMetrics] = []
 
+    def compute_metrics(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None,
+        record: bool = True
+    ) -> ModelMetrics:
+        """
+        실제값/예측값으로 메트릭 계산 (단일 패스)
+
+        Args:
+            y_true: 실제값
+            y_pred: 예측값
+            sample_weight: 샘플 가중치 (선택)
+            record: 계산 결과를 이력에 기록할지 여부
+
+        Returns:
+            계산된 메트릭
+        """
+        values = compute_regression_metrics(y_true, y_pred, sample_weight)
+        metrics = ModelMetrics(
+            mae=values["mae"],
+            mse=values["mse"],
+            rmse=values["rmse"],
+            r2=values["r2"],
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+
+        if record:
+            self.record_metrics(metrics)
+        return metrics
+
     def record_metrics(self, metrics: ModelMetrics) -> None:
         """메트릭 기록"""
         self.metrics_history.append(metrics)
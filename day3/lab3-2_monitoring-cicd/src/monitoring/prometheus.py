@@ -0,0 +1,377 @@
+"""
+Prometheus Query Client Module
+
+Prometheus HTTP API(/api/v1/query, /api/v1/query_range) 조회 클라이언트
+- 연결 풀: requests.Session + HTTPAdapter로 TCP/keep-alive 연결 재사용
+- 동시 조회: 여러 PromQL을 스레드 풀로 한 번에 요청 (query_many)
+- 응답 캐시: 같은 쿼리를 cache_ttl_sec 안에 다시 요청하면 캐시된 결과 반환
+- 구간 분할: 긴 range 쿼리를 시계열당 최대 포인트 수(max_points) 이하 구간으로 나눠
+  동시에 요청한 뒤 시계열별로 병합
+"""
+
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Prometheus는 range 쿼리 한 번에 시계열당 11,000 포인트까지만 허용
+MAX_POINTS_PER_QUERY = 11000
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800, "y": 31536000}
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)")
+
+
+class PrometheusError(RuntimeError):
+    """Prometheus API 오류 응답 (status != success)"""
+
+
+def parse_duration(value: Union[str, int, float]) -> float:
+    """
+    Prometheus 기간 문자열을 초 단위로 변환
+
+    Args:
+        value: "30s", "5m", "1h30m" 형식 문자열 또는 초 단위 숫자
+
+    Returns:
+        초 단위 기간
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = value.strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+
+    matches = list(_DURATION_PATTERN.finditer(text))
+    if not matches or "".join(m.group(0) for m in matches) != text:
+        raise ValueError(f"Invalid duration: {value!r}. Expected e.g. 30s, 5m, 1h30m")
+    return sum(float(m.group(1)) * _DURATION_UNITS[m.group(2)] for m in matches)
+
+
+def split_range(
+    start: float,
+    end: float,
+    step: float,
+    max_points: int = MAX_POINTS_PER_QUERY
+) -> List[Tuple[float, float]]:
+    """
+    [start, end] 구간을 시계열당 max_points 이하인 구간으로 분할
+
+    구간 경계 포인트가 중복되지 않도록 다음 구간은 이전 구간 끝 + step에서 시작합니다.
+
+    Args:
+        start: 시작 시각 (unix seconds)
+        end: 종료 시각 (unix seconds)
+        step: 해상도 (초)
+        max_points: 구간당 최대 포인트 수
+
+    Returns:
+        (chunk_start, chunk_end) 목록
+    """
+    if step <= 0:
+        raise ValueError("step must be > 0")
+    if end < start:
+        raise ValueError("end must be >= start")
+
+    span = step * (max_points - 1)
+    chunks = []
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + span, end)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + step
+    return chunks
+
+
+def merge_range_results(parts: Sequence[List[Dict]]) -> List[Dict]:
+    """
+    구간별 range 쿼리 결과(matrix)를 시계열(label set)별로 병합
+
+    Args:
+        parts: 구간 순서대로 나열된 query_range 결과 목록
+
+    Returns:
+        시계열별 values가 시간순으로 합쳐진 결과
+    """
+    merged: "OrderedDict[Tuple, Dict]" = OrderedDict()
+    for part in parts:
+        for series in part:
+            key = tuple(sorted(series["metric"].items()))
+            entry = merged.setdefault(key, {"metric": series["metric"], "values": {}})
+            for timestamp, value in series.get("values", []):
+                entry["values"][timestamp] = value
+
+    return [
+        {"metric": entry["metric"], "values": [[t, v] for t, v in sorted(entry["values"].items())]}
+        for entry in merged.values()
+    ]
+
+
+def instant_values(results: List[Dict], label: str = "user_id") -> Dict[str, float]:
+    """
+    instant 쿼리 결과(vector)를 {label 값: 값} 딕셔너리로 변환
+
+    Args:
+        results: query() 결과
+        label: 키로 사용할 라벨 이름
+
+    Returns:
+        라벨 값별 메트릭 값 (같은 라벨 값이 여러 개면 마지막 값)
+    """
+    return {
+        series["metric"].get(label, "unknown"): float(series["value"][1])
+        for series in results
+    }
+
+
+@dataclass
+class PrometheusClientStats:
+    """클라이언트 요청 통계"""
+    requests: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors
+        }
+
+
+class PrometheusClient:
+    """연결 풀 / 동시 조회 / TTL 캐시를 지원하는 Prometheus 조회 클라이언트"""
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:9090",
+        timeout: float = 10.0,
+        range_timeout: float = 30.0,
+        max_workers: int = 8,
+        cache_ttl_sec: float = 5.0,
+        max_cache_entries: int = 256,
+        max_points: int = MAX_POINTS_PER_QUERY,
+        retries: int = 2
+    ):
+        """
+        클라이언트 초기화
+
+        Args:
+            base_url: Prometheus 서버 URL
+            timeout: instant 쿼리 타임아웃 (초)
+            range_timeout: range 쿼리 타임아웃 (초)
+            max_workers: 동시 요청 스레드 수 (연결 풀 크기와 같음)
+            cache_ttl_sec: 응답 캐시 유지 시간 (초, 0이면 캐시 안 함)
+            max_cache_entries: 캐시 최대 항목 수 (초과 시 오래된 항목부터 제거)
+            max_points: range 쿼리 구간당 시계열 최대 포인트 수
+            retries: 연결 실패 시 재시도 횟수
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_points < 2:
+            raise ValueError("max_points must be >= 2")
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.range_timeout = range_timeout
+        self.max_workers = max_workers
+        self.cache_ttl_sec = cache_ttl_sec
+        self.max_cache_entries = max_cache_entries
+        self.max_points = max_points
+        self.stats = PrometheusClientStats()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=max_workers, max_retries=retries
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cache: "OrderedDict[Tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 조회 API
+    # ------------------------------------------------------------------
+
+    def healthy(self, timeout: float = 5.0) -> bool:
+        """/-/healthy 확인"""
+        try:
+            return self.session.get(f"{self.base_url}/-/healthy", timeout=timeout).status_code == 200
+        except requests.RequestException:
+            return False
+
+    def query(self, promql: str, timestamp: Optional[float] = None) -> List[Dict]:
+        """
+        instant 쿼리
+
+        Args:
+            promql: PromQL 문자열
+            timestamp: 평가 시각 (unix seconds, 없으면 서버 현재 시각)
+
+        Returns:
+            result 목록 (vector)
+        """
+        params = {"query": promql}
+        if timestamp is not None:
+            params["time"] = timestamp
+        return self._get("/api/v1/query", params, self.timeout)
+
+    def query_range(
+        self,
+        promql: str,
+        start: float,
+        end: float,
+        step: Union[str, float] = "30s"
+    ) -> List[Dict]:
+        """
+        range 쿼리 (긴 구간은 자동 분할 후 동시 요청)
+
+        Args:
+            promql: PromQL 문자열
+            start: 시작 시각 (unix seconds)
+            end: 종료 시각 (unix seconds)
+            step: 해상도 ("30s" 형식 또는 초)
+
+        Returns:
+            시계열별로 병합된 result 목록 (matrix)
+        """
+        step_sec = parse_duration(step)
+        chunks = split_range(start, end, step_sec, self.max_points)
+
+        def fetch(chunk):
+            return self._get(
+                "/api/v1/query_range",
+                {"query": promql, "start": chunk[0], "end": chunk[1], "step": step_sec},
+                self.range_timeout
+            )
+
+        if len(chunks) == 1:
+            return fetch(chunks[0])
+        return merge_range_results(list(self._pool().map(fetch, chunks)))
+
+    def query_last(
+        self,
+        promql: str,
+        duration: Union[str, float] = "30m",
+        step: Union[str, float] = "30s"
+    ) -> List[Dict]:
+        """
+        최근 duration 구간 range 쿼리
+
+        Args:
+            promql: PromQL 문자열
+            duration: 조회 기간 ("30m" 형식 또는 초)
+            step: 해상도
+
+        Returns:
+            result 목록 (matrix)
+        """
+        end = time.time()
+        return self.query_range(promql, end - parse_duration(duration), end, step)
+
+    def query_many(
+        self,
+        queries: Union[Sequence[str], Dict[str, str]],
+        raise_on_error: bool = False
+    ) -> Dict[str, List[Dict]]:
+        """
+        여러 instant 쿼리 동시 요청
+
+        Args:
+            queries: PromQL 목록 또는 {이름: PromQL}
+            raise_on_error: True면 첫 오류를 그대로 발생, False면 실패한 쿼리는 빈 결과
+
+        Returns:
+            {이름(또는 PromQL): result 목록}
+        """
+        if not isinstance(queries, dict):
+            queries = {q: q for q in queries}
+
+        futures = {name: self._pool().submit(self.query, q) for name, q in queries.items()}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except (requests.RequestException, PrometheusError, ValueError) as e:
+                if raise_on_error:
+                    raise
+                logger.warning(f"Prometheus query failed ({queries[name]}): {e}")
+                results[name] = []
+        return results
+
+    def clear_cache(self) -> None:
+        """응답 캐시 비우기"""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """스레드 풀과 연결 풀 정리"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+
+    def __enter__(self) -> "PrometheusClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="prometheus"
+                )
+            return self._executor
+
+    def _get(self, path: str, params: Dict, timeout: float) -> List[Dict]:
+        key = (path, tuple(sorted(params.items())))
+        if self.cache_ttl_sec > 0:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] > time.monotonic():
+                    self.stats.cache_hits += 1
+                    return cached[1]
+
+        with self._lock:
+            self.stats.requests += 1
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=timeout)
+            data = response.json()
+        except (requests.RequestException, ValueError):
+            with self._lock:
+                self.stats.errors += 1
+            raise
+
+        if data.get("status") != "success":
+            with self._lock:
+                self.stats.errors += 1
+            raise PrometheusError(
+                f"{data.get('errorType', response.status_code)}: {data.get('error', response.text)}"
+            )
+
+        result = data["data"]["result"]
+        if self.cache_ttl_sec > 0:
+            with self._lock:
+                self._cache[key] = (time.monotonic() + self.cache_ttl_sec, result)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_cache_entries:
+                    self._cache.popitem(last=False)
+        return result
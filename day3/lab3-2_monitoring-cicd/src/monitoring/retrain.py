@@ -0,0 +1,210 @@
+"""
+Multi-tenant Retrain Trigger Module
+
+전체 사용자(user_id)의 모델 성능 메트릭을 한 번에 평가하고 재학습 트리거를 제어
+- evaluate_drift: MAE / R² 벡터 전체에 Drift 규칙을 numpy로 일괄 적용
+- DispatchLimiter: 같은 사용자 중복 트리거 방지(쿨다운, 상태 파일로 실행 간 유지) +
+  실행당 최대 트리거 수 / 트리거 간 최소 간격 제한
+"""
+
+import os
+import json
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAE_THRESHOLD = 0.45
+R2_THRESHOLD = 0.75
+
+
+def evaluate_drift(
+    mae: Dict[str, float],
+    r2: Dict[str, float],
+    mae_threshold: float = MAE_THRESHOLD,
+    r2_threshold: float = R2_THRESHOLD
+) -> List[Dict]:
+    """
+    사용자별 MAE / R²에 Drift 규칙 일괄 적용
+
+    - MAE > mae_threshold 또는 R² < r2_threshold이면 Drift
+    - drift_score = (MAE 초과 비율 + R² 미달 비율) / 2
+    - 두 메트릭 중 하나라도 없는 사용자는 Drift 아님 ("No metrics available")
+
+    Args:
+        mae: {user_id: MAE}
+        r2: {user_id: R²}
+        mae_threshold: MAE 임계값
+        r2_threshold: R² 임계값
+
+    Returns:
+        user_id 순으로 정렬된 사용자별 결과
+        (user_id, drift_detected, mae, r2, drift_score, reason)
+    """
+    users = sorted(set(mae) | set(r2))
+    mae_values = np.array([mae.get(u, np.nan) for u in users], dtype=np.float64)
+    r2_values = np.array([r2.get(u, np.nan) for u in users], dtype=np.float64)
+
+    available = ~np.isnan(mae_values) & ~np.isnan(r2_values)
+    with np.errstate(invalid="ignore"):
+        mae_drift = available & (mae_values > mae_threshold)
+        r2_drift = available & (r2_values < r2_threshold)
+    mae_score = np.where(mae_drift, (mae_values - mae_threshold) / mae_threshold, 0.0)
+    r2_score = np.where(r2_drift, (r2_threshold - r2_values) / r2_threshold, 0.0)
+    drift_score = (mae_score + r2_score) / 2
+
+    results = []
+    for i, user_id in enumerate(users):
+        if not available[i]:
+            results.append({
+                "user_id": user_id,
+                "drift_detected": False,
+                "mae": None,
+                "r2": None,
+                "drift_score": 0,
+                "reason": "No metrics available"
+            })
+            continue
+
+        reasons = []
+        if mae_drift[i]:
+            reasons.append(f"MAE({mae_values[i]:.4f}) > {mae_threshold}")
+        if r2_drift[i]:
+            reasons.append(f"R²({r2_values[i]:.4f}) < {r2_threshold}")
+        results.append({
+            "user_id": user_id,
+            "drift_detected": bool(mae_drift[i] or r2_drift[i]),
+            "mae": float(mae_values[i]),
+            "r2": float(r2_values[i]),
+            "drift_score": float(drift_score[i]),
+            "reason": "; ".join(reasons) if reasons else "Model performance normal"
+        })
+    return results
+
+
+@dataclass
+class DispatchSummary:
+    """트리거 실행 결과"""
+    dispatched: List[str] = field(default_factory=list)
+    cooldown: List[str] = field(default_factory=list)
+    deferred: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "dispatched": self.dispatched,
+            "cooldown": self.cooldown,
+            "deferred": self.deferred,
+            "failed": self.failed
+        }
+
+
+class DispatchLimiter:
+    """재학습 트리거 중복 제거 / 속도 제한"""
+
+    def __init__(
+        self,
+        state_path: Optional[str] = None,
+        cooldown_sec: float = 3600.0,
+        max_dispatches: int = 10,
+        min_interval_sec: float = 1.0
+    ):
+        """
+        트리거 제한기 초기화
+
+        Args:
+            state_path: 사용자별 마지막 트리거 시각을 저장할 JSON 경로 (없으면 메모리에만 유지)
+            cooldown_sec: 같은 사용자를 다시 트리거하기까지 최소 시간 (초)
+            max_dispatches: 한 번 실행에서 보낼 최대 트리거 수 (나머지는 다음 실행으로 연기)
+            min_interval_sec: 트리거 사이 최소 간격 (초)
+        """
+        if max_dispatches < 0:
+            raise ValueError("max_dispatches must be >= 0")
+
+        self.state_path = state_path
+        self.cooldown_sec = cooldown_sec
+        self.max_dispatches = max_dispatches
+        self.min_interval_sec = min_interval_sec
+        self.last_dispatch: Dict[str, float] = self._load_state()
+        self._last_sent: Optional[float] = None
+
+    def in_cooldown(self, user_id: str, now: Optional[float] = None) -> bool:
+        """쿨다운 중인지 확인"""
+        last = self.last_dispatch.get(user_id)
+        if last is None:
+            return False
+        return (now if now is not None else time.time()) - last < self.cooldown_sec
+
+    def dispatch_all(
+        self,
+        candidates: List[Dict],
+        dispatch: Callable[[str, float], bool]
+    ) -> DispatchSummary:
+        """
+        Drift 점수가 높은 사용자부터 트리거
+
+        Args:
+            candidates: evaluate_drift 결과 중 트리거할 항목 (user_id, drift_score)
+            dispatch: dispatch(user_id, drift_score) -> 성공 여부
+
+        Returns:
+            DispatchSummary
+        """
+        summary = DispatchSummary()
+        seen = set()
+        ordered = sorted(candidates, key=lambda c: c["drift_score"] or 0, reverse=True)
+
+        for candidate in ordered:
+            user_id = candidate["user_id"]
+            if user_id in seen:
+                continue
+            seen.add(user_id)
+
+            if self.in_cooldown(user_id):
+                summary.cooldown.append(user_id)
+                continue
+            if len(summary.dispatched) + len(summary.failed) >= self.max_dispatches:
+                summary.deferred.append(user_id)
+                continue
+
+            self._wait_interval()
+            if dispatch(user_id, candidate["drift_score"]):
+                summary.dispatched.append(user_id)
+                self.last_dispatch[user_id] = time.time()
+                self._save_state()
+            else:
+                summary.failed.append(user_id)
+
+        return summary
+
+    def _wait_interval(self) -> None:
+        if self._last_sent is not None:
+            remaining = self.min_interval_sec - (time.monotonic() - self._last_sent)
+            if remaining > 0:
+                time.sleep(remaining)
+        self._last_sent = time.monotonic()
+
+    def _load_state(self) -> Dict[str, float]:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path) as f:
+                return {k: float(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable dispatch state {self.state_path}: {e}")
+            return {}
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.last_dispatch, f, indent=2)
+        os.replace(tmp_path, self.state_path)
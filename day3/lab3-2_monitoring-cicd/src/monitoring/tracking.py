@@ -0,0 +1,361 @@
+"""
+Batched MLflow Logging Module
+
+파라미터 / 메트릭 / 태그를 메모리에 모았다가 MlflowClient.log_batch로 한 번에 전송
+- log_metric 호출마다 발생하던 트래킹 서버 왕복(HTTP)을 배치 단위로 축소
+- 백그라운드 스레드가 flush_interval_sec 간격 또는 배치가 가득 찼을 때 전송
+- 일시적 오류(연결 오류, 5xx)만 지수 백오프로 재시도, 최종 실패한 배치는 버리고 통계에 기록
+  (INVALID_PARAMETER_VALUE 같은 4xx 오류는 재시도해도 같으므로 바로 실패 처리)
+- 버퍼 상한(max_buffer): 가득 차면 대기(block) 또는 버림(drop)
+- close() / with 블록 종료 / 인터프리터 종료(atexit) 시 남은 항목 전송
+- 로컬 파일 저장소(file:///...) 트래킹 URI에서도 동작
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# MlflowClient.log_batch 요청 하나당 상한 (MLflow REST API 제한)
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+MAX_TAGS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    재시도할 만한 일시적 오류인지 판정
+
+    Args:
+        error: log_batch에서 발생한 예외
+
+    Returns:
+        연결 오류(ConnectionError, TimeoutError, requests 오류 등 OSError)나
+        HTTP 5xx MlflowException이면 True
+    """
+    if isinstance(error, (ConnectionError, TimeoutError, OSError)):
+        return True
+    get_status = getattr(error, "get_http_status_code", None)
+    if get_status is None:
+        return False
+    return get_status() >= 500
+
+
+@dataclass
+class BatchLoggerStats:
+    """배치 로거 전송 통계"""
+    metrics_logged: int = 0
+    params_logged: int = 0
+    tags_logged: int = 0
+    batches_sent: int = 0
+    retries: int = 0
+    failed_batches: int = 0
+    dropped: int = 0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class BatchedMlflowLogger:
+    """MlflowClient.log_batch 기반 비동기 배치 로거"""
+
+    def __init__(
+        self,
+        run_id: str,
+        tracking_uri: Optional[str] = None,
+        client: Any = None,
+        flush_interval_sec: float = 2.0,
+        max_buffer: int = 10000,
+        overflow: str = "block",
+        max_retries: int = 3,
+        backoff_sec: float = 0.5
+    ):
+        """
+        배치 로거 초기화
+
+        Args:
+            run_id: 기록할 MLflow run ID
+            tracking_uri: 트래킹 서버 URI (client를 넘기면 무시)
+            client: 사용할 MlflowClient (없으면 tracking_uri로 생성)
+            flush_interval_sec: 백그라운드 전송 주기 (초)
+            max_buffer: 버퍼에 보관할 최대 항목 수
+            overflow: 버퍼가 가득 찼을 때 동작 ("block": 공간이 날 때까지 대기, "drop": 버림)
+            max_retries: 배치 하나당 최대 재시도 횟수
+            backoff_sec: 첫 재시도 대기 시간 (재시도마다 2배)
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unsupported overflow policy: {overflow}. Supported: {list(OVERFLOW_POLICIES)}"
+            )
+        if max_buffer < 1:
+            raise ValueError("max_buffer must be >= 1")
+        if flush_interval_sec <= 0:
+            raise ValueError("flush_interval_sec must be > 0")
+
+        if client is None:
+            from mlflow.tracking import MlflowClient
+            client = MlflowClient(tracking_uri=tracking_uri)
+
+        self.run_id = run_id
+        self.client = client
+        self.flush_interval_sec = flush_interval_sec
+        self.max_buffer = max_buffer
+        self.overflow = overflow
+        self.max_retries = max_retries
+        self.backoff_sec = backoff_sec
+        self.stats = BatchLoggerStats()
+
+        # (kind, key, value, timestamp, step) 항목, kind: metric / param / tag
+        self._buffer = deque()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._thread = threading.Thread(
+            target=self._run, name="mlflow-batch-logger", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # 기록 API (mlflow fluent API와 같은 이름)
+    # ------------------------------------------------------------------
+
+    def log_metric(
+        self,
+        key: str,
+        value: float,
+        step: int = 0,
+        timestamp: Optional[int] = None
+    ) -> None:
+        """메트릭 하나 추가 (timestamp: 밀리초, 기본 현재 시각)"""
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        self._put(("metric", key, float(value), timestamp, step))
+
+    def log_metrics(self, metrics: Dict[str, float], step: int = 0) -> None:
+        """메트릭 여러 개 추가 (같은 timestamp 사용)"""
+        timestamp = int(time.time() * 1000)
+        for key, value in metrics.items():
+            self.log_metric(key, value, step=step, timestamp=timestamp)
+
+    def log_param(self, key: str, value: Any) -> None:
+        """파라미터 하나 추가"""
+        self._put(("param", key, str(value), None, None))
+
+    def log_params(self, params: Dict[str, Any]) -> None:
+        """파라미터 여러 개 추가"""
+        for key, value in params.items():
+            self.log_param(key, value)
+
+    def set_tag(self, key: str, value: Any) -> None:
+        """태그 하나 추가"""
+        self._put(("tag", key, str(value), None, None))
+
+    def set_tags(self, tags: Dict[str, Any]) -> None:
+        """태그 여러 개 추가"""
+        for key, value in tags.items():
+            self.set_tag(key, value)
+
+    @property
+    def pending(self) -> int:
+        """아직 전송되지 않은 항목 수"""
+        with self._cond:
+            return len(self._buffer) + self._in_flight
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        버퍼가 모두 전송(또는 최종 실패 처리)될 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            제한 시간 안에 버퍼가 비었는지 여부
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._buffer and self._in_flight == 0, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> BatchLoggerStats:
+        """
+        남은 항목을 전송하고 백그라운드 스레드 종료
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            전송 통계
+        """
+        with self._cond:
+            if self._closed:
+                return self.stats
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+        if self.stats.failed_batches or self.stats.dropped:
+            logger.warning(
+                f"MLflow batch logger closed with {self.stats.failed_batches} failed batches, "
+                f"{self.stats.dropped} dropped items (last error: {self.stats.last_error})"
+            )
+        return self.stats
+
+    def __enter__(self) -> "BatchedMlflowLogger":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _put(self, item: tuple) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Logger is closed")
+            if len(self._buffer) >= self.max_buffer:
+                if self.overflow == "drop":
+                    self.stats.dropped += 1
+                    return
+                # 백그라운드 스레드가 바로 보내도록 깨운 뒤 공간이 날 때까지 대기
+                self._flush_requested = True
+                self._cond.notify_all()
+                self._cond.wait_for(
+                    lambda: len(self._buffer) < self.max_buffer or self._closed
+                )
+                if self._closed:
+                    raise RuntimeError("Logger is closed")
+            self._buffer.append(item)
+            if len(self._buffer) >= MAX_ENTITIES_PER_BATCH:
+                self._cond.notify_all()
+
+    def _take_batch(self) -> list:
+        """버퍼 앞쪽에서 log_batch 한 번에 보낼 수 있는 만큼 꺼냄 (lock 보유 상태에서 호출)"""
+        limits = {
+            "metric": MAX_METRICS_PER_BATCH,
+            "param": MAX_PARAMS_PER_BATCH,
+            "tag": MAX_TAGS_PER_BATCH
+        }
+        counts = {kind: 0 for kind in limits}
+        batch = []
+        while self._buffer and len(batch) < MAX_ENTITIES_PER_BATCH:
+            kind = self._buffer[0][0]
+            if counts[kind] >= limits[kind]:
+                break
+            batch.append(self._buffer.popleft())
+            counts[kind] += 1
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed
+                    or self._flush_requested
+                    or len(self._buffer) >= MAX_ENTITIES_PER_BATCH,
+                    timeout=self.flush_interval_sec
+                )
+                batch = self._take_batch()
+                if not batch:
+                    self._flush_requested = False
+                    self._cond.notify_all()
+                    if self._closed:
+                        return
+                    continue
+                self._in_flight = len(batch)
+                self._cond.notify_all()
+
+            self._send(batch)
+
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def _send(self, batch: list) -> None:
+        """배치 하나 전송 (재시도 포함)"""
+        from mlflow.entities import Metric, Param, RunTag
+
+        metrics = []
+        params = {}
+        tags = {}
+        for kind, key, value, timestamp, step in batch:
+            if kind == "metric":
+                metrics.append(Metric(key, value, timestamp, step))
+            elif kind == "param":
+                params[key] = Param(key, value)
+            else:
+                tags[key] = RunTag(key, value)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.client.log_batch(
+                    self.run_id,
+                    metrics=metrics,
+                    params=list(params.values()),
+                    tags=list(tags.values())
+                )
+                break
+            except Exception as e:
+                self.stats.last_error = str(e)
+                if not is_transient_error(e):
+                    self.stats.failed_batches += 1
+                    logger.error(f"MLflow log_batch failed with non-retryable error: {e}")
+                    return
+                if attempt == self.max_retries:
+                    self.stats.failed_batches += 1
+                    logger.error(f"MLflow log_batch failed after {attempt + 1} attempts: {e}")
+                    return
+                self.stats.retries += 1
+                delay = self.backoff_sec * (2 ** attempt)
+                logger.warning(f"MLflow log_batch failed ({e}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+
+        self.stats.batches_sent += 1
+        self.stats.metrics_logged += len(metrics)
+        self.stats.params_logged += len(params)
+        self.stats.tags_logged += len(tags)
+
+
+def batch_logger(
+    run_id: Optional[str] = None,
+    tracking_uri: Optional[str] = None,
+    **kwargs
+) -> BatchedMlflowLogger:
+    """
+    배치 로거 생성 (편의 함수)
+
+    Args:
+        run_id: 기록할 run ID (없으면 현재 활성 run)
+        tracking_uri: 트래킹 서버 URI (없으면 mlflow.get_tracking_uri())
+        **kwargs: BatchedMlflowLogger 옵션
+
+    Returns:
+        BatchedMlflowLogger
+    """
+    import mlflow
+
+    if run_id is None:
+        run = mlflow.active_run()
+        if run is None:
+            raise RuntimeError("No active MLflow run; pass run_id or call mlflow.start_run()")
+        run_id = run.info.run_id
+    if tracking_uri is None:
+        tracking_uri = mlflow.get_tracking_uri()
+
+    return BatchedMlflowLogger(run_id, tracking_uri=tracking_uri, **kwargs)
@@ -4,16 +4,28 @@ from .api import (
     ModelServer,
     PredictionRequest,
     PredictionResponse,
+    FeedbackRequest,
     HealthResponse,
     validate_input,
+    decode_binary_instances,
     create_app
 )
+from .exporter import (
+    ExporterConfig,
+    ModelMetricsExporter,
+    create_exporter
+)
 
 __all__ = [
     "ModelServer",
     "PredictionRequest",
     "PredictionResponse",
+    "FeedbackRequest",
     "HealthResponse",
     "validate_input",
-    "create_app"
+    "decode_binary_instances",
+    "create_app",
+    "ExporterConfig",
+    "ModelMetricsExporter",
+    "create_exporter"
 ]
@@ -15,6 +15,9 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# 바이너리 예측 요청 (application/octet-stream) 지원 dtype
+BINARY_DTYPES = {"float32": "<f4", "float64": "<f8"}
+
 
 class PredictionRequest(BaseModel):
     """예측 요청 스키마"""
@@ -26,6 +29,19 @@ class PredictionRequest(BaseModel):
     )
 
 
+class FeedbackRequest(BaseModel):
+    """정답 피드백 스키마 (임베디드 exporter의 MAE / R² 계산용)"""
+
+    instances: List[List[float]] = Field(
+        ...,
+        description="Input features that were served (8 features per sample)"
+    )
+    targets: List[float] = Field(
+        ...,
+        description="Observed target values for each instance"
+    )
+
+
 class PredictionResponse(BaseModel):
     """예측 응답 스키마"""
 
@@ -61,16 +77,27 @@ class HealthResponse(BaseModel):
 class ModelServer:
     """모델 서버 클래스"""
 
-    def __init__(self, model=None, model_version: str = "v1.0"):
+    def __init__(
+        self,
+        model=None,
+        model_version: str = "v1.0",
+        transform=None,
+        exporter=None
+    ):
         """
         모델 서버 초기화
 
         Args:
             model: 학습된 모델 인스턴스
             model_version: 모델 버전
+            transform: 예측 전 적용할 피처 변환 (FeaturePipeline 등 transform() 보유 객체).
+                모델 자체가 변환을 포함하면 None
+            exporter: 요청 / 피드백을 기록할 ModelMetricsExporter (선택)
         """
         self.model = model
         self.model_version = model_version
+        self.transform = transform
+        self.exporter = exporter
         self.request_count = 0
         self.error_count = 0
         self.total_latency = 0.0
@@ -90,30 +117,74 @@ class ModelServer:
         Returns:
             예측 응답
         """
+        start_time = time.time()
+        predictions = self.predict_array(instances)
+        latency_ms = (time.time() - start_time) * 1000
+
+        return PredictionResponse(
+            predictions=predictions.tolist(),
+            model_version=self.model_version,
+            latency_ms=round(latency_ms, 3)
+        )
+
+    def predict_array(self, X) -> np.ndarray:
+        """
+        배열 입력 예측 (응답 스키마 변환 없음)
+
+        Args:
+            X: 입력 특성 (n_samples, 8) 배열 또는 리스트
+
+        Returns:
+            예측값 배열
+        """
         if not self.is_ready:
             raise RuntimeError("Model is not loaded")
 
         start_time = time.time()
 
         try:
-            X = np.array(instances)
+            X_raw = np.asarray(X, dtype=np.float64)
+            X = X_raw
+            if self.transform is not None:
+                X = self.transform.transform(X)
             predictions = self.model.predict(X)
             latency_ms = (time.time() - start_time) * 1000
 
             self.request_count += 1
             self.total_latency += latency_ms
+            if self.exporter is not None:
+                self.exporter.observe_prediction(X_raw, latency_ms / 1000)
 
-            return PredictionResponse(
-                predictions=predictions.tolist(),
-                model_version=self.model_version,
-                latency_ms=round(latency_ms, 3)
-            )
+            return predictions
 
         except Exception as e:
             self.error_count += 1
+            if self.exporter is not None:
+                self.exporter.observe_error()
             logger.error(f"Prediction error: {e}")
             raise
 
+    def record_feedback(self, instances, targets) -> int:
+        """
+        정답 피드백 기록 (입력을 다시 예측해 실제값과 함께 exporter에 전달)
+
+        Args:
+            instances: 서빙했던 입력 특성
+            targets: 관측된 실제값
+
+        Returns:
+            기록한 샘플 수
+        """
+        if self.exporter is None:
+            raise RuntimeError("Metrics exporter is not configured")
+        if not self.is_ready:
+            raise RuntimeError("Model is not loaded")
+
+        X = np.asarray(instances, dtype=np.float64)
+        if self.transform is not None:
+            X = self.transform.transform(X)
+        return self.exporter.record_feedback(targets, self.model.predict(X))
+
     def health_check(self) -> HealthResponse:
         """헬스 체크"""
         return HealthResponse(
@@ -133,7 +204,7 @@ class ModelServer:
             if (self.request_count + self.error_count) > 0 else 0
         )
 
-        return {
+        metrics = {
             "request_count": self.request_count,
             "error_count": self.error_count,
             "error_rate": round(error_rate, 4),
@@ -141,6 +212,9 @@ class ModelServer:
             "model_version": self.model_version,
             "model_loaded": self.is_ready
         }
+        if self.exporter is not None:
+            metrics["monitoring"] = self.exporter.last_snapshot
+        return metrics
 
 
 def validate_input(instances: List[List[float]]) -> bool:
@@ -173,19 +247,48 @@ def validate_input(instances: List[List[float]]) -> bool:
     return True
 
 
-def create_app(model=None, model_version: str = "v1.0"):
+def decode_binary_instances(body: bytes, dtype: str = "float32") -> np.ndarray:
+    """
+    바이너리 요청 본문 → (n_samples, 8) 배열
+
+    본문은 little-endian float32/float64 행 우선(row-major) 배열입니다.
+
+    Args:
+        body: 요청 본문
+        dtype: "float32" 또는 "float64"
+
+    Returns:
+        입력 특성 배열
+    """
+    if dtype not in BINARY_DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype}. Supported: {list(BINARY_DTYPES)}")
+
+    expected_features = 8
+    row_bytes = expected_features * np.dtype(BINARY_DTYPES[dtype]).itemsize
+    if not body or len(body) % row_bytes != 0:
+        raise ValueError(
+            f"Invalid binary payload: {len(body)} bytes is not a multiple of "
+            f"{row_bytes} ({expected_features} x {dtype})"
+        )
+    return np.frombuffer(body, dtype=BINARY_DTYPES[dtype]).reshape(-1, expected_features)
+
+
+def create_app(model=None, model_version: str = "v1.0", transform=None, exporter=None):
     """
     FastAPI 앱 생성 (FastAPI가 설치된 환경에서 사용)
 
     Args:
         model: 학습된 모델
         model_version: 모델 버전
+        transform: 예측 전 적용할 피처 변환 (선택)
+        exporter: ModelMetricsExporter (선택). 주면 /metrics/prometheus, /feedback 추가
 
     Returns:
         FastAPI 앱 인스턴스
     """
     try:
-        from fastapi import FastAPI, HTTPException
+        from fastapi import FastAPI, HTTPException, Request, Response
+        from starlette.concurrency import run_in_threadpool
 
         app = FastAPI(
             title="California Housing Model API",
@@ -193,7 +296,9 @@ def create_app(model=None, model_version: str = "v1.0"):
             version=model_version
         )
 
-        server = ModelServer(model=model, model_version=model_version)
+        server = ModelServer(
+            model=model, model_version=model_version, transform=transform, exporter=exporter
+        )
 
         @app.get("/health", response_model=HealthResponse)
         def health():
@@ -203,6 +308,30 @@ def create_app(model=None, model_version: str = "v1.0"):
         def metrics():
             return server.get_metrics()
 
+        if exporter is not None:
+            @app.get("/metrics/prometheus")
+            def prometheus_metrics():
+                body, content_type = exporter.render()
+                return Response(content=body, media_type=content_type)
+
+            @app.post("/feedback")
+            def feedback(request: FeedbackRequest):
+                if not validate_input(request.instances):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Invalid input: expected 8 features per instance"
+                    )
+                if len(request.targets) != len(request.instances):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Invalid input: expected one target per instance"
+                    )
+                try:
+                    recorded = server.record_feedback(request.instances, request.targets)
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=str(e))
+                return {"recorded": recorded, "label_window": len(exporter.labels)}
+
         @app.post("/predict", response_model=PredictionResponse)
         def predict(request: PredictionRequest):
             if not validate_input(request.instances):
@@ -215,6 +344,26 @@ def create_app(model=None, model_version: str = "v1.0"):
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @app.post("/predict/binary")
+        async def predict_binary(request: Request):
+            # 본문: float32(기본) 또는 X-Dtype: float64 행 우선 배열
+            # 응답: float64 little-endian 예측값 배열
+            try:
+                X = decode_binary_instances(
+                    await request.body(), request.headers.get("x-dtype", "float32")
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            try:
+                predictions = await run_in_threadpool(server.predict_array, X)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+            return Response(
+                content=np.asarray(predictions, dtype="<f8").tobytes(),
+                media_type="application/octet-stream",
+                headers={"X-Model-Version": server.model_version}
+            )
+
         return app
 
     except ImportError:
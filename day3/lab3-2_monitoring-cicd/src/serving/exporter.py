@@ -0,0 +1,373 @@
+"""
+Embedded Metrics Exporter Module
+
+서빙 프로세스 안에서 실제 트래픽으로 모델 품질 / 드리프트 / 지연 시간 메트릭을 노출
+- 요청 경로: 입력 / 지연 시간을 고정 크기 링 버퍼에 추가하고 카운터 / 히스토그램만 갱신 (O(1))
+  (model_prediction_total은 성공 / 실패 모두 행 수가 아닌 요청 수를 셈)
+- 정답 피드백: record_feedback으로 (실제값, 예측값) 쌍을 링 버퍼에 추가
+- 백그라운드 스레드: interval_sec마다 ModelMonitor(MAE/R²), DriftDetector(KS 검정),
+  지연 시간 백분위수를 계산해 Gauge 갱신
+- 메트릭 이름 / 라벨은 기존 metrics-exporter와 같음
+  (model_mae_score, model_r2_score, model_prediction_total, model_prediction_latency)
+  → Grafana 대시보드 / Alert 규칙을 그대로 사용
+"""
+
+import os
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..monitoring.drift import DriftDetector, ModelMonitor
+
+logger = logging.getLogger(__name__)
+
+# 기존 metrics-exporter와 같은 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+LATENCY_QUANTILES = (0.5, 0.95, 0.99)
+
+
+@dataclass
+class ExporterConfig:
+    """임베디드 Exporter 설정"""
+    model_name: str = "california-housing"
+    user_id: str = "local"
+    namespace: str = "default"
+    interval_sec: float = 15.0
+    input_window: int = 5000
+    label_window: int = 5000
+    latency_window: int = 10000
+    min_samples: int = 30
+
+    @classmethod
+    def from_env(cls) -> "ExporterConfig":
+        """환경 변수(MODEL_NAME, USER_ID, NAMESPACE, EXPORTER_INTERVAL_SEC 등)에서 설정 생성"""
+        user_num = os.environ.get("USER_NUM")
+        default_user = f"user{user_num}" if user_num else cls.user_id
+        user_id = os.environ.get("USER_ID", default_user)
+        return cls(
+            model_name=os.environ.get("MODEL_NAME", cls.model_name),
+            user_id=user_id,
+            namespace=os.environ.get(
+                "NAMESPACE", f"kubeflow-{user_id}" if user_num else cls.namespace
+            ),
+            interval_sec=float(os.environ.get("EXPORTER_INTERVAL_SEC", cls.interval_sec)),
+            input_window=int(os.environ.get("EXPORTER_INPUT_WINDOW", cls.input_window)),
+            label_window=int(os.environ.get("EXPORTER_LABEL_WINDOW", cls.label_window)),
+            min_samples=int(os.environ.get("EXPORTER_MIN_SAMPLES", cls.min_samples))
+        )
+
+
+class RingBuffer:
+    """고정 크기 numpy 링 버퍼 (가장 최근 capacity개 행 유지, 행 모양은 첫 추가 시 결정)"""
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._data: Optional[np.ndarray] = None
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, rows) -> None:
+        """행 추가 (capacity보다 많으면 마지막 capacity개만 유지)"""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.float64))
+        if len(rows) == 0:
+            return
+        rows = rows[-self.capacity:]
+
+        with self._lock:
+            if self._data is None:
+                self._data = np.empty((self.capacity,) + rows.shape[1:], dtype=np.float64)
+            elif rows.shape[1:] != self._data.shape[1:]:
+                raise ValueError(
+                    f"Row shape mismatch: expected {self._data.shape[1:]}, got {rows.shape[1:]}"
+                )
+            n = len(rows)
+            first = min(n, self.capacity - self._next)
+            self._data[self._next:self._next + first] = rows[:first]
+            self._data[:n - first] = rows[first:]
+            self._next = (self._next + n) % self.capacity
+            self._size = min(self._size + n, self.capacity)
+
+    def values(self) -> np.ndarray:
+        """저장된 행 복사본 (오래된 순)"""
+        with self._lock:
+            if self._data is None:
+                return np.empty(0, dtype=np.float64)
+            if self._size < self.capacity:
+                return self._data[:self._size].copy()
+            return np.concatenate([self._data[self._next:], self._data[:self._next]])
+
+
+class ModelMetricsExporter:
+    """서빙 프로세스 임베디드 Prometheus Exporter"""
+
+    def __init__(
+        self,
+        config: Optional[ExporterConfig] = None,
+        model_version: str = "v1.0",
+        monitor: Optional[ModelMonitor] = None,
+        detector: Optional[DriftDetector] = None,
+        registry=None
+    ):
+        """
+        Exporter 초기화
+
+        Args:
+            config: Exporter 설정 (없으면 기본값)
+            model_version: 라벨에 사용할 모델 버전
+            monitor: MAE/R² 계산용 ModelMonitor (없으면 기본 임계값으로 생성)
+            detector: 드리프트 감지기 (set_reference 완료 상태여야 드리프트 게이지 갱신)
+            registry: prometheus_client CollectorRegistry (없으면 전용 레지스트리 생성)
+        """
+        from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+        self.config = config or ExporterConfig()
+        self.model_version = model_version
+        self.monitor = monitor or ModelMonitor()
+        self.detector = detector
+        self.registry = registry or CollectorRegistry()
+
+        cfg = self.config
+        self.inputs = RingBuffer(cfg.input_window)
+        self.labels = RingBuffer(cfg.label_window)
+        self.latencies = RingBuffer(cfg.latency_window)
+
+        label_names = ["model_name", "version", "user_id", "namespace"]
+        self._labels = {
+            "model_name": cfg.model_name,
+            "version": model_version,
+            "user_id": cfg.user_id,
+            "namespace": cfg.namespace
+        }
+
+        def gauge(name, doc, extra=()):
+            return Gauge(name, doc, label_names + list(extra), registry=self.registry)
+
+        self.mae_gauge = gauge("model_mae_score", "MAE over recent labeled predictions")
+        self.r2_gauge = gauge("model_r2_score", "R2 over recent labeled predictions")
+        self.drift_score_gauge = gauge(
+            "model_drift_score", "Fraction of features drifted (KS test) in recent inputs"
+        )
+        self.drifted_features_gauge = gauge(
+            "model_drifted_features", "Number of drifted features in recent inputs"
+        )
+        self.feature_pvalue_gauge = gauge(
+            "model_feature_drift_pvalue", "KS test p-value per feature", ["feature"]
+        )
+        self.latency_gauge = gauge(
+            "model_latency_seconds", "Prediction latency quantiles over recent requests",
+            ["quantile"]
+        )
+        self.window_gauge = gauge(
+            "model_metrics_window_samples", "Samples in each metrics window", ["window"]
+        )
+        self.updated_gauge = gauge(
+            "model_metrics_updated_timestamp_seconds", "Last background metrics update"
+        )
+        self.prediction_counter = Counter(
+            "model_prediction_total", "Total predictions", label_names + ["status"],
+            registry=self.registry
+        )
+        self.latency_histogram = Histogram(
+            "model_prediction_latency", "Prediction latency (seconds)", label_names,
+            buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+
+        self.last_snapshot: Dict = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # 요청 경로 (가벼운 연산만)
+    # ------------------------------------------------------------------
+
+    def observe_prediction(self, X: np.ndarray, latency_sec: float) -> None:
+        """
+        성공한 예측 요청 기록
+
+        Args:
+            X: 요청 입력 (n_samples, n_features), 변환 전 원본
+            latency_sec: 요청 처리 시간 (초)
+        """
+        X = np.asarray(X)
+        self.prediction_counter.labels(**self._labels, status="success").inc()
+        self.latency_histogram.labels(**self._labels).observe(latency_sec)
+        self.latencies.extend([latency_sec])
+        if self.detector is not None:
+            self.inputs.extend(X)
+
+    def observe_error(self) -> None:
+        """실패한 예측 요청 기록"""
+        self.prediction_counter.labels(**self._labels, status="error").inc()
+
+    def record_feedback(self, y_true, y_pred) -> int:
+        """
+        정답 피드백 기록 (MAE / R² 계산용)
+
+        Args:
+            y_true: 실제값
+            y_pred: 같은 입력에 대한 모델 예측값
+
+        Returns:
+            기록한 쌍의 수
+        """
+        y_true = np.asarray(y_true, dtype=np.float64).reshape(-1)
+        y_pred = np.asarray(y_pred, dtype=np.float64).reshape(-1)
+        if y_true.shape != y_pred.shape:
+            raise ValueError(
+                f"Length mismatch: y_true={len(y_true)}, y_pred={len(y_pred)}"
+            )
+        self.labels.extend(np.column_stack([y_true, y_pred]))
+        return len(y_true)
+
+    # ------------------------------------------------------------------
+    # 백그라운드 계산
+    # ------------------------------------------------------------------
+
+    def compute(self) -> Dict:
+        """
+        윈도우 메트릭 계산 후 Gauge 갱신 (백그라운드 스레드에서 주기적으로 호출)
+
+        Returns:
+            계산 결과 스냅숏
+        """
+        cfg = self.config
+        snapshot: Dict = {"timestamp": time.time()}
+
+        pairs = self.labels.values()
+        self.window_gauge.labels(**self._labels, window="labels").set(len(pairs))
+        if len(pairs) >= cfg.min_samples:
+            metrics = self.monitor.compute_metrics(pairs[:, 0], pairs[:, 1], record=False)
+            is_healthy, warnings = self.monitor.check_performance(metrics)
+            self.mae_gauge.labels(**self._labels).set(metrics.mae)
+            self.r2_gauge.labels(**self._labels).set(metrics.r2)
+            snapshot["performance"] = {
+                **metrics.to_dict(), "healthy": is_healthy, "warnings": warnings
+            }
+
+        if self.detector is not None and self.detector.reference_data is not None:
+            inputs = self.inputs.values()
+            self.window_gauge.labels(**self._labels, window="inputs").set(len(inputs))
+            if len(inputs) >= cfg.min_samples:
+                _, results = self.detector.detect_drift(inputs)
+                summary = self.detector.get_drift_summary(results)
+                self.drift_score_gauge.labels(**self._labels).set(summary["drift_score"])
+                self.drifted_features_gauge.labels(**self._labels).set(
+                    summary["drifted_features"]
+                )
+                for result in results:
+                    self.feature_pvalue_gauge.labels(
+                        **self._labels, feature=result.feature_name
+                    ).set(result.p_value)
+                snapshot["drift"] = summary
+
+        latencies = self.latencies.values()
+        self.window_gauge.labels(**self._labels, window="latency").set(len(latencies))
+        if len(latencies):
+            values = np.quantile(latencies, LATENCY_QUANTILES)
+            for q, value in zip(LATENCY_QUANTILES, values):
+                self.latency_gauge.labels(**self._labels, quantile=str(q)).set(value)
+            snapshot["latency_ms"] = {
+                f"p{int(q * 100)}": round(float(v) * 1000, 3)
+                for q, v in zip(LATENCY_QUANTILES, values)
+            }
+
+        self.updated_gauge.labels(**self._labels).set(snapshot["timestamp"])
+        self.last_snapshot = snapshot
+        return snapshot
+
+    def start(self) -> None:
+        """interval_sec 간격 백그라운드 계산 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """백그라운드 계산 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.config.interval_sec):
+            try:
+                self.compute()
+            except Exception as e:
+                logger.error(f"Metrics computation failed: {e}")
+
+    # ------------------------------------------------------------------
+    # 노출
+    # ------------------------------------------------------------------
+
+    def render(self) -> Tuple[bytes, str]:
+        """Prometheus 텍스트 포맷 (본문, Content-Type)"""
+        from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+    def serve(self, port: int = 8000, addr: str = "0.0.0.0") -> None:
+        """
+        별도 포트에서 /metrics 노출 (기존 metrics-exporter와 같은 8000 포트 스크레이프 설정 재사용)
+
+        Args:
+            port: 포트
+            addr: 바인드 주소
+        """
+        from prometheus_client import start_http_server
+
+        start_http_server(port, addr=addr, registry=self.registry)
+        logger.info(f"Metrics exporter listening on {addr}:{port}/metrics")
+
+
+def create_exporter(
+    model_version: str = "v1.0",
+    reference_data: Optional[np.ndarray] = None,
+    feature_names: Optional[List[str]] = None,
+    config: Optional[ExporterConfig] = None,
+    mae_threshold: float = 0.45,
+    r2_threshold: float = 0.75,
+    start: bool = True
+) -> ModelMetricsExporter:
+    """
+    Exporter 생성 (편의 함수)
+
+    Args:
+        model_version: 모델 버전
+        reference_data: 드리프트 기준 데이터 (학습 입력, 없으면 드리프트 게이지 비활성)
+        feature_names: 특성 이름
+        config: Exporter 설정 (없으면 환경 변수에서 생성)
+        mae_threshold: ModelMonitor MAE 임계값
+        r2_threshold: ModelMonitor R² 임계값
+        start: 백그라운드 계산 바로 시작 여부
+
+    Returns:
+        ModelMetricsExporter
+    """
+    detector = None
+    if reference_data is not None:
+        detector = DriftDetector()
+        detector.set_reference(reference_data, feature_names)
+
+    exporter = ModelMetricsExporter(
+        config=config or ExporterConfig.from_env(),
+        model_version=model_version,
+        monitor=ModelMonitor(mae_threshold=mae_threshold, r2_threshold=r2_threshold),
+        detector=detector
+    )
+    if start:
+        exporter.start()
+    return exporter
@@ -0,0 +1,431 @@
+"""
+HTTP Load Testing Module
+
+서빙 앱(FastAPI)에 동시 요청을 보내 지연 시간 분포 / 처리량 / 오류율 측정
+- 대상: create_app() (California Housing) 또는 day2 Iris API (app/main.py)
+- 연결: 프로세스 내 ASGI 앱(httpx.ASGITransport) 또는 localhost URL
+- closed-loop: 동시 사용자 N명이 응답을 받자마자 다음 요청 (동시성 고정)
+- open-loop: 초당 rate건을 일정 간격으로 발사 (응답 지연과 무관하게 도착률 고정).
+  지연 시간은 예정 발사 시각부터 측정하므로 서버가 밀려도 대기 시간이 반영됨
+- 동시성 스윕: 처리량 증가가 멈추는 포화 지점 탐색
+"""
+
+import asyncio
+import io
+import json
+import time
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 버킷 상한 (ms, 로그 간격)
+HISTOGRAM_BOUNDS_MS = [
+    0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000
+]
+
+# 요청 본문 형식 (json: 행 JSON, binary: float32 바이트, npy: .npy 배열, columnar: 컬럼 JSON)
+PAYLOAD_FORMATS = ("json", "binary", "npy", "columnar")
+
+
+@dataclass
+class RequestSpec:
+    """HTTP 요청 한 건"""
+    path: str
+    content: bytes
+    headers: Dict[str, str]
+    rows: int
+
+
+@dataclass
+class LoadTestConfig:
+    """부하 테스트 설정"""
+    mode: str = "closed"
+    concurrency: int = 8
+    rate: float = 100.0
+    duration_sec: float = 10.0
+    max_requests: Optional[int] = None
+    batch_size: int = 1
+    payload_format: str = "json"
+    warmup_requests: int = 10
+    timeout_sec: float = 10.0
+    max_in_flight: int = 1000
+    seed: int = 42
+
+    def __post_init__(self):
+        if self.mode not in ("closed", "open"):
+            raise ValueError(f"Unsupported mode: {self.mode}. Supported: closed, open")
+        if self.payload_format not in PAYLOAD_FORMATS:
+            raise ValueError(
+                f"Unsupported payload format: {self.payload_format}. "
+                f"Supported: {list(PAYLOAD_FORMATS)}"
+            )
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+
+
+@dataclass
+class LoadTestResult:
+    """부하 테스트 결과"""
+    config: LoadTestConfig
+    latencies_ms: np.ndarray = field(repr=False)
+    status_counts: Dict[str, int]
+    elapsed_sec: float
+    rows: int
+    dropped: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms)
+
+    @property
+    def errors(self) -> int:
+        return sum(
+            count for status, count in self.status_counts.items()
+            if not status.startswith("2")
+        )
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def throughput_rps(self) -> float:
+        """성공 요청 기준 초당 요청 수"""
+        return (self.requests - self.errors) / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """지연 시간 분위수 (ms)"""
+        return float(np.percentile(self.latencies_ms, q)) if self.requests else 0.0
+
+    def histogram(self) -> List[Tuple[str, int]]:
+        """지연 시간 히스토그램 [(버킷 레이블, 요청 수), ...]"""
+        bounds = HISTOGRAM_BOUNDS_MS
+        counts = np.bincount(
+            np.searchsorted(bounds, self.latencies_ms, side="left"),
+            minlength=len(bounds) + 1
+        )
+        labels = [f"<= {b:g} ms" for b in bounds] + [f"> {bounds[-1]:g} ms"]
+        return list(zip(labels, counts.tolist()))
+
+    def render_histogram(self, width: int = 40) -> str:
+        """텍스트 막대 그래프"""
+        histogram = [(label, count) for label, count in self.histogram() if count]
+        peak = max((count for _, count in histogram), default=1)
+        return "\n".join(
+            f"  {label:>12} | {'#' * max(1, round(count / peak * width)):<{width}} {count}"
+            for label, count in histogram
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "config": asdict(self.config),
+            "requests": self.requests,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "error_rate": round(self.error_rate, 4),
+            "status_counts": dict(self.status_counts),
+            "elapsed_sec": round(self.elapsed_sec, 3),
+            "throughput_rps": round(self.throughput_rps, 2),
+            "rows_per_sec": round(self.rows_per_sec, 2),
+            "latency_ms": {
+                "p50": round(self.percentile(50), 3),
+                "p90": round(self.percentile(90), 3),
+                "p99": round(self.percentile(99), 3),
+                "max": round(float(self.latencies_ms.max()), 3) if self.requests else 0.0
+            },
+            "histogram": dict(self.histogram())
+        }
+
+
+def housing_requests(batch_size: int, payload_format: str, seed: int = 42,
+                     pool_size: int = 16) -> List[RequestSpec]:
+    """
+    California Housing API(create_app) 요청 생성
+
+    json: POST /predict {"instances": [[8개 특성], ...]}
+    binary: POST /predict/binary (float32 행 우선 배열)
+    """
+    if payload_format not in ("json", "binary"):
+        raise ValueError(
+            f"Unsupported payload format for housing: {payload_format}. "
+            f"Supported: ['json', 'binary']"
+        )
+
+    rng = np.random.default_rng(seed)
+    base = np.array([3.87, 28.6, 5.43, 1.10, 1425.0, 3.07, 35.6, -119.6])
+    scale = np.array([1.9, 12.6, 2.5, 0.47, 1132.0, 10.4, 2.1, 2.0])
+
+    specs = []
+    for _ in range(pool_size):
+        X = base + scale * rng.standard_normal((batch_size, 8)) * 0.3
+        if payload_format == "binary":
+            specs.append(RequestSpec(
+                path="/predict/binary",
+                content=X.astype("<f4").tobytes(),
+                headers={"Content-Type": "application/octet-stream", "X-Dtype": "float32"},
+                rows=batch_size
+            ))
+        else:
+            specs.append(RequestSpec(
+                path="/predict",
+                content=_json_bytes({"instances": X.round(4).tolist()}),
+                headers={"Content-Type": "application/json"},
+                rows=batch_size
+            ))
+    return specs
+
+
+def iris_requests(batch_size: int, payload_format: str, seed: int = 42,
+                  pool_size: int = 16) -> List[RequestSpec]:
+    """
+    day2 Iris API(app/main.py) 요청 생성
+
+    json: batch_size 1은 POST /predict, 그 외는 POST /predict/batch (행 객체 리스트)
+    binary: POST /predict/columnar?dtype=float32 (float32 행 우선 바이트)
+    npy: POST /predict/columnar (np.save로 저장한 float32 (n, 4) 배열)
+    columnar: POST /predict/columnar {"sepal_length": [...], ...}
+    """
+    if payload_format not in PAYLOAD_FORMATS:
+        raise ValueError(
+            f"Unsupported payload format: {payload_format}. Supported: {list(PAYLOAD_FORMATS)}"
+        )
+
+    rng = np.random.default_rng(seed)
+    names = ["sepal_length", "sepal_width", "petal_length", "petal_width"]
+    specs = []
+    for _ in range(pool_size):
+        X = rng.uniform([4.3, 2.0, 1.0, 0.1], [7.9, 4.4, 6.9, 2.5], size=(batch_size, 4)).round(2)
+        if payload_format == "binary":
+            spec = RequestSpec(
+                path="/predict/columnar?dtype=float32",
+                content=X.astype("<f4").tobytes(),
+                headers={"Content-Type": "application/octet-stream"},
+                rows=batch_size
+            )
+        elif payload_format == "npy":
+            buffer = io.BytesIO()
+            np.save(buffer, X.astype("<f4"), allow_pickle=False)
+            spec = RequestSpec(
+                path="/predict/columnar",
+                content=buffer.getvalue(),
+                headers={"Content-Type": "application/x-npy"},
+                rows=batch_size
+            )
+        elif payload_format == "columnar":
+            spec = RequestSpec(
+                path="/predict/columnar",
+                content=_json_bytes(dict(zip(names, X.T.tolist()))),
+                headers={"Content-Type": "application/json"},
+                rows=batch_size
+            )
+        else:
+            rows = [dict(zip(names, row)) for row in X.tolist()]
+            spec = RequestSpec(
+                path="/predict" if batch_size == 1 else "/predict/batch",
+                content=_json_bytes(rows[0] if batch_size == 1 else rows),
+                headers={"Content-Type": "application/json"},
+                rows=batch_size
+            )
+        specs.append(spec)
+    return specs
+
+
+TARGETS: Dict[str, Callable[..., List[RequestSpec]]] = {
+    "housing": housing_requests,
+    "iris": iris_requests,
+}
+
+
+def _json_bytes(payload) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
+
+def _make_client(target, timeout_sec: float, max_connections: int):
+    """ASGI 앱이면 프로세스 내 전송, 문자열이면 localhost URL 클라이언트"""
+    import httpx
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    if isinstance(target, str):
+        return httpx.AsyncClient(base_url=target, timeout=timeout_sec, limits=limits)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=target),
+        base_url="http://loadtest",
+        timeout=timeout_sec,
+        limits=limits
+    )
+
+
+async def _send(client, spec: RequestSpec) -> str:
+    """요청 한 건 전송 → 상태 코드 문자열 (예외는 예외 클래스 이름)"""
+    try:
+        response = await client.post(spec.path, content=spec.content, headers=spec.headers)
+        return str(response.status_code)
+    except Exception as e:
+        return type(e).__name__
+
+
+async def run_load_test_async(
+    target,
+    requests: Sequence[RequestSpec],
+    config: LoadTestConfig
+) -> LoadTestResult:
+    """
+    부하 테스트 실행 (비동기)
+
+    Args:
+        target: ASGI 앱 또는 base URL (예: "http://localhost:8000")
+        requests: 순환하며 보낼 요청 목록
+        config: 부하 테스트 설정
+
+    Returns:
+        LoadTestResult
+    """
+    connections = config.concurrency if config.mode == "closed" else config.max_in_flight
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    rows = 0
+    dropped = 0
+
+    async with _make_client(target, config.timeout_sec, connections) as client:
+        for i in range(config.warmup_requests):
+            await _send(client, requests[i % len(requests)])
+
+        start = time.perf_counter()
+        deadline = start + config.duration_sec
+        limit = config.max_requests or float("inf")
+        issued = 0
+
+        def record(status: str, latency_ms: float, spec: RequestSpec):
+            nonlocal rows
+            latencies.append(latency_ms)
+            statuses[status] = statuses.get(status, 0) + 1
+            if status.startswith("2"):
+                rows += spec.rows
+
+        if config.mode == "closed":
+            async def user():
+                nonlocal issued
+                while time.perf_counter() < deadline and issued < limit:
+                    spec = requests[issued % len(requests)]
+                    issued += 1
+                    sent = time.perf_counter()
+                    status = await _send(client, spec)
+                    record(status, (time.perf_counter() - sent) * 1000, spec)
+
+            await asyncio.gather(*(user() for _ in range(config.concurrency)))
+        else:
+            in_flight = set()
+            interval = 1.0 / config.rate
+
+            async def fire(spec: RequestSpec, scheduled: float):
+                status = await _send(client, spec)
+                record(status, (time.perf_counter() - scheduled) * 1000, spec)
+
+            while issued < limit:
+                scheduled = start + issued * interval
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                spec = requests[issued % len(requests)]
+                issued += 1
+                if len(in_flight) >= config.max_in_flight:
+                    dropped += 1
+                    continue
+                task = asyncio.ensure_future(fire(spec, scheduled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+
+        elapsed = time.perf_counter() - start
+
+    return LoadTestResult(
+        config=config,
+        latencies_ms=np.asarray(latencies, dtype=np.float64),
+        status_counts=statuses,
+        elapsed_sec=elapsed,
+        rows=rows,
+        dropped=dropped
+    )
+
+
+def run_load_test(
+    target,
+    config: LoadTestConfig,
+    profile: Union[str, Callable[..., List[RequestSpec]]] = "housing"
+) -> LoadTestResult:
+    """
+    부하 테스트 실행 편의 함수
+
+    Args:
+        target: ASGI 앱(create_app() 결과 등) 또는 base URL
+        config: 부하 테스트 설정
+        profile: 요청 생성기 이름("housing", "iris") 또는 함수
+
+    Returns:
+        LoadTestResult
+    """
+    make_requests = TARGETS[profile] if isinstance(profile, str) else profile
+    requests = make_requests(config.batch_size, config.payload_format, seed=config.seed)
+    return asyncio.run(run_load_test_async(target, requests, config))
+
+
+def sweep_concurrency(
+    target,
+    levels: Sequence[int],
+    config: LoadTestConfig,
+    profile: Union[str, Callable[..., List[RequestSpec]]] = "housing",
+    min_gain: float = 0.05
+) -> Tuple[List[LoadTestResult], Optional[int]]:
+    """
+    closed-loop 동시성 스윕으로 포화 지점 탐색
+
+    Args:
+        target: ASGI 앱 또는 base URL
+        levels: 동시 사용자 수 목록 (오름차순)
+        config: 기본 설정 (mode/concurrency는 덮어씀)
+        profile: 요청 생성기
+        min_gain: 이 비율 미만으로 처리량이 늘면 포화로 판정
+
+    Returns:
+        (단계별 결과, 포화 동시성 또는 None)
+    """
+    results = []
+    for level in levels:
+        step = LoadTestConfig(**{**asdict(config), "mode": "closed", "concurrency": level})
+        result = run_load_test(target, step, profile)
+        logger.info(
+            f"concurrency={level}: {result.throughput_rps:.1f} req/s, "
+            f"p99={result.percentile(99):.2f} ms, errors={result.error_rate:.2%}"
+        )
+        results.append(result)
+    return results, find_saturation(results, min_gain)
+
+
+def find_saturation(results: Sequence[LoadTestResult], min_gain: float = 0.05) -> Optional[int]:
+    """
+    처리량 증가율이 min_gain 미만이 되는 첫 동시성 (그 이전 단계가 포화 지점)
+
+    Args:
+        results: 동시성 오름차순 결과
+        min_gain: 최소 처리량 증가율
+
+    Returns:
+        포화 동시성 (끝까지 처리량이 늘면 None)
+    """
+    for previous, current in zip(results, results[1:]):
+        if previous.throughput_rps <= 0:
+            continue
+        if current.throughput_rps / previous.throughput_rps - 1 < min_gain:
+            return previous.config.concurrency
+    return None
@@ -32,3 +32,12 @@ def sample_batch_features():
         [5.6431, 52.0, 5.817352, 1.073059, 558.0, 2.547945, 37.85, -122.25],
         [3.8462, 35.0, 6.281853, 1.081081, 565.0, 2.181467, 37.85, -122.26]
     ]
+
+
+@pytest.fixture(scope="session")
+def synthetic_housing_data():
+    """California Housing 형태(8개 특성)의 합성 회귀 데이터"""
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(2000, 8))
+    y = 2.0 + X[:, 0] + 0.5 * np.sin(X[:, 1]) + 0.1 * rng.normal(size=2000)
+    return X[:1600], X[1600:], y[:1600], y[1600:]
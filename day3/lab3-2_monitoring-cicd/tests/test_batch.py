@@ -0,0 +1,196 @@
+"""
+Test cases for batch scoring
+"""
+
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.model.batch import BatchScorer, plan_chunks, score_batch
+from src.model.features import FeaturePipeline
+from src.model.trainer import CaliforniaHousingModel
+
+
+@pytest.fixture(scope="module")
+def fitted_model(synthetic_housing_data):
+    """학습된 RandomForest 모델 fixture"""
+    X_train, _, y_train, _ = synthetic_housing_data
+    model = CaliforniaHousingModel(
+        model_type="random_forest",
+        model_params={"n_estimators": 10, "max_depth": 6, "random_state": 42}
+    )
+    model.train(X_train, y_train)
+    return model
+
+
+@pytest.fixture
+def parquet_features(tmp_path, synthetic_housing_data):
+    """row group 100행짜리 Parquet 피처 파일"""
+    X_train, _, _, _ = synthetic_housing_data
+    path = str(tmp_path / "features.parquet")
+    pd.DataFrame(X_train, columns=CaliforniaHousingModel.FEATURE_NAMES).to_parquet(
+        path, row_group_size=100
+    )
+    return path, X_train
+
+
+def read_predictions(output_dir):
+    """출력 디렉터리의 예측을 row_id 순으로 읽기"""
+    df = pd.read_parquet(output_dir)
+    return df.sort_values("row_id")["prediction"].to_numpy()
+
+
+class TestPlanChunks:
+    """청크 분할 테스트"""
+
+    def test_npy_chunks(self, tmp_path, synthetic_housing_data):
+        """npy 입력은 chunk_size 행 단위로 분할"""
+        X_train, _, _, _ = synthetic_housing_data
+        path = str(tmp_path / "features.npy")
+        np.save(path, X_train)
+
+        chunks = plan_chunks(path, chunk_size=700)
+
+        assert [(c.start, c.stop) for c in chunks] == [(0, 700), (700, 1400), (1400, 1600)]
+
+    def test_parquet_chunks_follow_row_groups(self, parquet_features):
+        """Parquet 입력은 row group 경계에 맞춰 묶음"""
+        path, X = parquet_features
+
+        chunks = plan_chunks(path, chunk_size=250)
+
+        assert all(c.num_rows == 300 for c in chunks[:-1])
+        assert sum(c.num_rows for c in chunks) == len(X)
+        assert chunks[1].row_groups == (3, 4, 5)
+
+    def test_missing_columns(self, tmp_path):
+        """피처 컬럼 누락 시 에러"""
+        path = str(tmp_path / "bad.parquet")
+        pd.DataFrame({"MedInc": [1.0]}).to_parquet(path)
+
+        with pytest.raises(ValueError, match="Missing feature columns"):
+            plan_chunks(path, chunk_size=10)
+
+    def test_unsupported_format(self, tmp_path):
+        """지원하지 않는 입력 형식 에러"""
+        with pytest.raises(ValueError, match="Unsupported input format"):
+            plan_chunks(str(tmp_path / "features.csv"), chunk_size=10)
+
+
+class TestBatchScorer:
+    """BatchScorer 테스트"""
+
+    @pytest.mark.parametrize("compile_model", [True, False])
+    def test_parquet_parity(self, fitted_model, parquet_features, tmp_path, compile_model):
+        """병렬 배치 예측이 단일 predict 결과와 일치"""
+        path, X = parquet_features
+        scorer = BatchScorer(
+            fitted_model, n_workers=2, chunk_size=400, compile_model=compile_model
+        )
+
+        result = scorer.score(path, str(tmp_path / "out"))
+
+        assert result.total_rows == result.scored_rows == len(X)
+        assert result.skipped_chunks == 0
+        assert result.rows_per_sec > 0
+        np.testing.assert_allclose(
+            read_predictions(str(tmp_path / "out")), fitted_model.predict(X), rtol=1e-10
+        )
+
+    def test_npy_with_feature_pipeline(self, synthetic_housing_data, tmp_path):
+        """피처 파이프라인 포함 모델의 npy 입력 예측"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="gradient_boosting",
+            model_params={"n_estimators": 10, "max_depth": 3, "random_state": 42},
+            feature_pipeline=FeaturePipeline(CaliforniaHousingModel.FEATURE_NAMES)
+        )
+        model.train(X_train, y_train)
+        path = str(tmp_path / "features.npy")
+        np.save(path, X_test)
+
+        result = BatchScorer(model, n_workers=2, chunk_size=150).score(
+            path, str(tmp_path / "out")
+        )
+
+        assert result.num_chunks == 3
+        np.testing.assert_allclose(
+            read_predictions(str(tmp_path / "out")), model.predict(X_test), rtol=1e-10
+        )
+
+    def test_resume_skips_scored_chunks(self, fitted_model, parquet_features, tmp_path):
+        """재실행 시 누락된 청크만 다시 예측"""
+        path, X = parquet_features
+        output_dir = str(tmp_path / "out")
+        scorer = BatchScorer(fitted_model, n_workers=2, chunk_size=400)
+        first = scorer.score(path, output_dir)
+
+        os.remove(first.files[1])
+        second = scorer.score(path, output_dir)
+
+        assert second.skipped_chunks == first.num_chunks - 1
+        assert second.scored_rows == 400
+        np.testing.assert_allclose(read_predictions(output_dir), fitted_model.predict(X))
+
+    def test_resume_rejects_different_job(self, fitted_model, parquet_features, tmp_path):
+        """청크 설정이 다른 작업으로 이어서 실행하면 에러"""
+        path, _ = parquet_features
+        output_dir = str(tmp_path / "out")
+        BatchScorer(fitted_model, n_workers=1, chunk_size=400).score(path, output_dir)
+
+        with pytest.raises(ValueError, match="different job"):
+            BatchScorer(fitted_model, n_workers=1, chunk_size=200).score(path, output_dir)
+
+        result = BatchScorer(fitted_model, n_workers=1, chunk_size=200).score(
+            path, output_dir, resume=False
+        )
+        assert result.skipped_chunks == 0
+        assert len(os.listdir(output_dir)) == result.num_chunks + 1
+
+    def test_resume_rejects_different_model(self, fitted_model, parquet_features, tmp_path):
+        """모델 파일을 다시 학습/저장하거나 컴파일 여부를 바꾸면 이어서 실행하지 않음"""
+        path, _ = parquet_features
+        model_path = str(tmp_path / "model.joblib")
+        output_dir = str(tmp_path / "out")
+        fitted_model.save(model_path)
+        score_batch(model_path, path, output_dir, chunk_size=400, n_workers=1)
+
+        with pytest.raises(ValueError, match="different job"):
+            score_batch(model_path, path, output_dir, chunk_size=400, n_workers=1,
+                        compile_model=True)
+
+        stat = os.stat(model_path)
+        os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with pytest.raises(ValueError, match="different job"):
+            score_batch(model_path, path, output_dir, chunk_size=400, n_workers=1)
+
+    def test_resume_rejects_different_model_object(self, fitted_model, parquet_features,
+                                                   synthetic_housing_data, tmp_path):
+        """메모리의 다른 모델로 이어서 실행하면 에러"""
+        path, _ = parquet_features
+        output_dir = str(tmp_path / "out")
+        BatchScorer(fitted_model, n_workers=1, chunk_size=400).score(path, output_dir)
+
+        X_train, _, y_train, _ = synthetic_housing_data
+        other = CaliforniaHousingModel(model_type="linear_regression")
+        other.train(X_train, y_train)
+        with pytest.raises(ValueError, match="different job"):
+            BatchScorer(other, n_workers=1, chunk_size=400).score(path, output_dir)
+
+    def test_score_batch_from_file(self, fitted_model, parquet_features, tmp_path):
+        """저장된 모델 파일로 배치 예측"""
+        path, X = parquet_features
+        model_path = str(tmp_path / "model.joblib")
+        fitted_model.save(model_path)
+
+        result = score_batch(model_path, path, str(tmp_path / "out"), chunk_size=800, n_workers=2)
+
+        assert result.to_dict()["scored_rows"] == len(X)
+        np.testing.assert_allclose(read_predictions(str(tmp_path / "out")), fitted_model.predict(X))
+
+    def test_unfitted_model(self):
+        """학습되지 않은 모델 에러"""
+        with pytest.raises(RuntimeError):
+            BatchScorer(CaliforniaHousingModel())
@@ -0,0 +1,122 @@
+"""
+Test cases for compiled tree predictor
+"""
+
+import os
+import tempfile
+
+import pytest
+import numpy as np
+from sklearn.ensemble import ExtraTreesRegressor
+
+from src.model.compiled import CompiledForest
+from src.model.trainer import CaliforniaHousingModel
+from src.serving.api import ModelServer
+
+
+@pytest.fixture(scope="module", params=["random_forest", "gradient_boosting"])
+def fitted_model(request, synthetic_housing_data):
+    """학습된 트리 앙상블 모델 fixture"""
+    X_train, _, y_train, _ = synthetic_housing_data
+    model = CaliforniaHousingModel(
+        model_type=request.param,
+        model_params={"n_estimators": 20, "max_depth": 6, "random_state": 42}
+    )
+    model.train(X_train, y_train)
+    return model
+
+
+class TestCompiledForest:
+    """CompiledForest 테스트"""
+
+    def test_parity_batch(self, fitted_model, synthetic_housing_data):
+        """배치 예측 결과 일치 테스트"""
+        _, X_test, _, _ = synthetic_housing_data
+        compiled = fitted_model.compile()
+
+        np.testing.assert_allclose(
+            compiled.predict(X_test), fitted_model.predict(X_test), rtol=1e-10
+        )
+
+    def test_parity_single_row(self, fitted_model, sample_features):
+        """단일 샘플(1차원) 예측 결과 일치 테스트"""
+        compiled = fitted_model.compile()
+
+        prediction = compiled.predict(sample_features)
+
+        assert prediction.shape == (1,)
+        np.testing.assert_allclose(prediction, fitted_model.predict(sample_features))
+
+    def test_parity_small_batch_size(self, fitted_model, synthetic_housing_data):
+        """내부 배치 분할 시 결과 일치 테스트"""
+        _, X_test, _, _ = synthetic_housing_data
+        compiled = fitted_model.compile(batch_size=7)
+
+        np.testing.assert_allclose(
+            compiled.predict(X_test), fitted_model.predict(X_test), rtol=1e-10
+        )
+
+    def test_extra_trees_with_missing_values(self, synthetic_housing_data):
+        """ExtraTrees 및 결측값 처리 일치 테스트"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        estimator = ExtraTreesRegressor(n_estimators=10, random_state=42)
+        estimator.fit(X_train, y_train)
+
+        X_missing = X_test.copy()
+        X_missing[::5, 0] = np.nan
+        compiled = CompiledForest.from_sklearn(estimator)
+
+        np.testing.assert_allclose(
+            compiled.predict(X_test), estimator.predict(X_test), rtol=1e-10
+        )
+        assert np.allclose(compiled.predict(X_missing), estimator.predict(X_missing))
+
+    def test_wrong_features(self, fitted_model):
+        """잘못된 특성 수 오류 테스트"""
+        compiled = fitted_model.compile()
+
+        with pytest.raises(ValueError) as exc_info:
+            compiled.predict([[1, 2, 3]])
+
+        assert "Expected 8 features" in str(exc_info.value)
+
+    def test_unsupported_model(self, synthetic_housing_data):
+        """지원하지 않는 모델 컴파일 오류 테스트"""
+        X_train, _, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X_train, y_train)
+
+        with pytest.raises(TypeError) as exc_info:
+            model.compile()
+
+        assert "Unsupported model" in str(exc_info.value)
+
+    def test_compile_without_training(self):
+        """학습 없이 컴파일 시 오류 테스트"""
+        with pytest.raises(RuntimeError) as exc_info:
+            CaliforniaHousingModel().compile()
+
+        assert "not fitted" in str(exc_info.value)
+
+    def test_save_and_load(self, fitted_model, synthetic_housing_data):
+        """컴파일 모델 저장 및 로드 테스트"""
+        _, X_test, _, _ = synthetic_housing_data
+        compiled = fitted_model.compile()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "compiled.npz")
+            compiled.save(filepath)
+            loaded = CompiledForest.load(filepath)
+
+        np.testing.assert_array_equal(loaded.predict(X_test), compiled.predict(X_test))
+        assert loaded.to_dict() == compiled.to_dict()
+
+    def test_model_server_integration(self, fitted_model, sample_batch_features):
+        """ModelServer에 컴파일 모델 연결 테스트"""
+        server = ModelServer(model=fitted_model.compile())
+
+        response = server.predict(sample_batch_features)
+
+        np.testing.assert_allclose(
+            response.predictions, fitted_model.predict(sample_batch_features)
+        )
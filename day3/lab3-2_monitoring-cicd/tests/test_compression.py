@@ -0,0 +1,218 @@
+"""
+Test cases for model compression module
+"""
+
+import json
+import os
+import tempfile
+
+import pytest
+import numpy as np
+
+from src.model.compression import (
+    ModelCompressor,
+    compressed_path,
+    save_compression_report
+)
+from src.model.trainer import CaliforniaHousingModel
+
+
+@pytest.fixture(scope="module")
+def forest_model(synthetic_housing_data):
+    """학습된 RandomForest 모델 fixture"""
+    X_train, _, y_train, _ = synthetic_housing_data
+    model = CaliforniaHousingModel(
+        model_type="random_forest",
+        model_params={"n_estimators": 30, "max_depth": 10, "random_state": 42}
+    )
+    model.train(X_train, y_train)
+    return model
+
+
+class TestModelCompressor:
+    """ModelCompressor 테스트"""
+
+    def test_compress_random_forest(self, forest_model, synthetic_housing_data):
+        """RandomForest 압축 후보 생성 및 선택 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        # 허용 범위를 넉넉히 두어 모든 후보가 수용되도록 고정
+        compressor = ModelCompressor(
+            mae_tolerance=1.0, tree_counts=(5, 10), max_depths=(6,),
+            latency_iterations=5
+        )
+
+        report = compressor.compress(forest_model.model, X_train, y_train, X_test, y_test)
+
+        names = [c.name for c in report.candidates]
+        assert names == ["pruned_5", "pruned_10", "depth_6", "distilled_gbm"]
+        assert report.baseline.n_trees == 30
+        assert all(c.accepted for c in report.candidates)
+        assert report.selected is not None
+        assert report.selected.mae <= report.mae_budget
+        assert report.selected.latency_ms == min(c.latency_ms for c in report.candidates)
+
+    def test_test_set_reported_not_used_for_selection(self, forest_model, synthetic_housing_data):
+        """테스트 세트는 최종 MAE 보고에만 쓰이고 선택에는 영향이 없는지 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        X_fit, X_val, y_fit, y_val = X_train[:600], X_train[600:], y_train[:600], y_train[600:]
+        compressor = ModelCompressor(
+            mae_tolerance=0.05, tree_counts=(10,), max_depths=(), distill=False,
+            latency_iterations=5
+        )
+
+        without_test = compressor.compress(forest_model.model, X_fit, y_fit, X_val, y_val)
+        with_test = compressor.compress(
+            forest_model.model, X_fit, y_fit, X_val, y_val, X_test=X_test, y_test=y_test
+        )
+
+        assert without_test.candidates[0].test_mae is None
+        assert with_test.candidates[0].mae == without_test.candidates[0].mae
+        assert with_test.candidates[0].accepted == without_test.candidates[0].accepted
+        expected = np.abs(with_test.candidates[0].model.predict(X_test) - y_test).mean()
+        assert with_test.candidates[0].test_mae == pytest.approx(expected)
+        assert "test_mae" in with_test.to_dict()["baseline"]
+        assert "test MAE" in with_test.summary()
+
+    def test_pruning_ranks_trees_out_of_bag(self, forest_model, synthetic_housing_data):
+        """RF 트리 순위는 OOB로 매기고 검증 데이터에는 영향을 받지 않는지 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        compressor = ModelCompressor(
+            tree_counts=(10,), max_depths=(), distill=False, latency_iterations=5
+        )
+        estimators = forest_model.model.estimators_
+
+        report = compressor.compress(forest_model.model, X_train, y_train, X_test, y_test)
+        shuffled = compressor.compress(
+            forest_model.model, X_train, y_train, X_test, np.random.default_rng(0).permutation(y_test)
+        )
+
+        kept = [estimators.index(tree) for tree in report.candidates[0].model.estimators_]
+        assert kept == [estimators.index(tree) for tree in shuffled.candidates[0].model.estimators_]
+        tree_mae = ModelCompressor._oob_tree_mae(forest_model.model, X_train, y_train)
+        assert kept == sorted(np.argsort(tree_mae)[:10].tolist())
+
+    def test_pruning_without_oob_keeps_first_trees(self, forest_model, synthetic_housing_data):
+        """학습 데이터가 아니어서 OOB를 복원할 수 없으면 앞쪽 트리 유지"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        compressor = ModelCompressor(
+            tree_counts=(10,), max_depths=(), distill=False, latency_iterations=5
+        )
+
+        report = compressor.compress(
+            forest_model.model, X_train[:600], y_train[:600], X_test, y_test
+        )
+
+        assert ModelCompressor._oob_tree_mae(forest_model.model, X_train[:600], y_train[:600]) is None
+        assert report.candidates[0].model.estimators_ == forest_model.model.estimators_[:10]
+
+    def test_compress_gradient_boosting_prunes_stages(self, synthetic_housing_data):
+        """GBM 스테이지 가지치기 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="gradient_boosting",
+            model_params={"n_estimators": 40, "max_depth": 3, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+        compressor = ModelCompressor(tree_counts=(20,), distill=False, latency_iterations=5)
+
+        report = compressor.compress(model.model, X_train, y_train, X_test, y_test)
+
+        pruned = report.candidates[0]
+        assert pruned.name == "pruned_20"
+        np.testing.assert_allclose(
+            pruned.model.predict(X_test),
+            list(model.model.staged_predict(X_test))[19]
+        )
+
+    def test_no_candidate_within_tolerance(self, forest_model, synthetic_housing_data):
+        """허용 범위 내 후보가 없을 때 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        compressor = ModelCompressor(
+            mae_tolerance=-0.5, tree_counts=(5,), max_depths=(), distill=False,
+            latency_iterations=5
+        )
+
+        report = compressor.compress(forest_model.model, X_train, y_train, X_test, y_test)
+
+        assert report.selected is None
+        assert not any(c.accepted for c in report.candidates)
+
+    def test_unsupported_model(self, synthetic_housing_data):
+        """지원하지 않는 모델 압축 오류 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X_train, y_train)
+
+        with pytest.raises(TypeError):
+            ModelCompressor().compress(model.model, X_train, y_train, X_test, y_test)
+
+
+class TestCompressModel:
+    """CaliforniaHousingModel.compress 테스트"""
+
+    def test_compressed_model_save_and_load(self, forest_model, synthetic_housing_data):
+        """압축 모델을 원본 옆에 저장 및 로드 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+
+        compressed, report = forest_model.compress(
+            X_train, y_train, X_test, y_test,
+            mae_tolerance=1.0, tree_counts=(5,), max_depths=(), latency_iterations=5
+        )
+
+        assert compressed is not None
+        assert compressed.is_fitted is True
+        assert compressed.model is report.selected.model
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "model.joblib")
+            forest_model.save(filepath)
+            compressed.save(compressed_path(filepath))
+            report_path = save_compression_report(report, filepath)
+
+            assert os.path.exists(os.path.join(tmpdir, "model_compressed.joblib"))
+            loaded = CaliforniaHousingModel.load(compressed_path(filepath))
+            with open(report_path) as f:
+                saved_report = json.load(f)
+
+        np.testing.assert_allclose(loaded.predict(X_test), compressed.predict(X_test))
+        assert saved_report["selected"] == report.selected.name
+        assert "mae_budget" in saved_report
+
+    def test_compress_without_training(self, synthetic_housing_data):
+        """학습 없이 압축 시 오류 테스트"""
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+
+        with pytest.raises(RuntimeError) as exc_info:
+            CaliforniaHousingModel().compress(X_train, y_train, X_test, y_test)
+
+        assert "not fitted" in str(exc_info.value)
+
+
+class TestTrainModelCompression:
+    """train_model(compress=True) 테스트"""
+
+    def test_validation_split_from_train(self, synthetic_housing_data, monkeypatch):
+        """가지치기 / 수용 판단에 테스트 세트가 아닌 학습 데이터 검증 fold를 쓰는지 테스트"""
+        from src.model import trainer
+
+        X_train, X_test, y_train, y_test = synthetic_housing_data
+        monkeypatch.setattr(
+            trainer.CaliforniaHousingModel, "load_data",
+            lambda self, test_size=0.2: (X_train, X_test, y_train, y_test)
+        )
+        calls = {}
+        original = ModelCompressor.compress
+
+        def spy(self, estimator, X_fit, y_fit, X_val, y_val, X_test=None, y_test=None):
+            calls.update(X_fit=X_fit, X_val=X_val, X_test=X_test)
+            return original(self, estimator, X_fit, y_fit, X_val, y_val, X_test, y_test)
+
+        monkeypatch.setattr(ModelCompressor, "compress", spy)
+
+        trainer.train_model(model_type="random_forest", compress=True, validation_size=0.25)
+
+        test_rows = {row.tobytes() for row in X_test}
+        assert len(calls["X_val"]) == len(X_train) // 4
+        assert len(calls["X_fit"]) + len(calls["X_val"]) == len(X_train)
+        assert not any(row.tobytes() in test_rows for row in calls["X_val"])
+        np.testing.assert_array_equal(calls["X_test"], X_test)
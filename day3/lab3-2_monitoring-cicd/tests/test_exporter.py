@@ -0,0 +1,217 @@
+"""
+Test cases for embedded metrics exporter
+"""
+
+import time
+
+import pytest
+import numpy as np
+
+pytest.importorskip("prometheus_client")
+
+from src.model.trainer import CaliforniaHousingModel  # noqa: E402
+from src.serving.api import ModelServer  # noqa: E402
+from src.serving.exporter import (  # noqa: E402
+    ExporterConfig,
+    ModelMetricsExporter,
+    RingBuffer,
+    create_exporter
+)
+
+
+def sample(exporter, name, **labels):
+    """레지스트리에서 메트릭 값 조회"""
+    all_labels = {**exporter._labels, **labels}
+    return exporter.registry.get_sample_value(name, all_labels)
+
+
+@pytest.fixture(scope="module")
+def trained_model(synthetic_housing_data):
+    """학습된 모델 fixture"""
+    X_train, _, y_train, _ = synthetic_housing_data
+    model = CaliforniaHousingModel(
+        model_type="random_forest",
+        model_params={"n_estimators": 10, "max_depth": 6, "random_state": 42}
+    )
+    model.train(X_train, y_train)
+    return model
+
+
+@pytest.fixture
+def exporter(synthetic_housing_data):
+    """학습 입력을 드리프트 기준으로 쓰는 exporter (백그라운드 미시작)"""
+    X_train, _, _, _ = synthetic_housing_data
+    return create_exporter(
+        reference_data=X_train,
+        config=ExporterConfig(user_id="user01", namespace="kubeflow-user01", min_samples=20),
+        start=False
+    )
+
+
+class TestRingBuffer:
+    """RingBuffer 테스트"""
+
+    def test_keeps_latest(self):
+        """최근 capacity개만 오래된 순으로 유지"""
+        buffer = RingBuffer(5)
+        buffer.extend([1, 2, 3])
+        buffer.extend([4, 5, 6, 7])
+
+        np.testing.assert_array_equal(buffer.values(), [3, 4, 5, 6, 7])
+        assert len(buffer) == 5
+
+    def test_rows(self):
+        """2차원 행 추가 테스트"""
+        buffer = RingBuffer(3)
+        buffer.extend(np.arange(8).reshape(4, 2))
+
+        np.testing.assert_array_equal(buffer.values(), [[2, 3], [4, 5], [6, 7]])
+
+    def test_shape_mismatch(self):
+        """행 모양 불일치 오류 테스트"""
+        buffer = RingBuffer(3)
+        buffer.extend([[1.0, 2.0]])
+        with pytest.raises(ValueError, match="Row shape mismatch"):
+            buffer.extend([[1.0, 2.0, 3.0]])
+
+    def test_empty(self):
+        """빈 버퍼 테스트"""
+        assert len(RingBuffer(3).values()) == 0
+
+
+class TestModelMetricsExporter:
+    """ModelMetricsExporter 테스트"""
+
+    def test_from_env(self, monkeypatch):
+        """환경 변수 설정 테스트"""
+        monkeypatch.setenv("USER_NUM", "07")
+        monkeypatch.setenv("EXPORTER_INTERVAL_SEC", "5")
+        config = ExporterConfig.from_env()
+
+        assert config.user_id == "user07"
+        assert config.namespace == "kubeflow-user07"
+        assert config.interval_sec == 5.0
+
+    def test_quality_gauges(self, exporter, trained_model, synthetic_housing_data):
+        """피드백으로 MAE / R² 게이지 갱신 테스트"""
+        _, X_test, _, y_test = synthetic_housing_data
+        y_pred = trained_model.predict(X_test)
+        exporter.record_feedback(y_test, y_pred)
+        snapshot = exporter.compute()
+
+        expected_mae = np.mean(np.abs(y_test - y_pred))
+        assert sample(exporter, "model_mae_score") == pytest.approx(expected_mae, rel=1e-6)
+        assert sample(exporter, "model_r2_score") == pytest.approx(snapshot["performance"]["r2"], abs=1e-4)
+
+    def test_no_gauge_below_min_samples(self, exporter):
+        """샘플 수가 부족하면 품질 게이지를 만들지 않음"""
+        exporter.record_feedback([1.0, 2.0], [1.1, 2.1])
+        exporter.compute()
+
+        assert sample(exporter, "model_mae_score") is None
+
+    def test_drift_gauges(self, exporter, synthetic_housing_data):
+        """입력 분포 이동 시 드리프트 점수 상승 테스트"""
+        _, X_test, _, _ = synthetic_housing_data
+        exporter.observe_prediction(X_test, 0.01)
+        exporter.compute()
+        baseline = sample(exporter, "model_drift_score")
+
+        exporter.inputs = RingBuffer(len(X_test))
+        exporter.observe_prediction(X_test * 1.5 + 1.0, 0.01)
+        exporter.compute()
+
+        assert sample(exporter, "model_drift_score") > baseline
+        assert sample(exporter, "model_drift_score") == 1.0
+        assert sample(exporter, "model_feature_drift_pvalue", feature="feature_0") < 0.05
+
+    def test_latency_and_counters(self, exporter):
+        """요청 카운터 / 히스토그램 / 지연 시간 백분위수 테스트"""
+        for latency in (0.005, 0.02, 0.2):
+            exporter.observe_prediction(np.zeros((2, 8)), latency)
+        exporter.observe_error()
+        exporter.compute()
+
+        assert sample(exporter, "model_prediction_total", status="success") == 3
+        assert sample(exporter, "model_prediction_total", status="error") == 1
+        assert sample(exporter, "model_prediction_latency_bucket", le="0.01") == 1
+        assert sample(exporter, "model_latency_seconds", quantile="0.5") == pytest.approx(0.02)
+
+    def test_render(self, exporter):
+        """Prometheus 텍스트 포맷 노출 테스트"""
+        exporter.observe_prediction(np.zeros((1, 8)), 0.01)
+        body, content_type = exporter.render()
+
+        assert content_type.startswith("text/plain")
+        assert b'model_prediction_total{model_name="california-housing"' in body
+        assert b'user_id="user01"' in body
+
+    def test_background_interval(self, exporter):
+        """백그라운드 스레드가 주기적으로 계산하는지 테스트"""
+        exporter.config.interval_sec = 0.05
+        exporter.observe_prediction(np.zeros((1, 8)), 0.01)
+        exporter.start()
+        try:
+            deadline = time.time() + 5
+            while not exporter.last_snapshot and time.time() < deadline:
+                time.sleep(0.02)
+        finally:
+            exporter.stop()
+
+        assert "latency_ms" in exporter.last_snapshot
+
+    def test_without_detector(self):
+        """드리프트 기준 없이도 동작하는지 테스트"""
+        exporter = ModelMetricsExporter()
+        exporter.observe_prediction(np.zeros((3, 8)), 0.01)
+        snapshot = exporter.compute()
+
+        assert "drift" not in snapshot
+
+
+class TestServerIntegration:
+    """ModelServer / FastAPI 연동 테스트"""
+
+    def test_server_observes(self, exporter, trained_model, synthetic_housing_data):
+        """ModelServer 예측 / 피드백이 exporter에 기록되는지 테스트"""
+        _, X_test, _, y_test = synthetic_housing_data
+        server = ModelServer(model=trained_model, exporter=exporter)
+
+        server.predict_array(X_test[:50])
+        recorded = server.record_feedback(X_test[:50], y_test[:50])
+        exporter.compute()
+
+        assert recorded == 50
+        assert sample(exporter, "model_prediction_total", status="success") == 1
+        assert sample(exporter, "model_mae_score") is not None
+        assert "monitoring" in server.get_metrics()
+
+    def test_feedback_without_exporter(self, trained_model):
+        """exporter 없이 피드백 시 오류 테스트"""
+        with pytest.raises(RuntimeError, match="exporter is not configured"):
+            ModelServer(model=trained_model).record_feedback([[0.0] * 8], [1.0])
+
+    def test_app_endpoints(self, exporter, trained_model, synthetic_housing_data):
+        """/feedback, /metrics/prometheus 엔드포인트 테스트"""
+        pytest.importorskip("fastapi")
+        pytest.importorskip("httpx")
+        from fastapi.testclient import TestClient
+        from src.serving.api import create_app
+
+        _, X_test, _, y_test = synthetic_housing_data
+        client = TestClient(create_app(model=trained_model, exporter=exporter))
+
+        assert client.post("/predict", json={"instances": X_test[:5].tolist()}).status_code == 200
+        response = client.post(
+            "/feedback", json={"instances": X_test[:30].tolist(), "targets": y_test[:30].tolist()}
+        )
+        assert response.json() == {"recorded": 30, "label_window": 30}
+
+        bad = client.post("/feedback", json={"instances": X_test[:2].tolist(), "targets": [1.0]})
+        assert bad.status_code == 400
+
+        exporter.compute()
+        scrape = client.get("/metrics/prometheus")
+        assert scrape.status_code == 200
+        assert "model_mae_score" in scrape.text
+        assert "model_drift_score" in scrape.text
@@ -0,0 +1,191 @@
+"""
+Test cases for feature pipeline module
+"""
+
+import os
+import tempfile
+
+import pytest
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+from src.model.features import FeaturePipeline
+from src.model.trainer import CaliforniaHousingModel
+from src.serving.api import ModelServer
+
+
+@pytest.fixture(scope="module")
+def housing_like_data(synthetic_housing_data):
+    """양수 분모 / 위경도 범위를 갖도록 변환한 합성 데이터"""
+    X_train, X_test, y_train, y_test = synthetic_housing_data
+
+    def shift(X):
+        X = np.abs(X) + 0.5
+        X[:, 6] = 34.0 + X[:, 6]
+        X[:, 7] = -120.0 - X[:, 7]
+        return X
+
+    return shift(X_train), shift(X_test), y_train, y_test
+
+
+@pytest.fixture
+def pipeline():
+    """기본 피처 파이프라인 fixture"""
+    return FeaturePipeline(CaliforniaHousingModel.FEATURE_NAMES)
+
+
+class TestFeaturePipeline:
+    """FeaturePipeline 테스트"""
+
+    def test_output_names(self, pipeline):
+        """출력 열 이름 테스트"""
+        names = pipeline.output_names
+
+        assert names[:8] == CaliforniaHousingModel.FEATURE_NAMES
+        assert names[8:] == [
+            "bedroom_ratio", "people_per_household", "dist_to_bay", "dist_to_la"
+        ]
+
+    def test_matches_reference_implementation(self, pipeline, housing_like_data):
+        """pandas 스타일 피처 생성 + StandardScaler 결과와 일치 테스트"""
+        X_train, X_test, _, _ = housing_like_data
+
+        def reference_features(X):
+            return np.column_stack([
+                X,
+                X[:, 3] / (X[:, 2] + 1e-6),
+                X[:, 4] / (X[:, 5] + 1e-6),
+                np.sqrt((X[:, 6] - 37.77) ** 2 + (X[:, 7] + 122.42) ** 2),
+                np.sqrt((X[:, 6] - 34.05) ** 2 + (X[:, 7] + 118.24) ** 2)
+            ])
+
+        scaler = StandardScaler().fit(reference_features(X_train))
+        pipeline.fit(X_train)
+
+        np.testing.assert_allclose(
+            pipeline.transform(X_test),
+            scaler.transform(reference_features(X_test)),
+            rtol=1e-10, atol=1e-12
+        )
+
+    def test_single_row(self, pipeline, housing_like_data, sample_features):
+        """단일 샘플(1차원) 변환 테스트"""
+        pipeline.fit(housing_like_data[0])
+
+        result = pipeline.transform(sample_features)
+
+        assert result.shape == (1, 12)
+
+    def test_constant_column(self, pipeline, housing_like_data):
+        """분산이 0인 열 표준화 테스트"""
+        X_train = housing_like_data[0].copy()
+        X_train[:, 1] = 41.0
+
+        result = pipeline.fit_transform(X_train)
+
+        assert np.all(np.isfinite(result))
+        assert np.allclose(result[:, 1], 0.0)
+
+    def test_transform_without_fit(self, pipeline, sample_features):
+        """학습 없이 변환 시 오류 테스트"""
+        with pytest.raises(RuntimeError) as exc_info:
+            pipeline.transform(sample_features)
+
+        assert "not fitted" in str(exc_info.value)
+
+    def test_wrong_features(self, pipeline, housing_like_data):
+        """잘못된 특성 수 오류 테스트"""
+        pipeline.fit(housing_like_data[0])
+
+        with pytest.raises(ValueError) as exc_info:
+            pipeline.transform([[1, 2, 3]])
+
+        assert "Expected 8 features" in str(exc_info.value)
+
+    def test_unknown_input_feature(self):
+        """존재하지 않는 입력 피처 정의 오류 테스트"""
+        with pytest.raises(ValueError) as exc_info:
+            FeaturePipeline(
+                CaliforniaHousingModel.FEATURE_NAMES,
+                derived_features=[
+                    {"name": "x", "op": "ratio", "inputs": ["MedInc", "Unknown"]}
+                ]
+            )
+
+        assert "Unknown input features" in str(exc_info.value)
+
+    def test_product_and_linear_ops(self, housing_like_data):
+        """곱 / 선형 결합 파생 피처 테스트"""
+        X = housing_like_data[1]
+        pipeline = FeaturePipeline(
+            CaliforniaHousingModel.FEATURE_NAMES,
+            derived_features=[
+                {"name": "density", "op": "product", "inputs": ["Population", "AveOccup"]},
+                {"name": "location_score", "op": "linear", "inputs": ["Latitude", "Longitude"],
+                 "weights": [0.5, 0.5]}
+            ],
+            standardize=False
+        )
+
+        result = pipeline.transform(X)
+
+        np.testing.assert_allclose(result[:, 8], X[:, 4] * X[:, 5])
+        np.testing.assert_allclose(result[:, 9], X[:, 6] * 0.5 + X[:, 7] * 0.5)
+
+    def test_dict_roundtrip(self, pipeline, housing_like_data):
+        """to_dict / from_dict 복원 테스트"""
+        X_train, X_test, _, _ = housing_like_data
+        pipeline.fit(X_train)
+
+        restored = FeaturePipeline.from_dict(pipeline.to_dict())
+
+        np.testing.assert_array_equal(
+            restored.transform(X_test), pipeline.transform(X_test)
+        )
+
+
+class TestModelWithFeaturePipeline:
+    """피처 파이프라인을 포함한 모델 테스트"""
+
+    @pytest.fixture
+    def fitted_model(self, housing_like_data):
+        """피처 파이프라인 포함 학습 모델 fixture"""
+        X_train, _, y_train, _ = housing_like_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 10, "max_depth": 6, "random_state": 42},
+            feature_pipeline=FeaturePipeline(CaliforniaHousingModel.FEATURE_NAMES)
+        )
+        model.train(X_train, y_train)
+        return model
+
+    def test_model_uses_engineered_features(self, fitted_model):
+        """모델 입력 특성 수 테스트"""
+        assert fitted_model.model.n_features_in_ == 12
+
+    def test_save_and_load(self, fitted_model, housing_like_data):
+        """파이프라인 포함 저장 및 로드 테스트"""
+        _, X_test, _, _ = housing_like_data
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "model.joblib")
+            fitted_model.save(filepath)
+            loaded = CaliforniaHousingModel.load(filepath)
+
+        assert loaded.feature_pipeline is not None
+        np.testing.assert_array_equal(
+            loaded.predict(X_test), fitted_model.predict(X_test)
+        )
+
+    def test_server_compiled_with_transform(self, fitted_model, sample_batch_features):
+        """ModelServer에서 컴파일 모델 + 변환 적용 테스트"""
+        server = ModelServer(
+            model=fitted_model.compile(),
+            transform=fitted_model.feature_pipeline
+        )
+
+        response = server.predict(sample_batch_features)
+
+        np.testing.assert_allclose(
+            response.predictions, fitted_model.predict(sample_batch_features)
+        )
@@ -0,0 +1,241 @@
+"""
+Test cases for binary prediction endpoint and HTTP load testing
+"""
+
+import importlib.util
+import io
+import json
+import os
+
+import pytest
+import numpy as np
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.model.trainer import CaliforniaHousingModel  # noqa: E402
+from src.serving.api import create_app, decode_binary_instances  # noqa: E402
+from src.serving.loadtest import (  # noqa: E402
+    LoadTestConfig,
+    LoadTestResult,
+    find_saturation,
+    housing_requests,
+    iris_requests,
+    run_load_test
+)
+
+
+IRIS_APP_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "..", "day2", "lab2-1_fastapi-serving", "app", "main.py"
+)
+
+
+@pytest.fixture(scope="module")
+def iris_app():
+    """day2 Iris API 앱 fixture (model.joblib 대신 즉석 학습한 모델 사용)"""
+    from sklearn.datasets import load_iris
+    from sklearn.ensemble import RandomForestClassifier
+
+    spec = importlib.util.spec_from_file_location("iris_serving_app", IRIS_APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    X, y = load_iris(return_X_y=True)
+    module.model = RandomForestClassifier(n_estimators=10, random_state=42).fit(X, y)
+    module.SPECIES_BY_COLUMN = np.array(
+        [module.IRIS_SPECIES[int(c)] for c in module.model.classes_]
+    )
+    module.MODEL_LOADED = True
+    return module.app
+
+
+@pytest.fixture(scope="module")
+def app(synthetic_housing_data):
+    """학습된 모델을 올린 FastAPI 앱 fixture"""
+    X_train, _, y_train, _ = synthetic_housing_data
+    model = CaliforniaHousingModel(
+        model_type="random_forest",
+        model_params={"n_estimators": 10, "max_depth": 6, "random_state": 42}
+    )
+    model.train(X_train, y_train)
+    return create_app(model=model)
+
+
+def make_result(concurrency, throughput):
+    """처리량이 throughput인 1초짜리 결과"""
+    return LoadTestResult(
+        config=LoadTestConfig(concurrency=concurrency),
+        latencies_ms=np.ones(int(throughput)),
+        status_counts={"200": int(throughput)},
+        elapsed_sec=1.0,
+        rows=int(throughput)
+    )
+
+
+class TestBinaryEndpoint:
+    """/predict/binary 테스트"""
+
+    def test_decode_float32(self, synthetic_housing_data):
+        """float32 본문 디코딩 테스트"""
+        X_test = synthetic_housing_data[1][:5]
+        X = decode_binary_instances(X_test.astype("<f4").tobytes())
+        assert X.shape == (5, 8)
+        np.testing.assert_allclose(X, X_test.astype(np.float32))
+
+    def test_decode_invalid_size(self):
+        """행 크기로 나누어떨어지지 않는 본문 테스트"""
+        with pytest.raises(ValueError, match="Invalid binary payload"):
+            decode_binary_instances(b"\x00" * 10)
+
+    def test_decode_invalid_dtype(self):
+        """지원하지 않는 dtype 테스트"""
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            decode_binary_instances(b"\x00" * 32, dtype="int8")
+
+    def test_matches_json_predictions(self, app, synthetic_housing_data):
+        """바이너리 응답이 JSON 예측과 같은지 테스트"""
+        client = TestClient(app)
+        X = synthetic_housing_data[1][:20]
+
+        json_response = client.post("/predict", json={"instances": X.tolist()})
+        binary_response = client.post(
+            "/predict/binary",
+            content=X.astype("<f8").tobytes(),
+            headers={"X-Dtype": "float64"}
+        )
+
+        assert binary_response.status_code == 200
+        assert binary_response.headers["content-type"] == "application/octet-stream"
+        predictions = np.frombuffer(binary_response.content, dtype="<f8")
+        np.testing.assert_allclose(predictions, json_response.json()["predictions"])
+
+    def test_bad_payload_returns_400(self, app):
+        """잘못된 본문은 400 응답 테스트"""
+        client = TestClient(app)
+        response = client.post("/predict/binary", content=b"\x00" * 10)
+        assert response.status_code == 400
+
+
+class TestLoadTestConfig:
+    """LoadTestConfig 테스트"""
+
+    def test_invalid_mode(self):
+        """지원하지 않는 모드 테스트"""
+        with pytest.raises(ValueError, match="Unsupported mode"):
+            LoadTestConfig(mode="burst")
+
+    def test_invalid_format(self):
+        """지원하지 않는 페이로드 형식 테스트"""
+        with pytest.raises(ValueError, match="Unsupported payload format"):
+            LoadTestConfig(payload_format="protobuf")
+
+    def test_housing_columnar_unsupported(self):
+        """housing API는 npy / 컬럼 JSON 미지원"""
+        with pytest.raises(ValueError, match="Unsupported payload format for housing"):
+            housing_requests(batch_size=4, payload_format="npy")
+
+    def test_request_paths(self):
+        """요청 형식별 경로 테스트"""
+        assert housing_requests(4, "json", pool_size=1)[0].path == "/predict"
+        assert housing_requests(4, "binary", pool_size=1)[0].path == "/predict/binary"
+        assert iris_requests(1, "json", pool_size=1)[0].path == "/predict"
+        assert iris_requests(4, "json", pool_size=1)[0].path == "/predict/batch"
+        assert iris_requests(4, "binary", pool_size=1)[0].path == "/predict/columnar?dtype=float32"
+        assert iris_requests(4, "npy", pool_size=1)[0].path == "/predict/columnar"
+        assert iris_requests(4, "columnar", pool_size=1)[0].path == "/predict/columnar"
+
+    def test_iris_formats_same_rows(self):
+        """Iris 요청 형식이 달라도 같은 seed면 같은 입력 행"""
+        rows = iris_requests(3, "json", pool_size=1)[0].content
+        columnar = iris_requests(3, "columnar", pool_size=1)[0].content
+        binary = iris_requests(3, "binary", pool_size=1)[0].content
+
+        X = np.array([list(row.values()) for row in json.loads(rows)])
+        np.testing.assert_allclose(np.column_stack(list(json.loads(columnar).values())), X)
+        np.testing.assert_allclose(np.frombuffer(binary, dtype="<f4").reshape(3, 4), X, rtol=1e-6)
+
+
+class TestRunLoadTest:
+    """run_load_test 테스트"""
+
+    @pytest.mark.parametrize("payload_format", ["json", "binary"])
+    def test_closed_loop(self, app, payload_format):
+        """closed-loop 요청 수/상태 코드 테스트"""
+        config = LoadTestConfig(
+            concurrency=4, max_requests=40, duration_sec=30.0, batch_size=8,
+            payload_format=payload_format, warmup_requests=2
+        )
+        result = run_load_test(app, config)
+
+        assert result.requests == 40
+        assert result.status_counts == {"200": 40}
+        assert result.rows == 40 * 8
+        assert result.error_rate == 0.0
+        assert result.throughput_rps > 0
+
+    def test_open_loop(self, app):
+        """open-loop 도착률 기반 실행 테스트"""
+        config = LoadTestConfig(
+            mode="open", rate=200.0, duration_sec=0.25, warmup_requests=0
+        )
+        result = run_load_test(app, config)
+
+        assert 0 < result.requests <= 50
+        assert result.errors == 0
+        assert sum(count for _, count in result.histogram()) == result.requests
+
+    @pytest.mark.parametrize("payload_format", ["json", "binary", "npy", "columnar"])
+    def test_iris_profile(self, iris_app, payload_format):
+        """Iris API의 행 / 컬럼 엔드포인트 요청이 모두 성공하는지 테스트"""
+        config = LoadTestConfig(
+            concurrency=2, max_requests=10, duration_sec=30.0, batch_size=16,
+            payload_format=payload_format, warmup_requests=0
+        )
+        result = run_load_test(iris_app, config, profile="iris")
+
+        assert result.status_counts == {"200": 10}
+        assert result.rows == 10 * 16
+
+    @pytest.mark.parametrize("array", [
+        np.zeros((2, 4), dtype=np.complex128),
+        np.zeros(2, dtype=[(name, "f8") for name in "abcd"]),
+        np.zeros((2, 4), dtype="U8")
+    ])
+    def test_iris_npy_rejects_non_numeric_dtype(self, iris_app, array):
+        """구조화 / 복소수 / 문자열 .npy 입력은 422로 거부"""
+        buffer = io.BytesIO()
+        np.save(buffer, array)
+
+        response = TestClient(iris_app).post(
+            "/predict/columnar", content=buffer.getvalue(),
+            headers={"Content-Type": "application/x-npy"}
+        )
+
+        assert response.status_code == 422
+        assert "Unsupported .npy dtype" in response.json()["detail"]
+
+    def test_errors_counted(self, app):
+        """오류 응답이 오류율에 반영되는지 테스트"""
+        config = LoadTestConfig(max_requests=10, warmup_requests=0)
+        result = run_load_test(app, config, profile="iris")
+
+        assert result.requests == 10
+        assert result.error_rate == 1.0
+        assert result.throughput_rps == 0.0
+
+
+class TestFindSaturation:
+    """find_saturation 테스트"""
+
+    def test_saturation_detected(self):
+        """처리량 증가가 멈춘 단계 탐지"""
+        results = [make_result(1, 100), make_result(2, 190), make_result(4, 195)]
+        assert find_saturation(results) == 2
+
+    def test_no_saturation(self):
+        """처리량이 계속 늘면 None"""
+        results = [make_result(1, 100), make_result(2, 190), make_result(4, 350)]
+        assert find_saturation(results) is None
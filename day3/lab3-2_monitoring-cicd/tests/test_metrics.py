@@ -0,0 +1,143 @@
+"""
+Test cases for evaluation metrics module
+"""
+
+import pytest
+import numpy as np
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from src.model.metrics import (
+    RegressionMetricsAccumulator,
+    compute_regression_metrics,
+    compute_segment_metrics
+)
+
+
+@pytest.fixture
+def regression_data():
+    """회귀 예측 데이터 fixture"""
+    rng = np.random.default_rng(42)
+    y_true = rng.uniform(0.5, 5.0, 2000)
+    y_pred = y_true + rng.normal(0, 0.4, 2000)
+    weights = rng.uniform(0.1, 2.0, 2000)
+    return y_true, y_pred, weights
+
+
+class TestComputeRegressionMetrics:
+    """compute_regression_metrics 테스트"""
+
+    def test_matches_sklearn(self, regression_data):
+        """sklearn 메트릭과 동일한 값 테스트"""
+        y_true, y_pred, _ = regression_data
+
+        metrics = compute_regression_metrics(y_true, y_pred)
+
+        assert metrics["mae"] == pytest.approx(mean_absolute_error(y_true, y_pred))
+        assert metrics["mse"] == pytest.approx(mean_squared_error(y_true, y_pred))
+        assert metrics["rmse"] == pytest.approx(np.sqrt(mean_squared_error(y_true, y_pred)))
+        assert metrics["r2"] == pytest.approx(r2_score(y_true, y_pred))
+
+    def test_weighted_matches_sklearn(self, regression_data):
+        """가중치 적용 메트릭 테스트"""
+        y_true, y_pred, weights = regression_data
+
+        metrics = compute_regression_metrics(y_true, y_pred, sample_weight=weights)
+
+        assert metrics["mae"] == pytest.approx(
+            mean_absolute_error(y_true, y_pred, sample_weight=weights)
+        )
+        assert metrics["mse"] == pytest.approx(
+            mean_squared_error(y_true, y_pred, sample_weight=weights)
+        )
+        assert metrics["r2"] == pytest.approx(
+            r2_score(y_true, y_pred, sample_weight=weights)
+        )
+
+    def test_quantiles(self, regression_data):
+        """절대 오차 분위수 테스트"""
+        y_true, y_pred, _ = regression_data
+
+        metrics = compute_regression_metrics(y_true, y_pred, quantiles=[0.5, 0.9])
+
+        abs_err = np.abs(y_true - y_pred)
+        assert metrics["ae_p50"] == pytest.approx(np.median(abs_err))
+        assert metrics["ae_p90"] == pytest.approx(np.quantile(abs_err, 0.9))
+
+    def test_constant_target(self):
+        """상수 타겟 R² 처리 테스트"""
+        y_true = np.ones(10)
+
+        assert compute_regression_metrics(y_true, y_true)["r2"] == 1.0
+        assert compute_regression_metrics(y_true, y_true + 1)["r2"] == 0.0
+
+    def test_shape_mismatch(self):
+        """배열 크기 불일치 오류 테스트"""
+        with pytest.raises(ValueError) as exc_info:
+            compute_regression_metrics([1.0, 2.0], [1.0])
+
+        assert "Shape mismatch" in str(exc_info.value)
+
+    def test_empty_input(self):
+        """빈 입력 오류 테스트"""
+        with pytest.raises(ValueError):
+            compute_regression_metrics([], [])
+
+
+class TestComputeSegmentMetrics:
+    """compute_segment_metrics 테스트"""
+
+    def test_segments_match_subsets(self, regression_data):
+        """세그먼트별 메트릭이 부분 집합 계산과 동일한지 테스트"""
+        y_true, y_pred, _ = regression_data
+        segments = np.where(y_true > 2.5, "high", "low")
+
+        results = compute_segment_metrics(y_true, y_pred, segments)
+
+        assert set(results) == {"high", "low"}
+        for label, values in results.items():
+            mask = segments == label
+            expected = compute_regression_metrics(y_true[mask], y_pred[mask])
+            assert values["count"] == int(mask.sum())
+            assert values["mae"] == pytest.approx(expected["mae"])
+            assert values["mse"] == pytest.approx(expected["mse"])
+            assert values["r2"] == pytest.approx(expected["r2"])
+
+
+class TestRegressionMetricsAccumulator:
+    """RegressionMetricsAccumulator 테스트"""
+
+    def test_chunked_matches_full(self, regression_data):
+        """청크 누적 결과가 전체 계산과 동일한지 테스트"""
+        y_true, y_pred, _ = regression_data
+
+        acc = RegressionMetricsAccumulator()
+        for start in range(0, len(y_true), 300):
+            acc.update(y_true[start:start + 300], y_pred[start:start + 300])
+
+        expected = compute_regression_metrics(y_true, y_pred)
+        result = acc.result()
+
+        assert acc.count == len(y_true)
+        for key in ("mae", "mse", "rmse", "r2"):
+            assert result[key] == pytest.approx(expected[key])
+
+    def test_weighted_merge(self, regression_data):
+        """가중치 부분 결과 병합 테스트"""
+        y_true, y_pred, weights = regression_data
+
+        left = RegressionMetricsAccumulator().update(
+            y_true[:700], y_pred[:700], weights[:700]
+        )
+        right = RegressionMetricsAccumulator().update(
+            y_true[700:], y_pred[700:], weights[700:]
+        )
+        result = left.merge(right).result()
+
+        expected = compute_regression_metrics(y_true, y_pred, sample_weight=weights)
+        for key in ("mae", "mse", "r2"):
+            assert result[key] == pytest.approx(expected[key])
+
+    def test_empty_result(self):
+        """누적 없이 결과 조회 시 오류 테스트"""
+        with pytest.raises(ValueError):
+            RegressionMetricsAccumulator().result()
@@ -190,6 +190,21 @@ class TestModelMonitor:
 
         assert len(monitor.metrics_history) == 1
 
+    def test_compute_metrics(self):
+        """예측값 기반 메트릭 계산 테스트"""
+        monitor = ModelMonitor()
+        y_true = np.array([1.0, 2.0, 3.0, 4.0])
+        y_pred = np.array([1.5, 2.0, 2.5, 4.0])
+
+        metrics = monitor.compute_metrics(y_true, y_pred)
+
+        assert isinstance(metrics, ModelMetrics)
+        assert metrics.mae == pytest.approx(0.25)
+        assert metrics.mse == pytest.approx(0.125)
+        assert metrics.r2 == pytest.approx(0.9)
+        assert metrics.timestamp is not None
+        assert len(monitor.metrics_history) == 1
+
     def test_check_performance_healthy(self):
         """건강한 성능 확인 테스트"""
         monitor = ModelMonitor(mae_threshold=0.45, r2_threshold=0.75)
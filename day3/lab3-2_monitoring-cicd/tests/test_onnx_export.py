@@ -0,0 +1,160 @@
+"""
+Test cases for ONNX export module
+"""
+
+import json
+import os
+
+import pytest
+import numpy as np
+
+from src.model.features import FeaturePipeline
+from src.model.onnx_export import (
+    convert_estimator,
+    graph_optimization_level,
+    load_onnx_metadata,
+    onnx_metadata_path,
+    optimized_onnx_path
+)
+from src.model.trainer import CaliforniaHousingModel
+
+
+class TestPaths:
+    """경로/설정 헬퍼 테스트"""
+
+    def test_metadata_path(self):
+        """메타데이터 경로 테스트"""
+        assert onnx_metadata_path("models/model.onnx") == "models/model_onnx.json"
+
+    def test_optimized_path(self):
+        """최적화 그래프 경로 테스트"""
+        assert optimized_onnx_path("models/model.onnx") == "models/model.opt.onnx"
+
+    def test_invalid_optimization_level(self):
+        """지원하지 않는 최적화 수준 테스트"""
+        with pytest.raises(ValueError, match="Unsupported optimization level"):
+            graph_optimization_level("maximum")
+
+    def test_invalid_dtype(self):
+        """지원하지 않는 입력 dtype 테스트"""
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            convert_estimator(None, 8, dtype="float16")
+
+    def test_export_unfitted(self, tmp_path):
+        """학습 전 변환 시 오류 테스트"""
+        with pytest.raises(RuntimeError, match="not fitted"):
+            CaliforniaHousingModel().export_onnx(str(tmp_path / "model.onnx"))
+
+
+class TestExportOnnx:
+    """CaliforniaHousingModel.export_onnx 테스트 (onnx / onnxruntime / skl2onnx 필요)"""
+
+    @pytest.fixture(autouse=True)
+    def _require_onnx(self):
+        pytest.importorskip("onnx")
+        pytest.importorskip("onnxruntime")
+        pytest.importorskip("skl2onnx")
+
+    @pytest.mark.parametrize("model_type", list(CaliforniaHousingModel.SUPPORTED_MODELS))
+    def test_export_all_model_types(self, tmp_path, synthetic_housing_data, model_type):
+        """전체 모델 유형 변환 및 수치 일치 테스트"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        params = {} if model_type == "linear_regression" else {
+            "n_estimators": 10, "max_depth": 4, "random_state": 42
+        }
+        model = CaliforniaHousingModel(model_type=model_type, model_params=params)
+        model.train(X_train, y_train)
+
+        path = str(tmp_path / f"{model_type}.onnx")
+        result = model.export_onnx(path, X_check=X_test)
+
+        assert os.path.exists(path)
+        assert os.path.exists(result.optimized_path)
+        assert result.parity.passed
+        assert result.parity.num_samples == len(X_test)
+
+    def test_metadata_saved(self, tmp_path, synthetic_housing_data):
+        """메타데이터 저장 테스트"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X_train, y_train)
+
+        path = str(tmp_path / "model.onnx")
+        model.export_onnx(path, X_check=X_test, save_optimized=False)
+        metadata = load_onnx_metadata(path)
+
+        assert metadata["input_dtype"] == "float32"
+        assert metadata["feature_names"] == CaliforniaHousingModel.FEATURE_NAMES
+        assert metadata["opset"]["ai.onnx"] == 15
+        assert metadata["model_type"] == "linear_regression"
+        assert metadata["parity"]["passed"] is True
+        assert not os.path.exists(optimized_onnx_path(path))
+
+        with open(onnx_metadata_path(path)) as f:
+            assert json.load(f) == metadata
+
+    def test_feature_pipeline(self, tmp_path, synthetic_housing_data):
+        """feature_pipeline 출력 열을 그래프 입력으로 사용하는지 테스트"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        pipeline = FeaturePipeline(CaliforniaHousingModel.FEATURE_NAMES)
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "max_depth": 4, "random_state": 42},
+            feature_pipeline=pipeline
+        )
+        model.train(X_train, y_train)
+
+        result = model.export_onnx(str(tmp_path / "model.onnx"), X_check=X_test)
+
+        assert result.metadata["feature_names"] == pipeline.output_names
+        assert result.metadata["raw_feature_names"] == CaliforniaHousingModel.FEATURE_NAMES
+        assert FeaturePipeline.from_dict(result.metadata["feature_pipeline"]).is_fitted
+        assert result.parity.passed
+
+    def test_float64_linear(self, tmp_path, synthetic_housing_data):
+        """선형 모델 float64 변환 시 sklearn과 거의 정확히 일치"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X_train, y_train)
+
+        result = model.export_onnx(
+            str(tmp_path / "model.onnx"), X_check=X_test, dtype="float64", atol=1e-9, rtol=0.0
+        )
+
+        assert result.metadata["input_dtype"] == "float64"
+        assert result.parity.passed
+
+    def test_float64_tree_rejected(self, tmp_path, synthetic_housing_data):
+        """트리 앙상블 float64 변환 거부 테스트"""
+        X_train, _, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "max_depth": 4, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+
+        with pytest.raises(ValueError, match="float64 input is not supported"):
+            model.export_onnx(str(tmp_path / "model.onnx"), dtype="float64")
+
+    def test_optimized_model_loads(self, tmp_path, synthetic_housing_data):
+        """오프라인 최적화 그래프로 같은 예측을 하는지 테스트"""
+        import onnxruntime as ort
+
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="gradient_boosting",
+            model_params={"n_estimators": 20, "max_depth": 3, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+        result = model.export_onnx(str(tmp_path / "model.onnx"), optimization_level="extended")
+
+        predictions = []
+        for path in (result.path, result.optimized_path):
+            session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+            input_name = session.get_inputs()[0].name
+            predictions.append(
+                session.run(None, {input_name: X_test.astype(np.float32)})[0].ravel()
+            )
+
+        np.testing.assert_allclose(predictions[0], predictions[1], rtol=1e-6)
+        np.testing.assert_allclose(predictions[0], model.predict(X_test), rtol=1e-4, atol=1e-4)
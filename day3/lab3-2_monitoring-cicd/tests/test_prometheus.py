@@ -0,0 +1,256 @@
+"""
+Test cases for Prometheus query client (local stub HTTP server)
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from src.monitoring.prometheus import (
+    PrometheusClient,
+    PrometheusError,
+    instant_values,
+    merge_range_results,
+    parse_duration,
+    split_range
+)
+
+# metric, metric{user_id="..."}, max/min by (user_id) (metric)
+SELECTOR = re.compile(r'^(?:(?:max|min) by \(user_id\) \()?(\w+)(?:\{user_id="(\w+)"\})?\)?$')
+
+USER_METRICS = {
+    "model_mae_score": {"user01": 0.40, "user02": 0.52},
+    "model_r2_score": {"user01": 0.85, "user02": 0.70}
+}
+
+
+class StubPrometheus(BaseHTTPRequestHandler):
+    """Prometheus HTTP API 일부를 흉내 내는 핸들러"""
+
+    # keep-alive 지원 (HTTP/1.0이면 응답마다 연결을 닫아 재사용 여부를 확인할 수 없음)
+    protocol_version = "HTTP/1.1"
+    max_points = 11000
+    delay_sec = 0.0
+    log = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        # 세 번째 값: 클라이언트 포트 (TCP 연결마다 다름)
+        type(self).log.append((url.path, params, self.client_address[1]))
+        time.sleep(self.delay_sec)
+
+        if url.path == "/-/healthy":
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif url.path == "/api/v1/query":
+            self._query(params["query"])
+        elif url.path == "/api/v1/query_range":
+            self._query_range(params)
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def _query(self, promql):
+        if promql == "bad(":
+            self._send(400, {"status": "error", "errorType": "bad_data", "error": "parse error"})
+            return
+        match = SELECTOR.match(promql.strip())
+        name, user_id = match.groups() if match else (None, None)
+        result = [
+            {"metric": {"__name__": name, "user_id": user}, "value": [time.time(), str(v)]}
+            for user, v in USER_METRICS.get(name, {}).items()
+            if user_id is None or user == user_id
+        ]
+        self._send(200, {"status": "success", "data": {"resultType": "vector", "result": result}})
+
+    def _query_range(self, params):
+        start, end, step = float(params["start"]), float(params["end"]), float(params["step"])
+        points = int((end - start) // step) + 1
+        if points > self.max_points:
+            self._send(400, {
+                "status": "error", "errorType": "bad_data",
+                "error": "exceeded maximum resolution of 11,000 points per timeseries"
+            })
+            return
+        values = [[start + i * step, str(start + i * step)] for i in range(points)]
+        result = [{"metric": {"user_id": "user01"}, "values": values}]
+        self._send(200, {"status": "success", "data": {"resultType": "matrix", "result": result}})
+
+
+@pytest.fixture
+def prometheus_url():
+    """로컬 스텁 Prometheus 서버"""
+    StubPrometheus.log = []
+    StubPrometheus.delay_sec = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPrometheus)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHelpers:
+    """헬퍼 함수 테스트"""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("30s", 30.0), ("5m", 300.0), ("1h30m", 5400.0), ("250ms", 0.25), (15, 15.0), ("60", 60.0)
+    ])
+    def test_parse_duration(self, value, expected):
+        """기간 문자열 변환 테스트"""
+        assert parse_duration(value) == expected
+
+    def test_parse_duration_invalid(self):
+        """잘못된 기간 문자열 테스트"""
+        with pytest.raises(ValueError, match="Invalid duration"):
+            parse_duration("5 minutes")
+
+    def test_split_range(self):
+        """구간 분할 시 포인트 수 상한과 연속성 테스트"""
+        chunks = split_range(0, 1000, 10, max_points=30)
+
+        assert chunks[0][0] == 0
+        assert chunks[-1][1] == 1000
+        for (s1, e1), (s2, _) in zip(chunks, chunks[1:]):
+            assert s2 == e1 + 10
+        assert all((e - s) / 10 + 1 <= 30 for s, e in chunks)
+
+    def test_merge_range_results(self):
+        """구간 결과 병합 테스트"""
+        a = [{"metric": {"user_id": "u1"}, "values": [[0, "1"], [10, "2"]]}]
+        b = [{"metric": {"user_id": "u1"}, "values": [[20, "3"]]},
+             {"metric": {"user_id": "u2"}, "values": [[20, "9"]]}]
+
+        merged = merge_range_results([a, b])
+
+        assert merged[0]["values"] == [[0, "1"], [10, "2"], [20, "3"]]
+        assert merged[1]["metric"] == {"user_id": "u2"}
+
+    def test_instant_values(self):
+        """vector 결과 → 라벨별 값 변환 테스트"""
+        results = [{"metric": {"user_id": "user01"}, "value": [0, "0.4"]}]
+        assert instant_values(results) == {"user01": 0.4}
+
+
+class TestPrometheusClient:
+    """PrometheusClient 테스트"""
+
+    def test_healthy(self, prometheus_url):
+        """헬스 체크 테스트"""
+        with PrometheusClient(prometheus_url) as client:
+            assert client.healthy()
+        with PrometheusClient("http://127.0.0.1:1", retries=0) as client:
+            assert not client.healthy(timeout=1)
+
+    def test_query(self, prometheus_url):
+        """instant 쿼리 테스트"""
+        with PrometheusClient(prometheus_url) as client:
+            result = client.query("model_mae_score")
+            selected = client.query('model_mae_score{user_id="user02"}')
+        assert instant_values(result) == USER_METRICS["model_mae_score"]
+        assert instant_values(selected) == {"user02": 0.52}
+
+    def test_query_error(self, prometheus_url):
+        """오류 응답 테스트"""
+        with PrometheusClient(prometheus_url) as client:
+            with pytest.raises(PrometheusError, match="bad_data"):
+                client.query("bad(")
+            assert client.stats.errors == 1
+
+    def test_cache(self, prometheus_url):
+        """TTL 안의 같은 쿼리는 캐시에서 반환하는지 테스트"""
+        with PrometheusClient(prometheus_url, cache_ttl_sec=60) as client:
+            client.query("model_mae_score")
+            client.query("model_mae_score")
+            assert client.stats.cache_hits == 1
+            assert len(StubPrometheus.log) == 1
+
+            client.clear_cache()
+            client.query("model_mae_score")
+            assert len(StubPrometheus.log) == 2
+
+    def test_cache_expiry(self, prometheus_url):
+        """TTL이 지나면 다시 요청하는지 테스트"""
+        with PrometheusClient(prometheus_url, cache_ttl_sec=0.05) as client:
+            client.query("model_mae_score")
+            time.sleep(0.1)
+            client.query("model_mae_score")
+        assert len(StubPrometheus.log) == 2
+
+    def test_query_many_concurrent(self, prometheus_url):
+        """여러 쿼리를 동시에 요청하는지 테스트"""
+        StubPrometheus.delay_sec = 0.2
+        queries = {f"q{i}": "model_mae_score" + " " * i for i in range(4)}
+        queries["r2"] = "model_r2_score"
+
+        with PrometheusClient(prometheus_url, max_workers=8) as client:
+            start = time.perf_counter()
+            results = client.query_many(queries)
+            elapsed = time.perf_counter() - start
+
+        assert set(results) == set(queries)
+        assert instant_values(results["r2"]) == USER_METRICS["model_r2_score"]
+        assert elapsed < 0.2 * len(queries) * 0.6
+
+    def test_query_many_partial_failure(self, prometheus_url):
+        """일부 쿼리 실패 시 빈 결과로 대체하는지 테스트"""
+        with PrometheusClient(prometheus_url) as client:
+            results = client.query_many(["model_mae_score", "bad("])
+            assert results["bad("] == []
+            assert len(results["model_mae_score"]) == 2
+
+            with pytest.raises(PrometheusError):
+                client.query_many(["bad("], raise_on_error=True)
+
+    def test_connection_reuse(self, prometheus_url):
+        """세션이 연결을 재사용하는지 테스트 (클라이언트 포트 = 연결)"""
+        with PrometheusClient(prometheus_url, cache_ttl_sec=0) as client:
+            for _ in range(5):
+                client.query("model_mae_score")
+        ports = [port for path, _, port in StubPrometheus.log if path == "/api/v1/query"]
+        assert len(ports) == 5
+        assert len(set(ports)) == 1
+
+    def test_query_range_chunked(self, prometheus_url):
+        """긴 range 쿼리 분할 후 병합 테스트"""
+        with PrometheusClient(prometheus_url, max_points=100) as client:
+            result = client.query_range("model_mae_score", 0, 3000, step="10s")
+
+        range_calls = [p for path, p, _ in StubPrometheus.log if path == "/api/v1/query_range"]
+        assert len(range_calls) == 4
+        timestamps = [t for t, _ in result[0]["values"]]
+        assert timestamps == [float(t) for t in range(0, 3001, 10)]
+
+    def test_query_range_unchunked_rejected(self, prometheus_url):
+        """분할하지 않으면 서버가 거부하는 구간인지 확인 (스텁 동작 검증)"""
+        response = requests.get(
+            f"{prometheus_url}/api/v1/query_range",
+            params={"query": "x", "start": 0, "end": 86400 * 7, "step": 30}
+        )
+        assert response.json()["status"] == "error"
+
+        with PrometheusClient(prometheus_url) as client:
+            result = client.query_range("x", 0, 86400 * 7, step=30)
+        assert len(result[0]["values"]) == 86400 * 7 // 30 + 1
@@ -0,0 +1,170 @@
+"""
+Test cases for multi-tenant retrain trigger module
+"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+
+from src.monitoring.retrain import DispatchLimiter, evaluate_drift
+
+
+def single_user_drift(mae, r2, mae_threshold=0.45, r2_threshold=0.75):
+    """4_trigger_retrain.check_model_drift의 기존 단일 사용자 규칙"""
+    mae_drift = mae > mae_threshold
+    r2_drift = r2 < r2_threshold
+    mae_score = max(0, (mae - mae_threshold) / mae_threshold) if mae_drift else 0
+    r2_score = max(0, (r2_threshold - r2) / r2_threshold) if r2_drift else 0
+    return mae_drift or r2_drift, (mae_score + r2_score) / 2
+
+
+class TestEvaluateDrift:
+    """evaluate_drift 테스트"""
+
+    def test_matches_single_user_rule(self):
+        """사용자별 단일 판정 규칙과 같은 결과인지 테스트"""
+        rng = np.random.default_rng(0)
+        users = [f"user{i:02d}" for i in range(50)]
+        mae = dict(zip(users, rng.uniform(0.3, 0.6, len(users)).tolist()))
+        r2 = dict(zip(users, rng.uniform(0.6, 0.95, len(users)).tolist()))
+
+        for status in evaluate_drift(mae, r2):
+            detected, score = single_user_drift(mae[status["user_id"]], r2[status["user_id"]])
+            assert status["drift_detected"] == detected
+            assert status["drift_score"] == pytest.approx(score)
+
+    def test_reasons(self):
+        """Drift 사유 문자열 테스트"""
+        status = evaluate_drift({"u": 0.5}, {"u": 0.7})[0]
+        assert status["reason"] == "MAE(0.5000) > 0.45; R²(0.7000) < 0.75"
+
+        status = evaluate_drift({"u": 0.4}, {"u": 0.9})[0]
+        assert status["reason"] == "Model performance normal"
+        assert status["drift_detected"] is False
+
+    def test_missing_metric(self):
+        """메트릭이 하나라도 없으면 판정하지 않는지 테스트"""
+        results = evaluate_drift({"a": 0.9, "b": 0.9}, {"a": 0.5})
+        by_user = {r["user_id"]: r for r in results}
+
+        assert by_user["a"]["drift_detected"] is True
+        assert by_user["b"]["drift_detected"] is False
+        assert by_user["b"]["reason"] == "No metrics available"
+        assert by_user["b"]["mae"] is None
+
+    def test_empty(self):
+        """빈 입력 테스트"""
+        assert evaluate_drift({}, {}) == []
+
+
+class TestDispatchLimiter:
+    """DispatchLimiter 테스트"""
+
+    @staticmethod
+    def candidates(*scores):
+        return [{"user_id": f"user{i}", "drift_score": s} for i, s in enumerate(scores)]
+
+    def test_max_dispatches_highest_first(self):
+        """점수 높은 순으로 최대 건수만 트리거하고 나머지는 연기"""
+        sent = []
+        limiter = DispatchLimiter(max_dispatches=2, min_interval_sec=0)
+        summary = limiter.dispatch_all(
+            self.candidates(0.1, 0.5, 0.3), lambda u, s: sent.append(u) or True
+        )
+
+        assert sent == ["user1", "user2"]
+        assert summary.dispatched == ["user1", "user2"]
+        assert summary.deferred == ["user0"]
+
+    def test_duplicate_candidates(self):
+        """같은 사용자가 여러 번 있어도 한 번만 트리거"""
+        sent = []
+        limiter = DispatchLimiter(min_interval_sec=0)
+        limiter.dispatch_all(
+            self.candidates(0.2) * 3, lambda u, s: sent.append(u) or True
+        )
+        assert sent == ["user0"]
+
+    def test_cooldown_persisted(self, tmp_path):
+        """상태 파일로 실행 간 쿨다운 유지"""
+        state = str(tmp_path / "state.json")
+        first = DispatchLimiter(state_path=state, cooldown_sec=3600, min_interval_sec=0)
+        first.dispatch_all(self.candidates(0.2), lambda u, s: True)
+
+        with open(state) as f:
+            assert "user0" in json.load(f)
+
+        second = DispatchLimiter(state_path=state, cooldown_sec=3600, min_interval_sec=0)
+        summary = second.dispatch_all(self.candidates(0.2, 0.1), lambda u, s: True)
+        assert summary.cooldown == ["user0"]
+        assert summary.dispatched == ["user1"]
+
+        expired = DispatchLimiter(state_path=state, cooldown_sec=0, min_interval_sec=0)
+        assert not expired.in_cooldown("user0")
+
+    def test_failed_not_recorded(self, tmp_path):
+        """실패한 트리거는 쿨다운에 기록하지 않음"""
+        state = str(tmp_path / "state.json")
+        limiter = DispatchLimiter(state_path=state, min_interval_sec=0)
+        summary = limiter.dispatch_all(self.candidates(0.2), lambda u, s: False)
+
+        assert summary.failed == ["user0"]
+        assert not limiter.in_cooldown("user0")
+
+    def test_min_interval(self):
+        """트리거 사이 최소 간격 테스트"""
+        times = []
+        limiter = DispatchLimiter(min_interval_sec=0.05)
+        limiter.dispatch_all(
+            self.candidates(0.3, 0.2, 0.1), lambda u, s: times.append(time.monotonic()) or True
+        )
+
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_corrupt_state_ignored(self, tmp_path):
+        """읽을 수 없는 상태 파일은 무시"""
+        state = tmp_path / "state.json"
+        state.write_text("not json")
+        assert DispatchLimiter(state_path=str(state)).last_dispatch == {}
+
+
+class TestCheckModelDrift:
+    """4_trigger_retrain.check_model_drift 테스트"""
+
+    @staticmethod
+    def load_script(monkeypatch, prometheus_url):
+        import importlib.util
+        import os
+
+        monkeypatch.setenv("PROMETHEUS_URL", prometheus_url)
+        path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "scripts", "4_trigger_retrain.py"
+        )
+        spec = importlib.util.spec_from_file_location("trigger_retrain", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_nan_metrics(self):
+        """NaN 메트릭은 판정하지 않는지 테스트"""
+        status = evaluate_drift({"u": float("nan")}, {"u": 0.5})[0]
+        assert status["drift_detected"] is False
+        assert status["reason"] == "No metrics available"
+
+    def test_prometheus_unreachable(self, monkeypatch):
+        """Prometheus에 연결할 수 없으면 No metrics available 반환"""
+        script = self.load_script(monkeypatch, "http://127.0.0.1:1")
+
+        status = script.check_model_drift("user01")
+
+        assert status == {
+            "drift_detected": False,
+            "mae": None,
+            "r2": None,
+            "drift_score": 0,
+            "reason": "No metrics available"
+        }
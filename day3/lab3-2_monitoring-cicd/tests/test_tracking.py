@@ -0,0 +1,219 @@
+"""
+Test cases for batched MLflow logging module
+"""
+
+import threading
+
+import pytest
+
+from src.monitoring.tracking import (
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_PER_BATCH,
+    BatchedMlflowLogger,
+    batch_logger
+)
+
+mlflow = pytest.importorskip("mlflow")
+
+
+class RecordingClient:
+    """log_batch 호출을 기록하고 지정한 횟수만큼 실패하는 클라이언트"""
+
+    def __init__(self, failures=0, error=None):
+        self.failures = failures
+        self.error = error
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        with self.lock:
+            if self.failures > 0:
+                self.failures -= 1
+                raise self.error or ConnectionError("tracking server unavailable")
+            self.calls.append((run_id, list(metrics), list(params), list(tags)))
+
+
+@pytest.fixture
+def file_store(tmp_path, monkeypatch):
+    """로컬 파일 저장소 트래킹 URI와 run"""
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    uri = (tmp_path / "mlruns").as_uri()
+    client = mlflow.tracking.MlflowClient(tracking_uri=uri)
+    experiment_id = client.create_experiment("batch-logger-test")
+    run = client.create_run(experiment_id)
+    return uri, client, run.info.run_id
+
+
+class TestBatchedMlflowLogger:
+    """BatchedMlflowLogger 테스트"""
+
+    def test_invalid_overflow(self):
+        """지원하지 않는 overflow 정책 테스트"""
+        with pytest.raises(ValueError, match="Unsupported overflow policy"):
+            BatchedMlflowLogger("run", client=RecordingClient(), overflow="spill")
+
+    def test_single_batch(self):
+        """여러 호출이 log_batch 한 번으로 합쳐지는지 테스트"""
+        client = RecordingClient()
+        with BatchedMlflowLogger("run", client=client, flush_interval_sec=60) as batch:
+            batch.log_metrics({f"fi_{i}": i / 10 for i in range(8)})
+            batch.log_params({"n_estimators": 100, "max_depth": 5})
+            batch.set_tag("team", "a")
+
+        assert len(client.calls) == 1
+        run_id, metrics, params, tags = client.calls[0]
+        assert run_id == "run"
+        assert len(metrics) == 8
+        assert {p.key: p.value for p in params} == {"n_estimators": "100", "max_depth": "5"}
+        assert tags[0].value == "a"
+        assert batch.stats.batches_sent == 1
+
+    def test_chunking_respects_limits(self):
+        """MLflow 배치 상한에 맞춰 나눠 보내는지 테스트"""
+        client = RecordingClient()
+        batch = BatchedMlflowLogger("run", client=client, flush_interval_sec=60)
+        for i in range(MAX_METRICS_PER_BATCH + 5):
+            batch.log_metric("loss", float(i), step=i)
+        batch.log_params({f"p{i}": i for i in range(MAX_PARAMS_PER_BATCH + 1)})
+        stats = batch.close()
+
+        for _, metrics, params, tags in client.calls:
+            assert len(metrics) <= MAX_METRICS_PER_BATCH
+            assert len(params) <= MAX_PARAMS_PER_BATCH
+            assert len(metrics) + len(params) + len(tags) <= MAX_METRICS_PER_BATCH
+        assert stats.metrics_logged == MAX_METRICS_PER_BATCH + 5
+        assert stats.params_logged == MAX_PARAMS_PER_BATCH + 1
+        steps = [m.step for _, metrics, _, _ in client.calls for m in metrics]
+        assert steps == list(range(MAX_METRICS_PER_BATCH + 5))
+
+    def test_retry(self):
+        """일시적 실패 후 재시도 테스트"""
+        client = RecordingClient(failures=2)
+        with BatchedMlflowLogger("run", client=client, backoff_sec=0.01) as batch:
+            batch.log_metric("mae", 0.5)
+
+        assert len(client.calls) == 1
+        assert batch.stats.retries == 2
+        assert batch.stats.failed_batches == 0
+
+    def test_retry_exhausted(self):
+        """재시도 소진 시 배치를 버리고 기록하는지 테스트"""
+        client = RecordingClient(failures=10)
+        with BatchedMlflowLogger(
+            "run", client=client, max_retries=1, backoff_sec=0.01
+        ) as batch:
+            batch.log_metric("mae", 0.5)
+
+        assert client.calls == []
+        assert batch.stats.failed_batches == 1
+        assert "unavailable" in batch.stats.last_error
+
+    def test_retry_server_error(self):
+        """5xx MlflowException은 재시도하는지 테스트"""
+        from mlflow.exceptions import MlflowException
+        from mlflow.protos.databricks_pb2 import TEMPORARILY_UNAVAILABLE
+
+        error = MlflowException("service unavailable", TEMPORARILY_UNAVAILABLE)
+        client = RecordingClient(failures=1, error=error)
+        with BatchedMlflowLogger("run", client=client, backoff_sec=0.01) as batch:
+            batch.log_metric("mae", 0.5)
+
+        assert len(client.calls) == 1
+        assert batch.stats.retries == 1
+
+    def test_no_retry_client_error(self):
+        """INVALID_PARAMETER_VALUE 같은 4xx 오류는 재시도하지 않는지 테스트"""
+        from mlflow.exceptions import MlflowException
+        from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+        error = MlflowException("param already logged", INVALID_PARAMETER_VALUE)
+        client = RecordingClient(failures=10, error=error)
+        with BatchedMlflowLogger("run", client=client, backoff_sec=0.01) as batch:
+            batch.log_param("n_estimators", 100)
+
+        assert client.failures == 9
+        assert batch.stats.retries == 0
+        assert batch.stats.failed_batches == 1
+        assert "already logged" in batch.stats.last_error
+
+    def test_drop_when_full(self):
+        """overflow="drop"일 때 버퍼 상한 초과 항목을 버리는지 테스트"""
+        client = RecordingClient()
+        batch = BatchedMlflowLogger(
+            "run", client=client, flush_interval_sec=60, max_buffer=3, overflow="drop"
+        )
+        for i in range(5):
+            batch.log_metric("m", float(i), step=i)
+        stats = batch.close()
+
+        assert stats.metrics_logged + stats.dropped == 5
+        assert stats.dropped >= 2
+
+    def test_block_when_full(self):
+        """overflow="block"일 때 항목 손실 없이 모두 전송하는지 테스트"""
+        client = RecordingClient()
+        batch = BatchedMlflowLogger("run", client=client, flush_interval_sec=60, max_buffer=2)
+        for i in range(10):
+            batch.log_metric("m", float(i), step=i)
+        stats = batch.close()
+
+        assert stats.metrics_logged == 10
+        assert stats.dropped == 0
+
+    def test_flush(self):
+        """flush 후 pending이 0인지 테스트"""
+        client = RecordingClient()
+        batch = BatchedMlflowLogger("run", client=client, flush_interval_sec=60)
+        batch.log_metric("mae", 0.5)
+
+        assert batch.flush(timeout=5)
+        assert batch.pending == 0
+        assert len(client.calls) == 1
+        batch.close()
+
+    def test_log_after_close(self):
+        """종료 후 기록 시 오류 테스트"""
+        batch = BatchedMlflowLogger("run", client=RecordingClient())
+        batch.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            batch.log_metric("mae", 0.5)
+
+
+class TestFileStore:
+    """로컬 파일 저장소 트래킹 URI 통합 테스트"""
+
+    def test_logged_to_run(self, file_store):
+        """파일 저장소 run에 메트릭/파라미터/태그가 기록되는지 테스트"""
+        uri, client, run_id = file_store
+
+        with BatchedMlflowLogger(run_id, tracking_uri=uri) as batch:
+            batch.log_metrics({"r2": 0.8, "mae": 0.3})
+            batch.log_metric("loss", 1.0, step=0)
+            batch.log_metric("loss", 0.5, step=1)
+            batch.log_params({"model_type": "random_forest"})
+            batch.set_tags({"team": "a", "pipeline": "test"})
+
+        data = client.get_run(run_id).data
+        assert data.metrics["r2"] == pytest.approx(0.8)
+        assert data.params["model_type"] == "random_forest"
+        assert data.tags["team"] == "a"
+        history = client.get_metric_history(run_id, "loss")
+        assert [m.value for m in sorted(history, key=lambda m: m.step)] == [1.0, 0.5]
+
+    def test_batch_logger_active_run(self, file_store, monkeypatch):
+        """batch_logger가 활성 run을 사용하는지 테스트"""
+        uri, client, _ = file_store
+        monkeypatch.setenv("MLFLOW_TRACKING_URI", uri)
+        experiment = client.get_experiment_by_name("batch-logger-test")
+
+        with mlflow.start_run(experiment_id=experiment.experiment_id) as run:
+            with batch_logger() as batch:
+                batch.log_metric("drift_score", 0.2)
+
+        assert client.get_run(run.info.run_id).data.metrics["drift_score"] == pytest.approx(0.2)
+
+    def test_batch_logger_requires_run(self):
+        """활성 run이 없을 때 오류 테스트"""
+        with pytest.raises(RuntimeError, match="No active MLflow run"):
+            batch_logger()
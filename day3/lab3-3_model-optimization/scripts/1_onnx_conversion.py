@@ -16,10 +16,11 @@ from sklearn.metrics import accuracy_score
 
 # ONNX 관련 라이브러리
 import onnx
-import onnxruntime as ort
 from skl2onnx import convert_sklearn
 from skl2onnx.common.data_types import FloatTensorType
 
+from session_manager import create_session
+
 def main():
     print("=" * 60)
     print("Lab 3-3: ONNX Conversion")
@@ -106,7 +107,7 @@ def main():
     print("   ✅ ONNX 모델 유효성 검사 통과")
     
     # ONNX Runtime으로 추론 테스트
-    sess = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+    sess = create_session(onnx_path)
     
     # 입력/출력 정보
     input_name = sess.get_inputs()[0].name
@@ -1,23 +1,36 @@
 #!/usr/bin/env python3
 """
 Lab 3-3: Quantization
-동적 양자화를 적용하여 모델 크기 및 추론 속도 최적화
+동적 양자화를 적용하여 모델 크기 및 추론 속도 최적화하고,
+정적(보정) 양자화 / FP16 변형과 비교해 배포할 변형을 추천
 
 실행: python scripts/2_quantization.py
+      python scripts/2_quantization.py --budget 0.02 --exclude-op-types Gemm
 사전 요구: python scripts/1_onnx_conversion.py 실행 완료
 """
 
 import os
+import json
+import argparse
 import numpy as np
 from sklearn.datasets import load_iris
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score
 
 import onnx
-import onnxruntime as ort
 from onnxruntime.quantization import quantize_dynamic, QuantType
 
+from quantization_suite import QuantizationConfig, print_report, sweep_variants
+from session_manager import create_session
+
 def main():
+    parser = argparse.ArgumentParser(description='양자화 실습')
+    parser.add_argument('--budget', type=float, default=0.01,
+                        help='허용 정확도 감소폭 (추천 기준)')
+    parser.add_argument('--exclude-op-types', nargs='*', default=[],
+                        help='양자화 제외 연산자 유형')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Lab 3-3: Quantization (동적 양자화)")
     print("=" * 60)
@@ -82,15 +95,15 @@ def main():
     # 테스트 데이터 준비
     iris = load_iris()
     X, y = iris.data, iris.target
-    _, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
     
     # ONNX 원본 모델 추론
-    sess_original = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+    sess_original = create_session(onnx_path)
     input_name = sess_original.get_inputs()[0].name
     onnx_pred = sess_original.run(None, {input_name: X_test.astype(np.float32)})[0]
     
     # 양자화 모델 추론
-    sess_quantized = ort.InferenceSession(quantized_path, providers=['CPUExecutionProvider'])
+    sess_quantized = create_session(quantized_path)
     quant_pred = sess_quantized.run(None, {input_name: X_test.astype(np.float32)})[0]
     
     # 정확도 계산
@@ -110,6 +123,31 @@ def main():
     else:
         print(f"\n   ⚠️ 양자화 후 정확도 변화: {accuracy_diff:+.2f}%")
     
+    # =========================================================================
+    # Step 4: 정적 양자화 / FP16 변형 비교 및 추천
+    # =========================================================================
+    print("\n⚖️ Step 4: 양자화 변형 비교 (정확도 × 지연 시간)")
+    print("-" * 40)
+    print("   static_qdq: 학습 데이터 200행으로 활성값 범위 보정 (INT8, QDQ)")
+    print("   fp16: float16 변환 (트리 연산자는 float32 유지)")
+    print(f"   허용 정확도 감소폭: {args.budget:.2%}\n")
+
+    report = sweep_variants(
+        onnx_path, X_train, X_test, y_test,
+        task='classification',
+        budget=args.budget,
+        output_dir='outputs/quantized',
+        config=QuantizationConfig(exclude_op_types=args.exclude_op_types)
+    )
+    print_report(report)
+    print(f"\n   ★ 추천 변형: {report.recommended}")
+    if report.recommended == 'fp32':
+        print("   💡 트리 모델에는 양자화할 MatMul/Gemm이 없어 원본이 가장 적합합니다.")
+
+    with open('outputs/quantization_report.json', 'w') as f:
+        json.dump(report.to_dict(), f, indent=2)
+    print("   💾 리포트 저장: outputs/quantization_report.json")
+
     # =========================================================================
     # 결과 요약
     # =========================================================================
@@ -121,6 +159,7 @@ def main():
     print(f"   {'파일 크기':<20} {onnx_size:.2f} KB{'':<8} {quant_size:.2f} KB")
     print(f"   {'테스트 정확도':<20} {onnx_accuracy:.4f}{'':<10} {quant_accuracy:.4f}")
     print(f"   {'양자화 타입':<20} {'-':<15} {'UINT8':<15}")
+    print(f"   {'추천 변형':<20} {report.recommended:<15}")
     print("=" * 60)
     
     print("\n✅ 양자화 실습 완료!")
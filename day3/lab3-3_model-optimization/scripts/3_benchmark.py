@@ -11,10 +11,13 @@ Lab 3-3: Benchmark & MLflow
   - python scripts/1_onnx_conversion.py 실행 완료
   - python scripts/2_quantization.py 실행 완료
   - IRSA 설정 완료 (S3 접근용)
+
+추론 시간은 benchmark_suite.py로 측정합니다 (호출별 지연 시간의 p50/p95/p99, 신뢰 구간).
+배치 크기 × 스레드 수 전체 매트릭스는 outputs/benchmark.json에 저장되어 MLflow 아티팩트로 기록됩니다.
 """
 
 import os
-import time
+import json
 import boto3
 import pickle
 import numpy as np
@@ -22,23 +25,20 @@ from sklearn.datasets import load_iris
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score
 
-import onnxruntime as ort
 import mlflow
 from mlflow import MlflowClient
 
-def measure_inference_time(predict_fn, X, n_iterations=1000):
-    """추론 시간 측정 (밀리초 단위)"""
-    # 워밍업
-    for _ in range(10):
-        predict_fn(X)
-    
-    # 실제 측정
-    start = time.perf_counter()
-    for _ in range(n_iterations):
-        predict_fn(X)
-    end = time.perf_counter()
-    
-    return ((end - start) / n_iterations) * 1000  # ms로 변환
+from benchmark_suite import (
+    BenchmarkConfig,
+    measure,
+    onnx_factory,
+    print_header,
+    print_stats,
+    run_benchmark,
+    sklearn_factory,
+    summarize
+)
+from session_manager import BoundSession, create_session, load_settings
 
 def main():
 
@@ -112,18 +112,15 @@ def main():
     with open(files['original'], 'rb') as f:
         sklearn_model = pickle.load(f)
     
-    # ONNX 모델 로드
-    onnx_session = ort.InferenceSession(
-        files['onnx'], 
-        providers=['CPUExecutionProvider']
-    )
-    input_name = onnx_session.get_inputs()[0].name
+    # 세션 설정 (session_manager.py로 튜닝한 결과가 있으면 사용)
+    session_settings = load_settings()
+    print(f"   세션 설정: {session_settings.to_dict()}")
+    
+    # ONNX 모델 로드 (라벨 출력만, 배치 크기별 IO 바인딩 재사용)
+    onnx_session = BoundSession(create_session(files['onnx'], session_settings))
     
     # 양자화 모델 로드
-    quant_session = ort.InferenceSession(
-        files['quantized'], 
-        providers=['CPUExecutionProvider']
-    )
+    quant_session = BoundSession(create_session(files['quantized'], session_settings))
     
     print("   ✅ 모든 모델 로드 완료")
     
@@ -147,44 +144,57 @@ def main():
     print("\n⚡ Step 3: 추론 속도 벤치마크")
     print("-" * 40)
     
-    n_iterations = 1000
-    print(f"   반복 횟수: {n_iterations}회")
-    
-    # 원본 sklearn 추론
-    print("\n   원본 sklearn 측정 중...")
-    original_time = measure_inference_time(
-        lambda x: sklearn_model.predict(x), 
-        X_test, 
-        n_iterations
-    )
-    
-    # ONNX 추론
-    print("   ONNX Runtime 측정 중...")
-    onnx_time = measure_inference_time(
-        lambda x: onnx_session.run(None, {input_name: x.astype(np.float32)}),
-        X_test,
-        n_iterations
-    )
-    
-    # 양자화 모델 추론
-    print("   양자화 모델 측정 중...")
-    quant_time = measure_inference_time(
-        lambda x: quant_session.run(None, {input_name: x.astype(np.float32)}),
-        X_test,
-        n_iterations
-    )
-    
-    # 속도 향상 계산
+    # 호출별 지연 시간 기록 (최소 1000회, 평균 대신 중앙값/꼬리 지연 보고)
+    config = BenchmarkConfig(min_iterations=1000, max_iterations=1000, min_time_sec=0)
+    n_iterations = config.min_iterations
+    print(f"   반복 횟수: {n_iterations}회 (테스트 세트 {len(X_test)}행 배치)")
+    
+    # 테스트 세트 전체 배치 측정
+    print()
+    print_header()
+    test_stats = {}
+    for name, predict_fn in [
+        ('sklearn', lambda x: sklearn_model.predict(x)),
+        ('onnx', onnx_session.run),
+        ('quantized', quant_session.run)
+    ]:
+        X_bench = X_test if name == 'sklearn' else X_test_float32
+        timings = measure(predict_fn, X_bench, config)
+        test_stats[name] = summarize(timings, name, len(X_test), threads=1)
+        print_stats(test_stats[name])
+    
+    # 속도 향상 계산 (p50 기준)
+    original_time = test_stats['sklearn'].p50_ms
+    onnx_time = test_stats['onnx'].p50_ms
+    quant_time = test_stats['quantized'].p50_ms
     onnx_speedup = original_time / onnx_time
     quant_speedup = original_time / quant_time
     
-    print(f"\n   📊 벤치마크 결과:")
+    print(f"\n   📊 벤치마크 결과 (p50):")
     print(f"   {'모델':<15} {'추론 시간':<15} {'속도 향상':<10}")
     print(f"   {'-' * 40}")
     print(f"   {'원본 sklearn':<15} {original_time:.4f} ms{'':<6} 1.0x")
     print(f"   {'ONNX':<15} {onnx_time:.4f} ms{'':<6} {onnx_speedup:.1f}x")
     print(f"   {'양자화':<15} {quant_time:.4f} ms{'':<6} {quant_speedup:.1f}x")
     
+    # 배치 크기별 매트릭스 (1 ~ 65536행)
+    print(f"\n   배치 크기별 측정 중...")
+    matrix_config = BenchmarkConfig(min_time_sec=0.5)
+    print_header()
+    benchmark_report = run_benchmark(
+        {
+            'sklearn': sklearn_factory(sklearn_model),
+            'onnx': onnx_factory(files['onnx'], session_settings),
+            'quantized': onnx_factory(files['quantized'], session_settings)
+        },
+        X,
+        matrix_config
+    )
+    benchmark_path = 'outputs/benchmark.json'
+    with open(benchmark_path, 'w') as f:
+        json.dump(benchmark_report, f, indent=2)
+    print(f"   ✅ 매트릭스 결과 저장: {benchmark_path}")
+    
     # =========================================================================
     # Step 4: 정확도 검증
     # =========================================================================
@@ -193,8 +203,8 @@ def main():
     
     # 예측
     original_pred = sklearn_model.predict(X_test)
-    onnx_pred = onnx_session.run(None, {input_name: X_test_float32})[0]
-    quant_pred = quant_session.run(None, {input_name: X_test_float32})[0]
+    onnx_pred = onnx_session.run(X_test_float32)[0].copy()
+    quant_pred = quant_session.run(X_test_float32)[0].copy()
     
     # 정확도 계산
     test_accuracy = accuracy_score(y_test, original_pred)
@@ -292,33 +302,46 @@ def main():
     
     # MLflow Run 시작
     with mlflow.start_run(run_name="benchmark-results") as run:
-        # 크기 메트릭
-        mlflow.log_metric("original_size_kb", original_size)
-        mlflow.log_metric("onnx_size_kb", onnx_size)
-        mlflow.log_metric("quantized_size_kb", quant_size)
-        
-        # 속도 메트릭
-        mlflow.log_metric("original_inference_ms", original_time)
-        mlflow.log_metric("onnx_inference_ms", onnx_time)
-        mlflow.log_metric("quantized_inference_ms", quant_time)
-        mlflow.log_metric("onnx_speedup", onnx_speedup)
-        mlflow.log_metric("quantized_speedup", quant_speedup)
-        
-        # 정확도 메트릭
-        mlflow.log_metric("original_accuracy", test_accuracy)
-        mlflow.log_metric("onnx_accuracy", onnx_accuracy)
-        mlflow.log_metric("quantized_accuracy", quant_accuracy)
+        # 메트릭/파라미터를 dict로 모아 log_batch 요청 한 번씩으로 전송
+        metrics = {
+            # 크기 메트릭
+            "original_size_kb": original_size,
+            "onnx_size_kb": onnx_size,
+            "quantized_size_kb": quant_size,
+            # 속도 메트릭
+            "original_inference_ms": original_time,
+            "onnx_inference_ms": onnx_time,
+            "quantized_inference_ms": quant_time,
+            "onnx_speedup": onnx_speedup,
+            "quantized_speedup": quant_speedup,
+            # 정확도 메트릭
+            "original_accuracy": test_accuracy,
+            "onnx_accuracy": onnx_accuracy,
+            "quantized_accuracy": quant_accuracy
+        }
+        for name, stats in test_stats.items():
+            prefix = "original" if name == "sklearn" else name
+            metrics[f"{prefix}_p95_ms"] = stats.p95_ms
+            metrics[f"{prefix}_p99_ms"] = stats.p99_ms
+            metrics[f"{prefix}_throughput_rows_per_sec"] = stats.throughput_rows_per_sec
+        mlflow.log_metrics(metrics)
         
         # 파라미터
-        mlflow.log_param("n_iterations", n_iterations)
-        mlflow.log_param("test_samples", len(X_test))
-        mlflow.log_param("quantization_type", "dynamic_uint8")
+        params = {
+            "n_iterations": n_iterations,
+            "test_samples": len(X_test),
+            "quantization_type": "dynamic_uint8"
+        }
+        for key, value in session_settings.to_dict().items():
+            params[f"ort_{key}"] = value
+        mlflow.log_params(params)
         
         # 아티팩트 (모델 파일)
         print("\n   아티팩트 업로드 중...")
         try:
             mlflow.log_artifact(files['onnx'])
             mlflow.log_artifact(files['quantized'])
+            mlflow.log_artifact(benchmark_path)
             print("   ✅ 아티팩트 업로드 완료")
         except Exception as e:
             print(f"   ⚠️ 아티팩트 업로드 실패: {e}")
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Lab 3-3: 추론 벤치마크 스위트
+
+원본 sklearn / ONNX / 양자화 ONNX 모델을 배치 크기 × 스레드 수 조합별로 측정합니다.
+평균 하나만 보는 대신 호출별 지연 시간을 모두 기록해 분포를 보고합니다.
+
+- 지연 시간: p50 / p95 / p99 / 평균 / 표준편차 (ms)
+- 처리량: rows/sec
+- 신뢰 구간: p50과 평균의 95% 부트스트랩 신뢰 구간
+- CPU 고정: --cpus 0,1 (Linux sched_setaffinity)
+- 결과 JSON 저장, 두 실행 결과 비교 (회귀 감지 시 exit code 1)
+
+실행:
+  # 측정 (outputs/ 의 모델 파일 사용)
+  python scripts/benchmark_suite.py run --output outputs/benchmark.json
+  python scripts/benchmark_suite.py run --batch-sizes 1 64 --threads 1 4 --cpus 0-3
+
+  # 회귀 비교 (p50이 10% 넘게 느려지고 신뢰 구간이 겹치지 않으면 실패)
+  python scripts/benchmark_suite.py compare outputs/baseline.json outputs/benchmark.json --threshold 0.10
+"""
+
+import os
+import sys
+import json
+import time
+import pickle
+import argparse
+import platform
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from sklearn.datasets import load_iris
+
+from session_manager import BoundSession, SessionSettings, create_session
+
+DEFAULT_BATCH_SIZES = [1, 8, 64, 1024, 65536]
+
+MODEL_FILES = {
+    'sklearn': 'outputs/model_original.pkl',
+    'onnx': 'outputs/model_optimized.onnx',
+    'quantized': 'outputs/model_quantized.onnx'
+}
+
+# 백엔드 팩토리: 스레드 수 → predict(X) 함수
+PredictFactory = Callable[[int], Callable[[np.ndarray], object]]
+
+
+@dataclass
+class BenchmarkConfig:
+    """벤치마크 설정"""
+    batch_sizes: List[int] = field(default_factory=lambda: list(DEFAULT_BATCH_SIZES))
+    thread_counts: List[int] = field(default_factory=lambda: [1])
+    warmup: int = 10
+    min_iterations: int = 30
+    max_iterations: int = 1000
+    min_time_sec: float = 1.0
+    n_bootstrap: int = 1000
+    cpus: Optional[List[int]] = None
+    seed: int = 42
+
+
+@dataclass
+class LatencyStats:
+    """한 조합(백엔드, 배치 크기, 스레드 수)의 측정 결과"""
+    backend: str
+    batch_size: int
+    threads: int
+    iterations: int
+    mean_ms: float
+    std_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    min_ms: float
+    max_ms: float
+    p50_ci_ms: List[float]
+    mean_ci_ms: List[float]
+    throughput_rows_per_sec: float
+    throughput_ci: List[float]
+
+    @property
+    def key(self) -> str:
+        return f"{self.backend}/b{self.batch_size}/t{self.threads}"
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def summarize(
+    timings_ms: np.ndarray,
+    backend: str,
+    batch_size: int,
+    threads: int,
+    n_bootstrap: int = 1000,
+    seed: int = 42
+) -> LatencyStats:
+    """
+    호출별 지연 시간 → 분위수 / 부트스트랩 신뢰 구간
+
+    Args:
+        timings_ms: 호출별 지연 시간 (ms)
+        backend: 백엔드 이름
+        batch_size: 배치 크기
+        threads: 스레드 수
+        n_bootstrap: 부트스트랩 재표본 수
+        seed: 재표본 난수 시드
+
+    Returns:
+        LatencyStats
+    """
+    timings_ms = np.asarray(timings_ms, dtype=np.float64)
+    p50, p95, p99 = np.percentile(timings_ms, [50, 95, 99])
+
+    rng = np.random.default_rng(seed)
+    samples = timings_ms[rng.integers(0, len(timings_ms), size=(n_bootstrap, len(timings_ms)))]
+    p50_ci = np.percentile(np.median(samples, axis=1), [2.5, 97.5])
+    mean_ci = np.percentile(samples.mean(axis=1), [2.5, 97.5])
+
+    # 처리량은 중앙값 기준 (느린 쪽 CI 경계 → 낮은 처리량)
+    throughput = batch_size / (p50 / 1000)
+    throughput_ci = [batch_size / (p50_ci[1] / 1000), batch_size / (p50_ci[0] / 1000)]
+
+    return LatencyStats(
+        backend=backend,
+        batch_size=batch_size,
+        threads=threads,
+        iterations=len(timings_ms),
+        mean_ms=float(timings_ms.mean()),
+        std_ms=float(timings_ms.std(ddof=1)) if len(timings_ms) > 1 else 0.0,
+        p50_ms=float(p50),
+        p95_ms=float(p95),
+        p99_ms=float(p99),
+        min_ms=float(timings_ms.min()),
+        max_ms=float(timings_ms.max()),
+        p50_ci_ms=[float(v) for v in p50_ci],
+        mean_ci_ms=[float(v) for v in mean_ci],
+        throughput_rows_per_sec=float(throughput),
+        throughput_ci=[float(v) for v in throughput_ci]
+    )
+
+
+def measure(
+    predict_fn: Callable[[np.ndarray], object],
+    X: np.ndarray,
+    config: BenchmarkConfig
+) -> np.ndarray:
+    """
+    호출별 지연 시간 측정 (ms 배열)
+
+    워밍업 후 min_iterations회 이상, min_time_sec 이상 반복하며 max_iterations에서 멈춥니다.
+    큰 배치는 반복 횟수가 자동으로 줄어듭니다.
+    """
+    for _ in range(config.warmup):
+        predict_fn(X)
+
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < config.max_iterations:
+        start = time.perf_counter_ns()
+        predict_fn(X)
+        timings.append((time.perf_counter_ns() - start) / 1e6)
+        if (len(timings) >= config.min_iterations
+                and time.perf_counter() - started >= config.min_time_sec):
+            break
+    return np.asarray(timings)
+
+
+def make_batch(X: np.ndarray, batch_size: int, seed: int = 42) -> np.ndarray:
+    """테스트 데이터에서 복원 추출로 batch_size 행 입력 생성 (float32)"""
+    rng = np.random.default_rng(seed)
+    return np.ascontiguousarray(X[rng.integers(0, len(X), size=batch_size)], dtype=np.float32)
+
+
+def sklearn_factory(model) -> PredictFactory:
+    """sklearn 모델 팩토리 (n_jobs와 BLAS/OpenMP 스레드 수 제한)"""
+    from threadpoolctl import threadpool_limits
+
+    def factory(threads: int):
+        if hasattr(model, 'n_jobs'):
+            model.n_jobs = threads
+
+        def predict(X):
+            with threadpool_limits(limits=threads):
+                return model.predict(X)
+        return predict
+    return factory
+
+
+def onnx_factory(path: str, settings: Optional[SessionSettings] = None) -> PredictFactory:
+    """
+    ONNX Runtime 세션 팩토리 (intra_op_num_threads)
+
+    settings의 나머지 설정(실행 모드, 메모리 아레나 등)은 그대로 두고 스레드 수만 바꾸며,
+    배치 크기별 IO 바인딩을 재사용합니다.
+    """
+    base = settings or SessionSettings()
+
+    def factory(threads: int):
+        session = create_session(path, replace(base, intra_op_num_threads=threads))
+        bound = BoundSession(session, output_names=[session.get_outputs()[0].name])
+        return bound.run
+    return factory
+
+
+def load_backends(files: Dict[str, str] = MODEL_FILES) -> Dict[str, PredictFactory]:
+    """존재하는 모델 파일로 백엔드 구성 (없는 파일은 건너뜀)"""
+    backends = {}
+    for name, path in files.items():
+        if not os.path.exists(path):
+            print(f"   ⚠️ {name}: {path} 없음 (건너뜀)")
+            continue
+        if path.endswith('.pkl'):
+            with open(path, 'rb') as f:
+                backends[name] = sklearn_factory(pickle.load(f))
+        else:
+            backends[name] = onnx_factory(path)
+    return backends
+
+
+def pin_cpus(cpus: Optional[Sequence[int]]) -> Optional[List[int]]:
+    """현재 프로세스를 지정한 CPU에 고정 (Linux). 적용된 CPU 목록 반환"""
+    if not hasattr(os, 'sched_getaffinity'):
+        if cpus:
+            print("   ⚠️ 이 플랫폼은 CPU 고정을 지원하지 않습니다")
+        return None
+    if cpus:
+        os.sched_setaffinity(0, set(cpus))
+    return sorted(os.sched_getaffinity(0))
+
+
+def run_benchmark(
+    backends: Dict[str, PredictFactory],
+    X: np.ndarray,
+    config: BenchmarkConfig,
+    verbose: bool = True
+) -> Dict:
+    """
+    백엔드 × 스레드 수 × 배치 크기 전체 측정
+
+    Args:
+        backends: {이름: 팩토리}
+        X: 입력 풀 (배치는 여기서 복원 추출)
+        config: 벤치마크 설정
+        verbose: 진행 상황 출력
+
+    Returns:
+        {'meta': 실행 환경, 'results': [LatencyStats dict, ...]}
+    """
+    affinity = pin_cpus(config.cpus)
+    batches = {bs: make_batch(X, bs, config.seed) for bs in config.batch_sizes}
+
+    results = []
+    for name, factory in backends.items():
+        for threads in config.thread_counts:
+            predict_fn = factory(threads)
+            for batch_size, batch in batches.items():
+                timings = measure(predict_fn, batch, config)
+                stats = summarize(timings, name, batch_size, threads,
+                                  config.n_bootstrap, config.seed)
+                results.append(stats.to_dict())
+                if verbose:
+                    print_stats(stats)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'cpu_affinity': affinity,
+            'config': asdict(config)
+        },
+        'results': results
+    }
+
+
+def print_header():
+    print(f"   {'backend':<10} {'batch':>6} {'thr':>3} {'iters':>6} "
+          f"{'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'p50 95% CI':>21} {'rows/s':>13}")
+    print(f"   {'-' * 96}")
+
+
+def print_stats(stats: LatencyStats):
+    ci = f"[{stats.p50_ci_ms[0]:.4f}, {stats.p50_ci_ms[1]:.4f}]"
+    print(f"   {stats.backend:<10} {stats.batch_size:>6} {stats.threads:>3} {stats.iterations:>6} "
+          f"{stats.p50_ms:>10.4f} {stats.p95_ms:>10.4f} {stats.p99_ms:>10.4f} {ci:>21} "
+          f"{stats.throughput_rows_per_sec:>13,.0f}")
+
+
+def compare_runs(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    두 실행 결과 비교
+
+    같은 (백엔드, 배치 크기, 스레드 수) 조합에서 p50이 threshold 이상 느려지고
+    두 p50 신뢰 구간이 겹치지 않으면 회귀로 판정합니다 (측정 잡음에 의한 오탐 방지).
+
+    Args:
+        baseline: 기준 실행 JSON
+        current: 비교 실행 JSON
+        threshold: 허용 p50 상대 증가율 (0.10 = 10%)
+
+    Returns:
+        조합별 비교 결과 목록 (regression 키 포함)
+    """
+    base = {(r['backend'], r['batch_size'], r['threads']): r for r in baseline['results']}
+    rows = []
+    for r in current['results']:
+        key = (r['backend'], r['batch_size'], r['threads'])
+        if key not in base:
+            continue
+        b = base[key]
+        change = r['p50_ms'] / b['p50_ms'] - 1
+        separated = r['p50_ci_ms'][0] > b['p50_ci_ms'][1]
+        rows.append({
+            'backend': key[0],
+            'batch_size': key[1],
+            'threads': key[2],
+            'baseline_p50_ms': b['p50_ms'],
+            'current_p50_ms': r['p50_ms'],
+            'change': change,
+            'regression': bool(change > threshold and separated)
+        })
+    return rows
+
+
+def cmd_run(args) -> int:
+    config = BenchmarkConfig(
+        batch_sizes=args.batch_sizes,
+        thread_counts=args.threads,
+        warmup=args.warmup,
+        min_iterations=args.min_iterations,
+        max_iterations=args.max_iterations,
+        min_time_sec=args.min_time,
+        cpus=args.cpus
+    )
+
+    print("=" * 60)
+    print("Lab 3-3: 추론 벤치마크 스위트")
+    print("=" * 60)
+
+    backends = load_backends()
+    if not backends:
+        print("   ❌ 모델 파일이 없습니다. 1_onnx_conversion.py, 2_quantization.py를 먼저 실행하세요.")
+        return 1
+
+    X = load_iris().data
+    print()
+    print_header()
+    report = run_benchmark(backends, X, config)
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n   ✅ 결과 저장: {args.output}")
+    return 0
+
+
+def cmd_compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    rows = compare_runs(baseline, current, args.threshold)
+    print(f"   {'backend':<10} {'batch':>6} {'thr':>3} {'base p50':>10} {'cur p50':>10} {'change':>8}")
+    print(f"   {'-' * 54}")
+    for row in rows:
+        mark = "❌" if row['regression'] else "  "
+        print(f"   {row['backend']:<10} {row['batch_size']:>6} {row['threads']:>3} "
+              f"{row['baseline_p50_ms']:>10.4f} {row['current_p50_ms']:>10.4f} "
+              f"{row['change'] * 100:>+7.1f}% {mark}")
+
+    regressions = [row for row in rows if row['regression']]
+    if regressions:
+        print(f"\n   ❌ 성능 회귀 {len(regressions)}건 (p50 +{args.threshold * 100:.0f}% 초과)")
+        return 1
+    print(f"\n   ✅ 성능 회귀 없음 ({len(rows)}개 조합 비교)")
+    return 0
+
+
+def parse_cpus(value: str) -> List[int]:
+    """'0,2-3' → [0, 2, 3]"""
+    cpus = []
+    for part in value.split(','):
+        if '-' in part:
+            low, high = part.split('-')
+            cpus.extend(range(int(low), int(high) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추론 벤치마크 스위트")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help="벤치마크 측정")
+    run.add_argument('--batch-sizes', type=int, nargs='+', default=DEFAULT_BATCH_SIZES)
+    run.add_argument('--threads', type=int, nargs='+', default=[1])
+    run.add_argument('--warmup', type=int, default=10)
+    run.add_argument('--min-iterations', type=int, default=30)
+    run.add_argument('--max-iterations', type=int, default=1000)
+    run.add_argument('--min-time', type=float, default=1.0, help="조합당 최소 측정 시간 (초)")
+    run.add_argument('--cpus', type=parse_cpus, default=None, help="CPU 고정 (예: 0,1 또는 0-3)")
+    run.add_argument('--output', default='outputs/benchmark.json')
+    run.set_defaults(func=cmd_run)
+
+    compare = sub.add_parser('compare', help="두 실행 결과 비교 (회귀 시 exit 1)")
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.10)
+    compare.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
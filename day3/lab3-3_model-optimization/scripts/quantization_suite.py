@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Lab 3-3: 양자화 스위트
+
+ONNX 모델 하나로 여러 경량화 변형을 만들고 정확도 × 지연 시간을 함께 비교합니다.
+
+- dynamic   : 가중치만 UINT8 (quantize_dynamic, 기존 2_quantization.py 방식)
+- static_qdq: 학습 데이터로 활성값 범위를 보정(calibration)한 정적 INT8 양자화 (QDQ 포맷)
+- fp16      : float16 변환 (ai.onnx.ml 연산자는 float32로 유지, 입출력 dtype 유지)
+
+연산자 유형 / 노드 이름 단위로 양자화·fp16 변환에서 제외할 수 있습니다.
+sweep_variants()는 모든 변형을 평가해 허용 오차(정확도 감소 또는 MAE 증가율) 안에서
+원본보다 확실히 빠른(p50 5% 이상 개선 + 95% 신뢰 구간 비겹침) 가장 빠른 변형을 추천합니다.
+트리 앙상블처럼 양자화할 MatMul/Gemm이 없는 그래프에서는 원본(fp32)이 추천됩니다.
+
+실행:
+  python scripts/quantization_suite.py --model outputs/model_optimized.onnx --budget 0.01
+  python scripts/quantization_suite.py --exclude-op-types Gemm --fp16-block-ops Softmax
+"""
+
+import os
+import sys
+import json
+import argparse
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.model_selection import train_test_split
+
+from benchmark_suite import BenchmarkConfig, LatencyStats, make_batch, measure, summarize
+from session_manager import SessionSettings, create_session
+
+ML_DOMAIN = 'ai.onnx.ml'
+
+VARIANTS = ['fp32', 'dynamic', 'static_qdq', 'fp16']
+
+CALIBRATION_METHODS = ['minmax', 'entropy', 'percentile']
+
+
+@dataclass
+class QuantizationConfig:
+    """양자화 변형 생성 설정"""
+    calibration_samples: int = 200
+    calibration_batch_size: int = 32
+    calibration_method: str = 'minmax'
+    per_channel: bool = False
+    exclude_op_types: List[str] = field(default_factory=list)
+    exclude_nodes: List[str] = field(default_factory=list)
+    fp16_block_ops: List[str] = field(default_factory=list)
+    seed: int = 42
+
+    def __post_init__(self):
+        if self.calibration_method not in CALIBRATION_METHODS:
+            raise ValueError(
+                f"Unsupported calibration method: {self.calibration_method}. "
+                f"Supported: {CALIBRATION_METHODS}"
+            )
+
+
+@dataclass
+class VariantResult:
+    """변형 하나의 평가 결과"""
+    name: str
+    path: str
+    size_kb: float
+    metric: float
+    agreement: float
+    latency: LatencyStats
+    quantized_nodes: int = 0
+    within_budget: bool = False
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data['latency'] = self.latency.to_dict()
+        return data
+
+
+@dataclass
+class QuantizationReport:
+    """변형 비교 결과와 추천"""
+    task: str
+    metric_name: str
+    budget: float
+    batch_size: int
+    variants: List[VariantResult]
+    recommended: str
+
+    def to_dict(self) -> Dict:
+        return {
+            'task': self.task,
+            'metric_name': self.metric_name,
+            'budget': self.budget,
+            'batch_size': self.batch_size,
+            'recommended': self.recommended,
+            'variants': [v.to_dict() for v in self.variants]
+        }
+
+
+def _training_data_reader_class():
+    from onnxruntime.quantization import CalibrationDataReader
+
+    class TrainingDataReader(CalibrationDataReader):
+        """학습 데이터에서 추출한 보정용 입력 배치"""
+
+        def __init__(self, input_name: str, X: np.ndarray, batch_size: int):
+            self.batches = [
+                {input_name: np.ascontiguousarray(X[i:i + batch_size], dtype=np.float32)}
+                for i in range(0, len(X), batch_size)
+            ]
+            self._iter = iter(self.batches)
+
+        def get_next(self):
+            return next(self._iter, None)
+
+        def rewind(self):
+            self._iter = iter(self.batches)
+
+    return TrainingDataReader
+
+
+def calibration_reader(model_path: str, X_train: np.ndarray, config: QuantizationConfig):
+    """
+    학습 데이터 보정 리더 생성
+
+    Args:
+        model_path: ONNX 모델 경로 (입력 이름 확인용)
+        X_train: 학습 데이터 특성
+        config: 양자화 설정 (calibration_samples / calibration_batch_size)
+
+    Returns:
+        onnxruntime.quantization.CalibrationDataReader
+    """
+    import onnx
+
+    input_name = onnx.load(model_path).graph.input[0].name
+    rng = np.random.default_rng(config.seed)
+    n = min(config.calibration_samples, len(X_train))
+    X = X_train[rng.choice(len(X_train), size=n, replace=False)]
+    return _training_data_reader_class()(input_name, X, config.calibration_batch_size)
+
+
+def excluded_node_names(model, op_types: Sequence[str], nodes: Sequence[str]) -> List[str]:
+    """제외 연산자 유형에 해당하는 노드 이름 + 직접 지정한 노드 이름"""
+    names = [node.name for node in model.graph.node if node.op_type in set(op_types)]
+    return sorted(set(names) | set(nodes))
+
+
+def count_quantized_nodes(path: str) -> int:
+    """양자화 연산자(QuantizeLinear, DynamicQuantizeLinear, QLinear*, *Integer) 수"""
+    import onnx
+
+    return sum(
+        1 for node in onnx.load(path).graph.node
+        if 'Quantize' in node.op_type or node.op_type.startswith('QLinear')
+        or node.op_type.endswith('Integer')
+    )
+
+
+def quantize_dynamic_variant(model_path: str, output_path: str,
+                             config: QuantizationConfig) -> str:
+    """가중치 UINT8 동적 양자화"""
+    import onnx
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    model = onnx.load(model_path)
+    quantize_dynamic(
+        model_input=model_path,
+        model_output=output_path,
+        weight_type=QuantType.QUInt8,
+        per_channel=config.per_channel,
+        nodes_to_exclude=excluded_node_names(model, config.exclude_op_types, config.exclude_nodes)
+    )
+    return output_path
+
+
+def quantize_static_variant(model_path: str, output_path: str, X_train: np.ndarray,
+                            config: QuantizationConfig) -> str:
+    """
+    학습 데이터 보정 정적 INT8 양자화 (QDQ 포맷)
+
+    Args:
+        model_path: float32 ONNX 모델 경로
+        output_path: 저장 경로
+        X_train: 보정용 학습 데이터 특성
+        config: 양자화 설정
+
+    Returns:
+        저장 경로
+    """
+    import onnx
+    from onnxruntime.quantization import CalibrationMethod, QuantFormat, QuantType, quantize_static
+
+    methods = {
+        'minmax': CalibrationMethod.MinMax,
+        'entropy': CalibrationMethod.Entropy,
+        'percentile': CalibrationMethod.Percentile
+    }
+    model = onnx.load(model_path)
+    quantize_static(
+        model_input=model_path,
+        model_output=output_path,
+        calibration_data_reader=calibration_reader(model_path, X_train, config),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=config.per_channel,
+        calibrate_method=methods[config.calibration_method],
+        nodes_to_exclude=excluded_node_names(model, config.exclude_op_types, config.exclude_nodes)
+    )
+    return output_path
+
+
+def convert_fp16_variant(model_path: str, output_path: str, config: QuantizationConfig) -> str:
+    """
+    float16 변환
+
+    ai.onnx.ml 도메인 연산자(TreeEnsemble, ZipMap 등)는 float16을 지원하지 않으므로
+    자동으로 변환에서 제외하며(앞뒤에 Cast 삽입), 입출력은 float32로 유지합니다.
+    """
+    import onnx
+    from onnxruntime.transformers.float16 import convert_float_to_float16
+
+    model = onnx.load(model_path)
+    block_ops = {node.op_type for node in model.graph.node if node.domain == ML_DOMAIN}
+    block_ops.update(config.fp16_block_ops)
+    fp16_model = convert_float_to_float16(
+        model,
+        keep_io_types=True,
+        op_block_list=sorted(block_ops),
+        node_block_list=list(config.exclude_nodes)
+    )
+    onnx.save_model(fp16_model, output_path)
+    return output_path
+
+
+def build_variants(model_path: str, X_train: np.ndarray, output_dir: str,
+                   config: QuantizationConfig,
+                   variants: Sequence[str] = VARIANTS) -> Dict[str, str]:
+    """
+    양자화 변형 생성
+
+    Returns:
+        {변형 이름: 모델 경로} (fp32는 원본 경로)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    paths = {}
+    for name in variants:
+        if name not in VARIANTS:
+            raise ValueError(f"Unsupported variant: {name}. Supported: {VARIANTS}")
+        output_path = os.path.join(output_dir, f"{stem}_{name}.onnx")
+        if name == 'fp32':
+            paths[name] = model_path
+        elif name == 'dynamic':
+            paths[name] = quantize_dynamic_variant(model_path, output_path, config)
+        elif name == 'static_qdq':
+            paths[name] = quantize_static_variant(model_path, output_path, X_train, config)
+        else:
+            paths[name] = convert_fp16_variant(model_path, output_path, config)
+    return paths
+
+
+def _session_predict(path: str, threads: int = 1):
+    session = create_session(path, SessionSettings(intra_op_num_threads=threads))
+    input_name = session.get_inputs()[0].name
+    output_names = [session.get_outputs()[0].name]
+    return lambda X: np.asarray(session.run(output_names, {input_name: X})[0]).ravel()
+
+
+def evaluate_metric(task: str, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """classification: accuracy / regression: MAE"""
+    if task == 'classification':
+        return float(np.mean(y_pred == y_true))
+    return float(np.mean(np.abs(y_pred.astype(np.float64) - y_true)))
+
+
+def within_budget(task: str, metric: float, baseline: float, budget: float) -> bool:
+    """
+    허용 오차 판정
+
+    classification: 정확도 감소폭(절대값) <= budget
+    regression: MAE 증가율(상대값) <= budget
+    """
+    if task == 'classification':
+        return baseline - metric <= budget + 1e-12
+    return metric <= baseline * (1 + budget) + 1e-12
+
+
+def recommend(variants: Sequence[VariantResult], min_speedup: float = 0.05) -> str:
+    """
+    허용 오차 안에서 fp32보다 확실히 빠른 변형 중 p50이 가장 낮은 것 (없으면 fp32)
+
+    "확실히 빠름": p50이 min_speedup 이상 낮고, 변형의 p50 신뢰 구간 상한이
+    fp32의 p50 신뢰 구간 하한보다 낮음 (benchmark_suite.compare_runs와 같은 기준).
+    양자화 노드가 하나도 없는 양자화 변형은 원본과 같은 그래프이므로 제외합니다.
+    """
+    baseline = next(v for v in variants if v.name == 'fp32')
+    faster = [
+        v for v in variants
+        if v.name != 'fp32' and v.within_budget
+        and (v.name == 'fp16' or v.quantized_nodes > 0)
+        and v.latency.p50_ms <= baseline.latency.p50_ms * (1 - min_speedup)
+        and v.latency.p50_ci_ms[1] < baseline.latency.p50_ci_ms[0]
+    ]
+    if not faster:
+        return 'fp32'
+    return min(faster, key=lambda v: v.latency.p50_ms).name
+
+
+def sweep_variants(
+    model_path: str,
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    task: str = 'classification',
+    budget: float = 0.01,
+    output_dir: str = 'outputs',
+    config: Optional[QuantizationConfig] = None,
+    bench_config: Optional[BenchmarkConfig] = None,
+    batch_size: int = 64,
+    variants: Sequence[str] = VARIANTS,
+    min_speedup: float = 0.05
+) -> QuantizationReport:
+    """
+    변형별 정확도 × 지연 시간 비교 후 추천
+
+    Args:
+        model_path: float32 ONNX 모델 경로
+        X_train: 보정용 학습 데이터 특성
+        X_test: 평가 데이터 특성
+        y_test: 평가 데이터 타겟
+        task: "classification" (accuracy) 또는 "regression" (MAE)
+        budget: 허용 정확도 감소폭 또는 MAE 증가율
+        output_dir: 변형 저장 디렉터리
+        config: 양자화 설정
+        bench_config: 지연 시간 측정 설정
+        batch_size: 지연 시간 측정 배치 크기
+        variants: 생성할 변형
+        min_speedup: 추천에 필요한 최소 p50 개선율
+
+    Returns:
+        비교 결과와 추천 변형
+    """
+    if task not in ('classification', 'regression'):
+        raise ValueError(f"Unsupported task: {task}. Supported: classification, regression")
+
+    config = config or QuantizationConfig()
+    bench_config = bench_config or BenchmarkConfig(min_iterations=50, min_time_sec=0.5)
+    paths = build_variants(model_path, X_train, output_dir, config, variants)
+
+    X_eval = X_test.astype(np.float32)
+    batch = make_batch(X_test, batch_size, bench_config.seed)
+    reference = _session_predict(model_path)(X_eval)
+    baseline_metric = evaluate_metric(task, y_test, reference)
+
+    results = []
+    for name, path in paths.items():
+        predict = _session_predict(path)
+        predictions = predict(X_eval)
+        metric = evaluate_metric(task, y_test, predictions)
+        if task == 'classification':
+            agreement = float(np.mean(predictions == reference))
+        else:
+            agreement = float(np.mean(np.isclose(predictions, reference, rtol=1e-3, atol=1e-3)))
+
+        timings = measure(predict, batch, bench_config)
+        results.append(VariantResult(
+            name=name,
+            path=path,
+            size_kb=os.path.getsize(path) / 1024,
+            metric=metric,
+            agreement=agreement,
+            latency=summarize(timings, name, batch_size, 1,
+                              bench_config.n_bootstrap, bench_config.seed),
+            quantized_nodes=count_quantized_nodes(path),
+            within_budget=within_budget(task, metric, baseline_metric, budget)
+        ))
+
+    return QuantizationReport(
+        task=task,
+        metric_name='accuracy' if task == 'classification' else 'mae',
+        budget=budget,
+        batch_size=batch_size,
+        variants=results,
+        recommended=recommend(results, min_speedup)
+    )
+
+
+def print_report(report: QuantizationReport):
+    print(f"   {'variant':<11} {'size KB':>9} {report.metric_name:>9} {'agree':>7} "
+          f"{'q-nodes':>7} {'p50 ms':>9} {'p50 95% CI':>19}  budget")
+    print(f"   {'-' * 86}")
+    for v in report.variants:
+        ci = f"[{v.latency.p50_ci_ms[0]:.4f}, {v.latency.p50_ci_ms[1]:.4f}]"
+        mark = '★' if v.name == report.recommended else ('✓' if v.within_budget else '✗')
+        print(f"   {v.name:<11} {v.size_kb:>9.2f} {v.metric:>9.4f} {v.agreement:>7.1%} "
+              f"{v.quantized_nodes:>7} {v.latency.p50_ms:>9.4f} {ci:>19}  {mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='양자화 변형 비교 및 추천')
+    parser.add_argument('--model', default='outputs/model_optimized.onnx')
+    parser.add_argument('--output-dir', default='outputs/quantized')
+    parser.add_argument('--budget', type=float, default=0.01,
+                        help='허용 정확도 감소폭 (분류) / MAE 증가율 (회귀)')
+    parser.add_argument('--variants', nargs='+', default=VARIANTS, choices=VARIANTS)
+    parser.add_argument('--calibration-samples', type=int, default=200)
+    parser.add_argument('--calibration-method', default='minmax', choices=CALIBRATION_METHODS)
+    parser.add_argument('--per-channel', action='store_true')
+    parser.add_argument('--exclude-op-types', nargs='*', default=[],
+                        help='양자화 제외 연산자 유형 (예: Gemm MatMul)')
+    parser.add_argument('--exclude-nodes', nargs='*', default=[], help='제외 노드 이름')
+    parser.add_argument('--fp16-block-ops', nargs='*', default=[],
+                        help='fp16 변환 제외 연산자 유형 (ai.onnx.ml은 자동 제외)')
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--report', default='outputs/quantization_report.json')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        print(f"   ❌ 오류: {args.model} 파일이 없습니다. 먼저 1_onnx_conversion.py를 실행하세요.")
+        return 1
+
+    iris = load_iris()
+    X_train, X_test, _, y_test = train_test_split(
+        iris.data, iris.target, test_size=0.2, random_state=42
+    )
+    config = QuantizationConfig(
+        calibration_samples=args.calibration_samples,
+        calibration_method=args.calibration_method,
+        per_channel=args.per_channel,
+        exclude_op_types=args.exclude_op_types,
+        exclude_nodes=args.exclude_nodes,
+        fp16_block_ops=args.fp16_block_ops
+    )
+    report = sweep_variants(
+        args.model, X_train, X_test, y_test,
+        task='classification', budget=args.budget, output_dir=args.output_dir,
+        config=config, batch_size=args.batch_size, variants=args.variants
+    )
+    print_report(report)
+    print(f"\n   ★ 추천 변형: {report.recommended}")
+
+    os.makedirs(os.path.dirname(args.report) or '.', exist_ok=True)
+    with open(args.report, 'w') as f:
+        json.dump(report.to_dict(), f, indent=2)
+    print(f"   💾 리포트 저장: {args.report}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
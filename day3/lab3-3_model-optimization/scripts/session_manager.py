@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Lab 3-3: ONNX Runtime 세션 관리자
+
+스크립트마다 기본 SessionOptions로 InferenceSession을 따로 만드는 대신,
+튜닝된 설정으로 세션을 만들고 재사용합니다.
+
+- SessionSettings: intra/inter-op 스레드 수, 실행 모드(sequential/parallel),
+  메모리 아레나, 메모리 패턴, 그래프 최적화 수준
+- BoundSession: 고정 배치 크기별로 입력/출력 버퍼를 미리 할당한 IO 바인딩 재사용
+  (호출마다 출력 텐서를 새로 할당하지 않음)
+- SessionPool: 동시 워커 수만큼 세션을 만들어 두고 스레드 간 빌려 쓰기
+- autotune(): 설정 조합별로 동시 처리량(rows/s)을 측정해 이 호스트에서 가장 빠른 설정 탐색
+
+실행:
+  # 튜닝 후 결과 저장 (다른 스크립트가 outputs/session_tuning.json을 자동으로 사용)
+  python scripts/session_manager.py --model outputs/model_optimized.onnx \\
+      --batch-size 64 --concurrency 4 --output outputs/session_tuning.json
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import itertools
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_TUNING_PATH = 'outputs/session_tuning.json'
+
+EXECUTION_MODES = {
+    'sequential': 'ORT_SEQUENTIAL',
+    'parallel': 'ORT_PARALLEL',
+}
+
+OPTIMIZATION_LEVELS = {
+    'disable': 'ORT_DISABLE_ALL',
+    'basic': 'ORT_ENABLE_BASIC',
+    'extended': 'ORT_ENABLE_EXTENDED',
+    'all': 'ORT_ENABLE_ALL',
+}
+
+
+@dataclass(frozen=True)
+class SessionSettings:
+    """InferenceSession 설정"""
+    intra_op_num_threads: int = 1
+    inter_op_num_threads: int = 1
+    execution_mode: str = 'sequential'
+    enable_cpu_mem_arena: bool = True
+    enable_mem_pattern: bool = True
+    graph_optimization_level: str = 'all'
+
+    def __post_init__(self):
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Unsupported execution mode: {self.execution_mode}. "
+                f"Supported: {list(EXECUTION_MODES)}"
+            )
+        if self.graph_optimization_level not in OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"Unsupported optimization level: {self.graph_optimization_level}. "
+                f"Supported: {list(OPTIMIZATION_LEVELS)}"
+            )
+        if self.intra_op_num_threads < 0 or self.inter_op_num_threads < 0:
+            raise ValueError("Thread counts must be >= 0 (0 = onnxruntime default)")
+
+    def to_session_options(self):
+        """onnxruntime.SessionOptions 생성"""
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_num_threads
+        options.inter_op_num_threads = self.inter_op_num_threads
+        options.execution_mode = getattr(ort.ExecutionMode, EXECUTION_MODES[self.execution_mode])
+        options.enable_cpu_mem_arena = self.enable_cpu_mem_arena
+        options.enable_mem_pattern = self.enable_mem_pattern
+        options.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel, OPTIMIZATION_LEVELS[self.graph_optimization_level]
+        )
+        return options
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SessionSettings':
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def load_settings(path: str = DEFAULT_TUNING_PATH,
+                  default: Optional[SessionSettings] = None) -> SessionSettings:
+    """autotune 결과 파일의 최적 설정 (파일이 없으면 default 또는 기본값)"""
+    if not os.path.exists(path):
+        return default or SessionSettings()
+    with open(path) as f:
+        return SessionSettings.from_dict(json.load(f)['best']['settings'])
+
+
+def create_session(path: str, settings: Optional[SessionSettings] = None):
+    """설정을 적용한 CPU InferenceSession 생성"""
+    import onnxruntime as ort
+
+    settings = settings or SessionSettings()
+    return ort.InferenceSession(
+        path, settings.to_session_options(), providers=['CPUExecutionProvider']
+    )
+
+
+# ONNX 입력 텐서 타입 → numpy 자료형
+ONNX_TENSOR_DTYPES = {
+    'tensor(float)': np.float32,
+    'tensor(double)': np.float64,
+    'tensor(int64)': np.int64,
+    'tensor(int32)': np.int32,
+}
+
+
+class BoundSession:
+    """
+    배치 크기별 IO 바인딩을 재사용하는 세션
+
+    첫 호출 때 (batch_size, n_features) 입력 버퍼와 출력 버퍼를 할당하고
+    이후 같은 배치 크기는 입력을 버퍼에 복사한 뒤 run_with_iobinding()만 실행합니다.
+    입력 버퍼는 모델 입력 타입(tensor(float) → float32)으로 할당되며 호출 입력은 복사 시 캐스팅됩니다.
+    IO 바인딩은 텐서 출력만 지원하므로 기본값은 텐서 출력 전체이며,
+    ZipMap의 확률 딕셔너리 같은 비텐서 출력은 제외됩니다.
+    반환된 출력은 내부 버퍼이므로 다음 호출에서 덮어써집니다 (보관하려면 copy()).
+    """
+
+    def __init__(self, session, output_names: Optional[Sequence[str]] = None):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+        tensor_outputs = [o.name for o in session.get_outputs() if o.type.startswith('tensor')]
+        self.output_names = list(output_names or tensor_outputs)
+        unsupported = set(self.output_names) - set(tensor_outputs)
+        if unsupported:
+            raise ValueError(f"IO binding supports tensor outputs only, got {sorted(unsupported)}")
+        input_type = session.get_inputs()[0].type
+        if input_type not in ONNX_TENSOR_DTYPES:
+            raise ValueError(
+                f"Unsupported input type: {input_type}. Supported: {list(ONNX_TENSOR_DTYPES)}"
+            )
+        self.input_dtype = np.dtype(ONNX_TENSOR_DTYPES[input_type])
+        self._bindings: Dict[Tuple[int, ...], Tuple] = {}
+
+    def _bind(self, shape: Tuple[int, ...]):
+        import onnxruntime as ort
+
+        input_buffer = np.zeros(shape, dtype=self.input_dtype)
+        probe = self.session.run(self.output_names, {self.input_name: input_buffer})
+
+        binding = self.session.io_binding()
+        binding.bind_ortvalue_input(
+            self.input_name, ort.OrtValue.ortvalue_from_numpy(input_buffer)
+        )
+        outputs = []
+        for name, value in zip(self.output_names, probe):
+            buffer = np.empty_like(value)
+            binding.bind_ortvalue_output(name, ort.OrtValue.ortvalue_from_numpy(buffer))
+            outputs.append(buffer)
+        self._bindings[shape] = (binding, input_buffer, outputs)
+        return self._bindings[shape]
+
+    def run(self, X: np.ndarray) -> List:
+        """예측 (output_names 순서의 출력 리스트)"""
+        X = np.asarray(X)
+        binding, input_buffer, outputs = (
+            self._bindings.get(X.shape) or self._bind(X.shape)
+        )
+        np.copyto(input_buffer, X, casting='same_kind')
+        self.session.run_with_iobinding(binding)
+        return outputs
+
+
+class SessionPool:
+    """
+    동시 워커용 세션 풀
+
+    세션 하나를 여러 스레드가 동시에 run()해도 안전하지만, 같은 세션의 스레드 풀을 나눠 쓰고
+    IO 바인딩 버퍼는 공유할 수 없으므로 워커마다 세션(BoundSession)을 하나씩 빌려 줍니다.
+    """
+
+    def __init__(self, path: str, size: int = 1, settings: Optional[SessionSettings] = None,
+                 output_names: Optional[Sequence[str]] = None):
+        """
+        Args:
+            path: ONNX 모델 경로
+            size: 세션 수 (동시 워커 수)
+            settings: 세션 설정
+            output_names: 받을 출력 이름 (기본: 전체)
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be >= 1, got {size}")
+        self.path = path
+        self.settings = settings or SessionSettings()
+        self.size = size
+        self._sessions: queue.Queue = queue.Queue()
+        for _ in range(size):
+            self._sessions.put(BoundSession(create_session(path, self.settings), output_names))
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[BoundSession]:
+        """세션 하나 빌리기 (모두 사용 중이면 대기)"""
+        bound = self._sessions.get(timeout=timeout)
+        try:
+            yield bound
+        finally:
+            self._sessions.put(bound)
+
+    def run(self, X: np.ndarray) -> List[np.ndarray]:
+        """빌린 세션으로 예측 (출력 복사본 반환)"""
+        with self.session() as bound:
+            return [value.copy() for value in bound.run(X)]
+
+
+@dataclass
+class TuningResult:
+    """설정 한 조합의 처리량 측정 결과"""
+    settings: SessionSettings
+    rows_per_sec: float
+    requests: int
+    p50_ms: float
+    p99_ms: float
+
+    def to_dict(self) -> Dict:
+        return {
+            'settings': self.settings.to_dict(),
+            'rows_per_sec': round(self.rows_per_sec, 1),
+            'requests': self.requests,
+            'p50_ms': round(self.p50_ms, 4),
+            'p99_ms': round(self.p99_ms, 4)
+        }
+
+
+def candidate_settings(
+    concurrency: int = 1,
+    cpu_count: Optional[int] = None,
+    graph_optimization_level: str = 'all'
+) -> List[SessionSettings]:
+    """
+    탐색할 설정 조합
+
+    intra-op 스레드는 1부터 (CPU 수 / 동시 워커 수)까지 2배씩 늘려 과다 구독을 피하고,
+    parallel 실행 모드는 inter-op 스레드 2개로 시험합니다.
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    max_intra = max(1, cpu_count // concurrency)
+    intra_options = sorted({min(2 ** i, max_intra) for i in range(max_intra.bit_length())})
+
+    candidates = []
+    for intra, mode, arena, pattern in itertools.product(
+        intra_options, EXECUTION_MODES, (True, False), (True, False)
+    ):
+        candidates.append(SessionSettings(
+            intra_op_num_threads=intra,
+            inter_op_num_threads=2 if mode == 'parallel' else 1,
+            execution_mode=mode,
+            enable_cpu_mem_arena=arena,
+            enable_mem_pattern=pattern,
+            graph_optimization_level=graph_optimization_level
+        ))
+    return candidates
+
+
+def measure_throughput(
+    path: str,
+    X: np.ndarray,
+    settings: SessionSettings,
+    concurrency: int = 1,
+    duration_sec: float = 1.0,
+    warmup: int = 5
+) -> TuningResult:
+    """
+    워커 concurrency개가 각자 세션을 빌려 duration_sec 동안 반복 예측한 처리량
+
+    Args:
+        path: ONNX 모델 경로
+        X: 고정 배치 입력
+        settings: 세션 설정
+        concurrency: 동시 워커 수 (= 풀 크기)
+        duration_sec: 측정 시간
+        warmup: 워커별 워밍업 호출 수
+
+    Returns:
+        측정 결과
+    """
+    pool = SessionPool(path, size=concurrency, settings=settings)
+    latencies: List[List[float]] = [[] for _ in range(concurrency)]
+    ready = threading.Barrier(concurrency + 1)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def worker(index: int):
+        try:
+            with pool.session() as bound:
+                for _ in range(warmup):
+                    bound.run(X)
+                ready.wait()
+                timings = latencies[index]
+                while not stop.is_set():
+                    started = time.perf_counter_ns()
+                    bound.run(X)
+                    timings.append((time.perf_counter_ns() - started) / 1e6)
+        except threading.BrokenBarrierError:
+            pass
+        except Exception as e:
+            errors.append(e)
+            ready.abort()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    try:
+        ready.wait()
+        started = time.perf_counter()
+        time.sleep(duration_sec)
+    except threading.BrokenBarrierError:
+        started = time.perf_counter()
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if errors:
+        raise errors[0]
+
+    timings = np.concatenate([np.asarray(t) for t in latencies]) if any(latencies) else np.zeros(1)
+    requests = sum(len(t) for t in latencies)
+    return TuningResult(
+        settings=settings,
+        rows_per_sec=requests * len(X) / elapsed,
+        requests=requests,
+        p50_ms=float(np.percentile(timings, 50)),
+        p99_ms=float(np.percentile(timings, 99))
+    )
+
+
+def autotune(
+    path: str,
+    X: np.ndarray,
+    concurrency: int = 1,
+    candidates: Optional[Sequence[SessionSettings]] = None,
+    duration_sec: float = 1.0,
+    verbose: bool = True
+) -> List[TuningResult]:
+    """
+    설정 조합별 처리량 측정 (처리량 내림차순 정렬, 첫 번째가 최적)
+
+    Args:
+        path: ONNX 모델 경로
+        X: 고정 배치 입력 (서빙 시 배치 크기와 같게)
+        concurrency: 동시 워커 수
+        candidates: 탐색할 설정 (기본: candidate_settings())
+        duration_sec: 조합당 측정 시간
+        verbose: 진행 상황 출력
+
+    Returns:
+        측정 결과 리스트
+    """
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    candidates = candidates or candidate_settings(concurrency)
+    results = []
+    for settings in candidates:
+        result = measure_throughput(path, X, settings, concurrency, duration_sec)
+        results.append(result)
+        if verbose:
+            print_result(result)
+    return sorted(results, key=lambda r: r.rows_per_sec, reverse=True)
+
+
+def print_header():
+    print(f"   {'intra':>5} {'inter':>5} {'mode':<10} {'arena':>5} {'pattern':>7} "
+          f"{'rows/s':>12} {'p50 ms':>9} {'p99 ms':>9}")
+
+
+def print_result(result: TuningResult):
+    s = result.settings
+    print(f"   {s.intra_op_num_threads:>5} {s.inter_op_num_threads:>5} {s.execution_mode:<10} "
+          f"{str(s.enable_cpu_mem_arena):>5} {str(s.enable_mem_pattern):>7} "
+          f"{result.rows_per_sec:>12,.0f} {result.p50_ms:>9.4f} {result.p99_ms:>9.4f}")
+
+
+def main():
+    from sklearn.datasets import load_iris
+
+    parser = argparse.ArgumentParser(description='ONNX Runtime 세션 설정 자동 튜닝')
+    parser.add_argument('--model', default='outputs/model_optimized.onnx')
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--concurrency', type=int, default=1, help='동시 워커 수 (풀 크기)')
+    parser.add_argument('--duration', type=float, default=1.0, help='조합당 측정 시간 (초)')
+    parser.add_argument('--output', default=DEFAULT_TUNING_PATH)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        print(f"   ❌ 오류: {args.model} 파일이 없습니다. 먼저 1_onnx_conversion.py를 실행하세요.")
+        return 1
+
+    rng = np.random.default_rng(42)
+    X_pool = load_iris().data
+    X = X_pool[rng.integers(0, len(X_pool), size=args.batch_size)].astype(np.float32)
+
+    print(f"   모델: {args.model}, 배치 {args.batch_size}행, 동시 워커 {args.concurrency}, "
+          f"CPU {os.cpu_count()}개\n")
+    print_header()
+    results = autotune(args.model, X, args.concurrency, duration_sec=args.duration)
+
+    best, default = results[0], next(
+        (r for r in results if r.settings == SessionSettings()), None
+    )
+    print("\n   ★ 최적 설정:")
+    print_result(best)
+    if default is not None and default.rows_per_sec > 0:
+        print(f"   기본 설정 대비 처리량: {best.rows_per_sec / default.rows_per_sec:.2f}x")
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'model': args.model,
+            'batch_size': args.batch_size,
+            'concurrency': args.concurrency,
+            'cpu_count': os.cpu_count(),
+            'best': best.to_dict(),
+            'results': [r.to_dict() for r in results]
+        }, f, indent=2)
+    print(f"   💾 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())